@@ -7,111 +7,26 @@ lazy filesystem lookups.
 
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
-from src.java.parsing_utils import (
-    _PRIMITIVE_TYPES,  # noqa: F401 — re-exported for callers that import from here
-    _analyze_jpa_fields,
-    _extract_balanced_parens,
-    _extract_public_signatures,
-    _is_primitive_type,
-    _parse_parameters,
+from src.java.parsing_utils import (  # noqa: F401 — re-exported for callers that import from here
+    _PRIMITIVE_TYPES,
+    _extract_extends_implements,
+    _extract_field_details,
+    parse_java_source,
 )
+from src.lib.cache_files import RACY_WINDOW_NS, write_cache_file
+from src.lib.logging import get_logger
+from src.lib.workers import default_worker_count
 
-# ---------------------------------------------------------------------------
-# extends / implements extraction
-# ---------------------------------------------------------------------------
-
-_CLASS_DECL_PATTERN = re.compile(
-    r"(?:public\s+)?(?:abstract\s+)?(?:final\s+)?class\s+\w+(?:<[^>]+>)?\s*"
-    r"(?:extends\s+([\w<>, ]+?)\s*)?"
-    r"(?:implements\s+([\w<>, ]+?)\s*)?"
-    r"\{",
-    re.MULTILINE,
-)
-
-
-def _extract_extends_implements(source_code: str) -> tuple[str | None, list[str]]:
-    """Extract extends and implements from a Java class declaration.
-
-    Returns:
-        (extends_simple_name | None, [implements_simple_name, ...])
-    """
-    m = _CLASS_DECL_PATTERN.search(source_code)
-    if not m:
-        return None, []
-
-    extends_raw = m.group(1)
-    implements_raw = m.group(2)
-
-    extends_name: str | None = None
-    if extends_raw:
-        # Strip generics: BaseClass<T> → BaseClass
-        extends_name = extends_raw.strip().split("<")[0].strip()
-
-    implements_list: list[str] = []
-    if implements_raw:
-        for iface in implements_raw.split(","):
-            simple = iface.strip().split("<")[0].strip()
-            if simple:
-                implements_list.append(simple)
-
-    return extends_name, implements_list
-
-
-# ---------------------------------------------------------------------------
-# richer field extraction (with annotations)
-# ---------------------------------------------------------------------------
-
-def _extract_field_details(source_code: str) -> list[dict[str, Any]]:
-    """Extract class-level fields with their annotations and types.
-
-    Handles patterns like:
-        @Id
-        @GeneratedValue
-        private Long id;
-
-        @Autowired
-        private UserRepository userRepository;
-
-        private final String name;
-    """
-    results: list[dict[str, Any]] = []
-    # Walk line by line collecting annotation blocks + field declaration
-    lines = source_code.splitlines()
-    pending_annotations: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        ann_match = re.match(r"@(\w+)(?:\([^)]*\))?", stripped)
-        if ann_match and not stripped.startswith("//"):
-            pending_annotations.append(ann_match.group(1))
-            continue
-        # Field declaration: [modifiers] Type name;
-        field_match = re.match(
-            r"(?:private|protected|public)?\s*(?:static\s+)?(?:final\s+)?"
-            r"([\w<>\[\]]+(?:\s*<[^;]*>)?)\s+(\w+)\s*[;=]",
-            stripped,
-        )
-        if field_match:
-            ftype = field_match.group(1).strip()
-            fname = field_match.group(2).strip()
-            # Skip keywords that look like field declarations
-            if fname not in {"if", "while", "for", "return", "class", "new", "import", "package"}:
-                results.append({
-                    "name": fname,
-                    "type": ftype,
-                    "annotations": list(pending_annotations),
-                })
-            pending_annotations = []
-            continue
-        # Any non-blank, non-comment line clears the pending annotation list
-        if stripped and not stripped.startswith("//") and not stripped.startswith("*"):
-            pending_annotations = []
-
-    return results
-
+logger = get_logger(__name__)
 
 # ---------------------------------------------------------------------------
 # Core: analyze_java_class
@@ -149,109 +64,29 @@ def analyze_java_class(source_code: str, relative_path: str = "") -> dict[str, A
         "public_signatures": "",
     }
 
-    # Package
-    pkg_m = re.search(r"package\s+([\w.]+);", source_code)
-    if pkg_m:
-        entry["package"] = pkg_m.group(1)
+    parsed = parse_java_source(source_code)
+    entry["package"] = parsed.package
+    entry["imports"] = list(parsed.imports)
+    entry["class_name"] = parsed.class_name
+    entry["dependencies"] = parsed.dependency_dicts()
 
-    # Imports
-    for m in re.finditer(r"import\s+([\w.]+(?:\.\*)?);", source_code, re.MULTILINE):
-        entry["imports"].append(m.group(1))
-
-    # Record check
-    record_m = re.search(r"(?:public\s+)?record\s+(\w+)\s*\(([^)]*)\)", source_code)
-    if record_m:
-        entry["class_name"] = record_m.group(1)
+    if parsed.is_record:
         entry["is_record"] = True
-        for param in _parse_parameters(record_m.group(2)):
-            if not _is_primitive_type(param["type"]):
-                entry["dependencies"].append({"type": param["type"], "name": param["name"]})
         entry["category"] = "model"
         return entry
 
-    # Class name
-    cls_m = re.search(r"(?:public\s+)?(?:abstract\s+)?class\s+(\w+)", source_code)
-    if cls_m:
-        entry["class_name"] = cls_m.group(1)
-
-    # Extends / implements
-    extends_name, implements_list = _extract_extends_implements(source_code)
-    entry["extends"] = extends_name
-    entry["implements"] = implements_list
-
-    # Class-level annotations
-    class_decl_m = re.search(r'(?:public\s+)?(?:abstract\s+)?class\s+\w+', source_code)
-    if class_decl_m:
-        before = source_code[:class_decl_m.start()]
-        found = re.findall(r'@(\w+)(?:\([^)]*\))?', before)
-        keep = {
-            'Controller', 'RestController', 'Service', 'Repository', 'Component',
-            'RequestMapping', 'Timed', 'Transactional', 'Configuration', 'Bean',
-            'Slf4j', 'Log4j2', 'Data', 'Entity', 'Table', 'Document',
-        }
-        entry["annotations"] = [a for a in found if a in keep]
-
-    # Fields (rich: with annotations)
-    entry["fields"] = _extract_field_details(source_code)
-
-    # Methods
-    method_sig_pattern = re.compile(
-        r"(public|protected)\s+"
-        r"(?:static\s+)?(?:final\s+)?(?:synchronized\s+)?"
-        r"(\w+(?:<[^>]+>)?)\s+"
-        r"(\w+)\s*\(",
-        re.MULTILINE,
-    )
-    class_name = entry["class_name"]
-    for m in method_sig_pattern.finditer(source_code):
-        visibility = m.group(1)
-        return_type = m.group(2)
-        method_name = m.group(3)
-        if method_name == class_name:
-            continue  # constructor
-        params = _extract_balanced_parens(source_code, m.end() - 1)
-        parsed = _parse_parameters(params)
-        entry["methods"].append({
-            "name": method_name,
-            "return_type": return_type,
-            "parameters": params,
-            "parsed_params": parsed,
-            "is_void": return_type == "void",
-            "visibility": visibility,
-        })
-
-    # Constructor injection
-    if class_name:
-        ctor_pattern = re.compile(
-            rf"(?:public\s+)?{re.escape(class_name)}\s*\(([^)]*)\)",
-            re.MULTILINE | re.DOTALL,
-        )
-        for m in ctor_pattern.finditer(source_code):
-            for param in _parse_parameters(m.group(1)):
-                if not _is_primitive_type(param["type"]):
-                    if not any(d["name"] == param["name"] for d in entry["dependencies"]):
-                        entry["dependencies"].append({"type": param["type"], "name": param["name"]})
-
-    # Field injection (@Autowired, @Inject, @Resource)
-    dep_pattern = re.compile(
-        r"@(?:Autowired|Inject|Resource)\s+(?:private\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)",
-        re.MULTILINE,
-    )
-    for m in dep_pattern.finditer(source_code):
-        if not any(d["name"] == m.group(2) for d in entry["dependencies"]):
-            entry["dependencies"].append({"type": m.group(1), "name": m.group(2)})
-
-    # JPA fields
-    entry["jpa_info"] = _analyze_jpa_fields(source_code)
+    entry["extends"] = parsed.extends
+    entry["implements"] = list(parsed.implements)
+    entry["annotations"] = list(parsed.annotations)
+    entry["fields"] = parsed.field_dicts()
+    entry["methods"] = parsed.method_dicts()
+    entry["jpa_info"] = parsed.jpa_dict()
     entry["is_jpa_entity"] = (
         "Entity" in entry["annotations"] or "Table" in entry["annotations"]
     )
-
-    # Category
     entry["category"] = _detect_category(source_code, entry)
-
     # Pre-built signatures string for LLM
-    entry["public_signatures"] = _extract_public_signatures(source_code)
+    entry["public_signatures"] = parsed.public_signatures
 
     return entry
 
@@ -280,29 +115,282 @@ def _detect_category(source_code: str, entry: dict[str, Any]) -> str:
 # Build class index over a whole project
 # ---------------------------------------------------------------------------
 
-def build_class_index(project_path: str, source_files: list[str]) -> dict[str, dict[str, Any]]:
+# Below this many files, worker start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 200
+
+
+def _read_source(path: Path) -> tuple[str, tuple[int, int, str]]:
+    """Read a source file, returning its text and (size, mtime_ns, sha1)."""
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    # Universal newlines, as read_text() would do
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    return text, (st.st_size, st.st_mtime_ns, digest)
+
+
+def _analyze_file(
+    project_dir: Path, relative_path: str,
+) -> tuple[dict[str, Any] | None, tuple[int, int, str] | None]:
+    try:
+        source_code, fingerprint = _read_source(project_dir / relative_path)
+    except OSError:
+        return None, None
+    try:
+        return analyze_java_class(source_code, relative_path), fingerprint
+    except Exception:
+        return None, fingerprint  # Skip unparsable files silently
+
+
+def _analyze_chunk(
+    project_path: str, relative_paths: list[str],
+) -> list[tuple[dict[str, Any] | None, tuple[int, int, str] | None]]:
+    """Worker entry point: analyze a chunk of files (must stay picklable)."""
+    project_dir = Path(project_path)
+    return [_analyze_file(project_dir, rel) for rel in relative_paths]
+
+
+def default_index_workers(file_count: int) -> int:
+    """Return the worker count used when ``--index-workers`` is not given."""
+    if file_count < _PARALLEL_MIN_FILES:
+        return 1
+    return default_worker_count()
+
+
+def _analyze_files(
+    project_path: str, source_files: list[str], workers: int,
+) -> list[tuple[dict[str, Any] | None, tuple[int, int, str] | None]]:
+    """Analyze ``source_files``, returning (entry, fingerprint) per file in input order."""
+    if workers <= 1 or len(source_files) < 2:
+        return _analyze_chunk(project_path, source_files)
+
+    # A few chunks per worker keeps them busy when file sizes are uneven
+    chunk_size = max(1, -(-len(source_files) // (workers * 4)))
+    chunks = [source_files[i:i + chunk_size] for i in range(0, len(source_files), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order: the merge stays deterministic
+            results = pool.map(_analyze_chunk, [project_path] * len(chunks), chunks)
+            return [item for chunk in results for item in chunk]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("class_index_parallel_failed", error=str(e), fallback="serial")
+        return _analyze_chunk(project_path, source_files)
+
+
+def merge_class_entries(entries: list[dict[str, Any] | None]) -> dict[str, dict[str, Any]]:
+    """Merge analyzed entries into a class index, in the given order.
+
+    Simple class names are not unique across packages (``com.a.Mapper`` and
+    ``com.b.Mapper``). The first entry in input order (source files are
+    sorted) keeps the simple-name key and lists the others in
+    ``duplicates`` so callers can tell the name is ambiguous; the others
+    are indexed under their fully-qualified names. Each class appears
+    once, so ``len(index)`` is the number of classes.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    collisions: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        if not entry:
+            continue
+        class_name = entry.get("class_name")
+        if not class_name:
+            continue
+        if class_name in index:
+            collisions.setdefault(class_name, [index[class_name]]).append(entry)
+        else:
+            index[class_name] = entry
+
+    for class_name, same_name in collisions.items():
+        fqns = [_qualified_name(e) for e in same_name]
+        # Copy: entries may be shared with the incremental cache
+        same_name[0] = index[class_name] = {**same_name[0], "duplicates": fqns[1:]}
+        for entry, fqn in zip(same_name[1:], fqns[1:], strict=True):
+            index.setdefault(fqn, entry)
+    if collisions:
+        logger.warning(
+            "class_index_duplicate_names",
+            count=len(collisions),
+            names=sorted(collisions)[:20],
+        )
+    return index
+
+
+def _qualified_name(entry: dict[str, Any]) -> str:
+    package = entry.get("package") or ""
+    return f"{package}.{entry['class_name']}" if package else entry["class_name"]
+
+
+def build_class_index(
+    project_path: str, source_files: list[str], workers: int | None = None,
+) -> dict[str, dict[str, Any]]:
     """Build a class index for all source files.
 
+    Files are parsed in a process pool when there are enough of them; the
+    result does not depend on the worker count.
+
     Args:
         project_path: Absolute path to the Java project root.
         source_files: List of relative file paths (e.g. "src/main/java/.../Foo.java").
+        workers: Number of worker processes (None: CPU count for large
+            projects, 1: serial).
 
     Returns:
-        Dict mapping class_name → ClassIndexEntry.
+        Dict mapping class_name → ClassIndexEntry (see merge_class_entries
+        for duplicate simple names).
+    """
+    if workers is None:
+        workers = default_index_workers(len(source_files))
+    results = _analyze_files(project_path, source_files, workers)
+    return merge_class_entries([entry for entry, _ in results])
+
+
+# ---------------------------------------------------------------------------
+# Incremental class index
+# ---------------------------------------------------------------------------
+
+CLASS_INDEX_CACHE = "class_index_cache.json"
+_CACHE_VERSION = 1
+
+
+def _load_index_cache(project_path: str) -> tuple[dict[str, dict[str, Any]], int]:
+    """Return (per-file cache, time the cache was written in ns)."""
+    path = Path(project_path) / ".testboost" / CLASS_INDEX_CACHE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, 0
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}, 0
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}, 0
+    return files, int(data.get("written_at_ns", 0))
+
+
+def _save_index_cache(project_path: str, files: dict[str, dict[str, Any]]) -> None:
+    tb_dir = Path(project_path) / ".testboost"
+    if not tb_dir.is_dir():
+        return
+    try:
+        write_cache_file(
+            tb_dir / CLASS_INDEX_CACHE,
+            json.dumps(
+                {"version": _CACHE_VERSION, "written_at_ns": time.time_ns(), "files": files},
+                separators=(",", ":"),
+            ),
+            tb_dir=tb_dir,
+            comment="TestBoost local class index cache",
+        )
+    except OSError as e:
+        logger.warning("class_index_cache_write_failed", error=str(e))
+
+
+def _stat_fingerprint(project_dir: Path, relative_path: str) -> tuple[int, int] | None:
+    # Always a fresh stat: the filesystem index only tracks directory
+    # changes and would miss a file edited in place.
+    try:
+        st = os.stat(project_dir / relative_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def update_class_index(
+    project_path: str,
+    source_files: list[str],
+    workers: int | None = None,
+    full: bool = False,
+) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
+    """Build the class index, reparsing only files that changed since last run.
+
+    Each file's (size, mtime_ns, sha1) fingerprint and parsed entry are kept
+    in ``.testboost/class_index_cache.json``. A file is reused when its size
+    and mtime are unchanged, or when they changed but its content hash did
+    not (touch, checkout). A changed or deleted class also invalidates every
+    class that extends it, transitively, since child entries are built
+    against their parent.
+
+    Args:
+        project_path: Absolute path to the Java project root.
+        source_files: List of relative file paths.
+        workers: Worker processes for the files to reparse (see build_class_index).
+        full: Ignore the cache and reparse everything.
+
+    Returns:
+        (class index, {"reused": n, "reparsed": n, "removed": n})
     """
-    index: dict[str, dict[str, Any]] = {}
     project_dir = Path(project_path)
-    for relative_path in source_files:
-        full_path = project_dir / relative_path
-        try:
-            source_code = full_path.read_text(encoding="utf-8", errors="replace")
-            entry = analyze_java_class(source_code, relative_path)
-            class_name = entry.get("class_name")
-            if class_name:
-                index[class_name] = entry
-        except Exception:
-            pass  # Skip unreadable files silently
-    return index
+    cache, written_at_ns = ({}, 0) if full else _load_index_cache(project_path)
+    # Same-size edits within the racy window leave (size, mtime)
+    # unchanged: files that recent are always confirmed by hash
+    racy_after = written_at_ns - RACY_WINDOW_NS
+
+    reused: dict[str, dict[str, Any]] = {}
+    changed: list[str] = []
+    for rel in source_files:
+        cached = cache.get(rel)
+        stat = _stat_fingerprint(project_dir, rel)
+        if cached is None or stat is None:
+            changed.append(rel)
+        elif (cached["size"], cached["mtime_ns"]) == stat and stat[1] < racy_after:
+            reused[rel] = cached
+        elif cached["size"] == stat[0] and _file_sha1(project_dir / rel) == cached["sha1"]:
+            reused[rel] = {**cached, "mtime_ns": stat[1]}
+        else:
+            changed.append(rel)
+
+    # Classes that changed or disappeared: their subclasses must be reparsed
+    wanted = set(source_files)
+    stale_names = {
+        (c.get("entry") or {}).get("class_name")
+        for rel, c in cache.items()
+        if rel not in reused or rel not in wanted
+    }
+    stale_names.discard(None)
+    while stale_names:
+        children = [
+            rel for rel, c in reused.items()
+            if (c.get("entry") or {}).get("extends") in stale_names
+        ]
+        stale_names = set()
+        for rel in children:
+            stale_names.add(reused.pop(rel)["entry"]["class_name"])
+            changed.append(rel)
+
+    if workers is None:
+        workers = default_index_workers(len(changed))
+    parsed = dict(zip(changed, _analyze_files(project_path, changed, workers), strict=True))
+
+    files: dict[str, dict[str, Any]] = {}
+    entries: list[dict[str, Any] | None] = []
+    for rel in source_files:
+        if rel in reused:
+            files[rel] = reused[rel]
+        else:
+            entry, fingerprint = parsed[rel]
+            if fingerprint is None:
+                entries.append(None)
+                continue
+            size, mtime_ns, sha1 = fingerprint
+            files[rel] = {"size": size, "mtime_ns": mtime_ns, "sha1": sha1, "entry": entry}
+        entries.append(files[rel]["entry"])
+
+    _save_index_cache(project_path, files)
+    stats = {
+        "reused": len(reused),
+        "reparsed": len(changed),
+        "removed": len([rel for rel in cache if rel not in wanted]),
+    }
+    logger.info("class_index_updated", **stats)
+    return merge_class_entries(entries), stats
+
+
+def _file_sha1(path: Path) -> str | None:
+    try:
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -332,14 +420,17 @@ def extract_test_examples(
     Returns:
         List of {"path": str, "content": str} dicts (relative paths).
     """
-    project_dir = Path(project_path)
-    test_root = project_dir / "src" / "test" / "java"
-    if not test_root.exists():
-        return []
+    from src.lib.project_index import get_project_index
 
-    test_files = list(test_root.rglob("*Test.java")) + list(test_root.rglob("*Tests.java"))
+    project_dir = Path(project_path)
+    index = get_project_index(project_dir)
+    test_files = [
+        index.abspath(p) for p in index.under("src/test/java")
+        if p.endswith(("Test.java", "Tests.java"))
+    ]
     if not test_files:
         return []
+    sizes = {index.abspath(p): index.files[p][0] for p in index.under("src/test/java")}
 
     # Group by category
     categorized: dict[str, Path | None] = dict.fromkeys(_TEST_CATEGORIES)
@@ -358,7 +449,7 @@ def extract_test_examples(
 
     # Build ordered list: categories first, then remaining sorted by size descending
     ordered: list[Path] = [p for p in categorized.values() if p is not None]
-    remaining_sorted = sorted(remaining, key=lambda p: p.stat().st_size, reverse=True)
+    remaining_sorted = sorted(remaining, key=lambda p: sizes.get(p, 0), reverse=True)
     ordered.extend(remaining_sorted)
 
     examples: list[dict[str, str]] = []
@@ -24,20 +24,18 @@ def find_source_files(project_path: str) -> list[str]:
     Returns:
         List of relative paths to source files
     """
-    project_dir = Path(project_path)
+    from src.lib.project_index import get_project_index
+
     source_files = []
 
     exclude_filenames = {"package-info.java", "module-info.java"}
 
-    for main_java_dir in project_dir.glob("**/src/main/java"):
-        for source_file in main_java_dir.glob("**/*.java"):
-            if source_file.name in exclude_filenames:
-                continue
-            relative_path = str(source_file.relative_to(project_dir))
-            if "/test/" in relative_path.replace("\\", "/"):
-                continue
-            if relative_path not in source_files:
-                source_files.append(relative_path)
+    for rel in get_project_index(project_path).java_sources():
+        if rel.rsplit("/", 1)[-1] in exclude_filenames:
+            continue
+        if "/test/" in rel:
+            continue
+        source_files.append(str(Path(rel)))
 
     source_files.sort()
     logger.info("source_files_found", count=len(source_files), project_path=project_path)
@@ -130,7 +128,68 @@ def classify_source_file(relative_path: str) -> str:
     return "other"
 
 
-def find_existing_test(project_path: str, source_relative_path: str) -> str | None:
+class ExistingTestIndex:
+    """Name-keyed index of the test files of a project.
+
+    Built once from the project filesystem index, it answers
+    :func:`find_existing_test` with dictionary lookups instead of one
+    recursive ``glob`` per source file and naming convention.
+    """
+
+    def __init__(self, test_roots: list[str], test_files: list[str]):
+        self._roots = test_roots
+        self._paths = set(test_files)
+        self._by_name: dict[str, list[str]] = {}
+        for rel in sorted(test_files):
+            self._by_name.setdefault(rel.rsplit("/", 1)[-1], []).append(rel)
+
+    @classmethod
+    def from_project(cls, project_path: str) -> "ExistingTestIndex":
+        from src.lib.project_index import get_project_index
+        index = get_project_index(project_path)
+        return cls(index.test_roots(), index.java_tests())
+
+    def find(self, source_relative_path: str) -> str | None:
+        """Return the relative path of the test for ``source_relative_path``."""
+        source_path = Path(source_relative_path.replace("\\", "/"))
+        class_name = source_path.stem
+
+        parts = source_path.parts
+        try:
+            main_idx = list(parts).index("main")
+            package_parts = parts[main_idx + 2 : -1]
+        except (ValueError, IndexError):
+            package_parts = ()
+
+        test_names = [
+            f"{class_name}Test.java",
+            f"{class_name}Tests.java",
+            f"Test{class_name}.java",
+        ]
+        pkg = "/".join(package_parts)
+
+        for test_root in self._roots:
+            # Same package as the source first, then anywhere under the root
+            if package_parts:
+                for test_name in test_names:
+                    candidate = f"{test_root}/{pkg}/{test_name}"
+                    if candidate in self._paths:
+                        return str(Path(candidate))
+
+            prefix = test_root + "/"
+            for test_name in test_names:
+                for candidate in self._by_name.get(test_name, ()):
+                    if candidate.startswith(prefix):
+                        return str(Path(candidate))
+
+        return None
+
+
+def find_existing_test(
+    project_path: str,
+    source_relative_path: str,
+    index: ExistingTestIndex | None = None,
+) -> str | None:
     """Find the existing test file for a given source file, if any.
 
     Searches for common test naming conventions:
@@ -138,36 +197,12 @@ def find_existing_test(project_path: str, source_relative_path: str) -> str | No
       - FooTests.java
       - TestFoo.java
 
+    A test in the same package as the source wins over a same-named test
+    elsewhere in the same test root. Pass a prebuilt ``index`` when looking
+    up many sources of the same project.
+
     Returns the relative path to the test file, or None.
     """
-    project_dir = Path(project_path)
-    source_path = Path(source_relative_path.replace("\\", "/"))
-    class_name = source_path.stem
-
-    parts = source_path.parts
-    try:
-        main_idx = list(parts).index("main")
-        package_parts = parts[main_idx + 2 : -1]
-    except (ValueError, IndexError):
-        package_parts = ()
-
-    test_names = [
-        f"{class_name}Test.java",
-        f"{class_name}Tests.java",
-        f"Test{class_name}.java",
-    ]
-
-    for test_dir in project_dir.glob("**/src/test/java"):
-        if package_parts:
-            pkg_dir = test_dir.joinpath(*package_parts)
-            for test_name in test_names:
-                candidate = pkg_dir / test_name
-                if candidate.exists():
-                    return str(candidate.relative_to(project_dir))
-
-        for test_name in test_names:
-            matches = list(test_dir.glob(f"**/{test_name}"))
-            if matches:
-                return str(matches[0].relative_to(project_dir))
-
-    return None
+    if index is None:
+        index = ExistingTestIndex.from_project(project_path)
+    return index.find(source_relative_path)
@@ -0,0 +1,329 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Gradle build-script analysis.
+
+Reads ``build.gradle`` / ``build.gradle.kts`` (Groovy and Kotlin DSL),
+``settings.gradle(.kts)`` and the ``gradle/libs.versions.toml`` version
+catalog well enough for test generation: declared dependencies, the Java
+version, the project coordinates, and which Gradle project (``:core``,
+``:services:billing``) a file belongs to, so build commands can be scoped
+to it. This is text analysis, not a Gradle evaluation: anything computed
+at configuration time (loops, ``ext`` properties, plugins adding
+dependencies) is out of reach.
+"""
+
+import re
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+BUILD_FILE_NAMES = ("build.gradle", "build.gradle.kts")
+SETTINGS_FILE_NAMES = ("settings.gradle", "settings.gradle.kts")
+
+# Dependency configuration → Maven-style scope (what the analysis reports)
+_CONFIGURATION_SCOPES = {
+    "implementation": "compile",
+    "api": "compile",
+    "compile": "compile",
+    "compileOnly": "provided",
+    "annotationProcessor": "provided",
+    "kapt": "provided",
+    "runtimeOnly": "runtime",
+    "runtime": "runtime",
+    "testImplementation": "test",
+    "testCompileOnly": "test",
+    "testRuntimeOnly": "test",
+    "testAnnotationProcessor": "test",
+    "testCompile": "test",
+    "testRuntime": "test",
+}
+_CONFIGURATION = "|".join(sorted(_CONFIGURATION_SCOPES, key=len, reverse=True))
+
+# `//` comments, except inside URLs (repository declarations)
+_LINE_COMMENT_PATTERN = re.compile(r"(?m)(?:^|(?<=\s))//.*$")
+_BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# implementation 'g:a:v'  /  testImplementation("g:a:v")  /  api(platform("g:a:v"))
+_STRING_DEPENDENCY_PATTERN = re.compile(
+    rf"\b(?P<conf>{_CONFIGURATION})\b\s*\(?\s*(?:(?:enforcedPlatform|platform)\s*\(\s*)?"
+    r"""['"](?P<coord>[^'"\s]+:[^'"\s]+)['"]"""
+)
+# implementation group: 'g', name: 'a', version: 'v'  (Groovy map notation)
+_MAP_DEPENDENCY_PATTERN = re.compile(
+    rf"\b(?P<conf>{_CONFIGURATION})\b\s*\(?\s*group\s*[:=]\s*['\"](?P<group>[^'\"]+)['\"]\s*,"
+    r"""\s*name\s*[:=]\s*['"](?P<name>[^'"]+)['"]"""
+    r"""(?:\s*,\s*version\s*[:=]\s*['"](?P<version>[^'"]+)['"])?"""
+)
+# implementation libs.spring.boot.starter.web  /  implementation(libs.junit)
+_CATALOG_DEPENDENCY_PATTERN = re.compile(
+    rf"\b(?P<conf>{_CONFIGURATION})\b\s*\(?\s*(?:(?:enforcedPlatform|platform)\s*\(\s*)?"
+    r"libs\.(?P<alias>[\w.]+)"
+)
+
+# Most specific first: a toolchain wins over sourceCompatibility
+_JAVA_VERSION_PATTERNS = (
+    re.compile(r"languageVersion\s*(?:=|\.set\s*\()\s*JavaLanguageVersion\.of\(\s*(\d+)\s*\)"),
+    re.compile(r"jvmToolchain\s*\(\s*(\d+)\s*\)"),
+    re.compile(r"options\.release\s*(?:=|\.set\s*\()\s*(\d+)"),
+    re.compile(
+        r"sourceCompatibility\s*=\s*(?:JavaVersion\.VERSION_)?['\"]?(1[._]\d+|\d+)"
+    ),
+    re.compile(
+        r"targetCompatibility\s*=\s*(?:JavaVersion\.VERSION_)?['\"]?(1[._]\d+|\d+)"
+    ),
+)
+
+_GROUP_PATTERN = re.compile(r"""(?m)^\s*group\s*=\s*['"]([^'"]+)['"]""")
+_VERSION_PATTERN = re.compile(r"""(?m)^\s*version\s*=\s*['"]([^'"]+)['"]""")
+_ROOT_NAME_PATTERN = re.compile(r"""rootProject\.name\s*=\s*['"]([^'"]+)['"]""")
+_INCLUDE_PATTERN = re.compile(r"""\binclude\b\s*\(?((?:\s*['"][^'"]+['"]\s*,?)+)\)?""")
+_QUOTED_PATTERN = re.compile(r"""['"]([^'"]+)['"]""")
+_PROJECT_DIR_PATTERN = re.compile(
+    r"""project\(\s*['"](:[^'"]+)['"]\s*\)\.projectDir\s*=\s*"""
+    r"""(?:file\(|new\s+File\(\s*(?:settingsDir|rootDir)\s*,)\s*['"]([^'"]+)['"]"""
+)
+
+
+def _strip_comments(content: str) -> str:
+    return _LINE_COMMENT_PATTERN.sub("", _BLOCK_COMMENT_PATTERN.sub("", content))
+
+
+def find_build_file(directory: Path) -> Path | None:
+    """Return the Gradle build script of ``directory``, if it has one."""
+    for name in BUILD_FILE_NAMES:
+        candidate = directory / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def is_gradle_project(project_path: str | Path) -> bool:
+    """True for a Gradle build (a ``pom.xml`` next to it means Maven wins)."""
+    project_dir = Path(project_path)
+    if (project_dir / "pom.xml").exists():
+        return False
+    return find_build_file(project_dir) is not None or any(
+        (project_dir / name).is_file() for name in SETTINGS_FILE_NAMES
+    )
+
+
+def read_version_catalog(project_dir: Path) -> dict[str, dict[str, str]]:
+    """Library aliases of ``gradle/libs.versions.toml``.
+
+    Returns:
+        {accessor: {"groupId", "artifactId", "version"}}, where the
+        accessor is the alias as written in build scripts after ``libs.``
+        (``spring-boot-starter`` → ``spring.boot.starter``).
+    """
+    path = project_dir / "gradle" / "libs.versions.toml"
+    try:
+        catalog = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    versions = catalog.get("versions", {})
+    libraries: dict[str, dict[str, str]] = {}
+    for alias, spec in (catalog.get("libraries") or {}).items():
+        accessor = re.sub(r"[-_]", ".", alias)
+        if isinstance(spec, str):
+            parts = spec.split(":")
+            if len(parts) >= 2:
+                libraries[accessor] = {
+                    "groupId": parts[0],
+                    "artifactId": parts[1],
+                    "version": parts[2] if len(parts) > 2 else "managed",
+                }
+            continue
+        if not isinstance(spec, dict):
+            continue
+        if "module" in spec:
+            group, _, name = spec["module"].partition(":")
+        else:
+            group, name = spec.get("group", ""), spec.get("name", "")
+        version = spec.get("version", "managed")
+        if isinstance(version, dict) and "ref" in version:
+            version = versions.get(version["ref"], "managed")
+        if isinstance(version, dict):  # rich version: {strictly = ..} / {require = ..}
+            version = version.get("strictly") or version.get("require") or "managed"
+        libraries[accessor] = {"groupId": group, "artifactId": name, "version": str(version)}
+    return libraries
+
+
+def parse_gradle_build(
+    content: str, catalog: dict[str, dict[str, str]] | None = None,
+) -> dict[str, Any]:
+    """Extract dependencies, Java version and coordinates from a build script.
+
+    Args:
+        content: ``build.gradle`` or ``build.gradle.kts`` text.
+        catalog: Version catalog from :func:`read_version_catalog`, used to
+            resolve ``libs.*`` dependencies.
+
+    Returns:
+        {"java_version": str | None, "group": str | None,
+        "version": str | None, "dependencies": [{"groupId", "artifactId",
+        "version", "scope", "configuration"}]}
+    """
+    text = _strip_comments(content)
+    # (offset, dependency): the three notations are merged in declaration order
+    found: list[tuple[int, dict[str, str]]] = []
+
+    def add(m: re.Match, group: str, artifact: str, version: str | None) -> None:
+        conf = m.group("conf")
+        found.append((m.start(), {
+            "groupId": group,
+            "artifactId": artifact,
+            "version": version or "managed",
+            "scope": _CONFIGURATION_SCOPES[conf],
+            "configuration": conf,
+        }))
+
+    for m in _STRING_DEPENDENCY_PATTERN.finditer(text):
+        parts = m.group("coord").split("@", 1)[0].split(":")
+        add(m, parts[0], parts[1], parts[2] if len(parts) > 2 else None)
+    for m in _MAP_DEPENDENCY_PATTERN.finditer(text):
+        add(m, m.group("group"), m.group("name"), m.group("version"))
+    for m in _CATALOG_DEPENDENCY_PATTERN.finditer(text):
+        entry = (catalog or {}).get(m.group("alias"))
+        if entry:
+            add(m, entry["groupId"], entry["artifactId"], entry["version"])
+        else:
+            add(m, "", f"libs.{m.group('alias')}", None)
+    dependencies = [dep for _, dep in sorted(found, key=lambda item: item[0])]
+
+    java_version = None
+    for pattern in _JAVA_VERSION_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            java_version = match.group(1).replace("_", ".")
+            break
+
+    group = _GROUP_PATTERN.search(text)
+    version = _VERSION_PATTERN.search(text)
+    return {
+        "java_version": java_version,
+        "group": group.group(1) if group else None,
+        "version": version.group(1) if version else None,
+        "dependencies": dependencies,
+    }
+
+
+def parse_gradle_settings(content: str) -> dict[str, Any]:
+    """Extract the root project name and included projects from settings.
+
+    Returns:
+        {"root_name": str | None, "projects": {":a:b": "a/b"}}: each
+        included project path mapped to its directory (relative to the
+        root, ``projectDir`` overrides applied).
+    """
+    text = _strip_comments(content)
+    projects: dict[str, str] = {}
+    for m in _INCLUDE_PATTERN.finditer(text):
+        for path in _QUOTED_PATTERN.findall(m.group(1)):
+            path = ":" + path.lstrip(":")
+            projects[path] = path[1:].replace(":", "/")
+    for path, directory in _PROJECT_DIR_PATTERN.findall(text):
+        projects[path] = directory.strip("/").removeprefix("./")
+    root_name = _ROOT_NAME_PATTERN.search(text)
+    return {"root_name": root_name.group(1) if root_name else None, "projects": projects}
+
+
+def read_gradle_settings(project_dir: Path) -> dict[str, Any]:
+    """:func:`parse_gradle_settings` of the project's settings script."""
+    for name in SETTINGS_FILE_NAMES:
+        path = project_dir / name
+        if path.is_file():
+            return parse_gradle_settings(path.read_text(encoding="utf-8", errors="replace"))
+    return {"root_name": None, "projects": {}}
+
+
+def read_gradle_build(project_dir: Path) -> dict[str, Any]:
+    """Analyze a (possibly multi-project) Gradle build.
+
+    The root script and the script of every included project are parsed;
+    dependencies are merged (first declaration wins) and the Java version
+    is taken from the root, else from the first project declaring one.
+
+    Returns:
+        {"java_version", "module_info": {"groupId", "artifactId",
+        "version"}, "dependencies", "subprojects": [":a", ...]}
+    """
+    settings = read_gradle_settings(project_dir)
+    catalog = read_version_catalog(project_dir)
+
+    scripts = []
+    root_script = find_build_file(project_dir)
+    if root_script is not None:
+        scripts.append(root_script)
+    for directory in settings["projects"].values():
+        script = find_build_file(project_dir / directory)
+        if script is not None:
+            scripts.append(script)
+
+    java_version = group = version = None
+    dependencies: list[dict[str, str]] = []
+    seen: set[tuple[str, str, str]] = set()
+    for script in scripts:
+        try:
+            parsed = parse_gradle_build(script.read_text(encoding="utf-8", errors="replace"), catalog)
+        except OSError as e:
+            logger.warning("gradle_build_unreadable", path=str(script), error=str(e))
+            continue
+        java_version = java_version or parsed["java_version"]
+        group = group or parsed["group"]
+        version = version or parsed["version"]
+        for dep in parsed["dependencies"]:
+            key = (dep["groupId"], dep["artifactId"], dep["scope"])
+            if key not in seen:
+                seen.add(key)
+                dependencies.append(dep)
+
+    return {
+        "java_version": java_version,
+        "module_info": {
+            "groupId": group or "",
+            "artifactId": settings["root_name"] or project_dir.resolve().name,
+            "version": version or "",
+        },
+        "dependencies": dependencies,
+        "subprojects": sorted(settings["projects"]),
+    }
+
+
+def gradle_project_path(project_path: str | Path, relative_path: str) -> str:
+    """Gradle project owning a file: ``:core``, ``:services:billing``, or ``""`` for the root.
+
+    The nearest ancestor directory that is an included project (per
+    settings) or has its own build script wins.
+
+    Args:
+        project_path: Root of the Gradle build.
+        relative_path: File path relative to ``project_path``.
+    """
+    project_dir = Path(project_path)
+    dirs_to_projects = {d: p for p, d in read_gradle_settings(project_dir)["projects"].items()}
+    parts = relative_path.replace("\\", "/").split("/")[:-1]
+    while parts:
+        directory = "/".join(parts)
+        if directory in dirs_to_projects:
+            return dirs_to_projects[directory]
+        if find_build_file(project_dir / directory) is not None:
+            return ":" + directory.replace("/", ":")
+        parts.pop()
+    return ""
+
+
+__all__ = [
+    "BUILD_FILE_NAMES",
+    "SETTINGS_FILE_NAMES",
+    "find_build_file",
+    "gradle_project_path",
+    "is_gradle_project",
+    "parse_gradle_build",
+    "parse_gradle_settings",
+    "read_gradle_build",
+    "read_gradle_settings",
+    "read_version_catalog",
+]
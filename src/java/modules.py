@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Build modules of a Java project.
+
+A reactor (Maven ``<modules>``) or multi-project (Gradle ``include``) build
+is analyzed module by module. Modules come from the build files; any
+directory holding a ``src/main/java`` or ``src/test/java`` root that no
+build file declares is a module too, so a partially declared layout still
+has every source tree accounted for. Every module is identified by its
+project-relative directory (``""`` for the root, ``/`` separated).
+"""
+
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from src.lib.logging import get_logger
+from src.lib.project_index import ProjectIndex
+
+logger = get_logger(__name__)
+
+_ROOT_SEGMENTS = ("src/main/java", "src/test/java")
+
+
+def local_name(tag: str) -> str:
+    """XML tag without its namespace (``{http://maven...}module`` -> ``module``)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _pom_child_text(root: ET.Element, name: str) -> str | None:
+    for child in root:
+        if local_name(child.tag) == name and child.text:
+            return child.text.strip()
+    return None
+
+
+def _normalize(rel: str) -> str:
+    parts: list[str] = []
+    for part in rel.replace("\\", "/").split("/"):
+        if part in ("", "."):
+            continue
+        if part == "..":
+            if parts:
+                parts.pop()
+            continue
+        parts.append(part)
+    return "/".join(parts)
+
+
+def _maven_modules(project_dir: Path) -> list[dict[str, str]]:
+    """Walk ``<modules>`` (profiles included) from the root pom, depth first."""
+    modules: list[dict[str, str]] = []
+    seen: set[str] = set()
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        if rel in seen:
+            continue
+        seen.add(rel)
+        pom = project_dir / rel / "pom.xml" if rel else project_dir / "pom.xml"
+        try:
+            root = ET.parse(pom).getroot()
+        except (OSError, ET.ParseError) as e:
+            logger.warning("maven_module_unreadable", path=str(pom), error=str(e))
+            continue
+        modules.append({
+            "path": rel,
+            "name": _pom_child_text(root, "artifactId") or (rel.rsplit("/", 1)[-1] or project_dir.resolve().name),
+            "build_file": f"{rel}/pom.xml" if rel else "pom.xml",
+        })
+        children = [
+            el.text.strip() for el in root.iter()
+            if local_name(el.tag) == "module" and el.text and el.text.strip()
+        ]
+        for child in reversed(children):
+            # <module> names a directory, or a pom file inside one
+            if child.endswith(".xml"):
+                child = child.rsplit("/", 1)[0] if "/" in child else ""
+            stack.append(_normalize(f"{rel}/{child}" if rel else child))
+    return modules
+
+
+def _gradle_modules(project_dir: Path) -> list[dict[str, str]]:
+    from src.java.gradle import find_build_file, read_gradle_settings
+
+    settings = read_gradle_settings(project_dir)
+    root_name = settings["root_name"] or project_dir.resolve().name
+    modules = []
+    for name, rel in [(root_name, ""), *sorted(settings["projects"].items())]:
+        build_file = find_build_file(project_dir / rel if rel else project_dir)
+        modules.append({
+            "path": _normalize(rel),
+            "name": name,
+            "build_file": (
+                (f"{_normalize(rel)}/{build_file.name}" if rel else build_file.name)
+                if build_file else ""
+            ),
+        })
+    return modules
+
+
+def discover_modules(project_dir: Path, index: ProjectIndex) -> list[dict[str, str]]:
+    """Every module of the build, sorted by path (the root first).
+
+    Args:
+        project_dir: Project root.
+        index: Filesystem index of the project (for undeclared source trees).
+
+    Returns:
+        ``[{"path", "name", "build_file"}]``; ``build_file`` is ``""`` for a
+        module found only through its source tree.
+    """
+    from src.java.gradle import is_gradle_project
+
+    if (project_dir / "pom.xml").exists():
+        declared = _maven_modules(project_dir)
+    elif is_gradle_project(project_dir):
+        declared = _gradle_modules(project_dir)
+    else:
+        declared = []
+
+    modules = {m["path"]: m for m in declared}
+    modules.setdefault("", {"path": "", "name": project_dir.resolve().name, "build_file": ""})
+    for root in index.source_roots() + index.test_roots():
+        for segment in _ROOT_SEGMENTS:
+            if root == segment or root.endswith("/" + segment):
+                owner = root[: -len(segment)].rstrip("/")
+                if owner not in modules:
+                    modules[owner] = {
+                        "path": owner, "name": owner.rsplit("/", 1)[-1], "build_file": "",
+                    }
+    return [modules[path] for path in sorted(modules)]
+
+
+def module_for_path(module_paths: Iterable[str], relative_path: str) -> str:
+    """Path of the innermost module containing ``relative_path`` (``""`` for the root)."""
+    paths = set(module_paths)
+    current = relative_path.replace("\\", "/").strip("/")
+    while current:
+        if current in paths:
+            return current
+        current = current.rsplit("/", 1)[0] if "/" in current else ""
+    return ""
+
+
+def find_module(modules: list[dict[str, Any]], relative_path: str) -> dict[str, Any] | None:
+    """The module entry (as stored by analyze) containing ``relative_path``."""
+    by_path = {m.get("path", ""): m for m in modules}
+    return by_path.get(module_for_path(by_path, relative_path))
+
+
+__all__ = ["discover_modules", "find_module", "local_name", "module_for_path"]
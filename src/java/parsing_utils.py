@@ -3,11 +3,23 @@
 
 No dependencies on other src.* modules.
 Used by src.java.class_analyzer and src.test_generation.generate_unit.
+
+Every extractor runs on a *masked* copy of the source: one precompiled
+pass blanks out comments and the contents of string, char and text-block
+literals, keeping every newline and character offset. Regexes therefore
+never match code that is commented out or quoted, and any span found in
+the masked text can be sliced from the original source unchanged.
+
+:func:`parse_java_source` runs all extractors once per source text and
+is cached, so the class index builder (``analyze_java_class``) and the
+generator (``_analyze_class``) share one parse of a file.
 """
 
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 _PRIMITIVE_TYPES = {
@@ -19,35 +31,69 @@ _PRIMITIVE_TYPES = {
 }
 
 
+# Comments and literals, in the order they must be tried at a position
+_MASK_PATTERN = re.compile(
+    r"//[^\n]*"
+    r"|/\*.*?(?:\*/|\Z)"
+    r'|"""(?:\\.|[^\\])*?(?:"""|\Z)'
+    r'|"(?:\\.|[^"\\\n])*"?'
+    r"|'(?:\\.|[^'\\\n])*'?",
+    re.DOTALL,
+)
+_NOT_NEWLINE = re.compile(r"[^\n]")
+
+
+def _blank(text: str) -> str:
+    if "\n" not in text:
+        return " " * len(text)
+    return _NOT_NEWLINE.sub(" ", text)
+
+
+def _mask_lexeme(m: re.Match[str]) -> str:
+    text = m.group()
+    if text[0] == "/":
+        return _blank(text)
+    # Keep the delimiters so the literal still reads as an expression
+    quote = '"""' if text.startswith('"""') else text[0]
+    q = len(quote)
+    if len(text) >= 2 * q and text.endswith(quote):
+        return quote + _blank(text[q:-q]) + quote
+    return quote + _blank(text[q:])
+
+
+@lru_cache(maxsize=64)
+def mask_java_source(source_code: str) -> str:
+    """Blank out comments and literal contents, preserving offsets.
+
+    The result has the same length and line structure as ``source_code``.
+    """
+    return _MASK_PATTERN.sub(_mask_lexeme, source_code)
+
+
 def _is_primitive_type(type_name: str) -> bool:
     clean = type_name.replace("final", "").strip().split("<")[0].strip()
     return clean in _PRIMITIVE_TYPES
 
 
-def _extract_balanced_parens(text: str, start_pos: int) -> str:
-    """Extract content between balanced parentheses starting at start_pos.
+def _balanced_parens_end(text: str, open_pos: int) -> int:
+    """Return the index of the parenthesis closing the one at ``open_pos``.
 
-    Handles nested parentheses correctly, unlike a simple regex [^)]*.
-    For example: @PathVariable("ownerId") int ownerId -> correctly captures full params.
+    Returns ``len(text)`` when it is never closed.
     """
     depth = 0
-    content: list[str] = []
-    i = start_pos
-    while i < len(text):
+    for i in range(open_pos, len(text)):
         c = text[i]
         if c == "(":
-            if depth > 0:
-                content.append(c)
             depth += 1
         elif c == ")":
             depth -= 1
             if depth == 0:
-                return "".join(content)
-            content.append(c)
-        elif depth > 0:
-            content.append(c)
-        i += 1
-    return "".join(content)
+                return i
+    return len(text)
+
+
+_PARAM_ANNOTATION_PATTERN = re.compile(r"@\w+(?:\([^)]*\))?\s*")
+_FINAL_MODIFIER_PATTERN = re.compile(r"\bfinal\s+")
 
 
 def _parse_parameters(params_str: str) -> list[dict[str, str]]:
@@ -73,41 +119,70 @@ def _parse_parameters(params_str: str) -> list[dict[str, str]]:
     result = []
     for param in params:
         # Handle annotations like @Valid, @PathVariable, etc.
-        param = re.sub(r"@\w+(?:\([^)]*\))?\s*", "", param).strip()
+        param = _PARAM_ANNOTATION_PATTERN.sub("", param).strip()
         # Remove 'final' modifier from parameter type
-        param = re.sub(r"\bfinal\s+", "", param).strip()
+        param = _FINAL_MODIFIER_PATTERN.sub("", param).strip()
         parts = param.rsplit(None, 1)
         if len(parts) == 2:
             result.append({"type": parts[0], "name": parts[1]})
     return result
 
 
-def _extract_public_signatures(source_code: str) -> str:
+_PUBLIC_SIGNATURE_PATTERN = re.compile(
+    r"public\s+(?:static\s+)?(?:final\s+)?(?:synchronized\s+)?"
+    r"(\w[\w<>\[\], ]*?)\s+(\w+)\s*\(",
+    re.MULTILINE,
+)
+_THROWS_PATTERN = re.compile(r"\s+throws\s+([\w, ]+)")
+_NOT_METHOD_NAMES = frozenset({"if", "while", "for", "switch", "class", "new", "return"})
+
+
+def _extract_public_signatures(source_code: str, masked: str | None = None) -> str:
     """Extract public method signatures with full parameter types from Java source."""
-    pattern = re.compile(
-        r"public\s+(?:static\s+)?(?:final\s+)?(?:synchronized\s+)?"
-        r"(\w[\w<>\[\], ]*?)\s+(\w+)\s*\(([^)]*)\)"
-        r"(?:\s+throws\s+([\w, ]+))?",
-        re.MULTILINE,
-    )
+    if masked is None:
+        masked = mask_java_source(source_code)
     sigs = []
-    for m in pattern.finditer(source_code):
+    for m in _PUBLIC_SIGNATURE_PATTERN.finditer(masked):
         ret = m.group(1).strip()
         name = m.group(2)
-        if name in {"if", "while", "for", "switch", "class", "new", "return"}:
+        if name in _NOT_METHOD_NAMES:
+            continue
+        close = _balanced_parens_end(masked, m.end() - 1)
+        if close == len(masked):
             continue
-        params = m.group(3).strip()
-        throws = f" throws {m.group(4).strip()}" if m.group(4) else ""
+        # Parameters from the original text: annotation values are literals
+        params = source_code[m.end():close].strip()
+        throws_m = _THROWS_PATTERN.match(masked, close + 1)
+        throws = f" throws {throws_m.group(1).strip()}" if throws_m else ""
         sigs.append(f"  - `{ret} {name}({params}){throws}`")
     return "\n".join(sigs[:20])
 
 
-def _analyze_jpa_fields(source_code: str) -> dict[str, Any]:
+_ID_BLOCK_PATTERN = re.compile(
+    r'@Id\s*'
+    r'(?:@GeneratedValue\s*(?:\(\s*(?:strategy\s*=\s*)?(?:GenerationType\.)?(\w+)\s*\))?\s*)?'
+    r'(?:@\w+(?:\([^)]*\))?\s*)*'
+    r'(?:private|protected)?\s*'
+    r'(\w+)\s+'
+    r'(\w+)\s*;',
+    re.MULTILINE | re.DOTALL,
+)
+# Anchored on the type: a leading optional-modifier-plus-\s* prefix would be
+# retried at every blank of the masked text.
+_DATE_FIELD_PATTERN = re.compile(
+    r'\b(Date|LocalDate|LocalDateTime|Instant|ZonedDateTime)\s+(\w+)\s*;',
+    re.MULTILINE,
+)
+
+
+def _analyze_jpa_fields(source_code: str, masked: str | None = None) -> dict[str, Any]:
     """Analyze JPA entity fields to detect @GeneratedValue, @Id, and field types.
 
     This information is critical for generating correct tests that don't call
     setId() on @GeneratedValue fields.
     """
+    if masked is None:
+        masked = mask_java_source(source_code)
     jpa_info: dict[str, Any] = {
         "id_field": None,
         "id_type": None,
@@ -116,34 +191,306 @@ def _analyze_jpa_fields(source_code: str) -> dict[str, Any]:
         "date_fields": [],
     }
 
-    id_block_pattern = re.compile(
-        r'@Id\s*'
-        r'(?:@GeneratedValue\s*(?:\(\s*(?:strategy\s*=\s*)?(?:GenerationType\.)?(\w+)\s*\))?\s*)?'
-        r'(?:@\w+(?:\([^)]*\))?\s*)*'
-        r'(?:private|protected)?\s*'
-        r'(\w+)\s+'
-        r'(\w+)\s*;',
-        re.MULTILINE | re.DOTALL,
-    )
-
-    id_match = id_block_pattern.search(source_code)
+    id_match = _ID_BLOCK_PATTERN.search(masked) if "@Id" in masked else None
     if id_match:
         strategy = id_match.group(1)
         id_type = id_match.group(2)
         id_name = id_match.group(3)
         jpa_info["id_field"] = id_name
         jpa_info["id_type"] = id_type
-        jpa_info["has_generated_value"] = strategy is not None or "@GeneratedValue" in source_code
+        jpa_info["has_generated_value"] = strategy is not None or "@GeneratedValue" in masked
         jpa_info["generated_value_strategy"] = strategy
-    elif "@GeneratedValue" in source_code:
+    elif "@GeneratedValue" in masked:
         jpa_info["has_generated_value"] = True
 
-    date_pat = re.compile(
-        r'(?:private|protected)?\s*'
-        r'(Date|LocalDate|LocalDateTime|Instant|ZonedDateTime)\s+(\w+)\s*;',
-        re.MULTILINE,
-    )
-    for dm in date_pat.finditer(source_code):
-        jpa_info["date_fields"].append({"name": dm.group(2), "type": dm.group(1)})
+    if "Date" in masked or "Instant" in masked:
+        for dm in _DATE_FIELD_PATTERN.finditer(masked):
+            jpa_info["date_fields"].append({"name": dm.group(2), "type": dm.group(1)})
 
     return jpa_info
+
+
+# ---------------------------------------------------------------------------
+# extends / implements extraction
+# ---------------------------------------------------------------------------
+
+_CLASS_DECL_PATTERN = re.compile(
+    r"(?:public\s+)?(?:abstract\s+)?(?:final\s+)?class\s+\w+(?:<[^>]+>)?\s*"
+    r"(?:extends\s+([\w<>, ]+?)\s*)?"
+    r"(?:implements\s+([\w<>, ]+?)\s*)?"
+    r"\{",
+    re.MULTILINE,
+)
+
+
+def _extract_extends_implements(
+    source_code: str, masked: str | None = None
+) -> tuple[str | None, list[str]]:
+    """Extract extends and implements from a Java class declaration.
+
+    Returns:
+        (extends_simple_name | None, [implements_simple_name, ...])
+    """
+    if masked is None:
+        masked = mask_java_source(source_code)
+    m = _CLASS_DECL_PATTERN.search(masked)
+    if not m:
+        return None, []
+
+    extends_raw = m.group(1)
+    implements_raw = m.group(2)
+
+    extends_name: str | None = None
+    if extends_raw:
+        # Strip generics: BaseClass<T> → BaseClass
+        extends_name = extends_raw.strip().split("<")[0].strip()
+
+    implements_list: list[str] = []
+    if implements_raw:
+        for iface in implements_raw.split(","):
+            simple = iface.strip().split("<")[0].strip()
+            if simple:
+                implements_list.append(simple)
+
+    return extends_name, implements_list
+
+
+# ---------------------------------------------------------------------------
+# richer field extraction (with annotations)
+# ---------------------------------------------------------------------------
+
+_FIELD_ANNOTATION_PATTERN = re.compile(r"@(\w+)(?:\([^)]*\))?")
+_FIELD_DECL_PATTERN = re.compile(
+    r"(?:private|protected|public)?\s*(?:static\s+)?(?:final\s+)?"
+    r"([\w<>\[\]]+(?:\s*<[^;]*>)?)\s+(\w+)\s*[;=]"
+)
+_NOT_FIELD_NAMES = frozenset({"if", "while", "for", "return", "class", "new", "import", "package"})
+
+
+def _extract_field_details(source_code: str, masked: str | None = None) -> list[dict[str, Any]]:
+    """Extract class-level fields with their annotations and types.
+
+    Handles patterns like:
+        @Id
+        @GeneratedValue
+        private Long id;
+
+        @Autowired
+        private UserRepository userRepository;
+
+        private final String name;
+    """
+    if masked is None:
+        masked = mask_java_source(source_code)
+    results: list[dict[str, Any]] = []
+    # Walk line by line collecting annotation blocks + field declaration.
+    # Comments are blank in the masked text, so they never clear the block.
+    pending_annotations: list[str] = []
+    for line in masked.splitlines():
+        stripped = line.strip()
+        ann_match = _FIELD_ANNOTATION_PATTERN.match(stripped)
+        if ann_match:
+            pending_annotations.append(ann_match.group(1))
+            continue
+        # Field declaration: [modifiers] Type name;
+        field_match = _FIELD_DECL_PATTERN.match(stripped)
+        if field_match:
+            ftype = field_match.group(1).strip()
+            fname = field_match.group(2).strip()
+            # Skip keywords that look like field declarations
+            if fname not in _NOT_FIELD_NAMES:
+                results.append({
+                    "name": fname,
+                    "type": ftype,
+                    "annotations": list(pending_annotations),
+                })
+            pending_annotations = []
+            continue
+        # Any other code line clears the pending annotation list
+        if stripped:
+            pending_annotations = []
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# One parse per compilation unit
+# ---------------------------------------------------------------------------
+
+_PACKAGE_PATTERN = re.compile(r"package\s+([\w.]+);")
+_IMPORT_PATTERN = re.compile(r"import\s+([\w.]+(?:\.\*)?);", re.MULTILINE)
+_RECORD_PATTERN = re.compile(r"(?:public\s+)?record\s+(\w+)\s*\(([^)]*)\)")
+_CLASS_NAME_PATTERN = re.compile(r"(?:public\s+)?(?:abstract\s+)?class\s+(\w+)")
+_ANNOTATION_PATTERN = re.compile(r"@(\w+)(?:\([^)]*\))?")
+_METHOD_PATTERN = re.compile(
+    r"(public|private|protected)\s+"
+    r"(?:static\s+)?(?:final\s+)?(?:synchronized\s+)?"
+    r"(\w+(?:<[^>]+>)?)\s+"
+    r"(\w+)\s*\(",
+    re.MULTILINE,
+)
+_INJECTED_FIELD_PATTERN = re.compile(
+    r"@(?:Autowired|Inject|Resource)\s+(?:private\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)",
+    re.MULTILINE,
+)
+CLASS_LEVEL_ANNOTATIONS = frozenset({
+    "Controller", "RestController", "Service", "Repository", "Component",
+    "RequestMapping", "Timed", "Transactional", "Configuration", "Bean",
+    "Slf4j", "Log4j2", "Data", "Entity", "Table", "Document",
+})
+
+
+@dataclass(frozen=True, slots=True)
+class JavaSource:
+    """Everything the extractors found in one Java source text.
+
+    Immutable and shared between callers (see :func:`parse_java_source`);
+    the ``*_dicts`` helpers return fresh structures the caller may mutate.
+
+    Attributes:
+        package: Package name, or ""
+        imports: Imported names, in source order
+        class_name: Name of the first class or record declared
+        is_record: Whether the type is a Java record
+        annotations: Class-level annotations from :data:`CLASS_LEVEL_ANNOTATIONS`
+        extends: Simple name of the superclass, if any
+        implements: Simple names of implemented interfaces
+        methods: (visibility, return_type, name, parameters) of the public
+            and protected methods, constructors excluded
+        dependencies: (type, name) of record components, constructor
+            parameters and injected fields
+        fields: (name, type, annotations) of field declarations
+        jpa_info: Result of :func:`_analyze_jpa_fields` as sorted items
+        public_signatures: Markdown list of public signatures
+    """
+
+    package: str = ""
+    imports: tuple[str, ...] = ()
+    class_name: str = ""
+    is_record: bool = False
+    annotations: tuple[str, ...] = ()
+    extends: str | None = None
+    implements: tuple[str, ...] = ()
+    methods: tuple[tuple[str, str, str, str], ...] = ()
+    dependencies: tuple[tuple[str, str], ...] = ()
+    fields: tuple[tuple[str, str, tuple[str, ...]], ...] = ()
+    jpa_info: tuple[tuple[str, Any], ...] = ()
+    public_signatures: str = ""
+
+    def method_dicts(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": name,
+                "return_type": return_type,
+                "parameters": params,
+                "parsed_params": _parse_parameters(params),
+                "is_void": return_type == "void",
+                "visibility": visibility,
+            }
+            for visibility, return_type, name, params in self.methods
+        ]
+
+    def dependency_dicts(self) -> list[dict[str, str]]:
+        return [{"type": t, "name": n} for t, n in self.dependencies]
+
+    def field_dicts(self) -> list[dict[str, Any]]:
+        return [
+            {"name": n, "type": t, "annotations": list(anns)}
+            for n, t, anns in self.fields
+        ]
+
+    def jpa_dict(self) -> dict[str, Any]:
+        info = dict(self.jpa_info)
+        info["date_fields"] = [{"name": n, "type": t} for n, t in info.get("date_fields", ())]
+        return info
+
+
+def _add_dependency(deps: list[tuple[str, str]], dep_type: str, name: str) -> None:
+    if not any(n == name for _, n in deps):
+        deps.append((dep_type, name))
+
+
+@lru_cache(maxsize=64)
+def parse_java_source(source_code: str) -> JavaSource:
+    """Run every extractor over ``source_code`` once.
+
+    Results are cached by source text, so analyzing the same file for the
+    class index and for generation in one process parses it only once.
+    """
+    masked = mask_java_source(source_code)
+
+    pkg_m = _PACKAGE_PATTERN.search(masked)
+    package = pkg_m.group(1) if pkg_m else ""
+    imports = tuple(m.group(1) for m in _IMPORT_PATTERN.finditer(masked))
+
+    deps: list[tuple[str, str]] = []
+
+    record_m = _RECORD_PATTERN.search(masked)
+    if record_m:
+        for param in _parse_parameters(record_m.group(2)):
+            if not _is_primitive_type(param["type"]):
+                deps.append((param["type"], param["name"]))
+        return JavaSource(
+            package=package,
+            imports=imports,
+            class_name=record_m.group(1),
+            is_record=True,
+            dependencies=tuple(deps),
+        )
+
+    cls_m = _CLASS_NAME_PATTERN.search(masked)
+    class_name = cls_m.group(1) if cls_m else ""
+
+    extends_name, implements_list = _extract_extends_implements(source_code, masked)
+
+    annotations: tuple[str, ...] = ()
+    if cls_m:
+        before = masked[:cls_m.start()]
+        annotations = tuple(
+            a for a in _ANNOTATION_PATTERN.findall(before) if a in CLASS_LEVEL_ANNOTATIONS
+        )
+
+    methods = []
+    for m in _METHOD_PATTERN.finditer(masked):
+        visibility, return_type, name = m.group(1), m.group(2), m.group(3)
+        # Constructors are not methods; private methods are not tested directly
+        if name == class_name or visibility == "private":
+            continue
+        open_pos = m.end() - 1
+        params = source_code[open_pos + 1:_balanced_parens_end(masked, open_pos)]
+        methods.append((visibility, return_type, name, params))
+
+    # Constructor injection
+    if class_name:
+        ctor_pattern = re.compile(
+            rf"(?:public\s+)?{re.escape(class_name)}\s*\(([^)]*)\)",
+            re.MULTILINE | re.DOTALL,
+        )
+        for m in ctor_pattern.finditer(masked):
+            for param in _parse_parameters(m.group(1)):
+                if not _is_primitive_type(param["type"]):
+                    _add_dependency(deps, param["type"], param["name"])
+
+    # Field injection (@Autowired, @Inject, @Resource)
+    for m in _INJECTED_FIELD_PATTERN.finditer(masked):
+        _add_dependency(deps, m.group(1), m.group(2))
+
+    jpa = _analyze_jpa_fields(source_code, masked)
+    jpa["date_fields"] = tuple((d["name"], d["type"]) for d in jpa["date_fields"])
+
+    return JavaSource(
+        package=package,
+        imports=imports,
+        class_name=class_name,
+        annotations=annotations,
+        extends=extends_name,
+        implements=tuple(implements_list),
+        methods=tuple(methods),
+        dependencies=tuple(deps),
+        fields=tuple(
+            (f["name"], f["type"], tuple(f["annotations"]))
+            for f in _extract_field_details(source_code, masked)
+        ),
+        jpa_info=tuple(sorted(jpa.items())),
+        public_signatures=_extract_public_signatures(source_code, masked),
+    )
@@ -0,0 +1,271 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Structured store for the project-level analysis data.
+
+``analyze`` used to embed everything it found (class index, source file
+details, conventions, test examples, build commands) as one JSON block at
+the end of ``.testboost/analysis.md``. Every later command re-read the
+whole markdown file, regex-searched it for the block and ``json.loads``-ed
+all of it, even to look up a single class.
+
+The data now lives in ``.testboost/analysis.db``, a SQLite file with:
+
+- ``meta``: one row per top-level field (JSON-encoded value);
+- ``classes``: one row per class index key, so a single entry can be read
+  without loading the rest of the index.
+
+``analysis.md`` stays as the human-readable summary. A database is always
+written to a temporary file and renamed into place, so readers never see a
+half-written analysis.
+
+Commands that only need a handful of class entries (``generate`` looks up
+the class under test, its parent and its direct dependencies) open a
+:class:`ClassIndexView` instead of materialising the whole index.
+"""
+
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+STORE_FILENAME = "analysis.db"
+SCHEMA_VERSION = 1
+
+# Top-level key stored row-by-row in the classes table, not in meta
+_CLASS_INDEX_KEY = "class_index"
+# meta marker: the data had a class_index (possibly empty)
+_HAS_CLASS_INDEX = "__class_index__"
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE classes (name TEXT PRIMARY KEY, entry TEXT NOT NULL);
+"""
+
+
+def get_store_path(project_path: str) -> Path:
+    """Return the path of ``.testboost/analysis.db``."""
+    return Path(project_path) / ".testboost" / STORE_FILENAME
+
+
+def write_analysis_data(project_path: str, data: dict[str, Any]) -> Path:
+    """Replace the stored analysis data with ``data``.
+
+    Args:
+        project_path: Path to the project root.
+        data: Analysis data dict; ``class_index`` (if present) is stored
+            one row per class.
+
+    Returns:
+        Path to the database file.
+    """
+    path = get_store_path(project_path)
+    tmp = path.with_name(STORE_FILENAME + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    (key, json.dumps(value, default=str))
+                    for key, value in data.items()
+                    if key != _CLASS_INDEX_KEY
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO classes (name, entry) VALUES (?, ?)",
+                [
+                    (name, json.dumps(entry, default=str))
+                    for name, entry in (data.get(_CLASS_INDEX_KEY) or {}).items()
+                ],
+            )
+            if _CLASS_INDEX_KEY in data:
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    (_HAS_CLASS_INDEX, "true"),
+                )
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+def _connect_readonly(path: Path) -> sqlite3.Connection | None:
+    if not path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.Error as e:
+        logger.warning("analysis_store_unreadable", path=str(path), error=str(e))
+        return None
+    if version != SCHEMA_VERSION:
+        conn.close()
+        logger.warning("analysis_store_version_mismatch", path=str(path), version=version)
+        return None
+    return conn
+
+
+def read_analysis_data(project_path: str, include_class_index: bool = True) -> dict[str, Any] | None:
+    """Load the stored analysis data.
+
+    Args:
+        project_path: Path to the project root.
+        include_class_index: Also load every class entry into
+            ``data["class_index"]``. Pass False when the caller reads
+            classes on demand (see :func:`read_class_entry`).
+
+    Returns:
+        The data dict, or None if no readable store exists.
+    """
+    conn = _connect_readonly(get_store_path(project_path))
+    if conn is None:
+        return None
+    try:
+        data: dict[str, Any] = {}
+        has_class_index = False
+        for key, value in conn.execute("SELECT key, value FROM meta"):
+            if key == _HAS_CLASS_INDEX:
+                has_class_index = True
+                continue
+            data[key] = json.loads(value)
+        if include_class_index and has_class_index:
+            data[_CLASS_INDEX_KEY] = {
+                name: json.loads(entry)
+                for name, entry in conn.execute("SELECT name, entry FROM classes ORDER BY rowid")
+            }
+        return data
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning("analysis_store_read_failed", error=str(e))
+        return None
+    finally:
+        conn.close()
+
+
+class ClassIndexView(Mapping[str, dict[str, Any]]):
+    """Read-only mapping over the ``classes`` table of an analysis store.
+
+    Entries are decoded on first access and kept in a small LRU cache, so
+    memory use depends on how many classes are looked up, not on the size
+    of the project. Iteration order matches the order ``analyze`` wrote the
+    index in.
+
+    Args:
+        conn: Open read-only connection to the store.
+        cache_size: Maximum number of decoded entries kept in memory.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, cache_size: int = 256):
+        self._conn = conn
+        self._cache: OrderedDict[str, dict[str, Any] | None] = OrderedDict()
+        self._cache_size = max(1, cache_size)
+        self._len: int | None = None
+
+    def _load(self, name: str) -> dict[str, Any] | None:
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+        try:
+            row = self._conn.execute(
+                "SELECT entry FROM classes WHERE name = ?", (name,)
+            ).fetchone()
+            entry = json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("analysis_store_read_failed", error=str(e), name=name)
+            entry = None
+        # Misses are cached too: unresolved dependency types (JDK, libraries)
+        # are looked up over and over during a generation run.
+        self._cache[name] = entry
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        if not isinstance(name, str):
+            raise KeyError(name)
+        entry = self._load(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._load(name) is not None
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = self._conn.execute("SELECT COUNT(*) FROM classes").fetchone()[0]
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        for (name,) in self._conn.execute("SELECT name FROM classes ORDER BY rowid"):
+            yield name
+
+    def close(self) -> None:
+        """Close the underlying connection and drop cached entries."""
+        self._cache.clear()
+        self._conn.close()
+
+    def __enter__(self) -> "ClassIndexView":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def open_class_index(project_path: str, cache_size: int = 256) -> ClassIndexView | None:
+    """Open the stored class index for on-demand lookups.
+
+    Args:
+        project_path: Path to the project root.
+        cache_size: Maximum number of decoded entries kept in memory.
+
+    Returns:
+        A :class:`ClassIndexView` (close it when done), or None if there is no
+        readable store or the stored analysis has no class index.
+    """
+    conn = _connect_readonly(get_store_path(project_path))
+    if conn is None:
+        return None
+    try:
+        marker = conn.execute(
+            "SELECT 1 FROM meta WHERE key = ?", (_HAS_CLASS_INDEX,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("analysis_store_read_failed", error=str(e))
+        marker = None
+    if marker is None:
+        conn.close()
+        return None
+    return ClassIndexView(conn, cache_size=cache_size)
+
+
+def read_class_entry(project_path: str, name: str) -> dict[str, Any] | None:
+    """Return one class index entry without loading the others."""
+    conn = _connect_readonly(get_store_path(project_path))
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT entry FROM classes WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+    except (sqlite3.Error, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+__all__ = [
+    "ClassIndexView",
+    "get_store_path",
+    "open_class_index",
+    "read_analysis_data",
+    "read_class_entry",
+    "write_analysis_data",
+]
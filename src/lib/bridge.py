@@ -11,6 +11,10 @@ In production: these just re-export the real functions.
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.test_generation.generate_unit import GenerationResult
 
 # Add TestBoost root to path
 TESTBOOST_ROOT = Path(__file__).parent.parent.parent
@@ -81,15 +85,31 @@ def classify_file(relative_path: str, project_path: str = "") -> str:
     return plugin.classify_source_file(relative_path)
 
 
-def find_test_for_source(project_path: str, source_relative_path: str) -> str | None:
-    """Find existing test file for a source file, if any."""
+def find_test_for_source(
+    project_path: str, source_relative_path: str, index: Any = None,
+) -> str | None:
+    """Find existing test file for a source file, if any.
+
+    ``index`` is an optional prebuilt :func:`build_test_lookup` result.
+    """
     from src.java.discovery import find_existing_test
-    return find_existing_test(project_path, source_relative_path)
+    return find_existing_test(project_path, source_relative_path, index=index)
+
+
+def build_test_lookup(project_path: str) -> Any:
+    """Build the test-name index used to batch find_test_for_source calls."""
+    from src.java.discovery import ExistingTestIndex
+    return ExistingTestIndex.from_project(project_path)
 
 
-async def generate_adaptive_tests(project_path: str, source_file: str, **kwargs) -> str:
+async def generate_adaptive_tests(
+    project_path: str, source_file: str, **kwargs
+) -> "GenerationResult":
     """Generate tests for a single source file using LLM.
 
+    Returns a GenerationResult object rather than a JSON string: the result
+    stays in-process, so nothing is serialized per file.
+
     CRITICAL: If the LLM is not reachable, this function MUST raise an exception.
     It should NEVER silently fallback or return empty results without error.
     """
@@ -115,14 +135,30 @@ async def fix_test_runtime_errors(test_code: str, test_errors: str, class_name:
     return await _fix(test_code, test_errors, class_name)
 
 
-def build_class_index(project_path: str, source_files: list[str]) -> dict[str, dict]:
+def build_class_index(
+    project_path: str, source_files: list[str], workers: int | None = None,
+) -> dict[str, dict]:
     """Build the full class index for all source files.
 
     Delegates to the Java class analyzer for backward compatibility.
     For the Python plugin, use plugin.build_generation_context() directly.
     """
     from src.java.class_analyzer import build_class_index as _build
-    return _build(project_path, source_files)
+    return _build(project_path, source_files, workers=workers)
+
+
+def update_class_index(
+    project_path: str,
+    source_files: list[str],
+    workers: int | None = None,
+    full: bool = False,
+) -> tuple[dict[str, dict], dict[str, int]]:
+    """Build the class index incrementally (reparse only changed files).
+
+    Returns (class index, {"reused", "reparsed", "removed"} counts).
+    """
+    from src.java.class_analyzer import update_class_index as _update
+    return _update(project_path, source_files, workers=workers, full=full)
 
 
 def extract_test_examples(
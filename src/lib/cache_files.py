@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Shared helpers for TestBoost's local cache files.
+
+Several caches (filesystem index, class index, module analysis, step-file
+sidecars, status summaries, session registry) trust a file's recorded
+``(mtime, size)`` to skip work. They share two rules:
+
+- **Racy window**: filesystem clocks are coarse, so a file modified within
+  ``RACY_WINDOW_NS`` of the moment its stat was recorded may change again
+  without its mtime moving. Such a stat is never trusted on its own.
+- **Atomic writes**: a cache is written to a temporary file and renamed
+  over the old one, so a concurrent reader sees the old or the new
+  content, never a partial file. Caches under ``.testboost/`` are local
+  and git-ignored.
+"""
+
+import os
+from pathlib import Path
+
+# See the module docstring: stats this recent are re-checked
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def ensure_gitignored(tb_dir: Path, pattern: str, comment: str) -> None:
+    """Make sure ``pattern`` is listed in ``<tb_dir>/.gitignore``."""
+    gitignore = tb_dir / ".gitignore"
+    if gitignore.exists():
+        content = gitignore.read_text(encoding="utf-8")
+        if pattern not in content:
+            with open(gitignore, "a", encoding="utf-8") as f:
+                f.write(f"\n# {comment}\n{pattern}\n")
+    else:
+        gitignore.write_text(f"# {comment}\n{pattern}\n", encoding="utf-8")
+
+
+def write_cache_file(
+    path: Path,
+    text: str,
+    *,
+    tb_dir: Path | None = None,
+    ignore_pattern: str | None = None,
+    comment: str = "TestBoost local cache",
+) -> None:
+    """Atomically replace ``path`` with ``text`` (temporary file + rename).
+
+    Args:
+        path: Cache file to write.
+        text: Its new content.
+        tb_dir: The ``.testboost`` directory whose ``.gitignore`` must list
+            the cache, or None for files that need no entry.
+        ignore_pattern: Pattern to list (default: the file name).
+        comment: Comment line written above a new ``.gitignore`` entry.
+
+    Raises:
+        OSError: If the file cannot be written; callers treat a cache that
+            could not be saved as a miss on the next run.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    if tb_dir is not None:
+        ensure_gitignored(tb_dir, ignore_pattern or path.name, comment)
+
+
+__all__ = [
+    "RACY_WINDOW_NS",
+    "ensure_gitignored",
+    "write_cache_file",
+]
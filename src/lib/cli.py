@@ -53,6 +53,7 @@ from src.lib.commands.generate_cmd import (  # noqa: E402,F401
     _compile_fix_item,
     _merge_answer_schemas,
     cmd_generate,
+    cmd_merge_shards,
 )
 from src.lib.commands.hitl_cmd import cmd_resume, cmd_sign_answer  # noqa: E402,F401
 from src.lib.commands.init_cmd import cmd_init  # noqa: E402,F401
@@ -65,8 +66,10 @@ from src.lib.commands.mutation_cmd import (  # noqa: E402,F401
 )
 from src.lib.commands.ops_cmd import (  # noqa: E402,F401
     cmd_cleanup,
+    cmd_compact,
     cmd_doctor,
     cmd_gitlab,
+    cmd_sessions,
     cmd_status,
     cmd_verify,
 )
@@ -75,6 +78,7 @@ from src.lib.commands.validate_cmd import (  # noqa: E402,F401
     _guess_failing_class,
     cmd_validate,
 )
+from src.lib.commands.watch_cmd import cmd_watch  # noqa: E402,F401
 
 
 def main() -> int:
@@ -103,16 +107,50 @@ def main() -> int:
     p_analyze = subparsers.add_parser("analyze", help="Analyze project structure")
     p_analyze.add_argument("project_path", help="Path to the project")
     p_analyze.add_argument("--verbose", "-v", action="store_true")
+    p_analyze.add_argument(
+        "--index-workers", type=int, default=None,
+        help="Processes used to build the class index (default: CPU count on large projects, 1 = serial)",
+    )
+    p_analyze.add_argument(
+        "--full-reindex", action="store_true",
+        help="Ignore the incremental class index cache and reparse every source file",
+    )
 
     # gaps
     p_gaps = subparsers.add_parser("gaps", help="Identify test coverage gaps")
     p_gaps.add_argument("project_path", help="Path to the Java project")
     p_gaps.add_argument("--verbose", "-v", action="store_true")
 
+    # watch
+    p_watch = subparsers.add_parser(
+        "watch", help="Keep the analysis index current while source and test files change",
+    )
+    p_watch.add_argument("project_path", help="Path to the Java project")
+    p_watch.add_argument(
+        "--debounce", type=float, default=0.3, metavar="SECONDS",
+        help="Quiet period that ends a batch of changes (default 0.3)",
+    )
+    p_watch.add_argument(
+        "--polling", action="store_true",
+        help="Poll the filesystem instead of using inotify (network drives, low watch limits)",
+    )
+    p_watch.add_argument(
+        "--poll-interval", type=float, default=1.0, metavar="SECONDS",
+        help="Polling interval (default 1.0)",
+    )
+
     # generate
     p_gen = subparsers.add_parser("generate", help="Generate tests")
     p_gen.add_argument("project_path", help="Path to the Java project")
     p_gen.add_argument("--files", nargs="*", help="Filter specific files")
+    p_gen.add_argument(
+        "--changed", nargs="+", default=None, metavar="FILE",
+        help="Regenerate only tests affected by these changed files (uses the class index)",
+    )
+    p_gen.add_argument(
+        "--changed-since", default=None, metavar="REF",
+        help="Like --changed, with the files changed since a git revision",
+    )
     p_gen.add_argument(
         "--no-runtime-fix",
         action="store_true",
@@ -130,11 +168,38 @@ def main() -> int:
         default=None,
         help="JSON file with answers/context to inject as test_requirements (for resume)",
     )
+    p_gen.add_argument(
+        "--shard", default=None, metavar="I/N",
+        help="Generate only shard I of N (stable hash of the file path); combine with merge-shards",
+    )
+
+    # merge-shards
+    p_merge = subparsers.add_parser(
+        "merge-shards", help="Combine the results of `generate --shard` into generation.md",
+    )
+    p_merge.add_argument("project_path", help="Path to the Java project")
+    p_merge.add_argument("--verbose", "-v", action="store_true")
 
     # validate
     p_val = subparsers.add_parser("validate", help="Compile and run tests")
     p_val.add_argument("project_path", help="Path to the Java project")
     p_val.add_argument("--verbose", "-v", action="store_true")
+    p_val.add_argument(
+        "--workers", type=int, default=None,
+        help="Per-file commands (pytest, go test) run at once (default: CPU count, max 8; 1 = serial)",
+    )
+    p_val.add_argument(
+        "--full-suite", action="store_true",
+        help="Run the project's whole test suite instead of only the generated test classes",
+    )
+    p_val.add_argument(
+        "--fork-count", default=None, metavar="N",
+        help="Surefire forkCount for the test run (e.g. 4 or 1C; Maven only)",
+    )
+    p_val.add_argument(
+        "--surefire-parallel", default=None, choices=["classes", "methods", "both", "all"],
+        help="Surefire parallel mode for the test run, one thread per CPU core (Maven only)",
+    )
     p_val.add_argument(
         "--fail-on-uncertainty", action="store_true",
         help="Pause with exit 78 and emit question.json when tests fail at runtime",
@@ -235,6 +300,38 @@ def main() -> int:
     p_cleanup.add_argument("--ttl-hours", type=int, default=24, help="Abandon threshold (default 24)")
     p_cleanup.add_argument("--dry-run", action="store_true", help="Just list, don't modify")
 
+    # compact â€” archive finished sessions
+    p_compact = subparsers.add_parser(
+        "compact",
+        help="Archive finished sessions into .testboost/archive/ (retention policy)",
+    )
+    p_compact.add_argument("project_path", help="Path to the project")
+    p_compact.add_argument(
+        "--keep-last", type=int, default=10,
+        help="Most recent sessions kept live whatever their status (default 10, minimum 1)",
+    )
+    p_compact.add_argument(
+        "--older-than-days", type=float, default=None,
+        help="Only archive sessions last updated more than N days ago",
+    )
+    p_compact.add_argument(
+        "--status", action="append",
+        choices=["completed", "failed", "abandoned", "in_progress"],
+        help="Session status to archive (repeatable; default completed, failed, abandoned)",
+    )
+    p_compact.add_argument("--dry-run", action="store_true", help="Just list, don't archive")
+
+    # sessions â€” list sessions from the registry
+    p_sessions = subparsers.add_parser(
+        "sessions",
+        help="List sessions from the session registry (.testboost/sessions.db)",
+    )
+    p_sessions.add_argument("project_path", help="Path to the project")
+    p_sessions.add_argument(
+        "--rebuild", action="store_true",
+        help="Re-index every session directory first (legacy sessions)",
+    )
+
     # doctor â€” health check
     p_doctor = subparsers.add_parser(
         "doctor",
@@ -263,7 +360,9 @@ def main() -> int:
         "init": cmd_init,
         "analyze": cmd_analyze,
         "gaps": cmd_gaps,
+        "watch": cmd_watch,
         "generate": cmd_generate,
+        "merge-shards": cmd_merge_shards,
         "validate": cmd_validate,
         "mutate": cmd_mutate,
         "killer": cmd_killer,
@@ -274,6 +373,8 @@ def main() -> int:
         "sign-answer": cmd_sign_answer,
         "gitlab": cmd_gitlab,
         "cleanup": cmd_cleanup,
+        "compact": cmd_compact,
+        "sessions": cmd_sessions,
         "doctor": cmd_doctor,
     }
 
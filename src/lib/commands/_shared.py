@@ -1,8 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 """Helpers shared across CLI command modules."""
 
-import json
-import re
 import sys
 from pathlib import Path
 from typing import Any
@@ -47,32 +45,22 @@ def _read_step_status(step_file: Path) -> str:
     """Read the status from a step markdown file's YAML frontmatter.
 
     Returns the status string (e.g. "completed", "failed", "in_progress")
-    or "unknown" if the file cannot be parsed.
+    or "unknown" if the file cannot be parsed. Parsed files are cached
+    (see src.lib.step_data).
     """
-    try:
-        content = step_file.read_text(encoding="utf-8")
-        match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-        if match:
-            for line in match.group(1).split("\n"):
-                if line.startswith("status:"):
-                    return line.partition(":")[2].strip()
-    except OSError:
-        pass
-    return "unknown"
+    from src.lib.step_data import step_status
+
+    return step_status(step_file)
 def _extract_json_field(markdown_content: str, field_name: str) -> Any:
     """Extract a field from a JSON block in a markdown file.
 
     Looks for ```json blocks in the markdown and extracts the named field.
+    Commands reading a step file use src.lib.step_data instead, which
+    parses each file once.
     """
-    json_blocks = re.findall(r"```json\n(.*?)```", markdown_content, re.DOTALL)
-    for block in json_blocks:
-        try:
-            data = json.loads(block)
-            if field_name in data:
-                return data[field_name]
-        except json.JSONDecodeError:
-            continue
-    return None
+    from src.lib.step_data import parse_step_markdown
+
+    return parse_step_markdown(markdown_content).field(field_name)
 
 
 def load_answer_for_step(
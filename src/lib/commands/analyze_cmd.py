@@ -7,8 +7,6 @@ import json
 import sys
 from pathlib import Path
 
-from src.lib.commands._shared import _extract_json_field
-
 
 def cmd_analyze(args: argparse.Namespace) -> int:
     """Analyze project structure."""
@@ -43,12 +41,10 @@ async def _cmd_analyze_async(args: argparse.Namespace) -> int:
         # --- Reuse existing TestBoost functions via bridge ---
         from src.lib.bridge import (
             analyze_project_context,
-            build_class_index,
-            classify_file,
             detect_test_conventions,
             extract_test_examples,
             find_source_files,
-            find_test_for_source,
+            update_class_index,
         )
         from src.lib.session_tracker import (
             get_project_analysis_path,
@@ -72,64 +68,8 @@ async def _cmd_analyze_async(args: argparse.Namespace) -> int:
 
         source_files = find_source_files(project_path)
 
-        # Build the analysis report
-        content = "# Project Analysis\n\n"
-        content += f"**Project type**: {result.get('project_type', 'unknown')}\n"
-        content += f"**Build system**: {result.get('build_system', 'unknown')}\n"
-        content += f"**Java version**: {result.get('java_version', 'unknown')}\n\n"
-
-        # Frameworks
-        frameworks = result.get("frameworks", [])
-        test_frameworks = result.get("test_frameworks", [])
-        content += "## Frameworks\n\n"
-        content += f"- **Application**: {', '.join(frameworks) if frameworks else 'none detected'}\n"
-        content += f"- **Testing**: {', '.join(test_frameworks) if test_frameworks else 'none detected'}\n\n"
-
-        # Source structure
-        src_struct = result.get("source_structure", {})
-        test_struct = result.get("test_structure", {})
-        content += "## Structure\n\n"
-        content += f"- **Source classes**: {src_struct.get('class_count', 0)}\n"
-        content += f"- **Existing tests**: {test_struct.get('test_count', 0)}\n"
-        content += f"- **Packages**: {len(src_struct.get('packages', []))}\n\n"
-
         # Classify source files and check for existing tests
-        file_details = []
-        for sf in source_files:
-            category = classify_file(sf, project_path)
-            test_file = find_test_for_source(project_path, sf)
-            file_details.append({
-                "path": sf,
-                "category": category,
-                "has_test": test_file is not None,
-                "test_file": test_file,
-            })
-
-        tested_count = sum(1 for f in file_details if f["has_test"])
-
-        # Source files table
-        content += "## Source Files for Test Generation\n\n"
-        content += f"Found **{len(source_files)}** source files"
-        content += f" ({tested_count} with existing tests, {len(source_files) - tested_count} without):\n\n"
-        content += "| # | Source File | Category | Has Test | Test File |\n"
-        content += "|---|-----------|----------|----------|----------|\n"
-        for i, fd in enumerate(file_details, 1):
-            src_name = Path(fd["path"]).name
-            has_test = "Yes" if fd["has_test"] else "No"
-            test_name = Path(fd["test_file"]).name if fd["test_file"] else "-"
-            content += f"| {i} | `{src_name}` | {fd['category']} | {has_test} | {test_name} |\n"
-        content += "\n"
-
-        # Conventions summary
-        if conventions.get("success"):
-            content += "## Detected Test Conventions\n\n"
-            naming = conventions.get("naming", {})
-            assertions = conventions.get("assertions", {})
-            mocking = conventions.get("mocking", {})
-            content += f"- **Naming pattern**: {naming.get('dominant_pattern', 'unknown')}\n"
-            content += f"- **Assertion style**: {assertions.get('dominant_style', 'unknown')}\n"
-            content += f"- **Uses Mockito**: {'yes' if mocking.get('uses_mockito') else 'no'}\n"
-            content += f"- **Uses Spring MockBean**: {'yes' if mocking.get('uses_spring_mock_bean') else 'no'}\n\n"
+        file_details = _source_file_details(project_path, source_files)
 
         # Detect build configuration via plugin
         from pathlib import Path as _Path
@@ -141,47 +81,40 @@ async def _cmd_analyze_async(args: argparse.Namespace) -> int:
         compile_cmd_str = " ".join(compile_cmd_list)
         test_cmd_str = " ".join(test_cmd_list)
 
-        # For Java: also detect Maven profiles and .mvn/maven.config
+        # For Java: also detect Maven profiles and .mvn/maven.config, or the
+        # Gradle wrapper and its caches
         maven_config_notes: list[str] = []
         if analysis_plugin.identifier == "java-spring":
-            from src.lib.plugins.java_spring import _detect_maven_build_config
-            maven_config = _detect_maven_build_config(project_path)
+            from src.lib.plugins.java_spring import _detect_build_config
+            maven_config = _detect_build_config(project_path)
             compile_cmd_str = maven_config["compile_cmd"]
             test_cmd_str = maven_config["test_cmd"]
             maven_config_notes = maven_config["notes"]
 
-        content += "## Build Configuration\n\n"
-        content += f"- **Compile command**: `{compile_cmd_str}`\n"
-        content += f"- **Test command**: `{test_cmd_str}`\n"
-        for note in maven_config_notes:
-            content += f"- {note}\n"
-        content += "\n"
-
         # --- Build class index (project-level, persisted across sessions) ---
         logger.info(f"Building class index for {len(source_files)} source files...")
-        class_index = build_class_index(project_path, source_files)
-        logger.info(f"Class index built: {len(class_index)} classes analyzed")
-
-        # Class index summary table
-        content += "## Class Index\n\n"
-        content += "| Class | Package | Category | Extends | Has Test |\n"
-        content += "|-------|---------|----------|---------|----------|\n"
-        tested_classes = {Path(fd["path"]).stem for fd in file_details if fd["has_test"]}
-        for cls_name, entry in sorted(class_index.items()):
-            pkg = entry.get("package", "")
-            cat = entry.get("category", "")
-            ext = entry.get("extends") or "-"
-            has_test_cls = "Yes" if cls_name in tested_classes else "No"
-            content += f"| `{cls_name}` | `{pkg}` | {cat} | {ext} | {has_test_cls} |\n"
-        content += "\n"
+        class_index, index_stats = update_class_index(
+            project_path, source_files,
+            workers=getattr(args, "index_workers", None),
+            full=getattr(args, "full_reindex", False),
+        )
+        logger.info(
+            f"Class index built: {len(class_index)} classes analyzed "
+            f"({index_stats['reparsed']} reparsed, {index_stats['reused']} reused from cache)"
+        )
 
         # --- Extract test examples (for LLM style reference) ---
         test_examples = extract_test_examples(project_path, max_examples=3, max_lines=150)
-        if test_examples:
-            content += "## Test Pattern Examples\n\n"
-            for i, ex in enumerate(test_examples, 1):
-                content += f"### Example {i}: `{ex['path']}`\n\n"
-                content += f"```java\n{ex['content']}\n```\n\n"
+
+        modules = result.get("modules", [])
+        if len(modules) > 1:
+            reused = sum(1 for m in modules if m.get("cached"))
+            logger.info(f"Analyzed {len(modules)} modules ({reused} reused from cache)")
+
+        summary, content = _analysis_report(
+            project_path, result, conventions, file_details, class_index, test_examples,
+            build={"compile_cmd": compile_cmd_str, "test_cmd": test_cmd_str, "notes": maven_config_notes},
+        )
 
         logger.info(f"Analysis complete: {len(source_files)} source files, {len(class_index)} classes indexed, {len(test_examples)} test examples")
 
@@ -217,8 +150,9 @@ async def _cmd_analyze_async(args: argparse.Namespace) -> int:
             },
         )
 
-        # Print summary to stdout for the LLM
-        logger.result("Analysis Complete", content)
+        # Print the (bounded) summary to stdout for the LLM; the detail
+        # tables stay in analysis.md and its sidecar pages
+        logger.result("Analysis Complete", summary)
 
         from src.lib.integrity import emit_token
         emit_token(project_path, "analysis", session["session_id"])
@@ -231,6 +165,165 @@ async def _cmd_analyze_async(args: argparse.Namespace) -> int:
             f"# Analysis - FAILED\n\n**Error**: {e}\n",
         )
         return 1
+def _analysis_report(
+    project_path: str,
+    result: dict,
+    conventions: dict,
+    file_details: list[dict],
+    class_index: dict,
+    test_examples: list[dict],
+    build: dict,
+) -> tuple[str, str]:
+    """Render the analysis as (stdout summary, analysis.md body).
+
+    The summary's size does not depend on the project's: tables with a row
+    per module, source file or class only appear in analysis.md, and move
+    to paginated sidecar files under ``.testboost/analysis/`` when they
+    do not fit on one page.
+    """
+    from src.lib.report_writer import ReportWriter, reset_sidecar_dir, table_or_pages
+    from src.lib.session_tracker import get_project_analysis_path
+
+    analysis_path = get_project_analysis_path(project_path)
+    sidecar_dir = analysis_path.parent / "analysis"
+    reset_sidecar_dir(sidecar_dir)
+
+    summary = ReportWriter()
+    summary.line("# Project Analysis")
+    summary.line()
+    summary.line(f"**Project type**: {result.get('project_type', 'unknown')}")
+    summary.line(f"**Build system**: {result.get('build_system', 'unknown')}")
+    summary.line(f"**Java version**: {result.get('java_version', 'unknown')}")
+    summary.line()
+
+    frameworks = result.get("frameworks", [])
+    test_frameworks = result.get("test_frameworks", [])
+    summary.heading("Frameworks")
+    summary.bullet("Application", ", ".join(frameworks) if frameworks else "none detected")
+    summary.bullet("Testing", ", ".join(test_frameworks) if test_frameworks else "none detected")
+    summary.line()
+
+    src_struct = result.get("source_structure", {})
+    test_struct = result.get("test_structure", {})
+    tested_count = sum(1 for f in file_details if f["has_test"])
+    modules = result.get("modules", [])
+    summary.heading("Structure")
+    summary.bullet("Source classes", src_struct.get("class_count", 0))
+    summary.bullet("Existing tests", test_struct.get("test_count", 0))
+    summary.bullet("Packages", len(src_struct.get("packages", [])))
+    if len(modules) > 1:
+        summary.bullet("Modules", len(modules))
+    summary.bullet(
+        "Source files for test generation",
+        f"{len(file_details)} ({tested_count} with existing tests, "
+        f"{len(file_details) - tested_count} without)",
+    )
+    summary.bullet("Classes indexed", len(class_index))
+    summary.line()
+
+    if conventions.get("success"):
+        naming = conventions.get("naming", {})
+        assertions = conventions.get("assertions", {})
+        mocking = conventions.get("mocking", {})
+        summary.heading("Detected Test Conventions")
+        summary.bullet("Naming pattern", naming.get("dominant_pattern", "unknown"))
+        summary.bullet("Assertion style", assertions.get("dominant_style", "unknown"))
+        summary.bullet("Uses Mockito", "yes" if mocking.get("uses_mockito") else "no")
+        summary.bullet("Uses Spring MockBean", "yes" if mocking.get("uses_spring_mock_bean") else "no")
+        summary.line()
+
+    summary.heading("Build Configuration")
+    summary.bullet("Compile command", f"`{build['compile_cmd']}`")
+    summary.bullet("Test command", f"`{build['test_cmd']}`")
+    for note in build["notes"]:
+        summary.line(f"- {note}")
+    summary.line()
+
+    details = ReportWriter()
+    details.write(summary.getvalue())
+    pages: list = []
+
+    if len(modules) > 1:
+        details.heading("Modules")
+        pages += table_or_pages(
+            details, sidecar_dir, "modules", "Modules",
+            ["Module", "Path", "Classes", "Tests", "Frameworks"],
+            [
+                (
+                    m.get("name", ""), f"`{m.get('path') or '.'}`", m.get("class_count", 0),
+                    m.get("test_count", 0),
+                    ", ".join(m.get("frameworks", []) + m.get("test_frameworks", [])) or "-",
+                )
+                for m in modules
+            ],
+            link_base=analysis_path.parent,
+        )
+
+    details.heading("Source Files for Test Generation")
+    pages += table_or_pages(
+        details, sidecar_dir, "source-files", "Source Files for Test Generation",
+        ["#", "Source File", "Category", "Has Test", "Test File"],
+        [
+            (
+                i, f"`{Path(fd['path']).name}`", fd["category"],
+                "Yes" if fd["has_test"] else "No",
+                Path(fd["test_file"]).name if fd["test_file"] else "-",
+            )
+            for i, fd in enumerate(file_details, 1)
+        ],
+        link_base=analysis_path.parent,
+    )
+
+    tested_classes = {Path(fd["path"]).stem for fd in file_details if fd["has_test"]}
+    details.heading("Class Index")
+    pages += table_or_pages(
+        details, sidecar_dir, "class-index", "Class Index",
+        ["Class", "Package", "Category", "Extends", "Has Test"],
+        [
+            (
+                f"`{cls_name}`", f"`{entry.get('package', '')}`", entry.get("category", ""),
+                entry.get("extends") or "-",
+                "Yes" if entry.get("class_name") in tested_classes else "No",
+            )
+            for cls_name, entry in sorted(class_index.items())
+        ],
+        link_base=analysis_path.parent,
+    )
+
+    if test_examples:
+        details.heading("Test Pattern Examples")
+        for i, ex in enumerate(test_examples, 1):
+            details.heading(f"Example {i}: `{ex['path']}`", level=3)
+            details.line(f"```java\n{ex['content']}\n```")
+            details.line()
+
+    if pages:
+        summary.line(
+            f"Detail tables: `{analysis_path}` and {len(pages)} page(s) under `{sidecar_dir}`."
+        )
+    else:
+        summary.line(f"Detail tables: `{analysis_path}`.")
+    return summary.getvalue(), details.getvalue()
+
+
+def _source_file_details(project_path: str, source_files: list[str]) -> list[dict]:
+    """Category and existing test of each source file (analysis data)."""
+    from src.lib.bridge import build_test_lookup, classify_file, find_test_for_source
+
+    file_details = []
+    test_lookup = build_test_lookup(project_path)
+    for sf in source_files:
+        category = classify_file(sf, project_path)
+        test_file = find_test_for_source(project_path, sf, index=test_lookup)
+        file_details.append({
+            "path": sf,
+            "category": category,
+            "has_test": test_file is not None,
+            "test_file": test_file,
+        })
+    return file_details
+
+
 def cmd_gaps(args: argparse.Namespace) -> int:
     """Identify test coverage gaps."""
     return asyncio.run(_cmd_gaps_async(args))
@@ -270,68 +363,23 @@ async def _cmd_gaps_async(args: argparse.Namespace) -> int:
         # Read source_files: project-level analysis first, session fallback for backward compat
         from src.lib.session_tracker import read_project_analysis_data
         source_files = None
-        project_data = read_project_analysis_data(project_path)
+        project_data = read_project_analysis_data(project_path, include_class_index=False)
         if project_data:
             source_files = project_data.get("source_files")
 
         if not source_files:
-            analysis_content = analysis_file.read_text(encoding="utf-8")
-            source_files = _extract_json_field(analysis_content, "source_files")
+            from src.lib.step_data import step_field
+
+            source_files = step_field(analysis_file, "source_files")
 
         if not source_files:
             logger.error("No source files found in analysis. Re-run analyze.")
             return 1
 
-        # Find existing test files
-        project_dir = Path(project_path)
-        existing_tests = set()
-
-        test_dirs = list(project_dir.glob("**/src/test/java"))
-        for test_dir in test_dirs:
-            for test_file in test_dir.rglob("*Test.java"):
-                # Extract class name from test file name
-                class_name = test_file.stem.replace("Test", "")
-                existing_tests.add(class_name)
-            for test_file in test_dir.rglob("*Tests.java"):
-                class_name = test_file.stem.replace("Tests", "")
-                existing_tests.add(class_name)
-
-        # Identify gaps: source files without corresponding tests
-        gaps = []
-        covered = []
-        for source_file in source_files:
-            source_name = Path(source_file).stem
-            if source_name in existing_tests:
-                covered.append(source_file)
-            else:
-                gaps.append(source_file)
-
-        # Build the gaps report
-        total = len(source_files)
+        gaps, covered = _find_gaps(project_path, source_files)
+        content, coverage_pct = _gaps_report(gaps, covered)
         gap_count = len(gaps)
-        coverage_pct = ((total - gap_count) / total * 100) if total > 0 else 0
-
-        content = "# Coverage Gap Analysis\n\n"
-        content += f"**Total testable files**: {total}\n"
-        content += f"**Files with tests**: {len(covered)}\n"
-        content += f"**Files WITHOUT tests**: {gap_count}\n"
-        content += f"**Estimated coverage**: {coverage_pct:.0f}%\n\n"
-
-        if gaps:
-            content += "## Files Needing Tests\n\n"
-            content += "| # | Source File | Priority |\n"
-            content += "|---|------------|----------|\n"
-            for i, gap in enumerate(gaps, 1):
-                # Simple priority heuristic based on path
-                priority = "high" if "service" in gap.lower() or "controller" in gap.lower() else "medium"
-                content += f"| {i} | `{gap}` | {priority} |\n"
-            content += "\n"
-
-        if covered:
-            content += "## Files Already Covered\n\n"
-            for c in covered:
-                content += f"- `{c}`\n"
-            content += "\n"
+        total = len(source_files)
 
         logger.info(f"Found {gap_count} files without tests out of {total} total")
 
@@ -353,3 +401,62 @@ async def _cmd_gaps_async(args: argparse.Namespace) -> int:
             f"# Coverage Gaps - FAILED\n\n**Error**: {e}\n",
         )
         return 1
+
+
+def _find_gaps(project_path: str, source_files: list[str]) -> tuple[list[str], list[str]]:
+    """Split source files into (gaps, covered) by test class name.
+
+    A source file is covered when a ``<Name>Test`` or ``<Name>Tests`` class
+    exists anywhere in the project's test roots.
+    """
+    from src.lib.project_index import get_project_index
+
+    existing_tests = set()
+    for test_file in get_project_index(project_path).java_tests():
+        stem = test_file.rsplit("/", 1)[-1][: -len(".java")]
+        # Extract class name from test file name
+        if stem.endswith("Tests"):
+            existing_tests.add(stem.replace("Tests", ""))
+        if stem.endswith("Test"):
+            existing_tests.add(stem.replace("Test", ""))
+
+    # Identify gaps: source files without corresponding tests
+    gaps = []
+    covered = []
+    for source_file in source_files:
+        source_name = Path(source_file).stem
+        if source_name in existing_tests:
+            covered.append(source_file)
+        else:
+            gaps.append(source_file)
+    return gaps, covered
+
+
+def _gaps_report(gaps: list[str], covered: list[str]) -> tuple[str, float]:
+    """Render the coverage-gaps step body; returns (markdown, coverage %)."""
+    total = len(gaps) + len(covered)
+    gap_count = len(gaps)
+    coverage_pct = ((total - gap_count) / total * 100) if total > 0 else 0
+
+    content = "# Coverage Gap Analysis\n\n"
+    content += f"**Total testable files**: {total}\n"
+    content += f"**Files with tests**: {len(covered)}\n"
+    content += f"**Files WITHOUT tests**: {gap_count}\n"
+    content += f"**Estimated coverage**: {coverage_pct:.0f}%\n\n"
+
+    if gaps:
+        content += "## Files Needing Tests\n\n"
+        content += "| # | Source File | Priority |\n"
+        content += "|---|------------|----------|\n"
+        for i, gap in enumerate(gaps, 1):
+            # Simple priority heuristic based on path
+            priority = "high" if "service" in gap.lower() or "controller" in gap.lower() else "medium"
+            content += f"| {i} | `{gap}` | {priority} |\n"
+        content += "\n"
+
+    if covered:
+        content += "## Files Already Covered\n\n"
+        for c in covered:
+            content += f"- `{c}`\n"
+        content += "\n"
+    return content, coverage_pct
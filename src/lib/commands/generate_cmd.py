@@ -3,14 +3,12 @@
 
 import argparse
 import asyncio
-import json
-import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 from src.lib.commands._shared import (
-    _extract_json_field,
     _warn_maven_config_issue,
     load_answer_for_step,
 )
@@ -29,6 +27,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         STATUS_FAILED,
         STATUS_IN_PROGRESS,
         AwaitingInputError,
+        append_generation_cursor,
         clear_generation_cursor,
         emit_question,
         finalize_answer,
@@ -46,7 +45,29 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         return 1
 
     session_dir = session["session_dir"]
-    logger = MdLogger(session_dir, "generation", verbose=getattr(args, "verbose", False))
+
+    # --shard i/N: this run owns one slice of the files and keeps its
+    # generation.md, cursor and logs in shards/<i>-of-<N>/
+    shard = None
+    step_dir = session_dir
+    if getattr(args, "shard", None):
+        from src.lib.shards import get_shard_dir, parse_shard
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if getattr(args, "fail_on_uncertainty", False) or getattr(args, "answer_file", None):
+            print(
+                "Error: --shard cannot pause for human input; drop --fail-on-uncertainty "
+                "and --answer-file, or generate without --shard.",
+                file=sys.stderr,
+            )
+            return 1
+        step_dir = str(get_shard_dir(session_dir, *shard))
+        Path(step_dir).mkdir(parents=True, exist_ok=True)
+
+    logger = MdLogger(step_dir, "generation", verbose=getattr(args, "verbose", False))
 
     # Check prerequisites
     gaps_file = Path(session_dir) / "coverage-gaps.md"
@@ -54,7 +75,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         logger.error("Coverage gaps step not completed. Run `gaps` first.")
         return 1
 
-    update_step_file(session_dir, "generation", STATUS_IN_PROGRESS, "# Test Generation\n\nGenerating...")
+    update_step_file(step_dir, "generation", STATUS_IN_PROGRESS, "# Test Generation\n\nGenerating...")
 
     # --- Human-in-the-loop: verify answer file if provided (finalized on success) ---
     answer_payload, abort = load_answer_for_step(
@@ -65,15 +86,31 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
 
     fail_on_uncertainty = bool(getattr(args, "fail_on_uncertainty", False))
 
+    from src.lib.analysis_store import ClassIndexView, open_class_index
+    class_index = None
+
     try:
         # Extract gaps from the coverage-gaps.md
-        gaps_content = gaps_file.read_text(encoding="utf-8")
-        gaps = _extract_json_field(gaps_content, "gaps")
+        from src.lib.step_data import coverage_gaps, session_build_commands, session_conventions
+
+        gaps = coverage_gaps(session_dir)
+
+        # --changed / --changed-since: regenerate only what the changes affect
+        changed = _changed_files(args, project_path)
+        if changed is not None:
+            gaps = _regeneration_targets(project_path, gaps or [], changed, logger)
+            if not gaps:
+                logger.info("No tests affected by the changed files. Nothing to generate.")
+                update_step_file(
+                    step_dir, "generation", STATUS_COMPLETED,
+                    "# Test Generation\n\nNo tests affected by the changed files.\n",
+                )
+                return 0
 
         if not gaps:
             logger.info("No coverage gaps found. Nothing to generate.")
             update_step_file(
-                session_dir, "generation", STATUS_COMPLETED,
+                step_dir, "generation", STATUS_COMPLETED,
                 "# Test Generation\n\nNo gaps to fill - all source files have tests.\n",
             )
             return 0
@@ -81,17 +118,20 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         # Load analysis data: project-level for class_index/test_examples/conventions,
         # session-level for maven command overrides (allows per-session customization).
         from src.lib.session_tracker import read_project_analysis_data
-        class_index = None
         test_examples = None
         conventions = None
+        modules: list[dict] = []
         maven_compile_cmd = None
         maven_test_cmd = None
 
-        project_data = read_project_analysis_data(project_path)
+        # The class index is read entry by entry from the analysis store;
+        # only projects analyzed before the store existed load it whole.
+        project_data = read_project_analysis_data(project_path, include_class_index=False)
         if project_data:
-            class_index = project_data.get("class_index")
+            class_index = open_class_index(project_path) or project_data.get("class_index")
             test_examples = project_data.get("test_examples")
             conventions = project_data.get("conventions")
+            modules = (project_data.get("project_context") or {}).get("modules") or []
             maven_compile_cmd = project_data.get("maven_compile_cmd")
             maven_test_cmd = project_data.get("maven_test_cmd")
         else:
@@ -101,18 +141,15 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
             )
 
         # Session analysis overrides (maven commands edited by user take priority)
-        analysis_file = Path(session_dir) / "analysis.md"
-        if analysis_file.exists():
-            analysis_content = analysis_file.read_text(encoding="utf-8")
-            session_conventions = _extract_json_field(analysis_content, "conventions")
-            session_compile_cmd = _extract_json_field(analysis_content, "maven_compile_cmd")
-            session_test_cmd = _extract_json_field(analysis_content, "maven_test_cmd")
-            if session_conventions:
-                conventions = session_conventions
-            if session_compile_cmd:
-                maven_compile_cmd = session_compile_cmd
-            if session_test_cmd:
-                maven_test_cmd = session_test_cmd
+        overridden_conventions = session_conventions(session_dir)
+        session_compile_cmd, session_test_cmd = session_build_commands(session_dir)
+        if overridden_conventions:
+            conventions = overridden_conventions
+            modules = []
+        if session_compile_cmd:
+            maven_compile_cmd = session_compile_cmd
+        if session_test_cmd:
+            maven_test_cmd = session_test_cmd
 
         # Apply file filter if specified
         target_files = gaps
@@ -127,6 +164,12 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                 logger.warn(f"No files matched filter: {args.files}")
                 target_files = gaps
 
+        if shard:
+            from src.lib.shards import select_shard
+            all_targets = len(target_files)
+            target_files = select_shard(target_files, *shard)
+            logger.info(f"Shard {shard[0]}/{shard[1]}: {len(target_files)} of {all_targets} files")
+
         logger.info(f"Generating tests for {len(target_files)} files...")
 
         # Resolve plugin for prompt template directory
@@ -149,7 +192,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         )
         from src.lib.startup_checks import check_llm_connection
         try:
-            await check_llm_connection()
+            await check_llm_connection(project_path=project_path)
         except Exception as e:
             logger.error(f"LLM connection failed: {e}")
             print(f"\nERROR: Cannot connect to LLM provider. {e}")
@@ -157,7 +200,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
             return 1
 
         # --- Per-file cursor: resume from where a previous run paused ---
-        cursor = load_generation_cursor(session_dir)
+        cursor = load_generation_cursor(step_dir)
         if cursor and cursor.get("target_files") == target_files:
             completed_files = list(cursor.get("completed_files", []))
             prior_deferred = {
@@ -176,7 +219,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
             prior_deferred = {}
         files_filter = list(args.files) if getattr(args, "files", None) else None
         save_generation_cursor(
-            session_dir,
+            step_dir,
             target_files=target_files,
             current_index=len(completed_files),
             completed_files=completed_files,
@@ -199,6 +242,8 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         # instead of one round-trip per file.
         uncertainties: list[dict] = []
         deferred_out: list[dict] = []
+        # deferred_out[:journaled_deferred] is already in the cursor journal
+        journaled_deferred = 0
 
         generated: list[dict] = []
         for i, source_file in enumerate(target_files):
@@ -266,14 +311,12 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                             "test_count": test_code.count("@Test") + test_code.count("def test_"),
                         })
                         completed_files.append(source_file)
-                        save_generation_cursor(
-                            session_dir,
-                            target_files=target_files,
-                            current_index=len(completed_files),
-                            completed_files=completed_files,
-                            files_filter=files_filter,
-                            deferred=deferred_out,
+                        append_generation_cursor(
+                            step_dir,
+                            completed_file=source_file,
+                            deferred=deferred_out[journaled_deferred:],
                         )
+                        journaled_deferred = len(deferred_out)
                         continue
 
                 # --- Edge case analysis ---
@@ -331,20 +374,19 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
 
                 merged_requirements = list(edge_cases or []) + list(injected or [])
 
-                result_json = await generate_adaptive_tests(
+                result = await generate_adaptive_tests(
                     project_path=project_path,
                     source_file=source_file,
-                    conventions=conventions,
+                    conventions=_module_conventions(modules, source_file) or conventions,
                     class_index=class_index,
                     test_examples=test_examples,
                     test_requirements=merged_requirements if merged_requirements else None,
                     prompt_template_dir=prompt_template_dir,
                 )
-                result = json.loads(result_json)
-                test_code = result.get("test_code", "")
+                test_code = result.test_code
                 has_tests = "@Test" in test_code or "def test_" in test_code
 
-                if not (result.get("success") and test_code and has_tests):
+                if not (result.success and test_code and has_tests):
                     logger.warn(f"No tests generated for {source_file}")
                 else:
                     # Test path comes from the technology plugin, NOT from the
@@ -352,7 +394,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                     # non-Java sources unchanged, which used to overwrite the
                     # production file with the generated test.
                     test_path = plugin.test_file_name(source_file)
-                    cls = result.get("context", {}).get("class_name", "") or class_name
+                    cls = result.class_name or class_name
 
                     # Developer-provided fix (fixed_code wins over hints if both)
                     dev_fix = compile_fixes.get(cls)
@@ -383,7 +425,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                             "source_file": source_file,
                             "class_name": cls,
                             "test_path": test_path,
-                            "package": result.get("context", {}).get("package", ""),
+                            "package": result.package,
                             "reason": "compilation_fix_exhausted",
                         })
                         continue
@@ -398,9 +440,9 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                         "path": test_path,
                         "content": test_code,
                         "class_name": cls,
-                        "package": result.get("context", {}).get("package", ""),
+                        "package": result.package,
                         "source_file": source_file,
-                        "test_count": result.get("test_count", 0),
+                        "test_count": result.test_count,
                     })
 
             except Exception as file_err:
@@ -408,14 +450,12 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
                 raise
 
             completed_files.append(source_file)
-            save_generation_cursor(
-                session_dir,
-                target_files=target_files,
-                current_index=len(completed_files),
-                completed_files=completed_files,
-                files_filter=files_filter,
-                deferred=deferred_out,
+            append_generation_cursor(
+                step_dir,
+                completed_file=source_file,
+                deferred=deferred_out[journaled_deferred:],
             )
+            journaled_deferred = len(deferred_out)
 
         # --- One batched question for everything that needs human input ---
         if uncertainties:
@@ -424,7 +464,7 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
             if answer_payload is not None:
                 finalize_answer(session_dir, answer_payload)
             save_generation_cursor(
-                session_dir,
+                step_dir,
                 target_files=target_files,
                 current_index=len(completed_files),
                 completed_files=completed_files,
@@ -459,41 +499,31 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
         if answer_payload is not None:
             finalize_answer(session_dir, answer_payload)
 
-        # --- Build report ---
-        content = "# Test Generation Results\n\n"
-        content += f"**Target files**: {len(target_files)}\n"
-        content += f"**Tests generated**: {len(generated)}\n\n"
-
-        if generated:
-            content += "## Generated Tests\n\n"
-            content += "| # | Source File | Test File | Test Count |\n"
-            content += "|---|------------|-----------|------------|\n"
-            for idx, test in enumerate(generated, 1):
-                content += f"| {idx} | `{test.get('source_file', '')}` | `{test.get('path', '')}` | {test.get('test_count', 0)} |\n"
-            content += "\n"
-            content += "## Generated Test Files\n\n"
-            for test in generated:
-                test_path = test.get("path", "")
-                if test_path:
-                    content += f"### `{test_path}`\n\n"
-                    content += f"Written to disk. {test.get('test_count', 0)} test methods.\n\n"
-
+        content = _generation_report(len(target_files), generated)
         failed = len(target_files) - len(generated)
         if failed > 0:
-            content += f"\n**Note**: {failed} file(s) did not produce tests.\n"
             logger.warn(f"{failed} files did not produce tests")
 
         logger.info(f"Generation complete: {len(generated)} test files created")
 
-        update_step_file(
-            session_dir, "generation", STATUS_COMPLETED, content,
-            data={"generated": [{k: v for k, v in t.items() if k != "content"} for t in generated]},
-        )
+        result_data = {"generated": [{k: v for k, v in t.items() if k != "content"} for t in generated]}
+        if shard:
+            result_data["shard"] = f"{shard[0]}/{shard[1]}"
+            result_data["target_files"] = target_files
+        update_step_file(step_dir, "generation", STATUS_COMPLETED, content, data=result_data)
 
-        clear_generation_cursor(session_dir)
+        clear_generation_cursor(step_dir)
 
         logger.result("Test Generation Complete", content)
 
+        if shard:
+            # The integrity token is emitted by merge-shards, once for the session
+            logger.info(
+                f"Shard {shard[0]}/{shard[1]} done. Run `merge-shards` once all "
+                f"{shard[1]} shards are done."
+            )
+            return 0
+
         from src.lib.integrity import emit_token
         emit_token(project_path, "generation", session["session_id"])
         return 0
@@ -505,10 +535,106 @@ async def _cmd_generate_async(args: argparse.Namespace) -> int:
     except Exception as e:
         logger.error(f"Test generation failed: {e}")
         update_step_file(
-            session_dir, "generation", STATUS_FAILED,
+            step_dir, "generation", STATUS_FAILED,
             f"# Test Generation - FAILED\n\n**Error**: {e}\n",
         )
         return 1
+    finally:
+        if isinstance(class_index, ClassIndexView):
+            class_index.close()
+
+
+def _generation_report(target_count: int, generated: list[dict], shards: int | None = None) -> str:
+    """Markdown body of generation.md."""
+    content = "# Test Generation Results\n\n"
+    content += f"**Target files**: {target_count}\n"
+    if shards:
+        content += f"**Shards**: {shards}\n"
+    content += f"**Tests generated**: {len(generated)}\n\n"
+
+    if generated:
+        content += "## Generated Tests\n\n"
+        content += "| # | Source File | Test File | Test Count |\n"
+        content += "|---|------------|-----------|------------|\n"
+        for idx, test in enumerate(generated, 1):
+            content += f"| {idx} | `{test.get('source_file', '')}` | `{test.get('path', '')}` | {test.get('test_count', 0)} |\n"
+        content += "\n"
+        content += "## Generated Test Files\n\n"
+        for test in generated:
+            test_path = test.get("path", "")
+            if test_path:
+                content += f"### `{test_path}`\n\n"
+                content += f"Written to disk. {test.get('test_count', 0)} test methods.\n\n"
+
+    failed = target_count - len(generated)
+    if failed > 0:
+        content += f"\n**Note**: {failed} file(s) did not produce tests.\n"
+    return content
+
+
+def cmd_merge_shards(args: argparse.Namespace) -> int:
+    """Combine the results of `generate --shard i/N` into generation.md.
+
+    Every shard of the session must be present under shards/ and
+    completed. The merged generation.md lists the tests of all shards, as
+    a single `generate` run would have, and the integrity token for the
+    generation step is emitted once here.
+    """
+    from src.lib.md_logger import MdLogger
+    from src.lib.session_tracker import STATUS_COMPLETED, get_current_session, update_step_file
+    from src.lib.shards import list_shard_dirs
+    from src.lib.step_data import generated_tests, step_field, step_status
+
+    project_path = args.project_path
+    session = get_current_session(project_path)
+    if not session:
+        print("Error: No active session. Run `init` first.", file=sys.stderr)
+        return 1
+    session_dir = session["session_dir"]
+
+    shard_sets = list_shard_dirs(session_dir)
+    if not shard_sets:
+        print("Error: no shard results in this session. Run `generate --shard i/N` first.", file=sys.stderr)
+        return 1
+    if len(shard_sets) > 1:
+        counts = ", ".join(str(n) for n in sorted(shard_sets))
+        print(
+            f"Error: shard results for several shard counts ({counts}) in "
+            f"{Path(session_dir) / 'shards'}; remove the stale ones.",
+            file=sys.stderr,
+        )
+        return 1
+    total, shard_dirs = next(iter(shard_sets.items()))
+    missing = [i for i in range(1, total + 1) if i not in shard_dirs]
+    unfinished = [
+        i for i in sorted(shard_dirs)
+        if step_status(shard_dirs[i] / "generation.md") != STATUS_COMPLETED
+    ]
+    if missing:
+        print(f"Error: shard(s) {', '.join(f'{i}/{total}' for i in missing)} missing.", file=sys.stderr)
+    if unfinished:
+        print(f"Error: shard(s) {', '.join(f'{i}/{total}' for i in unfinished)} not completed.", file=sys.stderr)
+    if missing or unfinished:
+        return 1
+
+    logger = MdLogger(session_dir, "generation", verbose=getattr(args, "verbose", False))
+    target_count = 0
+    generated: list[dict] = []
+    for index in sorted(shard_dirs):
+        target_count += len(step_field(shard_dirs[index] / "generation.md", "target_files", []))
+        generated.extend(generated_tests(shard_dirs[index]))
+    generated.sort(key=lambda t: t.get("source_file", ""))
+
+    content = _generation_report(target_count, generated, shards=total)
+    update_step_file(session_dir, "generation", STATUS_COMPLETED, content, data={"generated": generated})
+    logger.info(f"Merged {total} shard(s): {len(generated)} test files for {target_count} target files")
+    logger.result("Test Generation Complete", content)
+
+    from src.lib.integrity import emit_token
+    emit_token(project_path, "generation", session["session_id"])
+    return 0
+
+
 _MAX_COMPILE_FIX_ATTEMPTS = 3
 
 
@@ -554,6 +680,75 @@ def _merge_answer_schemas(items: list[dict]) -> dict:
     return merged
 
 
+def _changed_files(args: argparse.Namespace, project_path: str) -> list[str] | None:
+    """Project-relative changed files from --changed / --changed-since.
+
+    Returns None when neither option was given.
+    """
+    explicit = getattr(args, "changed", None)
+    since = getattr(args, "changed_since", None)
+    if explicit is None and not since:
+        return None
+    root = Path(project_path).resolve()
+    files = []
+    for name in explicit or []:
+        path = Path(name)
+        if path.is_absolute():
+            try:
+                path = path.resolve().relative_to(root)
+            except ValueError:
+                continue
+        files.append(path.as_posix())
+    if since:
+        from src.lib.dependency_graph import changed_files_since
+        files.extend(changed_files_since(project_path, since))
+    return files
+
+
+def _regeneration_targets(
+    project_path: str, gaps: list[str], changed: list[str], logger,
+) -> list[str]:
+    """Sources whose tests must be (re)generated after ``changed`` changed.
+
+    The affected set is the changed sources plus every class that
+    transitively extends, implements, injects or holds one of them. Only
+    sources without a test (gaps) or with a TestBoost-generated test are
+    targeted: hand-written tests are never overwritten.
+    """
+    from src.lib.analysis_store import open_class_index
+    from src.lib.dependency_graph import DependencyGraph
+    from src.lib.session_tracker import list_generated_tests, read_project_analysis_data
+
+    view = open_class_index(project_path)
+    if view is not None:
+        with view:
+            graph = DependencyGraph(view)
+    else:
+        data = read_project_analysis_data(project_path) or {}
+        graph = DependencyGraph(data.get("class_index") or {})
+
+    affected = graph.affected(changed)
+    generated = list_generated_tests(project_path)
+    gap_paths = {g.replace("\\", "/"): g for g in gaps}
+    targets: list[str] = []
+    kept: list[str] = []
+    for path in affected:
+        if path in gap_paths:
+            targets.append(gap_paths[path])
+        elif path in generated:
+            targets.append(str(Path(path)))
+        else:
+            kept.append(path)
+
+    logger.info(
+        f"{len(changed)} changed file(s) affect {len(affected)} source file(s); "
+        f"regenerating tests for {len(targets)}"
+    )
+    if kept:
+        logger.info(f"Keeping hand-written tests for: {', '.join(kept)}")
+    return targets
+
+
 def _safe_test_target(project_path: str, test_path: str, source_file: str) -> Path:
     """Resolve the absolute target for a generated test, refusing to clobber
     the source under test.
@@ -576,6 +771,19 @@ def _safe_test_target(project_path: str, test_path: str, source_file: str) -> Pa
     return full_path
 
 
+def _module_conventions(modules: list[dict], source_file: str) -> dict | None:
+    """Test conventions of the module owning ``source_file``, if it has tests.
+
+    The conventions of one module (its own naming, assertion library,
+    mocking style) beat the project-wide mix; modules without tests fall
+    back to the project-wide conventions.
+    """
+    from src.java.modules import find_module
+
+    module = find_module(modules, source_file) if modules else None
+    return (module or {}).get("conventions")
+
+
 async def _attempt_compile_fix(
     project_path: str,
     test_file: Path,
@@ -592,14 +800,15 @@ async def _attempt_compile_fix(
     The compile command comes from the technology plugin when one is
     supplied (e.g. `py_compile {test_file}` for Python); the Java path
     keeps honoring maven_compile_cmd from analysis.md so profiles and
-    custom properties set there are respected.
+    custom properties set there are respected. Gradle commands are scoped
+    to the project owning the test file (``:core:compileTestJava``).
 
     Returns (code, exhausted): exhausted is None when the file compiles (or
     the check was skipped for infra reasons), or a dict with "errors" and
     "attempts" when the retry budget ran out with the code still broken.
     The caller decides whether to queue a question or give up silently.
     """
-    from src.lib.plugins.java_spring import _parse_maven_cmd as _java_parse_maven_cmd
+    from src.lib.plugins.java_spring import _test_compile_command
 
     cmd: list[str] | None = None
     if plugin is not None and plugin.identifier != "java-spring":
@@ -610,12 +819,10 @@ async def _attempt_compile_fix(
         ]
     if cmd is None:
         try:
-            cmd = _java_parse_maven_cmd(maven_compile_cmd) if maven_compile_cmd else None
+            cmd = _test_compile_command(project_path, test_file, maven_compile_cmd)
         except ValueError as e:
             logger.warn(f"Invalid maven_compile_cmd, using default: {e}")
-            cmd = None
-    if not cmd:
-        cmd = [shutil.which("mvn") or shutil.which("mvn.cmd") or "mvn", "test-compile", "-q", "--no-transfer-progress"]
+            cmd = _test_compile_command(project_path, test_file)
 
     current_code = test_code
 
@@ -700,31 +907,35 @@ async def _attempt_test_runtime_fix(
     session_dir: str | None = None,
     maven_test_cmd: str | None = None,
 ) -> str:
-    """Run `mvn test -Dtest=<class>` and use LLM to fix runtime failures, retrying up to N times.
+    """Run the single test class and use LLM to fix runtime failures, retrying up to N times.
 
-    Runs AFTER the test compiles cleanly. Only the test code is rewritten — the
-    production class under test is never modified. Maven/Java specific; callers
-    gate this on the java-spring plugin.
-    """
-    from src.lib.plugins.java_spring import _parse_maven_cmd
+    Maven runs `mvn test -Dtest=<class>`; Gradle runs `<:project>:test --tests
+    <fully.qualified.Class>`. Runs AFTER the test compiles cleanly. Only the
+    test code is rewritten — the production class under test is never
+    modified. Java specific; callers gate this on the java-spring plugin.
 
-    base_cmd = None
-    if maven_test_cmd:
-        try:
-            base_cmd = _parse_maven_cmd(maven_test_cmd)
-        except ValueError as e:
-            logger.warn(f"Invalid maven_test_cmd, using default: {e}")
-            base_cmd = None
-    if not base_cmd:
-        base_cmd = [
-            shutil.which("mvn") or shutil.which("mvn.cmd") or "mvn",
-            "test", "-q", "--no-transfer-progress",
-        ]
+    The prompt carries the failing methods' messages and trimmed stack
+    traces from the run's JUnit XML reports, or the diagnostic lines of
+    the build output when no report was written.
+    """
+    from src.lib.junit_reports import (
+        build_module_dir,
+        collect_results,
+        find_junit_reports,
+        format_failures,
+    )
+    from src.lib.plugins.java_spring import _single_test_command
 
-    cmd = [*base_cmd, f"-Dtest={class_name}"]
+    try:
+        cmd = _single_test_command(project_path, test_file, class_name, maven_test_cmd)
+    except ValueError as e:
+        logger.warn(f"Invalid maven_test_cmd, using default: {e}")
+        cmd = _single_test_command(project_path, test_file, class_name)
     current_code = test_code
+    module_dir = build_module_dir(project_path, test_file)
 
     for attempt in range(1, _MAX_TEST_FIX_ATTEMPTS + 1):
+        run_started = time.time_ns()
         try:
             result = subprocess.run(
                 cmd, cwd=project_path, capture_output=True, text=True,
@@ -741,13 +952,21 @@ async def _attempt_test_runtime_fix(
                 logger.info(f"Tests passing after {attempt - 1} runtime-fix(es): {class_name}")
             return current_code
 
-        output = result.stdout + result.stderr
-        # Keep only lines useful for diagnosis to avoid prompt bloat from Maven noise
-        markers = ("FAIL", "ERROR", "Tests run:", "Caused by:", "at ", class_name)
-        relevant_lines = [ln for ln in output.splitlines() if any(m in ln for m in markers)]
-        if not relevant_lines:
-            relevant_lines = output.splitlines()[-40:]
-        relevant_errors = "\n".join(relevant_lines[:_TEST_FIX_OUTPUT_LINES])
+        failing = [
+            r for r in collect_results(find_junit_reports(module_dir, since_ns=run_started))
+            if r.failed and r.simple_class_name == class_name
+        ]
+        if failing:
+            relevant_errors = format_failures(failing)
+            relevant_lines = relevant_errors.splitlines()
+        else:
+            output = result.stdout + result.stderr
+            # Keep only lines useful for diagnosis to avoid prompt bloat from Maven noise
+            markers = ("FAIL", "ERROR", "Tests run:", "Caused by:", "at ", class_name)
+            relevant_lines = [ln for ln in output.splitlines() if any(m in ln for m in markers)]
+            if not relevant_lines:
+                relevant_lines = output.splitlines()[-40:]
+            relevant_errors = "\n".join(relevant_lines[:_TEST_FIX_OUTPUT_LINES])
 
         logger.info(
             f"Test failures in {class_name} "
@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Any
 
 from src.lib.commands._shared import (
-    _extract_json_field,
     _read_step_status,
     load_answer_for_step,
 )
@@ -247,8 +246,9 @@ async def _cmd_killer_async(args: argparse.Namespace) -> int:
 
     try:
         # Read surviving mutants from mutation step
-        mutation_content = mutation_file.read_text(encoding="utf-8")
-        surviving_mutants = _extract_json_field(mutation_content, "surviving_mutants")
+        from src.lib.step_data import surviving_mutants as read_surviving_mutants
+
+        surviving_mutants = read_surviving_mutants(session_dir)
 
         # Distinguish None (missing data / corrupt file) from [] (genuinely zero survivors)
         if surviving_mutants is None:
@@ -280,7 +280,7 @@ async def _cmd_killer_async(args: argparse.Namespace) -> int:
         from src.lib.bridge import generate_killer_tests
         from src.lib.startup_checks import check_llm_connection
         try:
-            await check_llm_connection()
+            await check_llm_connection(project_path=project_path)
         except Exception as e:
             logger.error(f"LLM connection failed: {e}")
             print(f"\nERROR: Cannot connect to LLM provider. {e}")
@@ -376,7 +376,7 @@ async def _cmd_killer_async(args: argparse.Namespace) -> int:
             # Compile-and-fix loop for killer tests
             maven_compile_cmd = None
             from src.lib.session_tracker import read_project_analysis_data
-            project_data = read_project_analysis_data(project_path)
+            project_data = read_project_analysis_data(project_path, include_class_index=False)
             if project_data:
                 maven_compile_cmd = project_data.get("maven_compile_cmd")
 
@@ -86,8 +86,73 @@ def cmd_cleanup(args: argparse.Namespace) -> int:
         if not dry_run:
             mark_abandoned(s["session_dir"])
     return 0
+def cmd_compact(args: argparse.Namespace) -> int:
+    """Archive finished sessions selected by a retention policy.
+
+    Each selected session is packed into .testboost/archive/<id>.tar.gz,
+    recorded in .testboost/archive/manifest.json and removed from
+    sessions/. The most recent session is always kept.
+    With --dry-run: list the sessions that would be archived.
+    """
+    from src.lib.session_archive import DEFAULT_STATUSES, archive_session, select_sessions
+    from src.lib.session_tracker import get_sessions_dir, list_sessions
+
+    project_path = args.project_path
+    if not get_sessions_dir(project_path).is_dir():
+        print(f"Error: no .testboost/sessions/ in {project_path}. Run `init` first.", file=sys.stderr)
+        return 1
+    dry_run = bool(getattr(args, "dry_run", False))
+
+    selected = select_sessions(
+        list_sessions(project_path),
+        keep_last=args.keep_last,
+        older_than_days=getattr(args, "older_than_days", None),
+        statuses=tuple(getattr(args, "status", None) or DEFAULT_STATUSES),
+    )
+    if not selected:
+        print("No sessions to compact.")
+        return 0
+
+    print(f"{'Would archive' if dry_run else 'Archiving'} {len(selected)} session(s):")
+    total = 0
+    for s in selected:
+        if dry_run:
+            print(f"  - {s['session_id']:30}  status={s['status']}")
+            continue
+        entry = archive_session(project_path, s)
+        total += entry["size_bytes"]
+        print(f"  - {s['session_id']:30}  status={s['status']:10}  -> archive/{entry['archive']}")
+    if not dry_run:
+        print(f"Archived {len(selected)} session(s), {total / 1024:.1f} KiB compressed.")
+    return 0
+def cmd_sessions(args: argparse.Namespace) -> int:
+    """List the sessions of a project from the session registry.
+
+    With --rebuild: drop .testboost/sessions.db and re-index every session
+    directory first (legacy sessions, or a registry out of step with the
+    directories after a manual copy).
+    """
+    from src.lib.session_registry import rebuild_registry
+    from src.lib.session_tracker import get_sessions_dir, list_sessions
+
+    project_path = args.project_path
+    if not get_sessions_dir(project_path).is_dir():
+        print(f"Error: no .testboost/sessions/ in {project_path}. Run `init` first.", file=sys.stderr)
+        return 1
+
+    if getattr(args, "rebuild", False):
+        count = rebuild_registry(project_path)
+        print(f"Session registry rebuilt: {count} session(s) indexed.")
+
+    sessions = list_sessions(project_path)
+    if not sessions:
+        print("No sessions.")
+        return 0
+    for s in sessions:
+        print(f"  - {s['session_id']:30}  status={s['status']:15}  step={s['step']}")
+    return 0
 def cmd_doctor(args: argparse.Namespace) -> int:
-    """Health-check: LLM, .tb_secret, write perms, Maven.
+    """Health-check: LLM, .tb_secret, write perms, Maven (or Gradle).
 
     Exit 0 if all green; 1 if any issue. Prints a per-check status line.
     """
@@ -119,18 +184,37 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     if not writable:
         issues.append("project directory is not writable")
 
-    # 3. Maven available
-    mvn = _sh.which("mvn") or _sh.which("mvn.cmd")
-    checks.append(("maven", mvn is not None, f"mvn {'found at ' + mvn if mvn else 'not on PATH'}"))
-    if mvn is None:
-        issues.append("Maven not on PATH (only blocks Java projects)")
+    # 3. Build tool available: the Gradle wrapper or binary for Gradle
+    # builds, Maven otherwise
+    from src.java.gradle import is_gradle_project
+
+    if is_gradle_project(project_path):
+        wrapper = next(
+            (name for name in ("gradlew", "gradlew.bat")
+             if _os.path.exists(_os.path.join(project_path, name))),
+            None,
+        )
+        gradle = wrapper or _sh.which("gradle") or _sh.which("gradle.bat")
+        if wrapper:
+            gradle_msg = f"Gradle wrapper {wrapper} found"
+        else:
+            gradle_msg = f"gradle {'found at ' + gradle if gradle else 'not on PATH and no wrapper'}"
+        checks.append(("gradle", gradle is not None, gradle_msg))
+        if gradle is None:
+            issues.append("Gradle not on PATH and no gradlew wrapper in the project")
+    else:
+        mvn = _sh.which("mvn") or _sh.which("mvn.cmd")
+        checks.append(("maven", mvn is not None, f"mvn {'found at ' + mvn if mvn else 'not on PATH'}"))
+        if mvn is None:
+            issues.append("Maven not on PATH (only blocks Java projects)")
 
     # 4. LLM reachable (best effort, async)
     llm_ok = True
     llm_msg = "LLM ping OK"
     try:
         from src.lib.startup_checks import check_llm_connection
-        asyncio.run(check_llm_connection())
+        # doctor always pings for real, and refreshes the cached result
+        asyncio.run(check_llm_connection(project_path=project_path, use_cache=False))
     except Exception as e:
         llm_ok = False
         llm_msg = f"LLM ping failed: {e}"
@@ -151,6 +235,7 @@ def cmd_status(args: argparse.Namespace) -> int:
     """Show current session status."""
     from pathlib import Path as _Path
 
+    from src.lib.session_archive import read_manifest
     from src.lib.session_tracker import (
         get_current_session,
         get_session_status,
@@ -167,4 +252,18 @@ def cmd_status(args: argparse.Namespace) -> int:
         print()
 
     print(status)
+
+    archived = read_manifest(args.project_path)
+    if archived:
+        print()
+        print(f"### Archived Sessions ({len(archived)})")
+        print()
+        print("| Session | Status | Step | Archived |")
+        print("|---------|--------|------|----------|")
+        # The most recent ones; the manifest lists them all
+        for entry in archived[-10:]:
+            print(
+                f"| {entry['session_id']} | {entry.get('status', '')} | "
+                f"{entry.get('step', '')} | {entry.get('archived_at', '')} |"
+            )
     return 0
@@ -6,9 +6,13 @@ import asyncio
 import re
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.lib.commands._shared import _extract_json_field, load_answer_for_step
+from src.lib.commands._shared import load_answer_for_step
+from src.lib.workers import default_worker_count
 
 
 def _guess_failing_class(line: str) -> str | None:
@@ -20,6 +24,26 @@ def _guess_failing_class(line: str) -> str | None:
     """
     m = re.search(r"([A-Z][A-Za-z0-9_]*Tests?)\b", line)
     return m.group(1) if m else None
+
+
+def _run_per_file(
+    commands: list[list[str]], project_path: str, timeout: int, workers: int,
+) -> list[subprocess.CompletedProcess]:
+    """Run one command per test file, at most ``workers`` at a time.
+
+    Each command is its own child process; the pool only bounds how many
+    run at once. Results come back in the order of ``commands``.
+    """
+    def run(cmd: list[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(cmd, cwd=project_path, capture_output=True, text=True, timeout=timeout)
+
+    if workers <= 1 or len(commands) < 2:
+        return [run(cmd) for cmd in commands]
+    with ThreadPoolExecutor(max_workers=min(workers, len(commands))) as pool:
+        # map() yields in submission order: the report stays deterministic
+        return list(pool.map(run, commands))
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
     """Compile and validate generated tests."""
     return asyncio.run(_cmd_validate_async(args))
@@ -46,6 +70,15 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
         print("Error: No active session. Run `init` first.", file=sys.stderr)
         return 1
 
+    fork_count = getattr(args, "fork_count", None)
+    if fork_count and not re.fullmatch(r"\d+(\.\d+)?C?", str(fork_count)):
+        print(
+            f"Error: invalid --fork-count {fork_count!r}: expected a number, "
+            "optionally followed by C (4, 1C, 0.5C).",
+            file=sys.stderr,
+        )
+        return 1
+
     session_dir = session["session_dir"]
     logger = MdLogger(session_dir, "validation", verbose=getattr(args, "verbose", False))
 
@@ -79,23 +112,24 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
         plugin = get_plugin_for_session(project_path)
 
         # Build session_config from analysis.md (allows profile/property customization)
+        from src.lib.step_data import generated_tests, session_build_commands
+
         session_config: dict = {}
-        analysis_file = Path(session_dir) / "analysis.md"
-        if analysis_file.exists():
-            analysis_content = analysis_file.read_text(encoding="utf-8")
-            maven_compile_cmd = _extract_json_field(analysis_content, "maven_compile_cmd")
-            maven_test_cmd = _extract_json_field(analysis_content, "maven_test_cmd")
-            if maven_compile_cmd:
-                session_config["maven_compile_cmd"] = maven_compile_cmd
-            if maven_test_cmd:
-                session_config["maven_test_cmd"] = maven_test_cmd
+        maven_compile_cmd, maven_test_cmd = session_build_commands(session_dir)
+        if maven_compile_cmd:
+            session_config["maven_compile_cmd"] = maven_compile_cmd
+        if maven_test_cmd:
+            session_config["maven_test_cmd"] = maven_test_cmd
+        if getattr(args, "fork_count", None):
+            session_config["surefire_fork_count"] = args.fork_count
+        if getattr(args, "surefire_parallel", None):
+            session_config["surefire_parallel"] = args.surefire_parallel
 
         compile_cmd_tpl = plugin.validation_command(_Path(project_path), session_config)
         test_run_cmd_tpl = plugin.test_run_command(_Path(project_path), session_config)
 
         # Collect generated test files from the generation step
-        gen_content = gen_file.read_text(encoding="utf-8")
-        generated_files = _extract_json_field(gen_content, "generated") or []
+        generated_files = generated_tests(session_dir)
         test_file_paths = [g["path"] for g in generated_files if g.get("path")]
 
         # Apply developer-provided test fixes from the answer payload
@@ -109,26 +143,40 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
                     target.write_text(fix["fixed_code"], encoding="utf-8")
                     logger.info(f"Applied developer-provided validate fix for {cls}")
 
+        # Suite-wide test commands (Maven/Gradle) run only the generated
+        # test classes, unless --full-suite asks for every test
+        scoped_test_cmds = None
+        if not getattr(args, "full_suite", False) and test_file_paths:
+            scoped_test_cmds = plugin.scoped_test_commands(
+                _Path(project_path), session_config, test_file_paths,
+            )
+
         # Helper: substitute {test_file} placeholder or run as-is
         def _expand_cmd(cmd_tpl: list[str], test_file: str) -> list[str]:
             return [part.replace("{test_file}", test_file) for part in cmd_tpl]
 
         has_placeholder = any("{test_file}" in part for part in compile_cmd_tpl)
+        workers = getattr(args, "workers", None) or default_worker_count()
 
         content = "# Validation Results\n\n"
         content += f"- **Compile**: `{' '.join(compile_cmd_tpl)}`\n"
-        content += f"- **Test**: `{' '.join(test_run_cmd_tpl)}`\n\n"
+        content += f"- **Test**: `{' '.join(test_run_cmd_tpl)}`\n"
+        if scoped_test_cmds:
+            content += (
+                f"- **Scope**: {len(test_file_paths)} generated test file(s), "
+                f"{len(scoped_test_cmds)} run(s)\n"
+            )
+        content += "\n"
 
         # Step 1: Compile tests
         compile_failed = False
         if has_placeholder:
-            # Per-file validation (Python, Go, etc.)
-            for tf in test_file_paths:
-                compile_cmd = _expand_cmd(compile_cmd_tpl, tf)
+            # Per-file validation (Python, Go, etc.), files in parallel
+            compile_cmds = [_expand_cmd(compile_cmd_tpl, tf) for tf in test_file_paths]
+            for compile_cmd in compile_cmds:
                 logger.info(f"Validating: {' '.join(compile_cmd)}")
-                compile_result = subprocess.run(
-                    compile_cmd, cwd=project_path, capture_output=True, text=True, timeout=120,
-                )
+            compile_results = _run_per_file(compile_cmds, project_path, 120, workers)
+            for tf, compile_result in zip(test_file_paths, compile_results, strict=True):
                 if compile_result.returncode != 0:
                     content += f"## Compilation: FAILED (`{tf}`)\n\n"
                     content += f"```\n{(compile_result.stdout + compile_result.stderr)[-2000:]}\n```\n"
@@ -169,26 +217,61 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
         content += "## Compilation: PASSED\n\n"
 
         # Step 2: Run tests
+        from src.lib.junit_reports import (
+            collect_results,
+            find_junit_reports,
+            format_failures,
+            format_summary,
+            parse_junit_xml,
+            summarize,
+        )
+
         has_test_placeholder = any("{test_file}" in part for part in test_run_cmd_tpl)
         test_timeout = 300  # 5 minutes
+        # Per-test results from JUnit XML reports (empty when none was written)
+        test_results = []
 
         if has_test_placeholder:
-            # Per-file test execution (Python, Go, etc.)
+            # Per-file test execution (Python, Go, etc.), files in parallel
             all_output = ""
             final_returncode = 0
-            for tf in test_file_paths:
-                test_run_cmd = _expand_cmd(test_run_cmd_tpl, tf)
+            with tempfile.TemporaryDirectory(prefix="testboost-junit-") as report_dir:
+                report_files = [_Path(report_dir) / f"{i}.xml" for i in range(len(test_file_paths))]
+                test_run_cmds = [
+                    [*_expand_cmd(test_run_cmd_tpl, tf), *plugin.junit_report_args(report)]
+                    for tf, report in zip(test_file_paths, report_files, strict=True)
+                ]
+                for test_run_cmd in test_run_cmds:
+                    logger.info(f"Running tests: {' '.join(test_run_cmd)}")
+                for test_result in _run_per_file(test_run_cmds, project_path, test_timeout, workers):
+                    all_output += test_result.stdout + test_result.stderr + "\n"
+                    if test_result.returncode != 0:
+                        final_returncode = test_result.returncode
+                for tf, report in zip(test_file_paths, report_files, strict=True):
+                    if report.exists():
+                        for case in parse_junit_xml(report):
+                            case.test_file = tf
+                            test_results.append(case)
+            test_output = all_output
+            test_returncode = final_returncode
+        elif scoped_test_cmds:
+            # Generated test classes only, one run per chunk of the selection
+            run_started = time.time_ns()
+            outputs = []
+            test_returncode = 0
+            for test_run_cmd in scoped_test_cmds:
                 logger.info(f"Running tests: {' '.join(test_run_cmd)}")
                 test_result = subprocess.run(
                     test_run_cmd, cwd=project_path, capture_output=True, text=True, timeout=test_timeout,
                 )
-                all_output += test_result.stdout + test_result.stderr + "\n"
+                outputs.append(test_result.stdout + test_result.stderr)
                 if test_result.returncode != 0:
-                    final_returncode = test_result.returncode
-            test_output = all_output
-            test_returncode = final_returncode
+                    test_returncode = test_result.returncode
+            test_output = "\n".join(outputs)
+            test_results = collect_results(find_junit_reports(project_path, since_ns=run_started))
         else:
-            # Whole-project test execution (Java/Maven)
+            # Whole-project test execution (Java/Maven, --full-suite)
+            run_started = time.time_ns()
             test_run_cmd = test_run_cmd_tpl
             logger.info(f"Running tests: {' '.join(test_run_cmd)}")
             test_result = subprocess.run(
@@ -196,43 +279,73 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
             )
             test_output = test_result.stdout + test_result.stderr
             test_returncode = test_result.returncode
+            # Surefire/Gradle reports written by this run only
+            test_results = collect_results(find_junit_reports(project_path, since_ns=run_started))
+
+        results_summary = summarize(test_results) if test_results else None
+        failing_tests = [r for r in test_results if r.failed]
 
         if test_returncode == 0:
             content += "## Tests: PASSED\n\n"
             content += "All tests passed successfully.\n\n"
 
-            # Try to extract test counts from Maven output
-            test_count_match = re.search(r"Tests run: (\d+)", test_output)
-            if test_count_match:
-                content += f"**Tests run**: {test_count_match.group(1)}\n"
+            if results_summary:
+                content += f"**Tests run**: {format_summary(results_summary)}\n"
+            else:
+                # No report: try to extract test counts from Maven output
+                test_count_match = re.search(r"Tests run: (\d+)", test_output)
+                if test_count_match:
+                    content += f"**Tests run**: {test_count_match.group(1)}\n"
 
             logger.info("All tests passed")
             status = STATUS_COMPLETED
         else:
             content += "## Tests: FAILED\n\n"
 
-            # Extract failure details
-            failure_lines = [
-                ln for ln in test_output.split("\n")
-                if "FAIL" in ln or "ERROR" in ln or "Tests run:" in ln
-            ]
-            if failure_lines:
-                content += "### Failure Details\n\n```\n"
-                content += "\n".join(failure_lines[-20:])
-                content += "\n```\n\n"
-
-            content += "### Full Output\n\n"
-            content += f"```\n{test_output[-3000:]}\n```\n"
+            failure_lines = []
+            if failing_tests:
+                content += f"**Tests run**: {format_summary(results_summary)}\n\n"
+                content += "### Failed Tests\n\n```\n"
+                content += format_failures(failing_tests)
+                content += "\n```\n"
+            else:
+                # No report, or the build failed outside the tests: grep the output
+                failure_lines = [
+                    ln for ln in test_output.split("\n")
+                    if "FAIL" in ln or "ERROR" in ln or "Tests run:" in ln
+                ]
+                if failure_lines:
+                    content += "### Failure Details\n\n```\n"
+                    content += "\n".join(failure_lines[-20:])
+                    content += "\n```\n\n"
+
+                content += "### Full Output\n\n"
+                content += f"```\n{test_output[-3000:]}\n```\n"
 
             logger.error("Some tests failed")
 
             # --- HITL trigger: pause if asked, instead of marking failed ---
             if fail_on_uncertainty:
-                failing_classes = sorted({
-                    _guess_failing_class(ln) for ln in failure_lines
-                    if _guess_failing_class(ln)
-                })
-                stack_trace = "\n".join(failure_lines[-30:])
+                if failing_tests:
+                    # Name failing tests by the keys validate_fixes is matched on
+                    fix_keys = {
+                        _Path(g["path"]).stem: g.get("class_name") or _Path(g["path"]).stem
+                        for g in generated_files if g.get("path")
+                    }
+                    failing_classes = sorted({
+                        fix_keys.get(stem, stem)
+                        for stem in (
+                            _Path(r.test_file).stem if r.test_file else r.simple_class_name
+                            for r in failing_tests
+                        )
+                    })
+                    stack_trace = format_failures(failing_tests)
+                else:
+                    failing_classes = sorted({
+                        _guess_failing_class(ln) for ln in failure_lines
+                        if _guess_failing_class(ln)
+                    })
+                    stack_trace = "\n".join(failure_lines[-30:])
                 # A new question supersedes the answered one
                 if answer_payload is not None:
                     finalize_answer(session_dir, answer_payload)
@@ -243,6 +356,7 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
                         "kind": "tests_failed_at_runtime",
                         "subject": {
                             "failing_classes": failing_classes,
+                            "failing_tests": [f"{r.class_name}.{r.name}" for r in failing_tests],
                             "command": " ".join(test_run_cmd_tpl),
                         },
                         "question": (
@@ -267,14 +381,18 @@ async def _cmd_validate_async(args: argparse.Namespace) -> int:
 
             status = STATUS_FAILED
 
-        update_step_file(
-            session_dir, "validation", status, content,
-            data={
-                "compilation": "passed",
-                "tests": "passed" if test_returncode == 0 else "failed",
-                "return_code": test_returncode,
-            },
-        )
+        data = {
+            "compilation": "passed",
+            "tests": "passed" if test_returncode == 0 else "failed",
+            "return_code": test_returncode,
+        }
+        if results_summary:
+            data["test_results"] = results_summary
+            data["failing_tests"] = [
+                {"class_name": r.class_name, "name": r.name, "status": r.status, "message": r.message}
+                for r in failing_tests
+            ]
+        update_step_file(session_dir, "validation", status, content, data=data)
 
         logger.result("Validation Results", content)
 
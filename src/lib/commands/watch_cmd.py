@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: Apache-2.0
+"""testboost watch — keep the project analysis current while editing."""
+
+import argparse
+import os
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.lib.commands._shared import _read_step_status
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How long one idle wait lasts: bounds the reaction time to a stop request
+_IDLE_WAIT = 0.5
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    """Watch source and test roots and refresh the analysis on change.
+
+    Updates the filesystem index, the class index (reparsing only the
+    changed files) and the analysis store, so `gaps` and `generate` start
+    from fresh data without rescanning the project. Session step files
+    are never written.
+    """
+    from src.lib.bridge import get_plugin_for_session
+    from src.lib.project_index import get_project_index
+    from src.lib.session_tracker import read_project_analysis_data
+    from src.lib.watcher import open_watcher
+
+    project_path = os.path.abspath(args.project_path)
+    if read_project_analysis_data(project_path, include_class_index=False) is None:
+        print("Error: No project analysis found. Run `analyze` first.", file=sys.stderr)
+        return 1
+    if get_plugin_for_session(project_path).identifier != "java-spring":
+        print("Error: watch supports Java projects only.", file=sys.stderr)
+        return 1
+
+    index = get_project_index(project_path)
+    roots = index.source_roots() + index.test_roots()
+    if not roots:
+        print("Error: No src/main/java or src/test/java directory to watch.", file=sys.stderr)
+        return 1
+
+    watcher = open_watcher(
+        project_path, roots,
+        polling=getattr(args, "polling", False),
+        interval=getattr(args, "poll_interval", 1.0),
+    )
+    print(f"Watching {len(roots)} director{'y' if len(roots) == 1 else 'ies'} "
+          f"({watcher.backend}). Press Ctrl-C to stop.", flush=True)
+    try:
+        _watch_loop(project_path, watcher, roots, debounce=getattr(args, "debounce", 0.3))
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        watcher.close()
+    return 0
+
+
+def _watch_loop(
+    project_path: str,
+    watcher: Any,
+    roots: list[str],
+    debounce: float = 0.3,
+    stop: threading.Event | None = None,
+    on_refresh: Callable[[dict[str, Any]], None] | None = None,
+) -> None:
+    """Refresh the analysis after each debounced batch of changes."""
+    from src.lib.project_index import get_project_index, settle_project_index
+    from src.lib.watcher import collect_changes
+
+    get_project_index(project_path).live = True
+    settled = False
+    while stop is None or not stop.is_set():
+        changed = collect_changes(watcher, timeout=_IDLE_WAIT, debounce=debounce)
+        if changed is not None and not changed:
+            if not settled:
+                settled = settle_project_index(project_path, roots)
+            continue
+        summary = _refresh_analysis(project_path, changed)
+        settled = False
+        print(
+            f"[watch] {summary['changed']} changed: {summary['reparsed']} reparsed, "
+            f"{summary['classes']} classes indexed"
+            + (f", {summary['gaps']} gaps" if summary["gaps"] is not None else ""),
+            flush=True,
+        )
+        if on_refresh is not None:
+            on_refresh(summary)
+
+
+def _refresh_analysis(project_path: str, changed: set[str] | None) -> dict[str, Any]:
+    """Fold a batch of changes into the indexes and the analysis store.
+
+    Args:
+        project_path: Project root.
+        changed: Changed project-relative paths, or None to rescan.
+
+    Returns:
+        {"changed", "reparsed", "classes", "gaps"} for the progress line
+        ("gaps" is the current gap count, None when the current session
+        has no gap list yet).
+    """
+    from src.lib.analysis_store import write_analysis_data
+    from src.lib.bridge import find_source_files, update_class_index
+    from src.lib.commands.analyze_cmd import _source_file_details
+    from src.lib.project_index import get_project_index, update_project_index
+    from src.lib.session_tracker import read_project_analysis_data
+
+    if changed is None:
+        get_project_index(project_path, refresh=True).live = True
+    else:
+        update_project_index(project_path, changed)
+
+    source_files = find_source_files(project_path)
+    class_index, stats = update_class_index(project_path, source_files)
+
+    data = read_project_analysis_data(project_path, include_class_index=False) or {}
+    data["source_files"] = source_files
+    data["source_file_details"] = _source_file_details(project_path, source_files)
+    data["class_index"] = class_index
+    write_analysis_data(project_path, data)
+
+    gaps = _count_gaps(project_path, source_files)
+    summary = {
+        "changed": "all" if changed is None else len(changed),
+        "reparsed": stats["reparsed"],
+        "classes": len(class_index),
+        "gaps": gaps,
+    }
+    logger.info("watch_refreshed", **summary)
+    return summary
+
+
+def _count_gaps(project_path: str, source_files: list[str]) -> int | None:
+    """Gap count for the progress line, or None before the first `gaps` run.
+
+    Read-only: the session's step files belong to the workflow commands.
+    Rewriting coverage-gaps.md here would move the session's ``step:``
+    back to coverage-gaps and change the gap list under a paused or
+    running `generate` (whose cursor is keyed by its target files).
+    """
+    from src.lib.commands.analyze_cmd import _find_gaps
+    from src.lib.session_tracker import STATUS_COMPLETED, get_current_session
+
+    session = get_current_session(project_path)
+    if not session:
+        return None
+    if _read_step_status(Path(session["session_dir"]) / "coverage-gaps.md") != STATUS_COMPLETED:
+        return None
+    gaps, _ = _find_gaps(project_path, source_files)
+    return len(gaps)
@@ -66,6 +66,10 @@ class Settings(BaseSettings):
         default=15,
         description="Startup check timeout in seconds (Gemini requires min 10s)",
     )
+    llm_check_cache_ttl: int = Field(
+        default=900,
+        description="Seconds a successful LLM connectivity check is reused (0 disables)",
+    )
 
     # Retry settings
     max_retries: int = Field(
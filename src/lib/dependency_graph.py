@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Reverse-dependency graph over the project class index.
+
+The class index records, for every class, what it ``extends`` and
+``implements``, its constructor/injected ``dependencies`` and its
+``fields``. When a class changes, the tests of every class that uses it
+(mocks it, extends it, holds it in a field) may be stale, and so may the
+tests of *their* users. :class:`DependencyGraph` inverts those edges so
+``generate --changed`` can regenerate exactly that transitive set.
+"""
+
+import re
+import subprocess
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Capitalised identifiers inside a type: Map<String, List<Customer>> → Map, String, List, Customer
+_TYPE_NAME_PATTERN = re.compile(r"\b[A-Z]\w*")
+
+
+def _norm(path: str) -> str:
+    return path.replace("\\", "/")
+
+
+def _referenced_types(entry: Mapping[str, Any]) -> set[str]:
+    """Names of the types a class index entry depends on."""
+    names: set[str] = set()
+    if entry.get("extends"):
+        names.add(entry["extends"])
+    names.update(entry.get("implements") or ())
+    for dep in entry.get("dependencies") or ():
+        names.update(_TYPE_NAME_PATTERN.findall(dep.get("type", "")))
+    for field in entry.get("fields") or ():
+        names.update(_TYPE_NAME_PATTERN.findall(field.get("type", "")))
+    return names
+
+
+class DependencyGraph:
+    """Who-uses-whom over the classes of one project.
+
+    Args:
+        class_index: Class index mapping (a dict or a ``ClassIndexView``).
+    """
+
+    def __init__(self, class_index: Mapping[str, Mapping[str, Any]]):
+        # Source file of each indexed class name, and the reverse: which
+        # source files define which names (later duplicates are indexed by FQN)
+        self._path_of: dict[str, str] = {}
+        self._names_in: dict[str, set[str]] = {}
+        uses: dict[str, set[str]] = {}
+        for name, entry in class_index.items():
+            path = _norm(entry.get("relative_path") or "")
+            if not path:
+                continue
+            self._path_of[name] = path
+            self._names_in.setdefault(path, set()).add(name)
+            uses[path] = uses.get(path, set()) | _referenced_types(entry)
+
+        self._dependents: dict[str, set[str]] = {}
+        for path, names in uses.items():
+            for name in names:
+                target = self._path_of.get(name)
+                if target and target != path:
+                    self._dependents.setdefault(target, set()).add(path)
+
+    def dependents(self, source_path: str) -> set[str]:
+        """Source files that directly use a class defined in ``source_path``."""
+        return set(self._dependents.get(_norm(source_path), ()))
+
+    def affected(self, changed_paths: Iterable[str]) -> list[str]:
+        """Changed indexed sources plus everything that transitively uses them.
+
+        Args:
+            changed_paths: Project-relative paths of changed files; paths
+                that are not indexed sources are ignored.
+
+        Returns:
+            Sorted project-relative source paths ("/" separated).
+        """
+        seen = {_norm(p) for p in changed_paths if _norm(p) in self._names_in}
+        queue = deque(seen)
+        while queue:
+            for user in self._dependents.get(queue.popleft(), ()):
+                if user not in seen:
+                    seen.add(user)
+                    queue.append(user)
+        return sorted(seen)
+
+
+def changed_files_since(project_path: str, ref: str) -> list[str]:
+    """Files changed between ``ref`` and the working tree, per git.
+
+    Args:
+        project_path: Project root (inside a git work tree).
+        ref: Any git revision (``HEAD~1``, ``origin/main``, a SHA...).
+
+    Returns:
+        Paths relative to ``project_path``.
+
+    Raises:
+        ValueError: If git is unavailable or ``ref`` cannot be resolved.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", ref, "--"],
+            cwd=project_path, capture_output=True, text=True, timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ValueError(f"cannot run git diff: {e}") from e
+    if result.returncode != 0:
+        raise ValueError(f"git diff {ref} failed: {result.stderr.strip()}")
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+__all__ = ["DependencyGraph", "changed_files_since"]
@@ -23,7 +23,10 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from src.lib.cache_files import ensure_gitignored
+
 SECRET_FILE = ".tb_secret"
+_SECRET_COMMENT = "TestBoost installation secret (never commit)"
 TOKEN_PREFIX = "[TESTBOOST_INTEGRITY:"
 TOKEN_SUFFIX = "]"
 
@@ -58,7 +61,7 @@ def get_or_create_secret(project_path: str) -> str:
         # masked variable BEFORE init runs) — the gitignore entry must be
         # ensured on every access, or the CI pause-state commit would push
         # the raw secret to the MR branch.
-        _ensure_gitignored(tb_dir, SECRET_FILE)
+        ensure_gitignored(tb_dir, SECRET_FILE, _SECRET_COMMENT)
         return secret_path.read_text(encoding="utf-8").strip()
 
     # Generate a new secret
@@ -67,7 +70,7 @@ def get_or_create_secret(project_path: str) -> str:
     secret_path.write_text(secret, encoding="utf-8")
 
     # Ensure .tb_secret is in .gitignore
-    _ensure_gitignored(tb_dir, SECRET_FILE)
+    ensure_gitignored(tb_dir, SECRET_FILE, _SECRET_COMMENT)
 
     return secret
 
@@ -252,17 +255,3 @@ def verify_answer(
             f"question expired (created {created}, TTL {ttl_hours}h)"
         )
 
-
-def _ensure_gitignored(tb_dir: Path, filename: str) -> None:
-    """Make sure the file is in .testboost/.gitignore."""
-    gitignore = tb_dir / ".gitignore"
-    if gitignore.exists():
-        content = gitignore.read_text(encoding="utf-8")
-        if filename not in content:
-            with open(gitignore, "a", encoding="utf-8") as f:
-                f.write(f"\n# TestBoost installation secret (never commit)\n{filename}\n")
-    else:
-        gitignore.write_text(
-            f"# TestBoost installation secret (never commit)\n{filename}\n",
-            encoding="utf-8",
-        )
@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Structured test results from JUnit XML reports.
+
+Maven Surefire writes ``target/surefire-reports/TEST-<class>.xml``, Gradle
+``build/test-results/<task>/TEST-<class>.xml`` and pytest the file given
+to ``--junitxml``. They share one format:
+
+```xml
+<testsuite name="com.example.OrderServiceTest" tests="3" failures="1">
+  <testcase classname="com.example.OrderServiceTest" name="total" time="0.012">
+    <failure message="expected: &lt;100&gt; but was: &lt;99&gt;"
+             type="org.opentest4j.AssertionFailedError">...stack trace...</failure>
+  </testcase>
+</testsuite>
+```
+
+``validate`` and the runtime-fix loop of ``generate`` read these reports
+rather than grepping the build output: each test comes back with its
+status, duration and, for failures, the message and stack trace. Prompts
+and HITL questions then carry the failing methods' traces only, trimmed
+to the frames of the test class. When a build writes no report (timeout,
+failure before the tests ran), callers fall back to the raw output.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.lib.cache_files import RACY_WINDOW_NS
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+STATUS_SKIPPED = "skipped"
+
+# Directories holding JUnit XML reports written by the build tools
+_REPORT_DIRS = ("surefire-reports", "test-results")
+_SKIPPED_DIRS = {".git", ".testboost", "node_modules", "src", "__pycache__"}
+_BUILD_FILES = ("pom.xml", "build.gradle", "build.gradle.kts")
+
+_MAX_MESSAGE_CHARS = 500
+_MAX_TRACE_LINES = 25
+
+
+@dataclass
+class CaseResult:
+    """Outcome of one test method.
+
+    Attributes:
+        class_name: Fully qualified class (``com.example.OrderServiceTest``)
+            or pytest node prefix (``tests.test_orders.TestTotal``).
+        name: Test method name.
+        status: One of ``passed``, ``failed``, ``error``, ``skipped``.
+        time: Duration in seconds.
+        message: Failure message (empty when the test passed).
+        failure_type: Exception type of the failure, if reported.
+        trace: Full stack trace or traceback of the failure.
+        test_file: Test file the result was collected for, when known.
+    """
+
+    class_name: str
+    name: str
+    status: str
+    time: float = 0.0
+    message: str = ""
+    failure_type: str = ""
+    trace: str = ""
+    test_file: str | None = None
+
+    @property
+    def simple_class_name(self) -> str:
+        """Class name without package or nested class (``OrderServiceTest``)."""
+        return self.class_name.rsplit(".", 1)[-1].split("$", 1)[0]
+
+    @property
+    def failed(self) -> bool:
+        return self.status in (STATUS_FAILED, STATUS_ERROR)
+
+
+def parse_junit_xml(path: str | Path) -> list[CaseResult]:
+    """Parse one JUnit XML report (``<testsuite>`` or ``<testsuites>`` root).
+
+    Unreadable or malformed files give an empty list: a report being
+    written while we read it must not fail the step.
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError) as e:
+        logger.warning("junit_report_unreadable", path=str(path), error=str(e))
+        return []
+    return [_parse_case(case) for case in root.iter("testcase")]
+
+
+def _parse_case(case: ET.Element) -> CaseResult:
+    result = CaseResult(
+        class_name=case.get("classname", ""),
+        name=case.get("name", ""),
+        status=STATUS_PASSED,
+        time=_parse_time(case.get("time")),
+    )
+    # Surefire's flakyFailure/rerunFailure are retries of a test that
+    # eventually passed (or failed): only the final outcome counts
+    for tag, status in (("failure", STATUS_FAILED), ("error", STATUS_ERROR), ("skipped", STATUS_SKIPPED)):
+        element = case.find(tag)
+        if element is None:
+            continue
+        result.status = status
+        result.message = (element.get("message") or "").strip()
+        result.failure_type = element.get("type") or ""
+        result.trace = (element.text or "").strip()
+        break
+    return result
+
+
+def _parse_time(value: str | None) -> float:
+    try:
+        # Surefire writes "1,234.5" on some locales
+        return float((value or "0").replace(",", ""))
+    except ValueError:
+        return 0.0
+
+
+def find_junit_reports(root: str | Path, since_ns: int | None = None) -> list[Path]:
+    """JUnit XML reports under ``root``'s Surefire/Gradle report directories.
+
+    Args:
+        root: Project or module directory to search.
+        since_ns: Only reports modified at or after this time
+            (``time.time_ns()``), so stale reports of classes the last run
+            did not execute are ignored.
+
+    Returns:
+        Report paths, sorted.
+    """
+    # Coarse clocks: a report written right after the run started may
+    # carry an mtime up to the racy window before it
+    threshold = None if since_ns is None else since_ns - RACY_WINDOW_NS
+    reports = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Reports live in build output, never under sources or VCS data
+        dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS]
+        if not any(part in _REPORT_DIRS for part in Path(dirpath).relative_to(root).parts):
+            continue
+        for filename in filenames:
+            if not (filename.startswith("TEST-") and filename.endswith(".xml")):
+                continue
+            path = Path(dirpath) / filename
+            try:
+                if threshold is not None and path.stat().st_mtime_ns < threshold:
+                    continue
+            except OSError:
+                continue
+            reports.append(path)
+    return sorted(reports)
+
+
+def build_module_dir(project_path: str | Path, path: str | Path) -> Path:
+    """Nearest directory from ``path`` up to ``project_path`` with a build file.
+
+    That is where the module's ``target/`` or ``build/`` directory sits;
+    searching there instead of the whole project keeps single-class runs
+    cheap in large multi-module builds.
+    """
+    project = Path(project_path).resolve()
+    current = (project / path).resolve().parent
+    while current != project and project in current.parents:
+        if any((current / name).exists() for name in _BUILD_FILES):
+            return current
+        current = current.parent
+    return project
+
+
+def collect_results(reports: list[str | Path]) -> list[CaseResult]:
+    """Results of all test cases in ``reports``, in report order."""
+    results: list[CaseResult] = []
+    for report in reports:
+        results.extend(parse_junit_xml(report))
+    return results
+
+
+def summarize(results: list[CaseResult]) -> dict[str, Any]:
+    """Counts by status and total duration of ``results``."""
+    summary: dict[str, Any] = {
+        "tests": len(results),
+        STATUS_PASSED: 0,
+        STATUS_FAILED: 0,
+        STATUS_ERROR: 0,
+        STATUS_SKIPPED: 0,
+    }
+    for result in results:
+        summary[result.status] += 1
+    summary["time"] = round(sum(r.time for r in results), 3)
+    return summary
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    """One-line summary, e.g. ``12 tests: 10 passed, 1 failed, 1 skipped (3.2s)``."""
+    parts = [
+        f"{summary[status]} {status}"
+        for status in (STATUS_PASSED, STATUS_FAILED, STATUS_ERROR, STATUS_SKIPPED)
+        if summary[status]
+    ]
+    return f"{summary['tests']} tests: {', '.join(parts) or 'none run'} ({summary['time']:.1f}s)"
+
+
+def trim_trace(result: CaseResult, max_lines: int = _MAX_TRACE_LINES) -> str:
+    """The part of a failure's stack trace worth showing.
+
+    Java traces keep the exception lines (``Caused by:`` included), the
+    frame that threw each exception, and the frames of the test class;
+    JDK, JUnit and framework frames in between are counted, not shown.
+    Other traces (pytest's) are only capped at ``max_lines``.
+    """
+    lines = result.trace.splitlines()
+    if not any(ln.lstrip().startswith("at ") for ln in lines):
+        kept = lines
+    else:
+        test_class = result.class_name.split("$", 1)[0]
+        kept = []
+        hidden = 0
+        first_frame = True
+        for ln in lines:
+            stripped = ln.lstrip()
+            if not stripped.startswith("at "):
+                if stripped.startswith("..."):
+                    continue
+                if hidden:
+                    kept.append(f"\t... {hidden} more")
+                    hidden = 0
+                kept.append(ln)
+                first_frame = True
+            elif first_frame or (test_class and test_class in stripped):
+                if hidden:
+                    kept.append(f"\t... {hidden} more")
+                    hidden = 0
+                kept.append(ln)
+                first_frame = False
+            else:
+                hidden += 1
+        if hidden:
+            kept.append(f"\t... {hidden} more")
+    if len(kept) > max_lines:
+        kept = [*kept[:max_lines], f"... ({len(kept) - max_lines} more lines)"]
+    return "\n".join(kept)
+
+
+def format_failures(results: list[CaseResult], max_lines: int = _MAX_TRACE_LINES) -> str:
+    """Failing tests with their message and trimmed trace, for reports and prompts."""
+    blocks = []
+    for result in results:
+        if not result.failed:
+            continue
+        message = result.message
+        if len(message) > _MAX_MESSAGE_CHARS:
+            message = message[:_MAX_MESSAGE_CHARS] + "..."
+        block = f"{result.class_name}.{result.name} ({result.status.upper()})"
+        if message:
+            block += f": {message}"
+        trace = trim_trace(result, max_lines)
+        if trace:
+            block += f"\n{trace}"
+        blocks.append(block)
+    return "\n\n".join(blocks)
+
+
+__all__ = [
+    "STATUS_ERROR",
+    "STATUS_FAILED",
+    "STATUS_PASSED",
+    "STATUS_SKIPPED",
+    "CaseResult",
+    "build_module_dir",
+    "collect_results",
+    "find_junit_reports",
+    "format_failures",
+    "format_summary",
+    "parse_junit_xml",
+    "summarize",
+    "trim_trace",
+]
@@ -50,6 +50,10 @@ class LLMMetricsCallback(BaseCallbackHandler):
         )
 
     def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        # A real call failed: the cached connectivity check is no longer trustworthy
+        from src.lib import llm_check_cache
+        llm_check_cache.invalidate()
+
         duration = time.time() - self.start_time if self.start_time else None
         error_msg = str(error).lower()
         cause = error.__cause__
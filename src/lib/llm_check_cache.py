@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Short-lived cache for the LLM connectivity check.
+
+Every LLM-dependent command pings the provider before doing real work. In
+CI and in iterative local loops the same project runs ``generate`` /
+``killer`` several times in a row against the same provider, so the ping
+(up to three retried round trips) is mostly wasted latency.
+
+A successful check is recorded in ``.testboost/llm_check.json`` together
+with the provider, model and base URL it was made against. A later check
+for the same triple within ``LLM_CHECK_CACHE_TTL`` seconds is skipped. Any
+failed real LLM call (see ``LLMMetricsCallback.on_llm_error``) drops the
+entry so the next command pings again.
+
+The file is a local cache, never committed: it is added to
+``.testboost/.gitignore`` on first write.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from src.lib.cache_files import write_cache_file
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "llm_check.json"
+
+# Project whose cache a failing LLM call should invalidate. Set by
+# check_llm_connection(); the callback has no other way to know it.
+_active_project: str | None = None
+
+
+def cache_key(provider: str, model: str, base_url: str | None) -> str:
+    """Return the cache key for a provider/model/base_url triple."""
+    raw = f"{provider}|{model}|{base_url or ''}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_path(project_path: str) -> Path:
+    return Path(project_path) / ".testboost" / CACHE_FILENAME
+
+
+def is_fresh(project_path: str, key: str, ttl_seconds: int) -> bool:
+    """Return True if a successful check for ``key`` is younger than the TTL."""
+    if ttl_seconds <= 0:
+        return False
+    path = _cache_path(project_path)
+    try:
+        entry: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return False
+    checked_at = entry.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return False
+    age = time.time() - checked_at
+    # A clock jump backwards makes the entry look younger than it is: distrust it
+    return 0 <= age < ttl_seconds
+
+
+def record_success(
+    project_path: str, key: str, provider: str, model: str, base_url: str | None,
+) -> None:
+    """Persist a successful check. Best effort: errors are logged, not raised."""
+    tb_dir = Path(project_path) / ".testboost"
+    if not tb_dir.is_dir():
+        return
+    entry = {
+        "key": key,
+        "provider": provider,
+        "model": model,
+        "base_url": base_url,
+        "checked_at": time.time(),
+    }
+    try:
+        write_cache_file(
+            tb_dir / CACHE_FILENAME,
+            json.dumps(entry),
+            tb_dir=tb_dir,
+            comment="TestBoost local LLM check cache",
+        )
+    except OSError as e:
+        logger.warning("llm_check_cache_write_failed", error=str(e))
+
+
+def invalidate(project_path: str | None = None) -> None:
+    """Drop the cached check for ``project_path`` (default: the active project)."""
+    target = project_path or _active_project
+    if not target:
+        return
+    try:
+        _cache_path(target).unlink()
+        logger.info("llm_check_cache_invalidated", project_path=target)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("llm_check_cache_invalidate_failed", error=str(e))
+
+
+def set_active_project(project_path: str | None) -> None:
+    """Remember which project a failing LLM call should invalidate."""
+    global _active_project
+    _active_project = project_path
+
+
+__all__ = [
+    "cache_key",
+    "invalidate",
+    "is_fresh",
+    "record_success",
+    "set_active_project",
+]
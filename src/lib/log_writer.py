@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Buffered writer for the session log files.
+
+Every :class:`~src.lib.md_logger.MdLogger` message used to append one line
+to ``logs/<date>.md`` on its own: compute the date, ``mkdir`` the logs
+directory, check whether the file exists, open it, write, close. Verbose
+generation runs log thousands of lines.
+
+Entries now go through a queue to one writer thread per process, which
+appends them in batches: one ``open`` per log file per batch, the
+directory created and the file header written once per file. A batch is
+written when it reaches ``max_batch`` entries, ``interval`` seconds after
+its first entry, right away for an ``ERROR`` entry, and whenever a caller
+flushes (the session tracker does at the end of every step) or the
+process exits.
+
+Ordering is that of the calls: the single writer appends entries in
+queue order, and the timestamp and file of an entry are fixed when it is
+queued, not when it is written. A flush returns only once every entry
+queued before it is on disk.
+
+:func:`tail_log_entries` reads the last rows of a log file from its end,
+for ``status``, which shows the latest entries of logs that can reach
+megabytes on a long generation day.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_INTERVAL = 0.5
+
+
+class _Entry(NamedTuple):
+    logs_dir: Path
+    day: str
+    line: str
+    urgent: bool = False
+
+
+def log_file_header(day: str) -> str:
+    """Header of a new ``logs/<day>.md`` file."""
+    return (
+        f"# Logs - {day}\n\n"
+        "| Time | Level | Step | Message | Details |\n"
+        "|------|-------|------|---------|---------|\n"
+    )
+
+
+class SessionLogWriter:
+    """Appends log lines to session log files from a background thread.
+
+    Args:
+        max_batch: Entries after which a batch is written without waiting.
+        interval: Longest time (seconds) an entry waits in the buffer.
+    """
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, interval: float = DEFAULT_INTERVAL):
+        self.max_batch = max_batch
+        self.interval = interval
+        self._queue: queue.SimpleQueue[_Entry | threading.Event | None] = queue.SimpleQueue()
+        # Log files known to exist (header written): skips the exists() check
+        self._known_files: set[Path] = set()
+        self._thread = threading.Thread(target=self._run, name="session-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, logs_dir: Path, day: str, line: str, urgent: bool = False) -> None:
+        """Queue ``line`` for ``logs_dir/<day>.md``; ``urgent`` writes it without delay."""
+        self._queue.put(_Entry(logs_dir, day, line, urgent))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every entry queued so far is written.
+
+        Returns:
+            False if ``timeout`` expired first.
+        """
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write what is queued and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list[_Entry] = []
+            waiters: list[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + self.interval
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if item.urgent or len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write(self, batch: list[_Entry]) -> None:
+        """Append ``batch``, one open per run of entries for the same file."""
+        start = 0
+        while start < len(batch):
+            first = batch[start]
+            end = start + 1
+            while end < len(batch) and (batch[end].logs_dir, batch[end].day) == (first.logs_dir, first.day):
+                end += 1
+            path = first.logs_dir / f"{first.day}.md"
+            try:
+                if path not in self._known_files:
+                    first.logs_dir.mkdir(parents=True, exist_ok=True)
+                    if not path.exists():
+                        path.write_text(log_file_header(first.day), encoding="utf-8")
+                    self._known_files.add(path)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.writelines(entry.line for entry in batch[start:end])
+            except OSError as e:
+                # A deleted session directory must not stop the other logs
+                self._known_files.discard(path)
+                logger.warning("session_log_write_failed", path=str(path), error=str(e))
+            start = end
+
+
+def _is_entry_row(line: str) -> bool:
+    return line.startswith("|") and not line.startswith("| Time") and not line.startswith("|---")
+
+
+def tail_log_entries(log_file: str | Path, count: int = 10, block_size: int = 8192) -> list[str]:
+    """The last ``count`` entry rows of a log file, oldest first.
+
+    Reads ``block_size`` blocks backwards from the end of the file until it
+    has ``count`` rows or reaches the start, so the cost depends on the
+    length of the last entries, not on the size of the log.
+    """
+    rows: list[str] = []
+    with open(log_file, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while len(rows) < count and pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b"\n")
+            # Unless this block starts the file, its first piece may be the
+            # end of a line that begins in the previous block
+            partial = lines.pop(0) if pos > 0 else b""
+            for raw in reversed(lines):
+                line = raw.decode("utf-8", errors="replace").rstrip("\r")
+                if _is_entry_row(line):
+                    rows.append(line)
+                    if len(rows) == count:
+                        break
+    rows.reverse()
+    return rows
+
+
+_writer: SessionLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> SessionLogWriter:
+    """The process-wide writer, started on first use."""
+    global _writer
+    writer = _writer
+    if writer is not None:
+        return writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = SessionLogWriter()
+        return _writer
+
+
+def flush_logs(timeout: float | None = None) -> None:
+    """Write every queued log entry (no-op when nothing was ever queued)."""
+    writer = _writer
+    if writer is not None:
+        writer.flush(timeout)
+
+
+def _close_at_exit() -> None:
+    writer = _writer
+    if writer is not None:
+        writer.close(timeout=10)
+
+
+def _reset_after_fork() -> None:
+    # The writer thread does not exist in a forked child; start a new one
+    # there on first use instead of queueing to a dead thread.
+    global _writer, _writer_lock
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+atexit.register(_close_at_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+__all__ = [
+    "DEFAULT_INTERVAL",
+    "DEFAULT_MAX_BATCH",
+    "SessionLogWriter",
+    "flush_logs",
+    "get_log_writer",
+    "log_file_header",
+    "tail_log_entries",
+]
@@ -9,13 +9,16 @@ Design decisions:
 - stdout gets a concise summary (what the LLM sees)
 - The .md log file gets full details (what the user can review)
 - Structured data is preserved as JSON blocks in the log
+- Log lines are queued and written in batches (src.lib.log_writer);
+  flush() forces them out
 """
 
 import json
 import sys
 from typing import Any
 
-from src.lib.session_tracker import write_log
+from src.lib.log_writer import flush_logs
+from src.lib.session_tracker import queue_log
 
 
 class MdLogger:
@@ -51,7 +54,7 @@ class MdLogger:
 
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log a debug message (only to file, not stdout)."""
-        write_log(self.session_dir, self.step_name, "DEBUG", message, **kwargs)
+        queue_log(self.session_dir, self.step_name, "DEBUG", message, **kwargs)
         self._entries.append({"level": "DEBUG", "message": message, **kwargs})
 
     def result(self, title: str, content: str) -> None:
@@ -62,11 +65,11 @@ class MdLogger:
         print(f"\n## {title}\n", file=sys.stdout)
         print(content, file=sys.stdout)
         print("", file=sys.stdout)
-        write_log(self.session_dir, self.step_name, "INFO", f"[RESULT] {title}")
+        queue_log(self.session_dir, self.step_name, "INFO", f"[RESULT] {title}")
 
     def data(self, label: str, data: dict[str, Any] | list[Any]) -> None:
         """Log structured data - written to file, summary to stdout."""
-        write_log(self.session_dir, self.step_name, "INFO", f"[DATA] {label}", entries=len(data) if isinstance(data, list) else "object")
+        queue_log(self.session_dir, self.step_name, "INFO", f"[DATA] {label}", entries=len(data) if isinstance(data, list) else "object")
 
         if self.verbose:
             print(f"\n### {label}\n", file=sys.stdout)
@@ -77,6 +80,10 @@ class MdLogger:
             elif isinstance(data, dict):
                 print(f"  {label}: {len(data)} fields", file=sys.stdout)
 
+    def flush(self) -> None:
+        """Write every queued log line to the session log file."""
+        flush_logs()
+
     def summary(self) -> str:
         """Get a concise summary of all logged entries.
 
@@ -107,7 +114,7 @@ class MdLogger:
         self._entries.append({"level": level, "message": message, **kwargs})
 
         # Write to markdown log file
-        write_log(self.session_dir, self.step_name, level, message, **kwargs)
+        queue_log(self.session_dir, self.step_name, level, message, **kwargs)
 
         # Print to stdout (concise format)
         prefix = {"INFO": " ", "WARN": "!", "ERROR": "X"}
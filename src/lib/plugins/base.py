@@ -129,3 +129,27 @@ class TechnologyPlugin(ABC):
             May include '{test_file}' placeholder for the caller to substitute.
         """
 
+    def scoped_test_commands(
+        self, project_path: Path, session_config: dict, test_files: list[str],
+    ) -> list[list[str]] | None:
+        """Return commands that run only ``test_files`` (project-relative paths).
+
+        Optional. Plugins whose test command runs a whole suite override this
+        so validation runs the generated tests only; long selections may be
+        split over several commands, run one after the other.
+
+        Returns:
+            The commands, or None when the plugin cannot scope its test run
+            (the caller then runs test_run_command()).
+        """
+        return None
+
+    def junit_report_args(self, report_file: Path) -> list[str]:
+        """Return extra test-run arguments that write a JUnit XML report.
+
+        Optional. Validation appends them to a per-file test command and
+        reads ``report_file`` for per-test results. Plugins whose build
+        tool writes its reports on its own (Surefire, Gradle) or cannot
+        write one keep the default, an empty list.
+        """
+        return []
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 """Java Spring plugin for TestBoost.
 
-Wraps existing Java/Maven behavior. All analysis logic delegates to the
-unchanged src.java.* modules. This plugin is a thin adapter — it does not
+Wraps existing Java/Maven/Gradle behavior. All analysis logic delegates to
+the src.java.* modules. This plugin is a thin adapter — it does not
 duplicate any parsing or discovery code.
 """
 
+import os
 import re
 import shlex
 import shutil
@@ -81,26 +82,70 @@ class JavaSpringPlugin(TechnologyPlugin):
         return ["**/*Test.java", "**/*Tests.java", "**/Test*.java"]
 
     # ------------------------------------------------------------------
-    # Build commands (extracted from cli._detect_maven_build_config)
+    # Build commands (Maven: extracted from cli._detect_maven_build_config)
     # ------------------------------------------------------------------
 
     def validation_command(self, project_path: Path, session_config: dict) -> list[str]:
-        """Return the mvn test-compile command, honoring session config overrides."""
+        """Return the test-compile command (mvn test-compile / gradle compileTestJava).
+
+        Session config overrides (``maven_compile_cmd``, which holds a Gradle
+        command for Gradle projects) win over detection.
+        """
         maven_compile_cmd = session_config.get("maven_compile_cmd")
         if maven_compile_cmd:
-            return _parse_maven_cmd(maven_compile_cmd)
+            return _parse_build_cmd(maven_compile_cmd)
 
-        config = _detect_maven_build_config(project_path)
-        return _parse_maven_cmd(config["compile_cmd"])
+        config = _detect_build_config(project_path)
+        return _parse_build_cmd(config["compile_cmd"])
 
     def test_run_command(self, project_path: Path, session_config: dict) -> list[str]:
-        """Return the mvn test command, honoring session config overrides."""
+        """Return the test command (mvn test / gradle test), honoring session config overrides.
+
+        Maven commands also get the Surefire settings of ``session_config``
+        (``surefire_fork_count``, ``surefire_parallel``).
+        """
         maven_test_cmd = session_config.get("maven_test_cmd")
         if maven_test_cmd:
-            return _parse_maven_cmd(maven_test_cmd)
-
-        config = _detect_maven_build_config(project_path)
-        return _parse_maven_cmd(config["test_cmd"])
+            cmd = _parse_build_cmd(maven_test_cmd)
+        else:
+            config = _detect_build_config(project_path)
+            cmd = _parse_build_cmd(config["test_cmd"])
+        if cmd and not _is_gradle_cmd(cmd):
+            cmd += _surefire_args(session_config)
+        return cmd
+
+    def scoped_test_commands(
+        self, project_path: Path, session_config: dict, test_files: list[str],
+    ) -> list[list[str]] | None:
+        """Run only ``test_files``: ``-Dtest=`` (Maven) or ``--tests`` (Gradle).
+
+        Maven: one ``<test cmd> -Dtest=A,B,...`` per chunk of class names.
+        Gradle: ``<:project>:test --tests <FQN> ...`` per owning project and
+        chunk. A chunk stays under _TEST_SELECTION_MAX_CHARS so the command
+        line fits on every platform.
+        """
+        cmd = self.test_run_command(project_path, session_config)
+        if not cmd or not test_files:
+            return None
+        if _is_gradle_cmd(cmd):
+            by_project: dict[tuple[str, ...], list[str]] = {}
+            for test_file in test_files:
+                full_path = Path(project_path) / test_file
+                scoped = tuple(_scope_gradle_cmd(cmd, str(project_path), full_path))
+                by_project.setdefault(scoped, []).append(_test_class_name(full_path, full_path.stem))
+            return [
+                [*scoped, *(arg for name in chunk for arg in ("--tests", name))]
+                for scoped, names in by_project.items()
+                for chunk in _chunk_selection(names)
+            ]
+        names = list(dict.fromkeys(Path(test_file).stem for test_file in test_files))
+        return [
+            # Modules of a multi-module build without any of these classes
+            # must not fail the run (both Surefire property spellings)
+            [*cmd, f"-Dtest={','.join(chunk)}",
+             "-Dsurefire.failIfNoSpecifiedTests=false", "-DfailIfNoTests=false"]
+            for chunk in _chunk_selection(names)
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +153,28 @@ class JavaSpringPlugin(TechnologyPlugin):
 # ---------------------------------------------------------------------------
 
 _ALLOWED_MAVEN_BINARIES = {"mvn", "mvn.cmd", "./mvnw", "mvnw"}
+_ALLOWED_GRADLE_BINARIES = {"gradle", "gradle.bat", "./gradlew", "gradlew", "gradlew.bat"}
+
+# Gradle tasks TestBoost issues; they are prefixed with the owning project
+# (``:core:compileTestJava``) when a command is scoped to one test file
+_SCOPABLE_GRADLE_TASKS = {"compileTestJava", "testClasses", "test"}
+
+# --configuration-cache (and its -problems=warn switch) appeared in Gradle 6.6
+_CONFIGURATION_CACHE_MIN_GRADLE = (6, 6)
+_WRAPPER_VERSION_PATTERN = re.compile(r"gradle-(\d+)\.(\d+)(?:\.\d+)?(?:-[\w.-]+)?-(?:bin|all)\.zip")
+
+
+def _detect_build_config(project_path: Path) -> dict:
+    """Detect the build commands of a Maven or Gradle project.
+
+    Maven wins when a pom.xml is present (see JavaSpringPlugin), Gradle
+    otherwise. Same return shape as _detect_maven_build_config.
+    """
+    from src.java.gradle import is_gradle_project
+
+    if is_gradle_project(project_path):
+        return _detect_gradle_build_config(project_path)
+    return _detect_maven_build_config(project_path)
 
 
 def _detect_maven_build_config(project_path: Path) -> dict:
@@ -188,11 +255,64 @@ def _detect_maven_build_config(project_path: Path) -> dict:
     }
 
 
-def _parse_maven_cmd(cmd_str: str) -> list[str]:
-    """Parse a Maven command string into a list, resolving the mvn binary.
+def _gradle_wrapper_version(project_dir: Path) -> tuple[int, int] | None:
+    """(major, minor) of the Gradle wrapper distribution, if declared."""
+    props = project_dir / "gradle" / "wrapper" / "gradle-wrapper.properties"
+    try:
+        match = _WRAPPER_VERSION_PATTERN.search(props.read_text(encoding="utf-8"))
+    except OSError:
+        return None
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _gradle_binary(project_dir: Path) -> str:
+    if os.name == "nt" and (project_dir / "gradlew.bat").exists():
+        return "gradlew.bat"
+    if (project_dir / "gradlew").exists():
+        return "./gradlew"
+    return "gradle"
 
-    Only binaries in _ALLOWED_MAVEN_BINARIES are accepted to prevent arbitrary
-    command execution from user-editable session config fields.
+
+def _detect_gradle_build_config(project_path: Path) -> dict:
+    """Detect Gradle build commands (wrapper, daemon, build/configuration cache).
+
+    Every invocation keeps the daemon warm and reuses task outputs through
+    the build cache, so a per-attempt compile costs Gradle's incremental
+    minimum. The configuration cache is enabled when the wrapper declares a
+    Gradle version that supports it; problems are reported as warnings so
+    builds whose plugins are not compatible still run.
+
+    Returns a dict with compile_cmd, test_cmd and notes (see
+    _detect_maven_build_config).
+    """
+    project_dir = Path(project_path)
+    binary = _gradle_binary(project_dir)
+    notes = [f"Gradle build — using `{binary}`"]
+    flags = "--daemon --build-cache"
+
+    version = _gradle_wrapper_version(project_dir)
+    if version is not None and version >= _CONFIGURATION_CACHE_MIN_GRADLE:
+        flags += " --configuration-cache --configuration-cache-problems=warn"
+        notes.append(f"Gradle {version[0]}.{version[1]}: configuration cache enabled")
+    else:
+        notes.append(
+            "Configuration cache not enabled (Gradle wrapper version unknown or older than 6.6)"
+        )
+
+    return {
+        "compile_cmd": f"{binary} compileTestJava -q {flags}",
+        # No -q: Gradle reports failing tests at lifecycle level
+        "test_cmd": f"{binary} test --console=plain {flags}",
+        "notes": notes,
+    }
+
+
+def _parse_build_cmd(cmd_str: str) -> list[str]:
+    """Parse a Maven or Gradle command string into a list, resolving the binary.
+
+    Only binaries in _ALLOWED_MAVEN_BINARIES / _ALLOWED_GRADLE_BINARIES are
+    accepted to prevent arbitrary command execution from user-editable
+    session config fields.
 
     Example: "mvn test-compile -q -P corp" -> ["/usr/bin/mvn", "test-compile", "-q", "-P", "corp"]
 
@@ -208,15 +328,122 @@ def _parse_maven_cmd(cmd_str: str) -> list[str]:
         return []
 
     binary = parts[0]
-    if binary not in _ALLOWED_MAVEN_BINARIES:
+    if binary not in _ALLOWED_MAVEN_BINARIES | _ALLOWED_GRADLE_BINARIES:
         raise ValueError(
-            f"Disallowed Maven binary in command: {binary!r}. "
-            f"Allowed values: {sorted(_ALLOWED_MAVEN_BINARIES)}"
+            f"Disallowed build tool binary in command: {binary!r}. "
+            f"Allowed values: {sorted(_ALLOWED_MAVEN_BINARIES | _ALLOWED_GRADLE_BINARIES)}"
         )
 
     if binary in ("mvn", "mvn.cmd"):
         resolved = shutil.which("mvn") or shutil.which("mvn.cmd") or "mvn"
         return [resolved] + parts[1:]
+    if binary in ("gradle", "gradle.bat"):
+        resolved = shutil.which("gradle") or shutil.which("gradle.bat") or "gradle"
+        return [resolved] + parts[1:]
 
-    # Local wrapper (./mvnw, mvnw) — keep as-is
+    # Local wrapper (./mvnw, ./gradlew, ...) — keep as-is
     return parts
+
+
+# Former name, from when only Maven commands were accepted
+_parse_maven_cmd = _parse_build_cmd
+
+
+def _is_gradle_cmd(cmd: list[str]) -> bool:
+    return bool(cmd) and Path(cmd[0]).name in {"gradle", "gradle.bat", "gradlew", "gradlew.bat"}
+
+
+def _scope_gradle_cmd(cmd: list[str], project_path: str, test_file: Path) -> list[str]:
+    """Prefix the Gradle tasks of ``cmd`` with the project owning ``test_file``."""
+    from src.java.gradle import gradle_project_path
+
+    try:
+        relative = Path(test_file).resolve().relative_to(Path(project_path).resolve()).as_posix()
+    except ValueError:
+        return cmd
+    owner = gradle_project_path(project_path, relative)
+    return [
+        f"{owner}:{part}" if i and part in _SCOPABLE_GRADLE_TASKS else part
+        for i, part in enumerate(cmd)
+    ]
+
+
+# Longest test selection (class names) put on one command line; Windows
+# caps a whole command line at 8191 characters in cmd.exe
+_TEST_SELECTION_MAX_CHARS = 4000
+
+
+def _chunk_selection(names: list[str]) -> list[list[str]]:
+    """Split ``names`` into runs whose joined length stays under the cap."""
+    chunks: list[list[str]] = []
+    length = 0
+    for name in names:
+        if chunks and length + len(name) + 1 <= _TEST_SELECTION_MAX_CHARS:
+            chunks[-1].append(name)
+            length += len(name) + 1
+        else:
+            chunks.append([name])
+            length = len(name)
+    return chunks
+
+
+def _surefire_args(session_config: dict) -> list[str]:
+    """Surefire system properties for ``surefire_fork_count`` / ``surefire_parallel``."""
+    args = []
+    fork_count = session_config.get("surefire_fork_count")
+    if fork_count:
+        args += [f"-DforkCount={fork_count}", "-DreuseForks=true"]
+    parallel = session_config.get("surefire_parallel")
+    if parallel:
+        # threadCount is per CPU core (perCoreThreadCount defaults to true)
+        args += [f"-Dparallel={parallel}", "-DthreadCount=1"]
+    return args
+
+
+def _test_class_name(test_file: Path, class_name: str) -> str:
+    """Fully-qualified test class name, from its path under src/test/java."""
+    posix = Path(test_file).as_posix()
+    _, marker, rest = posix.partition("src/test/java/")
+    if not marker or not rest.endswith(".java"):
+        return class_name
+    return rest[: -len(".java")].replace("/", ".")
+
+
+def _test_compile_command(
+    project_path: str, test_file: Path, configured_cmd: str | None = None,
+) -> list[str]:
+    """Command that compiles the tests of the module owning ``test_file``.
+
+    Uses the configured command (analysis ``maven_compile_cmd``) when set,
+    else the detected one. Gradle commands are scoped to the owning
+    project (``:core:compileTestJava``).
+
+    Raises:
+        ValueError: If the configured command uses a disallowed binary.
+    """
+    cmd = _parse_build_cmd(configured_cmd) if configured_cmd else []
+    if not cmd:
+        cmd = _parse_build_cmd(_detect_build_config(Path(project_path))["compile_cmd"])
+    if _is_gradle_cmd(cmd):
+        cmd = _scope_gradle_cmd(cmd, project_path, test_file)
+    return cmd
+
+
+def _single_test_command(
+    project_path: str, test_file: Path, class_name: str, configured_cmd: str | None = None,
+) -> list[str]:
+    """Command that runs one test class.
+
+    Maven: ``<test cmd> -Dtest=<class>``. Gradle: ``<:project>:test`` with
+    ``--tests <fully.qualified.Class>``.
+
+    Raises:
+        ValueError: If the configured command uses a disallowed binary.
+    """
+    cmd = _parse_build_cmd(configured_cmd) if configured_cmd else []
+    if not cmd:
+        cmd = _parse_build_cmd(_detect_build_config(Path(project_path))["test_cmd"])
+    if _is_gradle_cmd(cmd):
+        scoped = _scope_gradle_cmd(cmd, project_path, test_file)
+        return [*scoped, "--tests", _test_class_name(test_file, class_name)]
+    return [*cmd, f"-Dtest={class_name}"]
@@ -149,6 +149,10 @@ class PythonPytestPlugin(TechnologyPlugin):
         """Run the generated test file with pytest."""
         return ["python", "-m", "pytest", "--tb=short", "--no-header", "{test_file}"]
 
+    def junit_report_args(self, report_file: Path) -> list[str]:
+        """Have pytest write a JUnit XML report to ``report_file``."""
+        return [f"--junitxml={report_file}"]
+
 
 # ---------------------------------------------------------------------------
 # Private AST helpers
@@ -0,0 +1,379 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Project filesystem index.
+
+``analyze``, ``gaps`` and the discovery helpers all need the same view of
+the project tree: which Java sources and tests exist, where the build files
+are. Each of them used to run its own ``glob("**/...")`` / ``rglob`` walks,
+which also descended into ``target/``, ``node_modules/`` and ``.git/``.
+
+This module walks the tree once with ``os.scandir``, pruning VCS and build
+output directories, and records every file of interest with its size and
+mtime. The result is persisted in ``.testboost/fs_index.json`` (git-ignored)
+together with the mtime of every directory visited: a later command only
+has to ``stat`` those directories to know whether the index is still
+current, instead of listing the whole tree again.
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+from src.lib.cache_files import RACY_WINDOW_NS, write_cache_file
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "fs_index.json"
+INDEX_VERSION = 1
+
+# Never descended into, wherever they appear. Hidden directories (.git,
+# .idea, .gradle, .testboost, .venv, ...) are pruned by the leading dot.
+_ALWAYS_PRUNED = frozenset({"node_modules", "__pycache__", "venv"})
+
+# Build output, pruned only next to a build file: a package named ``build``
+# or ``target`` inside a source tree must still be indexed.
+_BUILD_OUTPUT_DIRS = frozenset({"target", "build", "out", "dist"})
+
+BUILD_FILES = frozenset({
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "settings.gradle",
+    "settings.gradle.kts",
+    "pyproject.toml",
+    "setup.py",
+    "go.mod",
+})
+
+INDEXED_SUFFIXES = frozenset({".java", ".kt", ".py", ".go"})
+
+_JAVA_MAIN = "src/main/java/"
+_JAVA_TEST = "src/test/java/"
+
+
+@dataclass
+class ProjectIndex:
+    """Snapshot of the interesting files of a project tree.
+
+    Paths are relative to ``root`` and always use ``/`` as separator.
+    """
+
+    root: str
+    files: dict[str, tuple[int, int]] = field(default_factory=dict)
+    dirs: dict[str, int] = field(default_factory=dict)
+    scanned_at_ns: int = 0
+    # Kept current by a watcher in this process (``testboost watch``):
+    # get_project_index trusts it without stat-ing its directories.
+    live: bool = field(default=False, repr=False, compare=False)
+    _sorted: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def paths(self) -> list[str]:
+        """Return every indexed file, sorted."""
+        if self._sorted is None or len(self._sorted) != len(self.files):
+            self._sorted = sorted(self.files)
+        return self._sorted
+
+    def java_sources(self) -> list[str]:
+        """Return the ``.java`` files under any ``src/main/java`` root."""
+        return [p for p in self.paths() if p.endswith(".java") and _under(p, _JAVA_MAIN)]
+
+    def java_tests(self) -> list[str]:
+        """Return the ``.java`` files under any ``src/test/java`` root."""
+        return [p for p in self.paths() if p.endswith(".java") and _under(p, _JAVA_TEST)]
+
+    def source_roots(self) -> list[str]:
+        """Return the ``src/main/java`` directories, shortest path first."""
+        return _roots(self.dirs, _JAVA_MAIN)
+
+    def test_roots(self) -> list[str]:
+        """Return the ``src/test/java`` directories, shortest path first."""
+        return _roots(self.dirs, _JAVA_TEST)
+
+    def build_files(self, name: str = "pom.xml") -> list[str]:
+        """Return the indexed build files called ``name``."""
+        return [p for p in self.paths() if p.rsplit("/", 1)[-1] == name]
+
+    def match(self, patterns: list[str]) -> list[str]:
+        """Return files whose name matches one of the glob ``patterns``.
+
+        Patterns follow the plugin ``test_file_pattern()`` convention
+        (``**/*Test.java``); only the file-name part is matched.
+        """
+        names = [p.rsplit("/", 1)[-1] for p in patterns]
+        return [p for p in self.paths() if any(fnmatch(p.rsplit("/", 1)[-1], n) for n in names)]
+
+    def under(self, prefix: str) -> list[str]:
+        """Return files below the relative directory ``prefix``."""
+        prefix = prefix.rstrip("/") + "/"
+        return [p for p in self.paths() if p.startswith(prefix)]
+
+    def abspath(self, relative_path: str) -> Path:
+        """Return the absolute path of an indexed file."""
+        return Path(self.root, *relative_path.split("/"))
+
+    def is_current(self) -> bool:
+        """Return True if no visited directory changed since the index was built.
+
+        Adding, removing or renaming an entry updates the mtime of its parent
+        directory, so stat-ing the directories is enough to detect any change
+        in the set of files.
+        """
+        racy_after = self.scanned_at_ns - RACY_WINDOW_NS
+        for rel, mtime_ns in self.dirs.items():
+            if mtime_ns >= racy_after:
+                return False
+            try:
+                if os.stat(os.path.join(self.root, rel)).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+def _under(path: str, segment: str) -> bool:
+    return path.startswith(segment) or f"/{segment}" in path
+
+
+def _roots(dirs: dict[str, int], segment: str) -> list[str]:
+    root_name = segment.rstrip("/")
+    found = [d for d in dirs if d == root_name or d.endswith("/" + root_name)]
+    return sorted(found, key=lambda d: (d.count("/"), d))
+
+
+def _scan_into(index: ProjectIndex, start: str = "") -> None:
+    """Walk ``start`` (relative to ``index.root``) and add what it contains."""
+    stack = [start]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(index.root, rel_dir) if rel_dir else index.root
+        try:
+            index.dirs[rel_dir] = os.stat(abs_dir).st_mtime_ns
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        is_module_root = any(e.name in BUILD_FILES for e in entries)
+        for entry in entries:
+            name = entry.name
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name.startswith(".") or name in _ALWAYS_PRUNED:
+                        continue
+                    if is_module_root and name in _BUILD_OUTPUT_DIRS:
+                        continue
+                    stack.append(rel)
+                elif entry.is_file():
+                    if _is_indexed(name):
+                        st = entry.stat()
+                        index.files[rel] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue
+
+
+def _is_indexed(name: str) -> bool:
+    return name in BUILD_FILES or os.path.splitext(name)[1] in INDEXED_SUFFIXES
+
+
+def scan_project(project_path: str) -> ProjectIndex:
+    """Walk the project once and return a fresh index (not persisted)."""
+    root = os.path.abspath(project_path)
+    index = ProjectIndex(root=root, scanned_at_ns=time.time_ns())
+    _scan_into(index)
+    logger.debug("project_index_scanned", root=root, files=len(index.files), dirs=len(index.dirs))
+    return index
+
+
+def _index_path(project_path: str) -> Path:
+    return Path(project_path) / ".testboost" / INDEX_FILENAME
+
+
+def save_project_index(index: ProjectIndex) -> None:
+    """Persist the index if the project has a ``.testboost/`` directory."""
+    tb_dir = Path(index.root) / ".testboost"
+    if not tb_dir.is_dir():
+        return
+    payload = {
+        "version": INDEX_VERSION,
+        "root": index.root,
+        "files": {p: list(v) for p, v in index.files.items()},
+        "dirs": index.dirs,
+        "scanned_at_ns": index.scanned_at_ns,
+    }
+    try:
+        write_cache_file(
+            tb_dir / INDEX_FILENAME,
+            json.dumps(payload, separators=(",", ":")),
+            tb_dir=tb_dir,
+            comment="TestBoost local filesystem index",
+        )
+    except OSError as e:
+        logger.warning("project_index_write_failed", error=str(e))
+
+
+def load_project_index(project_path: str) -> ProjectIndex | None:
+    """Load the persisted index, or None if missing, unreadable or moved."""
+    try:
+        payload = json.loads(_index_path(project_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return None
+    if payload.get("root") != os.path.abspath(project_path):
+        return None
+    return ProjectIndex(
+        root=payload["root"],
+        files={p: (v[0], v[1]) for p, v in payload.get("files", {}).items()},
+        dirs=dict(payload.get("dirs", {})),
+        scanned_at_ns=int(payload.get("scanned_at_ns", 0)),
+    )
+
+
+# Process-level memo: one CLI command asks for the index several times.
+_memo: dict[str, ProjectIndex] = {}
+
+
+def get_project_index(project_path: str | Path, refresh: bool = False) -> ProjectIndex:
+    """Return an up-to-date index for ``project_path``.
+
+    Reuses the in-process or persisted index when none of its directories
+    changed; otherwise rescans and persists the new index.
+
+    Args:
+        project_path: Project root.
+        refresh: Force a rescan.
+
+    Returns:
+        The project index.
+    """
+    root = os.path.abspath(project_path)
+    if not refresh:
+        cached = _memo.get(root) or load_project_index(root)
+        if cached is not None and (cached.live or cached.is_current()):
+            _memo[root] = cached
+            return cached
+    index = scan_project(root)
+    _memo[root] = index
+    save_project_index(index)
+    return index
+
+
+def update_project_index(project_path: str | Path, changed_paths: Iterable[str]) -> ProjectIndex:
+    """Apply reported changes to the index instead of rescanning the tree.
+
+    Each changed path is dropped from the index together with everything
+    below it, then re-added from disk if it still exists (a new or moved
+    directory is walked). Its parent directory is re-stat-ed. The result
+    is memoized and persisted.
+
+    Args:
+        project_path: Project root.
+        changed_paths: Project-relative paths of created, modified,
+            deleted or moved files and directories.
+
+    Returns:
+        The updated index.
+    """
+    root = os.path.abspath(project_path)
+    index = _memo.get(root) or load_project_index(root)
+    if index is None:
+        return get_project_index(root, refresh=True)
+
+    changed = {p.replace("\\", "/").strip("/") for p in changed_paths}
+    changed.discard("")
+    if changed:
+        def gone(rel: str) -> bool:
+            return rel in changed or any(rel.startswith(c + "/") for c in changed)
+
+        index.files = {p: v for p, v in index.files.items() if not gone(p)}
+        index.dirs = {d: m for d, m in index.dirs.items() if d == "" or not gone(d)}
+        parents = set()
+        for rel in changed:
+            abs_path = os.path.join(root, rel)
+            parents.add(rel.rpartition("/")[0])
+            if os.path.isdir(abs_path):
+                _scan_into(index, rel)
+            elif _is_indexed(rel.rsplit("/", 1)[-1]):
+                try:
+                    st = os.stat(abs_path)
+                except OSError:
+                    continue
+                index.files[rel] = (st.st_size, st.st_mtime_ns)
+        for parent in parents:
+            if parent in index.dirs:
+                try:
+                    index.dirs[parent] = os.stat(os.path.join(root, parent)).st_mtime_ns
+                except OSError:
+                    index.dirs.pop(parent, None)
+        index._sorted = None
+    _memo[root] = index
+    save_project_index(index)
+    return index
+
+
+def settle_project_index(project_path: str | Path, watched: Iterable[str]) -> bool:
+    """Make a watcher-maintained index trustworthy for other processes.
+
+    Directories changed less than the racy window before the last update
+    are never trusted by :meth:`ProjectIndex.is_current`, so commands run
+    next to ``testboost watch`` would rescan. Once every directory is older
+    than that window, re-stamp the watched directories and persist. If a
+    directory outside ``watched`` changed, fall back to a full rescan.
+
+    Args:
+        project_path: Project root.
+        watched: Project-relative directories whose changes the caller
+            has already applied.
+
+    Returns:
+        True when the persisted index is trusted as current, False if the
+        window has not elapsed yet (call again later).
+    """
+    root = os.path.abspath(project_path)
+    index = _memo.get(root)
+    if index is None:
+        return False
+    prefixes = tuple(w.rstrip("/") + "/" for w in watched)
+    racy_after = index.scanned_at_ns - RACY_WINDOW_NS
+    stamped: dict[str, int] = {}
+    for rel, mtime_ns in index.dirs.items():
+        try:
+            current = os.stat(os.path.join(root, rel)).st_mtime_ns
+        except OSError:
+            return False
+        if (rel + "/").startswith(prefixes):
+            stamped[rel] = current
+        elif current != mtime_ns or mtime_ns >= racy_after:
+            index = scan_project(root)
+            index.live = True
+            _memo[root] = index
+            save_project_index(index)
+            return False
+    now = time.time_ns()
+    if any(m >= now - RACY_WINDOW_NS for m in stamped.values()):
+        return False
+    index.dirs.update(stamped)
+    index.scanned_at_ns = now
+    save_project_index(index)
+    return True
+
+
+def forget_project_index(project_path: str | Path) -> None:
+    """Drop the in-process index for ``project_path`` (the file is kept)."""
+    _memo.pop(os.path.abspath(project_path), None)
+
+
+__all__ = [
+    "ProjectIndex",
+    "forget_project_index",
+    "get_project_index",
+    "load_project_index",
+    "save_project_index",
+    "scan_project",
+    "settle_project_index",
+    "update_project_index",
+]
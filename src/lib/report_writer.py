@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Markdown report rendering for large projects.
+
+Reports are built from parts appended to a list and joined once, instead
+of repeated ``str +=`` on an ever-growing string. Tables that grow with the
+project (one row per source file or class) are rendered inline only while
+they fit on one page; beyond that they are streamed, page by page, into
+sidecar files and the report links to them. The summary printed on stdout
+(what the LLM CLI reads) therefore stays bounded whatever the project size.
+"""
+
+import shutil
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from pathlib import Path
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per sidecar page (and the largest table kept inline)
+DEFAULT_PAGE_SIZE = 500
+
+
+class ReportWriter:
+    """Accumulates markdown in a list buffer.
+
+    Example:
+        report = ReportWriter()
+        report.heading("Structure")
+        report.bullet("Source classes", 12)
+        content = report.getvalue()
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        """Append raw markdown."""
+        self._parts.append(text)
+
+    def line(self, text: str = "") -> None:
+        """Append one line."""
+        self._parts.append(text + "\n")
+
+    def heading(self, title: str, level: int = 2) -> None:
+        """Append a heading followed by a blank line."""
+        self._parts.append(f"{'#' * level} {title}\n\n")
+
+    def bullet(self, label: str, value: object) -> None:
+        """Append a ``- **label**: value`` line."""
+        self._parts.append(f"- **{label}**: {value}\n")
+
+    def table(self, headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+        """Append a markdown table followed by a blank line."""
+        self._parts.extend(_table_lines(headers, rows))
+        self._parts.append("\n")
+
+    def getvalue(self) -> str:
+        """Return the report; the buffer is collapsed to that single string."""
+        value = "".join(self._parts)
+        self._parts = [value]
+        return value
+
+
+def _table_lines(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> Iterable[str]:
+    yield "| " + " | ".join(headers) + " |\n"
+    yield "|" + "|".join("---" for _ in headers) + "|\n"
+    for row in rows:
+        yield "| " + " | ".join(str(cell) for cell in row) + " |\n"
+
+
+def write_table_pages(
+    directory: Path,
+    stem: str,
+    title: str,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> list[Path]:
+    """Stream ``rows`` into ``<directory>/<stem>-001.md``, ``-002.md``, ...
+
+    Rows are written line by line, one page at a time; no page is held in
+    memory as one string. Each page has its own heading and table header
+    and links to its neighbours.
+
+    Returns:
+        The page paths, in order (empty when there are no rows).
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    pages: list[Path] = []
+    remaining = iter(rows)
+    while chunk := list(islice(remaining, page_size)):
+        number = len(pages) + 1
+        page = directory / f"{stem}-{number:03d}.md"
+        if pages:
+            with open(pages[-1], "a", encoding="utf-8") as previous:
+                previous.write(f"\n[Next page]({page.name})\n")
+        with open(page, "w", encoding="utf-8") as f:
+            f.write(f"# {title} (page {number})\n\n")
+            if pages:
+                f.write(f"[Previous page]({pages[-1].name})\n\n")
+            f.writelines(_table_lines(headers, chunk))
+        pages.append(page)
+    return pages
+
+
+def table_or_pages(
+    report: ReportWriter,
+    directory: Path,
+    stem: str,
+    title: str,
+    headers: Sequence[str],
+    rows: Sequence[Sequence[object]],
+    link_base: Path,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> list[Path]:
+    """Render ``rows`` inline if they fit on one page, else as sidecar pages.
+
+    Args:
+        report: Report receiving the table or the page links.
+        directory: Where sidecar pages go.
+        stem: Page file name prefix.
+        title: Page heading.
+        headers: Column headers.
+        rows: Table rows.
+        link_base: Directory the report is written to (links are relative to it).
+        page_size: Rows per page.
+
+    Returns:
+        The sidecar pages written (empty when the table was inlined).
+    """
+    if len(rows) <= page_size:
+        report.table(headers, rows)
+        return []
+    pages = write_table_pages(directory, stem, title, headers, rows, page_size)
+    report.line(f"{len(rows)} rows, in {len(pages)} pages of up to {page_size}:")
+    report.line()
+    for i, page in enumerate(pages, 1):
+        report.line(f"- [Page {i}]({page.relative_to(link_base).as_posix()})")
+    report.line()
+    return pages
+
+
+def reset_sidecar_dir(directory: Path) -> None:
+    """Remove the pages of a previous report."""
+    if directory.is_dir():
+        try:
+            shutil.rmtree(directory)
+        except OSError as e:
+            logger.warning("report_sidecars_not_removed", path=str(directory), error=str(e))
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "ReportWriter",
+    "reset_sidecar_dir",
+    "table_or_pages",
+    "write_table_pages",
+]
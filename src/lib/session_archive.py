@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Compaction of finished sessions into compressed archives.
+
+Sessions used to stay under ``.testboost/sessions/`` forever, logs,
+reports and question files included; ``cleanup`` only flips the status of
+stale ones. ``testboost compact`` moves the sessions a retention policy
+selects into ``.testboost/archive/<session_id>.tar.gz`` and records them
+in ``.testboost/archive/manifest.json``:
+
+```json
+{"version": 1, "sessions": [{"session_id": "001-test-generation",
+  "status": "completed", "step": "validation", "technology": "java-spring",
+  "started_at": "...", "updated_at": "...", "archived_at": "...",
+  "archive": "001-test-generation.tar.gz", "size_bytes": 18211,
+  "generated": {"src/main/java/A.java": "src/test/java/ATest.java"}}]}
+```
+
+The manifest is what ``status`` shows for archived sessions, and its
+``generated`` map keeps the tests of archived sessions known to
+``generate --changed``. Each step is atomic (temporary file + rename) and
+the live directory is removed last, so an interrupted compaction leaves
+the session either live or archived, never lost; compacting it again
+simply replaces its archive.
+"""
+
+import json
+import os
+import re
+import shutil
+import tarfile
+from pathlib import Path
+from typing import Any
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVE_DIR = "archive"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Statuses compacted when no --status is given: sessions that are over
+DEFAULT_STATUSES = ("completed", "failed", "abandoned")
+DEFAULT_KEEP_LAST = 10
+
+
+def get_archive_dir(project_path: str) -> Path:
+    """Return the path of ``.testboost/archive``."""
+    from src.lib.session_tracker import get_testboost_dir
+
+    return get_testboost_dir(project_path) / ARCHIVE_DIR
+
+
+def read_manifest(project_path: str) -> list[dict[str, Any]]:
+    """Archived sessions, oldest first (empty when nothing was compacted)."""
+    path = get_archive_dir(project_path) / MANIFEST_FILENAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning("archive_manifest_unreadable", path=str(path), error=str(e))
+        return []
+    sessions = manifest.get("sessions") if isinstance(manifest, dict) else None
+    return [s for s in sessions or [] if isinstance(s, dict) and s.get("session_id")]
+
+
+def _write_manifest(project_path: str, sessions: list[dict[str, Any]]) -> None:
+    path = get_archive_dir(project_path) / MANIFEST_FILENAME
+    tmp = path.with_name(MANIFEST_FILENAME + ".tmp")
+    tmp.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "sessions": sessions}, indent=2),
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def select_sessions(
+    sessions: list[dict[str, Any]],
+    *,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    older_than_days: float | None = None,
+    statuses: tuple[str, ...] | list[str] = DEFAULT_STATUSES,
+) -> list[dict[str, Any]]:
+    """Sessions a retention policy compacts.
+
+    A session is compacted when its status is one of ``statuses``, it is
+    not among the ``keep_last`` most recent sessions, and (when
+    ``older_than_days`` is given) it was last updated longer ago than
+    that. The most recent session is always kept, whatever the policy.
+
+    Args:
+        sessions: Sessions as returned by ``list_sessions`` (sorted by id).
+        keep_last: How many of the most recent sessions to keep live.
+        older_than_days: Minimum age, or None for no age condition.
+        statuses: Session statuses eligible for compaction.
+    """
+    kept = max(keep_last, 1)
+    candidates = sessions[:-kept] if len(sessions) > kept else []
+    selected = []
+    for session in candidates:
+        if session["status"] not in statuses:
+            continue
+        if older_than_days is not None:
+            age = session.get("age_hours")
+            if age is None or age < older_than_days * 24:
+                continue
+        selected.append(session)
+    return selected
+
+
+def archive_session(project_path: str, session: dict[str, Any]) -> dict[str, Any]:
+    """Pack one session into ``archive/<id>.tar.gz`` and remove its directory.
+
+    Returns:
+        The manifest entry recorded for the session.
+    """
+    from src.lib.session_tracker import _now_iso, get_session_technology, list_generated_tests
+
+    session_dir = Path(session["session_dir"])
+    archive_dir = get_archive_dir(project_path)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    archive = archive_dir / f"{session['session_id']}.tar.gz"
+    tmp = archive.with_name(archive.name + ".tmp")
+    with tarfile.open(tmp, "w:gz") as tar:
+        tar.add(session_dir, arcname=session["session_id"])
+    os.replace(tmp, archive)
+
+    entry = {
+        "session_id": session["session_id"],
+        "status": session["status"],
+        "step": session.get("step", ""),
+        "technology": get_session_technology(session_dir),
+        "started_at": session.get("started_at", ""),
+        "updated_at": session.get("updated_at", ""),
+        "archived_at": _now_iso(),
+        "archive": archive.name,
+        "size_bytes": archive.stat().st_size,
+        "generated": list_generated_tests(project_path, session_ids=[session["session_id"]]),
+    }
+    manifest = [s for s in read_manifest(project_path) if s["session_id"] != entry["session_id"]]
+    manifest.append(entry)
+    manifest.sort(key=lambda s: s["session_id"])
+    _write_manifest(project_path, manifest)
+
+    shutil.rmtree(session_dir)
+    logger.info("session_archived", session_id=entry["session_id"], size_bytes=entry["size_bytes"])
+    return entry
+
+
+def archived_session_numbers(project_path: str) -> list[int]:
+    """Numbers (``NNN-`` prefix) of the archived sessions."""
+    numbers = []
+    for entry in read_manifest(project_path):
+        match = re.match(r"^(\d+)-", entry["session_id"])
+        if match:
+            numbers.append(int(match.group(1)))
+    return numbers
+
+
+__all__ = [
+    "ARCHIVE_DIR",
+    "DEFAULT_KEEP_LAST",
+    "DEFAULT_STATUSES",
+    "MANIFEST_FILENAME",
+    "archive_session",
+    "archived_session_numbers",
+    "get_archive_dir",
+    "read_manifest",
+    "select_sessions",
+]
@@ -0,0 +1,295 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Index of the sessions under ``.testboost/sessions/``.
+
+Finding the current session used to mean listing every session directory,
+sorting the names and regex-parsing ``spec.md``; listing sessions (for
+``cleanup`` and ``doctor``) read every ``spec.md``. CI repositories keep
+thousands of historical sessions, and that scan ran on every command.
+
+``.testboost/sessions.db`` is a SQLite table with one row per session
+(id, status, step, technology, timestamps). The session tracker updates a
+row in its own transaction each time it writes a ``spec.md``, from the
+content it just wrote, so no file is read back.
+
+The registry is a cache, never the source of truth: session directories
+also arrive through git (a CI job checks out the sessions of earlier
+runs), are copied or deleted by hand. A lookup therefore checks, with one
+``stat`` each, that:
+
+- the mtime of ``sessions/`` is the one recorded at the last directory
+  scan (otherwise a session was added or removed: the directory is listed
+  again and only new sessions have their ``spec.md`` read);
+- the ``spec.md`` of each returned session still has the recorded mtime
+  and size (otherwise that one file is read again).
+
+Timestamps too close to the moment they were recorded are not trusted
+(the filesystem clock is coarse), as for the class index cache.
+``testboost sessions --rebuild`` drops the registry and re-reads every
+session directory.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from src.lib.cache_files import RACY_WINDOW_NS, ensure_gitignored
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+REGISTRY_FILENAME = "sessions.db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    number INTEGER,
+    status TEXT,
+    step TEXT,
+    technology TEXT,
+    started_at TEXT,
+    updated_at TEXT,
+    spec_mtime_ns INTEGER,
+    spec_size INTEGER,
+    recorded_at_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+_COLUMNS = (
+    "session_id", "number", "status", "step", "technology",
+    "started_at", "updated_at", "spec_mtime_ns", "spec_size", "recorded_at_ns",
+)
+
+_NUMBER_PATTERN = re.compile(r"^(\d+)-")
+
+
+def get_registry_path(project_path: str) -> Path:
+    """Return the path of ``.testboost/sessions.db``."""
+    return Path(project_path) / ".testboost" / REGISTRY_FILENAME
+
+
+def _connect(project_path: str) -> sqlite3.Connection:
+    path = get_registry_path(project_path)
+    created = not path.exists()
+    conn = sqlite3.connect(path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            conn.executescript("DROP TABLE IF EXISTS sessions; DROP TABLE IF EXISTS meta;")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    if created:
+        ensure_gitignored(
+            path.parent, REGISTRY_FILENAME + "*", comment="Session registry (rebuilt from sessions/)",
+        )
+    return conn
+
+
+def _row_from_spec(session_dir: Path, content: str | None, stat: os.stat_result | None) -> tuple:
+    """Registry row for ``session_dir``; ``content`` is None when it has no spec.md."""
+    from src.lib.session_tracker import STATUS_PENDING, _parse_frontmatter
+
+    match = _NUMBER_PATTERN.match(session_dir.name)
+    fm = _parse_frontmatter(content) if content is not None else {}
+    return (
+        session_dir.name,
+        int(match.group(1)) if match else None,
+        fm.get("status", STATUS_PENDING) if content is not None else None,
+        fm.get("step"),
+        fm.get("technology"),
+        fm.get("started_at"),
+        fm.get("updated_at"),
+        stat.st_mtime_ns if stat else None,
+        stat.st_size if stat else None,
+        time.time_ns(),
+    )
+
+
+def _read_row(session_dir: Path) -> tuple:
+    spec = session_dir / "spec.md"
+    try:
+        stat = spec.stat()
+        content = spec.read_text(encoding="utf-8")
+    except OSError:
+        return _row_from_spec(session_dir, None, None)
+    return _row_from_spec(session_dir, content, stat)
+
+
+def _upsert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    conn.executemany(
+        f"INSERT OR REPLACE INTO sessions ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+        rows,
+    )
+
+
+def _sync_directory(conn: sqlite3.Connection, sessions_dir: Path) -> None:
+    """Pick up sessions added or removed since the last scan of ``sessions/``."""
+    try:
+        dir_mtime = sessions_dir.stat().st_mtime_ns
+    except OSError:
+        with conn:
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM meta")
+        return
+    meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    if (
+        meta.get("dir_mtime_ns") == dir_mtime
+        and dir_mtime < meta.get("scanned_at_ns", 0) - RACY_WINDOW_NS
+    ):
+        return
+
+    scanned_at = time.time_ns()
+    on_disk = {entry.name for entry in os.scandir(sessions_dir) if entry.is_dir()}
+    known = {row[0] for row in conn.execute("SELECT session_id FROM sessions")}
+    with conn:
+        conn.executemany(
+            "DELETE FROM sessions WHERE session_id = ?", [(name,) for name in known - on_disk],
+        )
+        _upsert(conn, [_read_row(sessions_dir / name) for name in sorted(on_disk - known)])
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("dir_mtime_ns", dir_mtime), ("scanned_at_ns", scanned_at)],
+        )
+    if on_disk != known:
+        logger.debug(
+            "session_registry_synced",
+            added=len(on_disk - known), removed=len(known - on_disk),
+        )
+
+
+def _fresh(conn: sqlite3.Connection, sessions_dir: Path, row: sqlite3.Row) -> sqlite3.Row:
+    """``row``, re-read from its spec.md if that file changed since it was recorded."""
+    try:
+        stat = (sessions_dir / row["session_id"] / "spec.md").stat()
+        current = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        current = (None, None)
+    if (
+        current == (row["spec_mtime_ns"], row["spec_size"])
+        and (current[0] is None or current[0] < row["recorded_at_ns"] - RACY_WINDOW_NS)
+    ):
+        return row
+    with conn:
+        _upsert(conn, [_read_row(sessions_dir / row["session_id"])])
+    return conn.execute(
+        "SELECT * FROM sessions WHERE session_id = ?", (row["session_id"],)
+    ).fetchone()
+
+
+def _as_dict(sessions_dir: Path, row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "session_id": row["session_id"],
+        "session_dir": str(sessions_dir / row["session_id"]),
+        "has_spec": row["spec_mtime_ns"] is not None,
+        "status": row["status"],
+        "step": row["step"],
+        "technology": row["technology"],
+        "started_at": row["started_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
+def record_session(session_dir: str | Path, spec_content: str | None = None) -> None:
+    """Update the registry row of a session after its ``spec.md`` was written.
+
+    Args:
+        session_dir: ``.testboost/sessions/<id>``.
+        spec_content: The content just written to ``spec.md`` (read from
+            disk when omitted).
+
+    A failure to update the registry is logged and otherwise ignored: the
+    next lookup notices the changed ``spec.md`` and re-reads it.
+    """
+    session_dir = Path(session_dir)
+    if session_dir.parent.name != "sessions" or session_dir.parent.parent.name != ".testboost":
+        return
+    project_path = str(session_dir.parent.parent.parent)
+    try:
+        if spec_content is None:
+            row = _read_row(session_dir)
+        else:
+            row = _row_from_spec(session_dir, spec_content, (session_dir / "spec.md").stat())
+        conn = _connect(project_path)
+        try:
+            with conn:
+                _upsert(conn, [row])
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("session_registry_update_failed", session_dir=str(session_dir), error=str(e))
+
+
+def newest_session(project_path: str, sessions_dir: Path) -> dict[str, Any] | None:
+    """The session whose directory name sorts last, or None."""
+    conn = _connect(project_path)
+    try:
+        _sync_directory(conn, sessions_dir)
+        row = conn.execute(
+            "SELECT * FROM sessions ORDER BY session_id DESC LIMIT 1"
+        ).fetchone()
+        return _as_dict(sessions_dir, _fresh(conn, sessions_dir, row)) if row else None
+    finally:
+        conn.close()
+
+
+def all_sessions(project_path: str, sessions_dir: Path) -> list[dict[str, Any]]:
+    """Every session, sorted by directory name."""
+    conn = _connect(project_path)
+    try:
+        _sync_directory(conn, sessions_dir)
+        rows = conn.execute("SELECT * FROM sessions ORDER BY session_id").fetchall()
+        return [_as_dict(sessions_dir, _fresh(conn, sessions_dir, row)) for row in rows]
+    finally:
+        conn.close()
+
+
+def max_session_number(project_path: str, sessions_dir: Path) -> int | None:
+    """Highest ``NNN-`` number among the sessions, or None when there is none.
+
+    Numbers come from the directory names, so no ``spec.md`` is checked:
+    when nothing was added or removed this costs one ``stat`` and one query.
+    """
+    conn = _connect(project_path)
+    try:
+        _sync_directory(conn, sessions_dir)
+        return conn.execute("SELECT MAX(number) FROM sessions").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def rebuild_registry(project_path: str) -> int:
+    """Drop the registry and re-read every session directory.
+
+    Returns:
+        The number of sessions indexed.
+    """
+    from src.lib.session_tracker import get_sessions_dir
+
+    sessions_dir = get_sessions_dir(project_path)
+    conn = _connect(project_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM meta")
+        _sync_directory(conn, sessions_dir)
+        count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    finally:
+        conn.close()
+    logger.info("session_registry_rebuilt", sessions=count)
+    return count
+
+
+__all__ = [
+    "REGISTRY_FILENAME",
+    "all_sessions",
+    "get_registry_path",
+    "max_session_number",
+    "newest_session",
+    "rebuild_registry",
+    "record_session",
+]
@@ -16,6 +16,7 @@ A session = a directory under .testboost/sessions/ containing:
 import json
 import os
 import re
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -42,6 +43,8 @@ EXIT_AWAITING_INPUT = 78
 QUESTION_FILENAME = "question.json"
 ANSWER_CONSUMED_FILENAME = "answer.json.consumed"
 GENERATION_CURSOR_FILENAME = "generation_cursor.json"
+GENERATION_CURSOR_JOURNAL_FILENAME = "generation_cursor.journal"
+STATUS_CACHE_FILENAME = "status_cache.json"
 
 
 def get_testboost_dir(project_path: str) -> Path:
@@ -118,15 +121,7 @@ def create_session(project_path: str, name: str | None = None, description: str
     sessions_dir.mkdir(parents=True, exist_ok=True)
 
     # Determine next session number
-    existing = sorted(sessions_dir.iterdir()) if sessions_dir.exists() else []
-    existing_nums = []
-    for d in existing:
-        if d.is_dir():
-            match = re.match(r"^(\d+)-", d.name)
-            if match:
-                existing_nums.append(int(match.group(1)))
-
-    next_num = max(existing_nums, default=0) + 1
+    next_num = _max_session_number(project_path) + 1
 
     # Build session directory name
     if not name:
@@ -159,6 +154,7 @@ def create_session(project_path: str, name: str | None = None, description: str
     spec_content += "\n"
 
     (session_dir / "spec.md").write_text(spec_content, encoding="utf-8")
+    _record_session(session_dir, spec_content)
 
     return {
         "success": True,
@@ -178,31 +174,16 @@ def get_current_session(project_path: str) -> dict[str, Any] | None:
     if not sessions_dir.exists():
         return None
 
-    existing = sorted(
-        [d for d in sessions_dir.iterdir() if d.is_dir()],
-        key=lambda d: d.name,
-        reverse=True,
-    )
-
-    if not existing:
-        return None
-
-    session_dir = existing[0]
-    session_id = session_dir.name
-
-    # Read spec.md frontmatter
-    spec_path = session_dir / "spec.md"
-    if not spec_path.exists():
+    session = _registry_sessions(project_path, newest_only=True)
+    if not session or not session[0]["has_spec"]:
         return None
 
-    frontmatter = _parse_frontmatter(spec_path.read_text(encoding="utf-8"))
-
     return {
-        "session_id": session_id,
-        "session_dir": str(session_dir),
-        "status": frontmatter.get("status", STATUS_PENDING),
-        "step": frontmatter.get("step", "init"),
-        "started_at": frontmatter.get("started_at", ""),
+        "session_id": session[0]["session_id"],
+        "session_dir": session[0]["session_dir"],
+        "status": session[0]["status"] or STATUS_PENDING,
+        "step": session[0]["step"] or "init",
+        "started_at": session[0]["started_at"] or "",
     }
 
 
@@ -246,6 +227,16 @@ def update_step_file(
     file_path = session_path / f"{step_name}.md"
     file_path.write_text(md, encoding="utf-8")
 
+    # Parsed form for later steps (<step>.json, see src.lib.step_data)
+    from src.lib.step_data import write_step_sidecar
+
+    write_step_sidecar(file_path, md)
+
+    # The step's queued log lines are on disk once its file is
+    from src.lib.log_writer import flush_logs
+
+    flush_logs()
+
     # Update the progress table in spec.md
     _update_spec_progress(session_path, step_name, status, now)
 
@@ -256,7 +247,8 @@ def write_log(session_dir: str, step_name: str, level: str, message: str, **kwar
     """Append a log entry to the session's log file.
 
     Logs are written to .testboost/sessions/<id>/logs/<date>.md
-    in a structured, readable format.
+    in a structured, readable format. The entry is on disk when this
+    returns; see queue_log() for the buffered variant used by MdLogger.
 
     Args:
         session_dir: Path to the session directory
@@ -265,34 +257,59 @@ def write_log(session_dir: str, step_name: str, level: str, message: str, **kwar
         message: Log message
         **kwargs: Additional structured data
     """
+    from src.lib.log_writer import flush_logs, log_file_header
+
+    # Entries queued earlier must land first
+    flush_logs()
+
     logs_dir = Path(session_dir) / "logs"
     logs_dir.mkdir(exist_ok=True)
 
-    today = datetime.now(UTC).strftime("%Y-%m-%d")
+    today, entry = _format_log_entry(step_name, level, message, kwargs)
     log_file = logs_dir / f"{today}.md"
 
-    now = datetime.now(UTC).strftime("%H:%M:%S")
-    entry = f"| {now} | {level:<5} | {step_name:<15} | {message}"
-
-    if kwargs:
-        details = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-        entry += f" | {details}"
-    entry += " |\n"
-
     # Create header if file is new
     if not log_file.exists():
-        header = f"# Logs - {today}\n\n"
-        header += "| Time | Level | Step | Message | Details |\n"
-        header += "|------|-------|------|---------|---------|\n"
-        log_file.write_text(header, encoding="utf-8")
+        log_file.write_text(log_file_header(today), encoding="utf-8")
 
     with open(log_file, "a", encoding="utf-8") as f:
         f.write(entry)
 
 
+def queue_log(session_dir: str, step_name: str, level: str, message: str, **kwargs: Any) -> None:
+    """Queue a log entry for the session's log file (see src.lib.log_writer).
+
+    Same entry as write_log(), written in a batch by a background thread.
+    ERROR entries are written without delay; everything queued is written
+    by flush_logs(), at the end of each step (update_step_file) and at exit.
+    """
+    from src.lib.log_writer import get_log_writer
+
+    today, entry = _format_log_entry(step_name, level, message, kwargs)
+    get_log_writer().submit(Path(session_dir) / "logs", today, entry, urgent=level == "ERROR")
+
+
+def _format_log_entry(
+    step_name: str, level: str, message: str, details: dict[str, Any],
+) -> tuple[str, str]:
+    """Return (log file date, table row) for a log entry."""
+    now = datetime.now(UTC)
+    entry = f"| {now.strftime('%H:%M:%S')} | {level:<5} | {step_name:<15} | {message}"
+
+    if details:
+        entry += " | " + ", ".join(f"{k}={v}" for k, v in details.items())
+    entry += " |\n"
+    return now.strftime("%Y-%m-%d"), entry
+
+
 def get_session_status(project_path: str) -> str:
     """Get a human-readable summary of the current session status.
 
+    The last log entries are read from the end of the latest log file. The
+    summary is cached in the session's ``status_cache.json`` and served from
+    there while ``spec.md``, the step files and that log keep their mtime
+    and size, so polling ``status`` re-reads none of them.
+
     Returns a markdown-formatted string suitable for display.
     """
     session = get_current_session(project_path)
@@ -305,6 +322,15 @@ def get_session_status(project_path: str) -> str:
     if not spec_path.exists():
         return f"Session {session['session_id']} exists but has no spec.md."
 
+    from src.lib.log_writer import flush_logs, tail_log_entries
+
+    flush_logs()
+    latest_log = _latest_log_file(session_dir)
+    fingerprint = _status_fingerprint(session_dir, latest_log)
+    cached = _read_status_cache(session_dir, fingerprint)
+    if cached is not None:
+        return cached
+
     lines = []
     lines.append(f"## Session: {session['session_id']}")
     lines.append(f"**Status**: {session['status']}")
@@ -317,36 +343,92 @@ def get_session_status(project_path: str) -> str:
     lines.append("| Step | Status | File |")
     lines.append("|------|--------|------|")
 
+    from src.lib.step_data import step_status
+
     for step in STEPS:
         step_file = session_dir / f"{step}.md"
         if step_file.exists():
-            fm = _parse_frontmatter(step_file.read_text(encoding="utf-8"))
-            status = fm.get("status", "unknown")
+            status = step_status(step_file)
             lines.append(f"| {step} | {status} | {step}.md |")
         else:
             lines.append(f"| {step} | pending | - |")
 
     lines.append("")
 
-    # Show recent logs
-    logs_dir = session_dir / "logs"
-    if logs_dir.exists():
-        log_files = sorted(logs_dir.glob("*.md"), reverse=True)
-        if log_files:
-            latest_log = log_files[0]
-            log_content = latest_log.read_text(encoding="utf-8")
-            # Get last 10 log lines
-            log_lines = [ln for ln in log_content.split("\n") if ln.startswith("|") and not ln.startswith("| Time") and not ln.startswith("|---")]
-            if log_lines:
-                lines.append("### Recent Logs")
-                lines.append("")
-                lines.append("| Time | Level | Step | Message | Details |")
-                lines.append("|------|-------|------|---------|---------| ")
-                for log_line in log_lines[-10:]:
-                    lines.append(log_line)
-                lines.append("")
+    # Show the last 10 log entries, read from the end of the latest log
+    if latest_log is not None:
+        try:
+            log_lines = tail_log_entries(latest_log, 10)
+        except OSError:
+            log_lines = []
+        if log_lines:
+            lines.append("### Recent Logs")
+            lines.append("")
+            lines.append("| Time | Level | Step | Message | Details |")
+            lines.append("|------|-------|------|---------|---------| ")
+            for log_line in log_lines:
+                lines.append(log_line)
+            lines.append("")
+
+    text = "\n".join(lines)
+    _write_status_cache(session_dir, fingerprint, text)
+    return text
 
-    return "\n".join(lines)
+
+def _latest_log_file(session_dir: Path) -> Path | None:
+    try:
+        names = [n for n in os.listdir(session_dir / "logs") if n.endswith(".md")]
+    except OSError:
+        return None
+    return session_dir / "logs" / max(names) if names else None
+
+
+def _status_fingerprint(session_dir: Path, latest_log: Path | None) -> list[list[Any]]:
+    """(name, mtime, size) of every file ``get_session_status`` reads."""
+    paths = [session_dir / "spec.md", *(session_dir / f"{step}.md" for step in STEPS)]
+    if latest_log is not None:
+        paths.append(latest_log)
+    fingerprint = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        fingerprint.append([f"{path.parent.name}/{path.name}", st.st_mtime_ns, st.st_size])
+    return fingerprint
+
+
+def _read_status_cache(session_dir: Path, fingerprint: list[list[Any]]) -> str | None:
+    """The cached status text, if rendered from files that have not changed since."""
+    try:
+        cache = json.loads((session_dir / STATUS_CACHE_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("fingerprint") != fingerprint:
+        return None
+    text = cache.get("text")
+    return text if isinstance(text, str) else None
+
+
+def _write_status_cache(session_dir: Path, fingerprint: list[list[Any]], text: str) -> None:
+    from src.lib.cache_files import RACY_WINDOW_NS, write_cache_file
+
+    # Not cached until every file is out of the racy window
+    if any(mtime_ns > time.time_ns() - RACY_WINDOW_NS for _, mtime_ns, _ in fingerprint):
+        return
+    target = session_dir / STATUS_CACHE_FILENAME
+    try:
+        write_cache_file(
+            target,
+            json.dumps({"fingerprint": fingerprint, "text": text}),
+            tb_dir=session_dir.parent.parent,
+            ignore_pattern=f"{SESSIONS_DIR}/*/{STATUS_CACHE_FILENAME}",
+            comment="TestBoost local session status cache",
+        )
+    except OSError as e:
+        from src.lib.logging import get_logger
+
+        get_logger(__name__).warning("status_cache_not_written", path=str(target), error=str(e))
 
 
 # ---------------------------------------------------------------------------
@@ -620,20 +702,16 @@ def list_sessions(project_path: str) -> list[dict[str, Any]]:
     if not sessions_dir.exists():
         return []
     out: list[dict[str, Any]] = []
-    for sdir in sorted(sessions_dir.iterdir()):
-        if not sdir.is_dir():
-            continue
-        spec = sdir / "spec.md"
-        if not spec.exists():
+    for session in _registry_sessions(project_path):
+        if not session["has_spec"]:
             continue
-        fm = _parse_frontmatter(spec.read_text(encoding="utf-8"))
         info: dict[str, Any] = {
-            "session_id": sdir.name,
-            "session_dir": str(sdir),
-            "status": fm.get("status", STATUS_PENDING),
-            "step": fm.get("step", ""),
-            "started_at": fm.get("started_at", ""),
-            "updated_at": fm.get("updated_at", ""),
+            "session_id": session["session_id"],
+            "session_dir": session["session_dir"],
+            "status": session["status"] or STATUS_PENDING,
+            "step": session["step"] or "",
+            "started_at": session["started_at"] or "",
+            "updated_at": session["updated_at"] or "",
         }
         # Age (hours) since updated_at, or started_at if no update yet
         ts = info["updated_at"] or info["started_at"]
@@ -649,6 +727,50 @@ def list_sessions(project_path: str) -> list[dict[str, Any]]:
     return out
 
 
+def list_generated_tests(
+    project_path: str, session_ids: list[str] | None = None,
+) -> dict[str, str]:
+    """Map each source file to the test TestBoost generated for it.
+
+    Collected from the ``generated`` data of every session's
+    ``generation.md`` (archived sessions first, from the archive
+    manifest); a later session wins over an earlier one. Tests written by
+    hand never appear here.
+
+    Args:
+        project_path: Path to the project.
+        session_ids: Only these live sessions (archived ones are skipped).
+
+    Returns:
+        {source_file: test_path}, both project-relative with "/" separators.
+    """
+    from src.lib.step_data import read_step
+
+    out: dict[str, str] = {}
+    if session_ids is None:
+        from src.lib.session_archive import read_manifest
+
+        for entry in read_manifest(project_path):
+            out.update(entry.get("generated") or {})
+    sessions_dir = get_sessions_dir(project_path)
+    if not sessions_dir.exists():
+        return out
+    if session_ids is None:
+        session_dirs = sorted(sessions_dir.iterdir())
+    else:
+        session_dirs = [sessions_dir / sid for sid in sorted(session_ids)]
+    for sdir in session_dirs:
+        gen_file = sdir / "generation.md"
+        if not gen_file.is_file():
+            continue
+        data = read_step(gen_file)
+        for block in data.blocks if data else ():
+            for item in block.get("generated", []) if isinstance(block, dict) else []:
+                if isinstance(item, dict) and item.get("source_file") and item.get("path"):
+                    out[item["source_file"].replace("\\", "/")] = item["path"].replace("\\", "/")
+    return out
+
+
 def mark_abandoned(session_dir: str) -> None:
     """Flip a session's spec.md status to 'abandoned'.
 
@@ -663,6 +785,7 @@ def mark_abandoned(session_dir: str) -> None:
         r"(?m)^status:.*$", f"status: {STATUS_ABANDONED}", content, count=1
     )
     spec.write_text(content, encoding="utf-8")
+    _record_session(Path(session_dir), content)
 
 
 def find_abandoned_sessions(
@@ -679,6 +802,25 @@ def find_abandoned_sessions(
 
 
 # --- generation cursor helpers (per-file resumability) ---
+#
+# The cursor is a snapshot (generation_cursor.json, replaced atomically)
+# plus an append-only journal of per-file events
+# (generation_cursor.journal, one JSON object per line). A completed file
+# costs one appended line instead of a rewrite of the whole cursor; the
+# journal is folded into a new snapshot once it grows past
+# _CURSOR_JOURNAL_MAX_BYTES. Every snapshot has a random "epoch" and every
+# journal line carries the epoch it extends, so lines left over from an
+# older snapshot (a crash between the rename and the journal removal) are
+# ignored, as is a torn last line.
+
+_CURSOR_JOURNAL_MAX_BYTES = 64 * 1024
+
+# session_dir -> epoch of the snapshot this process last wrote or read
+_cursor_epochs: dict[str, str] = {}
+
+
+def _cursor_journal_path(session_dir: str) -> Path:
+    return Path(session_dir) / GENERATION_CURSOR_JOURNAL_FILENAME
 
 
 def save_generation_cursor(
@@ -690,45 +832,137 @@ def save_generation_cursor(
     files_filter: list[str] | None = None,
     deferred: list[dict[str, Any]] | None = None,
 ) -> Path:
-    """Persist progress through the generate per-file loop.
+    """Persist progress through the generate per-file loop (full snapshot).
 
     files_filter: the original `--files` patterns, so `resume` can replay
       the exact same scope instead of recomputing target_files from gaps.
     deferred: files awaiting human input, as dicts with at least
       source_file / class_name / reason (+ test_path for compile fixes,
       so a `fixed_code` answer can be applied without regenerating).
+
+    The snapshot replaces the previous one atomically and starts a new,
+    empty journal; per-file progress is then recorded with
+    append_generation_cursor().
     """
+    import secrets
+
     path = Path(session_dir) / GENERATION_CURSOR_FILENAME
+    epoch = secrets.token_hex(8)
     payload: dict[str, Any] = {
         "target_files": target_files,
         "current_index": current_index,
         "completed_files": completed_files,
         "updated_at": _now_iso(),
+        "epoch": epoch,
     }
     if files_filter is not None:
         payload["files_filter"] = files_filter
     if deferred is not None:
         payload["deferred"] = deferred
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    _cursor_journal_path(session_dir).unlink(missing_ok=True)
+    _cursor_epochs[str(session_dir)] = epoch
     return path
 
 
+def append_generation_cursor(
+    session_dir: str,
+    *,
+    completed_file: str | None = None,
+    deferred: list[dict[str, Any]] | None = None,
+) -> None:
+    """Record per-file progress in the cursor journal.
+
+    Args:
+        session_dir: Session directory holding the cursor snapshot.
+        completed_file: A file the generate loop just finished.
+        deferred: Files newly deferred (awaiting input) since the last
+            call, appended to the cursor's ``deferred`` list.
+    """
+    epoch = _cursor_epochs.get(str(session_dir))
+    if epoch is None:
+        cursor = load_generation_cursor(session_dir)
+        if cursor is None:
+            return
+        if "epoch" not in cursor:
+            _compact_generation_cursor(session_dir)
+        epoch = _cursor_epochs[str(session_dir)]
+    event: dict[str, Any] = {"epoch": epoch, "at": _now_iso()}
+    if completed_file is not None:
+        event["completed"] = completed_file
+    if deferred:
+        event["deferred"] = deferred
+    with open(_cursor_journal_path(session_dir), "a", encoding="utf-8") as f:
+        f.write(json.dumps(event, default=str) + "\n")
+        size = f.tell()
+    if size > _CURSOR_JOURNAL_MAX_BYTES:
+        _compact_generation_cursor(session_dir)
+
+
+def _compact_generation_cursor(session_dir: str) -> None:
+    """Fold the journal into a new snapshot."""
+    cursor = load_generation_cursor(session_dir)
+    if cursor is None:
+        return
+    save_generation_cursor(
+        session_dir,
+        target_files=cursor["target_files"],
+        current_index=cursor["current_index"],
+        completed_files=cursor["completed_files"],
+        files_filter=cursor.get("files_filter"),
+        deferred=cursor.get("deferred"),
+    )
+
+
 def load_generation_cursor(session_dir: str) -> dict[str, Any] | None:
-    """Read the cursor, or None if no resume state exists."""
+    """Read the cursor (snapshot + journal replay), or None if no resume state exists."""
     path = Path(session_dir) / GENERATION_CURSOR_FILENAME
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        cursor = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
         return None
+    epoch = cursor.get("epoch")
+    if epoch is None:
+        return cursor  # written before the journal existed
+    _cursor_epochs[str(session_dir)] = epoch
+    journal = _cursor_journal_path(session_dir)
+    if not journal.exists():
+        return cursor
+
+    completed = list(cursor.get("completed_files", []))
+    deferred = list(cursor.get("deferred", []))
+    replayed = False
+    with open(journal, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                break  # torn write at the tail: nothing after it was recorded
+            if not isinstance(event, dict) or event.get("epoch") != epoch:
+                continue
+            replayed = True
+            if event.get("completed") is not None:
+                completed.append(event["completed"])
+                cursor["current_index"] = cursor.get("current_index", 0) + 1
+            deferred.extend(event.get("deferred", []))
+            cursor["updated_at"] = event.get("at", cursor.get("updated_at"))
+    if replayed:
+        cursor["completed_files"] = completed
+        cursor["deferred"] = deferred
+    return cursor
 
 
 def clear_generation_cursor(session_dir: str) -> None:
-    """Drop the cursor file once generate has run to completion."""
+    """Drop the cursor (snapshot and journal) once generate has run to completion."""
     path = Path(session_dir) / GENERATION_CURSOR_FILENAME
     if path.exists():
         path.unlink()
+    _cursor_journal_path(session_dir).unlink(missing_ok=True)
+    _cursor_epochs.pop(str(session_dir), None)
 
 
 # --- Private helpers ---
@@ -762,6 +996,75 @@ def _parse_frontmatter(content: str) -> dict[str, str]:
     return fm
 
 
+def _record_session(session_dir: Path, spec_content: str) -> None:
+    """Update the session registry after writing a spec.md."""
+    from src.lib.session_registry import record_session
+
+    record_session(session_dir, spec_content)
+
+
+def _registry_sessions(project_path: str, newest_only: bool = False) -> list[dict[str, Any]]:
+    """Sessions from the registry, sorted by id (see src.lib.session_registry).
+
+    Falls back to scanning the sessions directory when the registry cannot
+    be opened (read-only checkout, locked database).
+    """
+    import sqlite3
+
+    from src.lib.session_registry import all_sessions, newest_session
+
+    sessions_dir = get_sessions_dir(project_path)
+    try:
+        if newest_only:
+            newest = newest_session(project_path, sessions_dir)
+            return [newest] if newest else []
+        return all_sessions(project_path, sessions_dir)
+    except (OSError, sqlite3.Error) as e:
+        from src.lib.logging import get_logger
+
+        get_logger(__name__).warning("session_registry_unavailable", error=str(e))
+
+    dirs = sorted(d for d in sessions_dir.iterdir() if d.is_dir())
+    if newest_only:
+        dirs = dirs[-1:]
+    out = []
+    for sdir in dirs:
+        spec = sdir / "spec.md"
+        fm = _parse_frontmatter(spec.read_text(encoding="utf-8")) if spec.exists() else {}
+        out.append({
+            "session_id": sdir.name,
+            "session_dir": str(sdir),
+            "has_spec": spec.exists(),
+            "status": fm.get("status"),
+            "step": fm.get("step"),
+            "technology": fm.get("technology"),
+            "started_at": fm.get("started_at"),
+            "updated_at": fm.get("updated_at"),
+        })
+    return out
+
+
+def _max_session_number(project_path: str) -> int:
+    """Highest session number in use, archived sessions included (0 if none)."""
+    import sqlite3
+
+    from src.lib.session_archive import archived_session_numbers
+    from src.lib.session_registry import max_session_number
+
+    sessions_dir = get_sessions_dir(project_path)
+    try:
+        live = max_session_number(project_path, sessions_dir)
+    except (OSError, sqlite3.Error) as e:
+        from src.lib.logging import get_logger
+
+        get_logger(__name__).warning("session_registry_unavailable", error=str(e))
+        live = max(
+            (int(m.group(1)) for d in sessions_dir.iterdir() if (m := re.match(r"^(\d+)-", d.name))),
+            default=None,
+        )
+    return max([*archived_session_numbers(project_path), live or 0])
+
+
 def _update_spec_progress(session_dir: Path, step_name: str, status: str, timestamp: str) -> None:
     """Update the progress table in spec.md."""
     spec_path = session_dir / "spec.md"
@@ -799,6 +1102,7 @@ def _update_spec_progress(session_dir: Path, step_name: str, status: str, timest
         )
 
     spec_path.write_text(new_content, encoding="utf-8")
+    _record_session(session_dir, new_content)
 
 
 # ---------------------------------------------------------------------------
@@ -818,30 +1122,37 @@ def get_project_analysis_path(project_path: str) -> Path:
 
 
 def write_project_analysis(project_path: str, content: str, data: dict[str, Any]) -> Path:
-    """Write the project-level analysis.md file.
+    """Write the project-level analysis: markdown summary + structured store.
 
     Analogous to update_step_file() but writes to .testboost/analysis.md
-    (not under a session directory).
+    (not under a session directory). The structured data goes to
+    .testboost/analysis.db (see src.lib.analysis_store); the markdown is
+    the human-readable summary only.
 
     Args:
         project_path: Path to the Java project root.
-        content: Markdown body content (without frontmatter or JSON block).
+        content: Markdown body content (without frontmatter).
         data: Structured data dict (class_index, conventions, etc.).
 
     Returns:
-        Path to the written file.
+        Path to the written markdown file.
     """
+    from src.lib.analysis_store import STORE_FILENAME, write_analysis_data
+
     analysis_path = get_project_analysis_path(project_path)
     now = _now_iso()
 
-    md = _make_frontmatter(status=STATUS_COMPLETED, updated_at=now)
-    md += content
-    md += "\n\n## Raw Data\n\n"
-    md += "```json\n"
-    md += json.dumps(data, indent=2, default=str)
-    md += "\n```\n"
+    write_analysis_data(project_path, data)
 
-    analysis_path.write_text(md, encoding="utf-8")
+    analysis_path.write_text(
+        "".join([
+            _make_frontmatter(status=STATUS_COMPLETED, updated_at=now),
+            content,
+            "\n\n## Raw Data\n\n",
+            f"Structured analysis data is stored in `{STORE_FILENAME}` next to this file.\n",
+        ]),
+        encoding="utf-8",
+    )
     return analysis_path
 
 
@@ -879,17 +1190,34 @@ def set_session_technology(session_dir: Path, technology: str) -> None:
         # Insert before the closing --- of the frontmatter block
         content = re.sub(r"\n---\n\n", f"\ntechnology: {technology}\n---\n\n", content, count=1)
     spec_path.write_text(content, encoding="utf-8")
+    _record_session(Path(session_dir), content)
 
 
-def read_project_analysis_data(project_path: str) -> dict[str, Any] | None:
-    """Read the structured data from the project-level analysis.md.
+def read_project_analysis_data(
+    project_path: str, include_class_index: bool = True,
+) -> dict[str, Any] | None:
+    """Read the structured project-level analysis data.
+
+    Reads .testboost/analysis.db; falls back to the JSON block embedded in
+    .testboost/analysis.md by older versions.
+
+    Args:
+        project_path: Path to the project root.
+        include_class_index: False skips loading the class index (callers
+            that look classes up on demand).
 
     Returns:
-        The parsed JSON data dict, or None if the file doesn't exist
-        or contains no valid JSON block (backward-compat: old sessions
-        without a project-level analysis will get None and fall back to
-        the session-level analysis.md).
+        The data dict, or None if neither the store nor a valid legacy
+        JSON block exists (backward-compat: old sessions without a
+        project-level analysis will get None and fall back to the
+        session-level analysis.md).
     """
+    from src.lib.analysis_store import read_analysis_data
+
+    data = read_analysis_data(project_path, include_class_index=include_class_index)
+    if data is not None:
+        return data
+
     analysis_path = get_project_analysis_path(project_path)
     if not analysis_path.exists():
         return None
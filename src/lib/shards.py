@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Partitioning of a generation run across processes or CI runners.
+
+``generate --shard i/N`` generates tests for one of N disjoint slices of
+the target files. A file belongs to the shard given by a stable hash of
+its path (SHA-1, separators normalized), so every runner computes the
+same partition from the same gap list, whatever its platform or Python
+hash seed, and a file keeps its shard when other files are added.
+
+A shard keeps its state under ``<session>/shards/<i>-of-<N>/``: its
+``generation.md``, its generation cursor and its logs. Runners therefore
+never write the same file, and the shard directories can be collected
+side by side (CI artifacts) before ``testboost merge-shards`` combines
+them into the session's ``generation.md``.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+SHARDS_DIR = "shards"
+
+_SHARD_SPEC = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_SHARD_DIR = re.compile(r"^(\d+)-of-(\d+)$")
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse ``"i/N"`` (1-based, as GitLab's ``CI_NODE_INDEX/CI_NODE_TOTAL``).
+
+    Raises:
+        ValueError: If ``spec`` is not ``i/N`` with ``1 <= i <= N``.
+    """
+    match = _SHARD_SPEC.match(spec or "")
+    if not match:
+        raise ValueError(f"invalid shard {spec!r}: expected i/N, e.g. 2/4")
+    index, total = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= total:
+        raise ValueError(f"invalid shard {spec!r}: index must be between 1 and {total or 'N'}")
+    return index, total
+
+
+def shard_of(path: str, total: int) -> int:
+    """1-based shard of ``path`` among ``total`` shards."""
+    digest = hashlib.sha1(path.replace("\\", "/").encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % total + 1
+
+
+def select_shard(files: list[str], index: int, total: int) -> list[str]:
+    """The files of shard ``index``/``total``, in their original order."""
+    return [f for f in files if shard_of(f, total) == index]
+
+
+def get_shard_dir(session_dir: str | Path, index: int, total: int) -> Path:
+    """``<session>/shards/<index>-of-<total>``."""
+    return Path(session_dir) / SHARDS_DIR / f"{index}-of-{total}"
+
+
+def list_shard_dirs(session_dir: str | Path) -> dict[int, dict[int, Path]]:
+    """Shard directories of a session: ``{total: {index: path}}``."""
+    found: dict[int, dict[int, Path]] = {}
+    root = Path(session_dir) / SHARDS_DIR
+    if not root.is_dir():
+        return found
+    for child in root.iterdir():
+        match = _SHARD_DIR.match(child.name)
+        if match and child.is_dir():
+            found.setdefault(int(match.group(2)), {})[int(match.group(1))] = child
+    return found
+
+
+__all__ = [
+    "SHARDS_DIR",
+    "get_shard_dir",
+    "list_shard_dirs",
+    "parse_shard",
+    "select_shard",
+    "shard_of",
+]
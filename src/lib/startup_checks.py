@@ -7,6 +7,7 @@ from typing import Any
 
 from langchain_core.messages import HumanMessage
 
+from src.lib import llm_check_cache
 from src.lib.config import get_settings
 from src.lib.llm import LLMError, LLMProviderError, LLMTimeoutError, get_llm
 from src.lib.logging import get_logger
@@ -99,17 +100,58 @@ async def _ping_llm_with_retry(llm: Any, timeout: int = STARTUP_TIMEOUT, max_ret
             raise LLMConnectionError(f"LLM ping failed: {e}") from e
 
 
-async def check_llm_connection(model: str | None = None) -> None:
+async def check_llm_connection(
+    model: str | None = None,
+    project_path: str | None = None,
+    use_cache: bool = True,
+) -> None:
     """
     Check LLM provider connectivity at startup.
 
     Called by testboost/lib/cli.py before LLM-dependent commands.
 
+    When ``project_path`` is given, a successful check is cached in
+    ``.testboost/llm_check.json`` for ``LLM_CHECK_CACHE_TTL`` seconds, keyed
+    by provider, model and base URL; a fresh entry skips the ping. Any
+    failure (here or in a later real LLM call) invalidates the entry.
+
+    Args:
+        model: Model override (defaults to settings.model)
+        project_path: Project whose ``.testboost/`` holds the cache
+        use_cache: False forces a real ping (the result is still recorded)
+
     Raises:
         LLMProviderError: If API key not configured
         LLMConnectionError: If connection fails after retries
         LLMTimeoutError: If ping times out
     """
+    provider = settings.llm_provider
+    effective_model = model or settings.model
+    base_url = settings.openai_api_base if provider == "openai" else None
+    key = llm_check_cache.cache_key(provider, effective_model, base_url)
+    llm_check_cache.set_active_project(project_path)
+
+    if (
+        project_path
+        and use_cache
+        and llm_check_cache.is_fresh(project_path, key, settings.llm_check_cache_ttl)
+    ):
+        logger.info("llm_connection_cached", provider=provider, model=effective_model)
+        return
+
+    try:
+        await _check_llm_connection_uncached(model)
+    except Exception:
+        if project_path:
+            llm_check_cache.invalidate(project_path)
+        raise
+
+    if project_path and settings.llm_check_cache_ttl > 0:
+        llm_check_cache.record_success(project_path, key, provider, effective_model, base_url)
+
+
+async def _check_llm_connection_uncached(model: str | None) -> None:
+    """Ping the provider and map failures to the LLM error hierarchy."""
     try:
         logger.info("llm_connection_check_start", model=model or settings.model)
         llm = get_llm(model=model, timeout=STARTUP_TIMEOUT)
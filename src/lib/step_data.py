@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Structured data of the session step files.
+
+Each step writes ``<step>.md`` (YAML-ish frontmatter, markdown body and a
+"Raw Data" JSON block). Later steps used to read those files back and
+regex-search every JSON block with ``json.loads`` once per field they
+needed: ``generate`` alone extracted four fields from ``coverage-gaps.md``
+and ``analysis.md``.
+
+:func:`read_step` parses a step file once and keeps the result for the
+life of the process, keyed by the file's (path, mtime, size): a rewritten
+or hand-edited file is parsed again, an unchanged one never is. The
+accessors below return typed values for the fields the commands use.
+
+``update_step_file`` also writes the parsed form to ``<step>.json`` next
+to the markdown. A fresh process loads that sidecar instead of parsing the
+markdown, as long as the markdown still has the mtime and size recorded
+in it; the markdown stays the source of truth (users edit the build
+commands in ``analysis.md``), so an edited file is simply parsed again.
+"""
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.lib.cache_files import RACY_WINDOW_NS, write_cache_file
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+SIDECAR_VERSION = 1
+
+_JSON_BLOCK = re.compile(r"```json\n(.*?)```", re.DOTALL)
+_FRONTMATTER = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class StepData:
+    """A parsed step file.
+
+    Attributes:
+        frontmatter: Frontmatter fields (``status``, ``step``, ...).
+        blocks: The JSON blocks of the body that parse, in order.
+    """
+
+    frontmatter: dict[str, str]
+    blocks: tuple[Any, ...]
+
+    @property
+    def status(self) -> str:
+        """The frontmatter status, or ``"unknown"``."""
+        return self.frontmatter.get("status") or "unknown"
+
+    def field(self, name: str, default: Any = None) -> Any:
+        """``name`` from the first JSON block that has it, else ``default``."""
+        for block in self.blocks:
+            if isinstance(block, dict) and name in block:
+                return block[name]
+        return default
+
+
+def parse_step_markdown(content: str) -> StepData:
+    """Parse the frontmatter and JSON blocks of step file content."""
+    frontmatter: dict[str, str] = {}
+    match = _FRONTMATTER.match(content)
+    if match:
+        for line in match.group(1).split("\n"):
+            if ":" in line:
+                key, _, value = line.partition(":")
+                frontmatter[key.strip()] = value.strip()
+    blocks = []
+    for block in _JSON_BLOCK.findall(content):
+        try:
+            blocks.append(json.loads(block))
+        except json.JSONDecodeError:
+            continue
+    return StepData(frontmatter, tuple(blocks))
+
+
+def sidecar_path(step_file: Path) -> Path:
+    """``<step>.json`` next to ``<step>.md``."""
+    return step_file.with_suffix(".json")
+
+
+# path -> ((mtime_ns, size), parsed data)
+_cache: dict[str, tuple[tuple[int, int], StepData]] = {}
+
+
+def read_step(step_file: str | Path) -> StepData | None:
+    """The parsed step file, or None if it cannot be read.
+
+    Cached by (path, mtime, size) for the life of the process; a file
+    modified within the last couple of seconds is not cached yet.
+    """
+    path = Path(step_file)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(str(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    data = _load_sidecar(path, st)
+    if data is None:
+        try:
+            data = parse_step_markdown(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            return None
+    # A parse of a file modified within the racy window is not cached.
+    # Sidecars need no such margin: only update_step_file writes them,
+    # right after the markdown, and the next write replaces both.
+    if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+        _cache[str(path)] = (key, data)
+    return data
+
+
+def _load_sidecar(step_file: Path, st: os.stat_result) -> StepData | None:
+    try:
+        payload = json.loads(sidecar_path(step_file).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != SIDECAR_VERSION
+        or payload.get("md_mtime_ns") != st.st_mtime_ns
+        or payload.get("md_size") != st.st_size
+    ):
+        return None
+    return StepData(dict(payload.get("frontmatter") or {}), tuple(payload.get("blocks") or ()))
+
+
+def write_step_sidecar(step_file: Path, content: str) -> None:
+    """Write ``<step>.json`` for the step file just written with ``content``."""
+    data = parse_step_markdown(content)
+    try:
+        st = step_file.stat()
+        payload = {
+            "version": SIDECAR_VERSION,
+            "md_mtime_ns": st.st_mtime_ns,
+            "md_size": st.st_size,
+            "frontmatter": data.frontmatter,
+            "blocks": list(data.blocks),
+        }
+        write_cache_file(sidecar_path(step_file), json.dumps(payload, default=str))
+    except OSError as e:
+        logger.warning("step_sidecar_not_written", path=str(step_file), error=str(e))
+
+
+def step_status(step_file: str | Path) -> str:
+    """Status of a step file, or ``"unknown"`` if it cannot be read."""
+    data = read_step(step_file)
+    return data.status if data else "unknown"
+
+
+def step_field(step_file: str | Path, name: str, default: Any = None) -> Any:
+    """A field of a step file's JSON data, or ``default``."""
+    data = read_step(step_file)
+    return data.field(name, default) if data else default
+
+
+# --- Typed accessors ---------------------------------------------------------
+
+
+def coverage_gaps(session_dir: str | Path) -> list[str]:
+    """Source files listed as coverage gaps by the ``gaps`` step."""
+    gaps = step_field(Path(session_dir) / "coverage-gaps.md", "gaps")
+    return list(gaps) if isinstance(gaps, list) else []
+
+
+def generated_tests(session_dir: str | Path) -> list[dict[str, Any]]:
+    """Tests written by the ``generate`` step (``path``, ``source_file``, ...)."""
+    generated = step_field(Path(session_dir) / "generation.md", "generated")
+    return [g for g in generated if isinstance(g, dict)] if isinstance(generated, list) else []
+
+
+def session_build_commands(session_dir: str | Path) -> tuple[str | None, str | None]:
+    """Session overrides of the build commands: (compile command, test command)."""
+    data = read_step(Path(session_dir) / "analysis.md")
+    if data is None:
+        return None, None
+    return data.field("maven_compile_cmd") or None, data.field("maven_test_cmd") or None
+
+
+def session_conventions(session_dir: str | Path) -> dict[str, Any] | None:
+    """Test conventions stored in the session's ``analysis.md``, if any."""
+    conventions = step_field(Path(session_dir) / "analysis.md", "conventions")
+    return conventions if isinstance(conventions, dict) and conventions else None
+
+
+def surviving_mutants(session_dir: str | Path) -> list[dict[str, Any]] | None:
+    """Mutants the ``mutate`` step left alive; None if ``mutation.md`` has no such data."""
+    mutants = step_field(Path(session_dir) / "mutation.md", "surviving_mutants")
+    return mutants if isinstance(mutants, list) else None
+
+
+__all__ = [
+    "StepData",
+    "coverage_gaps",
+    "generated_tests",
+    "parse_step_markdown",
+    "read_step",
+    "session_build_commands",
+    "session_conventions",
+    "sidecar_path",
+    "step_field",
+    "step_status",
+    "surviving_mutants",
+    "write_step_sidecar",
+]
@@ -0,0 +1,334 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Filesystem change notification for ``testboost watch``.
+
+Two backends report which files changed below a set of watched
+directories (project-relative, ``/`` separated):
+
+- :class:`InotifyWatcher` uses Linux inotify through ``ctypes``, so no
+  third-party package is needed. It keeps one watch per directory and
+  adds new directories as they appear.
+- :class:`PollingWatcher` is the portable fallback. It re-lists the
+  watched trees every ``interval`` seconds.
+
+``read()`` returns the changed paths, an empty set on timeout, or None
+when events were lost (inotify queue overflow) and the caller must
+rescan. :func:`collect_changes` debounces a burst of events (an IDE
+saving several files, a ``git checkout``) into one batch.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from typing import Protocol
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+WATCHED_SUFFIXES = (".java",)
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_ONLYDIR
+)
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class Watcher(Protocol):
+    """What the watch loop needs from a backend."""
+
+    backend: str
+
+    def read(self, timeout: float) -> set[str] | None: ...
+
+    def close(self) -> None: ...
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher over project-relative directories.
+
+    Args:
+        root: Project root.
+        dirs: Project-relative directories to watch, with their subtrees.
+
+    Raises:
+        OSError: If inotify is unavailable or the watch limit
+            (``fs.inotify.max_user_watches``) is reached.
+    """
+
+    backend = "inotify"
+
+    def __init__(self, root: str, dirs: Iterable[str]):
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.root = os.path.abspath(root)
+        self._libc = libc
+        self._fd = fd
+        self._paths: dict[int, str] = {}
+        try:
+            for rel in dirs:
+                self._watch_tree(rel)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, rel: str) -> bool:
+        path = os.fsencode(os.path.join(self.root, rel))
+        wd = self._libc.inotify_add_watch(self._fd, path, _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return False  # removed before we got to it
+            raise OSError(err, f"inotify_add_watch {rel}: {os.strerror(err)}")
+        self._paths[wd] = rel
+        return True
+
+    def _watch_tree(self, rel: str) -> None:
+        stack = [rel]
+        while stack:
+            current = stack.pop()
+            if not self._watch(current):
+                continue
+            try:
+                with os.scandir(os.path.join(self.root, current)) as it:
+                    stack.extend(
+                        f"{current}/{e.name}" for e in it
+                        if not e.name.startswith(".") and e.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+
+    def _unwatch_tree(self, rel: str) -> None:
+        # A directory moved out of the tree keeps its watches under the old path
+        prefix = rel + "/"
+        for wd, path in list(self._paths.items()):
+            if path == rel or path.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                self._paths.pop(wd, None)
+
+    def read(self, timeout: float) -> set[str] | None:
+        """Wait up to ``timeout`` seconds and return what changed."""
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        if not ready:
+            return set()
+        changed: set[str] = set()
+        lost = False
+        while True:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    lost = True
+                    continue
+                if mask & _IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                parent = self._paths.get(wd)
+                if parent is None:
+                    continue
+                if not name:
+                    if mask & _IN_DELETE_SELF:
+                        changed.add(parent)
+                    continue
+                rel = f"{parent}/{name}"
+                if mask & _IN_ISDIR:
+                    if name.startswith("."):
+                        continue
+                    # The index update walks the whole subtree of ``rel``,
+                    # which covers files created before its watch existed
+                    changed.add(rel)
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        self._watch_tree(rel)
+                    elif mask & _IN_MOVED_FROM:
+                        self._unwatch_tree(rel)
+                elif name.endswith(WATCHED_SUFFIXES):
+                    changed.add(rel)
+        return None if lost else changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Portable watcher that re-lists the watched trees periodically.
+
+    Args:
+        root: Project root.
+        dirs: Project-relative directories to watch, with their subtrees.
+        interval: Seconds between two listings.
+    """
+
+    backend = "polling"
+
+    def __init__(self, root: str, dirs: Iterable[str], interval: float = 1.0):
+        self.root = os.path.abspath(root)
+        self.dirs = list(dirs)
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        # Directories are recorded with a constant value: only their
+        # appearance or disappearance matters, not their mtime
+        snapshot: dict[str, tuple[int, int]] = {}
+        stack = list(self.dirs)
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(os.path.join(self.root, rel_dir)) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            snapshot[rel_dir] = (-1, 0)
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(rel)
+                    elif entry.name.endswith(WATCHED_SUFFIXES):
+                        st = entry.stat()
+                        snapshot[rel] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+        return snapshot
+
+    def read(self, timeout: float) -> set[str] | None:
+        """Wait up to ``timeout`` seconds and return what changed."""
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while True:
+            now = time.monotonic()
+            if self._next_scan > deadline:
+                time.sleep(max(deadline - now, 0.0))
+                return set()
+            time.sleep(max(self._next_scan - now, 0.0))
+            self._next_scan = time.monotonic() + self.interval
+            snapshot = self._scan()
+            previous, self._snapshot = self._snapshot, snapshot
+            changed = {
+                p for p in snapshot.keys() | previous.keys()
+                if snapshot.get(p) != previous.get(p)
+            }
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(
+    root: str, dirs: Iterable[str], polling: bool = False, interval: float = 1.0,
+) -> Watcher:
+    """Return an inotify watcher, or a polling one if inotify is unusable.
+
+    Args:
+        root: Project root.
+        dirs: Project-relative directories to watch, with their subtrees.
+        polling: Skip inotify (network filesystems, containers with a low
+            watch limit).
+        interval: Polling interval in seconds.
+    """
+    dirs = list(dirs)
+    if not polling:
+        try:
+            return InotifyWatcher(root, dirs)
+        except OSError as e:
+            logger.info("inotify_unavailable", error=str(e))
+    return PollingWatcher(root, dirs, interval=interval)
+
+
+def collect_changes(
+    watcher: Watcher, timeout: float, debounce: float = 0.3, max_delay: float = 5.0,
+) -> set[str] | None:
+    """Wait for a change, then gather events until ``debounce`` seconds of quiet.
+
+    Args:
+        watcher: Backend to read from.
+        timeout: Seconds to wait for the first event.
+        debounce: Quiet period that ends a batch.
+        max_delay: Upper bound on a batch's duration under a constant
+            stream of events.
+
+    Returns:
+        The changed paths (empty if nothing happened within ``timeout``),
+        or None if events were lost.
+    """
+    first = watcher.read(timeout)
+    if first is not None and not first:
+        return set()
+    lost = first is None
+    changed = set(first or ())
+    started = time.monotonic()
+    while time.monotonic() - started < max_delay:
+        more = watcher.read(debounce)
+        if more is None:
+            lost = True
+        elif not more:
+            break
+        else:
+            changed |= more
+    return None if lost else changed
+
+
+__all__ = [
+    "InotifyWatcher",
+    "PollingWatcher",
+    "Watcher",
+    "collect_changes",
+    "open_watcher",
+]
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Default size of TestBoost's worker pools.
+
+The class index parses files in a process pool and ``validate`` runs
+per-file commands in a thread pool. Both default to one worker per CPU,
+capped so a large CI runner does not start dozens of JVMs or parsers.
+"""
+
+import os
+
+MAX_DEFAULT_WORKERS = 8
+
+
+def default_worker_count() -> int:
+    """CPU count, between 1 and ``MAX_DEFAULT_WORKERS``."""
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS))
+
+
+__all__ = ["MAX_DEFAULT_WORKERS", "default_worker_count"]
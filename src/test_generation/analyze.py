@@ -5,12 +5,24 @@ Analyzes Java project structure, frameworks, dependencies, and testing patterns
 to provide context for intelligent test generation.
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import re
+import time
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+from src.lib.cache_files import RACY_WINDOW_NS, write_cache_file
+from src.lib.logging import get_logger
+from src.lib.project_index import ProjectIndex, get_project_index
+
+logger = get_logger(__name__)
+
+_PACKAGE_PATTERN = re.compile(r"package\s+([\w.]+);")
+
 
 async def analyze_project_context(
     project_path: str, include_dependencies: bool = True, scan_depth: int = 10
@@ -58,26 +70,29 @@ async def analyze_project_context(
         results["project_type"] = detected_plugin.identifier
 
     # Detect build system (Java-specific detailed analysis when applicable)
+    from src.java.gradle import is_gradle_project
+
     pom_file = project_dir / "pom.xml"
-    gradle_file = project_dir / "build.gradle"
-    gradle_kts = project_dir / "build.gradle.kts"
 
     if pom_file.exists():
         results["build_system"] = "maven"
         await _analyze_maven_project(pom_file, results, include_dependencies)
-    elif gradle_file.exists() or gradle_kts.exists():
+    elif is_gradle_project(project_dir):
         results["build_system"] = "gradle"
-        await _analyze_gradle_project(project_dir, results)
+        await _analyze_gradle_project(project_dir, results, include_dependencies)
 
-    # Analyze source structure
-    results["source_structure"] = await _analyze_source_structure(project_dir, scan_depth)
+    # One pruned walk of the tree serves every module below
+    index = get_project_index(project_dir)
 
-    # Analyze test structure
-    results["test_structure"] = await _analyze_test_structure(project_dir, scan_depth)
-
-    # Detect frameworks from imports
-    frameworks.extend(await _detect_frameworks(project_dir))
-    test_frameworks.extend(await _detect_test_frameworks(project_dir))
+    # Modules are analyzed concurrently; unchanged ones come from the cache
+    modules = await _analyze_modules(project_dir, index, include_dependencies)
+    results["modules"] = modules
+    results["source_structure"] = _merge_source_structure(index, modules)
+    results["test_structure"] = _merge_test_structure(index, modules)
+    frameworks.extend(sorted({f for m in modules for f in m["frameworks"]}))
+    test_frameworks.extend(sorted({f for m in modules for f in m["test_frameworks"]}))
+    if include_dependencies:
+        _merge_dependencies(results["dependencies"], modules)
 
     # Determine project type (only refine for Java plugins; non-Java keeps plugin identifier)
     if not detected_plugin or detected_plugin.identifier == "java-spring":
@@ -163,222 +178,350 @@ async def _analyze_maven_project(
         results["pom_parse_error"] = str(e)
 
 
-async def _analyze_gradle_project(project_dir: Path, results: dict[str, Any]) -> None:
-    """Analyze Gradle project structure."""
-    gradle_file = project_dir / "build.gradle"
-    if not gradle_file.exists():
-        gradle_file = project_dir / "build.gradle.kts"
-
-    if gradle_file.exists():
-        content = gradle_file.read_text(encoding="utf-8", errors="replace")
-
-        # Extract Java version
-        java_version_match = re.search(r"sourceCompatibility\s*=\s*['\"]?(\d+)['\"]?", content)
-        if java_version_match:
-            results["java_version"] = java_version_match.group(1)
-
-
-async def _analyze_source_structure(project_dir: Path, scan_depth: int) -> dict[str, Any]:
-    """Analyze source code structure."""
-    structure = {"main_sources": [], "packages": [], "class_count": 0, "interface_count": 0}
-
-    # Find main source directories - support multi-module Maven projects
-    src_dirs: list[Path] = []
-    java_files: list[Path] = []
-
-    # Check for standard single-module structure first
-    standard_src = project_dir / "src" / "main" / "java"
-    if standard_src.exists():
-        src_dirs.append(standard_src)
-
-    # Check for multi-module Maven structure (submodules with pom.xml and src/main/java)
-    for subdir in project_dir.iterdir():
-        if subdir.is_dir() and (subdir / "pom.xml").exists():
-            module_src = subdir / "src" / "main" / "java"
-            if module_src.exists():
-                src_dirs.append(module_src)
-
-    # Fallback to generic src directory
-    if not src_dirs:
-        generic_src = project_dir / "src"
-        if generic_src.exists():
-            src_dirs.append(generic_src)
-
-    # Collect all Java files from all source directories
-    for src_dir in src_dirs:
-        java_files.extend(src_dir.rglob("*.java"))
-
-    structure["class_count"] = len(java_files)
-
-    # Extract packages
-    packages = set()
-    for java_file in java_files[:200]:  # Limit for performance
+async def _analyze_gradle_project(
+    project_dir: Path, results: dict[str, Any], include_dependencies: bool
+) -> None:
+    """Analyze Gradle project structure and dependencies (all included projects)."""
+    from src.java.gradle import read_gradle_build
+
+    build = read_gradle_build(project_dir)
+    results["module_info"] = build["module_info"]
+    if build["java_version"]:
+        results["java_version"] = build["java_version"]
+    if build["subprojects"]:
+        results["subprojects"] = build["subprojects"]
+    if include_dependencies:
+        results["dependencies"] = build["dependencies"]
+
+
+# ---------------------------------------------------------------------------
+# Per-module analysis
+# ---------------------------------------------------------------------------
+
+MODULE_CACHE = "module_analysis_cache.json"
+_MODULE_CACHE_VERSION = 1
+
+_FRAMEWORK_MARKERS = (
+    ("spring", ("org.springframework",)),
+    ("jpa", ("javax.persistence", "jakarta.persistence")),
+    ("quarkus", ("io.quarkus",)),
+    ("micronaut", ("io.micronaut",)),
+    ("jax-rs", ("javax.ws.rs", "jakarta.ws.rs")),
+    ("hibernate", ("org.hibernate",)),
+)
+_TEST_FRAMEWORK_MARKERS = (
+    ("mockito", ("org.mockito",)),
+    ("assertj", ("org.assertj",)),
+    ("hamcrest", ("org.hamcrest",)),
+    ("testcontainers", ("org.testcontainers",)),
+    ("spring-boot-test", ("@SpringBootTest",)),
+    ("spring-test-slices", ("@WebMvcTest", "@DataJpaTest")),
+    ("rest-assured", ("io.rest-assured", "RestAssured")),
+    ("wiremock", ("org.wiremock", "WireMock")),
+)
+
+
+async def _analyze_modules(
+    project_dir: Path, index: ProjectIndex, include_dependencies: bool
+) -> list[dict[str, Any]]:
+    """Analyze every build module concurrently, reusing cached unchanged ones.
+
+    A module owns the files below its directory that no nested module
+    claims. Its cache entry is keyed by the (path, size, mtime) of those
+    files, so editing one module only re-analyzes that module.
+    """
+    from src.java.modules import discover_modules, module_for_path
+
+    modules = discover_modules(project_dir, index)
+    paths = [m["path"] for m in modules]
+    owned: dict[str, list[str]] = {path: [] for path in paths}
+    for rel in index.paths():
+        owned[module_for_path(paths, rel)].append(rel)
+
+    source_roots = index.source_roots()
+    test_roots = index.test_roots()
+    # No Maven-style root at all: generic src/ and test/ trees (root module)
+    fallback = not source_roots and not test_roots
+
+    cache, written_at_ns = _load_module_cache(project_dir)
+    results = await asyncio.gather(*(
+        asyncio.to_thread(
+            _analyze_module_cached, project_dir, module, owned[module["path"]],
+            [r for r in source_roots if module_for_path(paths, r) == module["path"]],
+            [r for r in test_roots if module_for_path(paths, r) == module["path"]],
+            fallback and not module["path"], include_dependencies,
+            cache.get(module["path"]), written_at_ns,
+        )
+        for module in modules
+    ))
+
+    _save_module_cache(project_dir, {
+        module["path"]: {"fingerprint": fingerprint, "result": result}
+        for module, (result, fingerprint) in zip(modules, results, strict=True)
+    })
+    analyzed = [result for result, _ in results]
+    logger.info(
+        "modules_analyzed",
+        modules=len(analyzed),
+        reused=sum(1 for m in analyzed if m["cached"]),
+    )
+    return analyzed
+
+
+def _module_fingerprint(
+    project_dir: Path, files: list[str], include_dependencies: bool
+) -> tuple[str, int]:
+    """(hash of every owned file's path/size/mtime, newest mtime)."""
+    digest = hashlib.sha1(f"{_MODULE_CACHE_VERSION}:{include_dependencies}".encode())
+    newest = 0
+    for rel in files:
+        # Fresh stats: the filesystem index misses files edited in place
         try:
-            content = java_file.read_text(encoding="utf-8", errors="replace")
-            package_match = re.search(r"package\s+([\w.]+);", content)
-            if package_match:
-                packages.add(package_match.group(1))
+            st = os.stat(project_dir / rel)
         except OSError:
-            # Skip unreadable files (permissions, encoding issues)
             continue
-
-    structure["packages"] = sorted(packages)[:50]
-    structure["main_sources"] = [str(d) for d in src_dirs]
-
-    return structure
-
-
-async def _analyze_test_structure(project_dir: Path, scan_depth: int) -> dict[str, Any]:
-    """Analyze test code structure."""
-    structure = {"test_sources": [], "test_count": 0, "test_packages": []}
-
-    # Find test directories - support multi-module Maven projects
-    test_dirs = []
-
-    # Check for standard single-module structure
-    standard_test = project_dir / "src" / "test" / "java"
-    if standard_test.exists():
-        test_dirs.append(standard_test)
-
-    # Check for multi-module Maven structure
-    for subdir in project_dir.iterdir():
-        if subdir.is_dir() and (subdir / "pom.xml").exists():
-            module_test = subdir / "src" / "test" / "java"
-            if module_test.exists():
-                test_dirs.append(module_test)
-
-    # Fallback to generic test directory
-    if not test_dirs:
-        generic_test = project_dir / "test"
-        if generic_test.exists():
-            test_dirs.append(generic_test)
-
-    # Collect all test files from all test directories
-    test_files: list[Path] = []
-    for test_dir in test_dirs:
-        test_files.extend(test_dir.rglob("*Test.java"))
-        test_files.extend(test_dir.rglob("*Tests.java"))
-        test_files.extend(test_dir.rglob("Test*.java"))
-
-    test_files = list(set(test_files))  # Remove duplicates
-    structure["test_count"] = len(test_files)
-
-    # Extract test packages
-    packages = set()
-    for test_file in test_files[:100]:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-            package_match = re.search(r"package\s+([\w.]+);", content)
-            if package_match:
-                packages.add(package_match.group(1))
-        except OSError:
-            # Skip unreadable files
+        newest = max(newest, st.st_mtime_ns)
+        digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest(), newest
+
+
+def _analyze_module_cached(
+    project_dir: Path,
+    module: dict[str, str],
+    files: list[str],
+    source_roots: list[str],
+    test_roots: list[str],
+    fallback: bool,
+    include_dependencies: bool,
+    cached: dict[str, Any] | None,
+    written_at_ns: int,
+) -> tuple[dict[str, Any], str]:
+    """Return (module result, fingerprint), from the cache when still valid."""
+    fingerprint, newest = _module_fingerprint(project_dir, files, include_dependencies)
+    if (
+        cached
+        and cached.get("fingerprint") == fingerprint
+        and newest < written_at_ns - RACY_WINDOW_NS
+    ):
+        return {**cached["result"], "cached": True}, fingerprint
+
+    result = _analyze_module(
+        project_dir, module, files, source_roots, test_roots, fallback, include_dependencies,
+    )
+    return {**result, "cached": False}, fingerprint
+
+
+def _analyze_module(
+    project_dir: Path,
+    module: dict[str, str],
+    files: list[str],
+    source_roots: list[str],
+    test_roots: list[str],
+    fallback: bool,
+    include_dependencies: bool,
+) -> dict[str, Any]:
+    """Structure, frameworks, conventions and dependencies of one module.
+
+    Every source and test file is read for packages and frameworks; the
+    conventions use a stratified sample of the module's tests, as the
+    project-wide detection does.
+    """
+    from src.test_generation.conventions import (
+        DEFAULT_SAMPLE_SIZE,
+        analyze_test_files,
+        stratified_sample,
+    )
+
+    if fallback:
+        source_roots = ["src"] if any(f.startswith("src/") and f.endswith(".java") for f in files) else []
+        test_roots = ["test"] if any(f.startswith("test/") for f in files) else []
+
+    def under(roots: list[str]) -> list[str]:
+        prefixes = tuple(r + "/" for r in roots)
+        return [f for f in files if f.startswith(prefixes)]
+
+    java_sources = [f for f in under(source_roots) if f.endswith(".java")]
+    java_tests = [f for f in under(test_roots) if _is_java_test_name(f.rsplit("/", 1)[-1])]
+
+    packages: set[str] = set()
+    frameworks: set[str] = set()
+    for rel in java_sources:
+        content = _read(project_dir / rel)
+        if content is None:
             continue
+        package_match = _PACKAGE_PATTERN.search(content)
+        if package_match:
+            packages.add(package_match.group(1))
+        frameworks.update(_markers(content, _FRAMEWORK_MARKERS))
+        if "org.springframework" in content and "@SpringBootApplication" in content:
+            frameworks.add("spring-boot")
+
+    test_packages: set[str] = set()
+    test_frameworks: set[str] = set()
+    for rel in java_tests:
+        content = _read(project_dir / rel)
+        if content is None:
+            continue
+        package_match = _PACKAGE_PATTERN.search(content)
+        if package_match:
+            test_packages.add(package_match.group(1))
+        if "org.junit.jupiter" in content:
+            test_frameworks.add("junit5")
+        elif "org.junit" in content:
+            test_frameworks.add("junit4")
+        test_frameworks.update(_markers(content, _TEST_FRAMEWORK_MARKERS))
+
+    conventions = None
+    if java_tests:
+        sample = stratified_sample(java_tests, DEFAULT_SAMPLE_SIZE)
+        conventions = {
+            "success": True,
+            "sample_size": len(sample),
+            **analyze_test_files([project_dir / rel for rel in sample]),
+        }
 
-    structure["test_packages"] = sorted(packages)[:30]
-    structure["test_sources"] = [str(d) for d in test_dirs]
-
-    return structure
+    return {
+        **module,
+        "source_roots": source_roots,
+        "test_roots": test_roots,
+        "class_count": len(java_sources),
+        "packages": sorted(packages),
+        "test_count": len(java_tests),
+        "test_packages": sorted(test_packages),
+        "frameworks": sorted(frameworks),
+        "test_frameworks": sorted(test_frameworks),
+        "conventions": conventions,
+        "dependencies": (
+            _module_dependencies(project_dir, module) if include_dependencies else []
+        ),
+    }
 
 
-async def _detect_frameworks(project_dir: Path) -> list[str]:
-    """Detect application frameworks from code and dependencies."""
-    frameworks = set()
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        # Skip unreadable files (permissions, encoding issues)
+        return None
 
-    # Collect source directories - support multi-module
-    src_dirs = []
-    standard_src = project_dir / "src" / "main" / "java"
-    if standard_src.exists():
-        src_dirs.append(standard_src)
 
-    for subdir in project_dir.iterdir():
-        if subdir.is_dir() and (subdir / "pom.xml").exists():
-            module_src = subdir / "src" / "main" / "java"
-            if module_src.exists():
-                src_dirs.append(module_src)
+def _markers(content: str, markers: tuple[tuple[str, tuple[str, ...]], ...]) -> set[str]:
+    return {name for name, needles in markers if any(n in content for n in needles)}
 
-    # Check imports in source files from all directories
-    java_files = []
-    for src_dir in src_dirs:
-        java_files.extend(list(src_dir.rglob("*.java"))[:30])
 
-    for java_file in java_files[:100]:
-        try:
-            content = java_file.read_text(encoding="utf-8", errors="replace")
-
-            if "org.springframework" in content:
-                frameworks.add("spring")
-                if "@SpringBootApplication" in content:
-                    frameworks.add("spring-boot")
-            if "javax.persistence" in content or "jakarta.persistence" in content:
-                frameworks.add("jpa")
-            if "io.quarkus" in content:
-                frameworks.add("quarkus")
-            if "io.micronaut" in content:
-                frameworks.add("micronaut")
-            if "javax.ws.rs" in content or "jakarta.ws.rs" in content:
-                frameworks.add("jax-rs")
-            if "org.hibernate" in content:
-                frameworks.add("hibernate")
+def _module_dependencies(project_dir: Path, module: dict[str, str]) -> list[dict[str, str]]:
+    """Dependencies declared by the module's own build file."""
+    build_file = module.get("build_file")
+    if not build_file or not module["path"]:
+        # The root build file is analyzed by _analyze_maven/gradle_project
+        return []
+    path = project_dir / build_file
+    if path.name == "pom.xml":
+        return _pom_dependencies(path)
+    from src.java.gradle import parse_gradle_build, read_version_catalog
 
-        except OSError:
-            # Skip unreadable files
-            continue
+    content = _read(path)
+    if content is None:
+        return []
+    return parse_gradle_build(content, read_version_catalog(project_dir))["dependencies"]
 
-    return sorted(frameworks)
 
+def _pom_dependencies(pom_file: Path) -> list[dict[str, str]]:
+    """``<dependencies>`` of one pom (dependencyManagement excluded)."""
+    from src.java.modules import local_name
 
-async def _detect_test_frameworks(project_dir: Path) -> list[str]:
-    """Detect test frameworks from test code."""
-    test_frameworks = set()
+    try:
+        root = ET.parse(pom_file).getroot()
+    except (OSError, ET.ParseError):
+        return []
+    dependencies = []
+    for section in root:
+        if local_name(section.tag) != "dependencies":
+            continue
+        for dep in section:
+            fields = {local_name(child.tag): (child.text or "").strip() for child in dep}
+            if fields.get("groupId") and fields.get("artifactId"):
+                dependencies.append({
+                    "groupId": fields["groupId"],
+                    "artifactId": fields["artifactId"],
+                    "version": fields.get("version") or "managed",
+                    "scope": fields.get("scope") or "compile",
+                })
+    return dependencies
+
+
+def _merge_dependencies(
+    dependencies: list[dict[str, Any]], modules: list[dict[str, Any]]
+) -> None:
+    """Append module dependencies not already listed (by group, artifact, scope)."""
+    seen = {(d.get("groupId"), d.get("artifactId"), d.get("scope")) for d in dependencies}
+    for module in modules:
+        for dep in module["dependencies"]:
+            key = (dep["groupId"], dep["artifactId"], dep["scope"])
+            if key not in seen:
+                seen.add(key)
+                dependencies.append(dep)
+
+
+def _merge_source_structure(index: ProjectIndex, modules: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "main_sources": [str(index.abspath(r)) for m in modules for r in m["source_roots"]],
+        "packages": sorted({p for m in modules for p in m["packages"]}),
+        "class_count": sum(m["class_count"] for m in modules),
+        "interface_count": 0,
+    }
 
-    # Collect test directories - support multi-module
-    test_dirs = []
-    standard_test = project_dir / "src" / "test" / "java"
-    if standard_test.exists():
-        test_dirs.append(standard_test)
 
-    for subdir in project_dir.iterdir():
-        if subdir.is_dir() and (subdir / "pom.xml").exists():
-            module_test = subdir / "src" / "test" / "java"
-            if module_test.exists():
-                test_dirs.append(module_test)
+def _merge_test_structure(index: ProjectIndex, modules: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "test_sources": [str(index.abspath(r)) for m in modules for r in m["test_roots"]],
+        "test_count": sum(m["test_count"] for m in modules),
+        "test_packages": sorted({p for m in modules for p in m["test_packages"]}),
+    }
 
-    # Check imports in test files from all directories
-    test_files = []
-    for test_dir in test_dirs:
-        test_files.extend(list(test_dir.rglob("*.java"))[:30])
 
-    for test_file in test_files[:100]:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            if "org.junit.jupiter" in content:
-                test_frameworks.add("junit5")
-            elif "org.junit" in content:
-                test_frameworks.add("junit4")
-            if "org.mockito" in content:
-                test_frameworks.add("mockito")
-            if "org.assertj" in content:
-                test_frameworks.add("assertj")
-            if "org.hamcrest" in content:
-                test_frameworks.add("hamcrest")
-            if "org.testcontainers" in content:
-                test_frameworks.add("testcontainers")
-            if "@SpringBootTest" in content:
-                test_frameworks.add("spring-boot-test")
-            if "@WebMvcTest" in content or "@DataJpaTest" in content:
-                test_frameworks.add("spring-test-slices")
-            if "io.rest-assured" in content or "RestAssured" in content:
-                test_frameworks.add("rest-assured")
-            if "org.wiremock" in content or "WireMock" in content:
-                test_frameworks.add("wiremock")
+def _is_java_test_name(name: str) -> bool:
+    return name.endswith(("Test.java", "Tests.java")) or (
+        name.startswith("Test") and name.endswith(".java")
+    )
 
-        except OSError:
-            # Skip unreadable files
-            continue
 
-    return sorted(test_frameworks)
+def _load_module_cache(project_dir: Path) -> tuple[dict[str, dict[str, Any]], int]:
+    """Return (per-module cache, time the cache was written in ns)."""
+    path = project_dir / ".testboost" / MODULE_CACHE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, 0
+    if not isinstance(data, dict) or data.get("version") != _MODULE_CACHE_VERSION:
+        return {}, 0
+    modules = data.get("modules")
+    if not isinstance(modules, dict):
+        return {}, 0
+    return modules, int(data.get("written_at_ns", 0))
+
+
+def _save_module_cache(project_dir: Path, modules: dict[str, dict[str, Any]]) -> None:
+    tb_dir = project_dir / ".testboost"
+    if not tb_dir.is_dir():
+        return
+    entries = {
+        key: {**entry, "result": {k: v for k, v in entry["result"].items() if k != "cached"}}
+        for key, entry in modules.items()
+    }
+    try:
+        write_cache_file(
+            tb_dir / MODULE_CACHE,
+            json.dumps(
+                {"version": _MODULE_CACHE_VERSION, "written_at_ns": time.time_ns(),
+                 "modules": entries},
+                separators=(",", ":"),
+            ),
+            tb_dir=tb_dir,
+            comment="TestBoost local module analysis cache",
+        )
+    except OSError as e:
+        logger.warning("module_cache_write_failed", error=str(e))
 
 
 def _determine_project_type(frameworks: list[str]) -> str:
@@ -3,22 +3,34 @@ Detect test conventions tool for test generation.
 
 Analyzes existing tests to detect naming conventions, assertion styles,
 mock patterns, and other testing conventions used in the project.
+
+Each sampled file is read once and handed to every analyzer (a visitor
+with ``visit(content)`` and ``result()``), so the sample can cover
+hundreds of files spread across modules and packages.
 """
 
+import asyncio
 import json
 import re
+from abc import ABC, abstractmethod
 from collections import Counter
+from itertools import zip_longest
 from pathlib import Path
 from typing import Any
 
+DEFAULT_SAMPLE_SIZE = 200
+
 
-async def detect_test_conventions(project_path: str, sample_size: int = 20) -> str:
+async def detect_test_conventions(
+    project_path: str, sample_size: int = DEFAULT_SAMPLE_SIZE
+) -> str:
     """
     Detect test conventions used in the project.
 
     Args:
         project_path: Path to the Java project root directory
-        sample_size: Number of test files to sample for analysis
+        sample_size: Number of test files to sample for analysis, spread
+            evenly over modules and packages
 
     Returns:
         JSON string with detected conventions
@@ -35,319 +47,352 @@ async def detect_test_conventions(project_path: str, sample_size: int = 20) -> s
     detected_plugin = get_registry().detect(project_dir)
     patterns = detected_plugin.test_file_pattern() if detected_plugin else ["**/*Test.java", "**/*Tests.java", "**/Test*.java"]
 
-    test_files: list[Path] = []
-    for pattern in patterns:
-        # Strip leading **/ prefix if present — rglob already searches recursively
-        glob_pattern = pattern.removeprefix("**/")
-        test_files.extend(project_dir.rglob(glob_pattern))
-    test_files = list(set(test_files))[:sample_size]
+    from src.lib.project_index import get_project_index
+    index = get_project_index(project_dir)
+    sample = stratified_sample(index.match(patterns), sample_size)
+    test_files: list[Path] = [index.abspath(p) for p in sample]
 
     if not test_files:
         return json.dumps({"success": False, "error": "No test files found"})
 
+    # File reads are blocking: keep them off the event loop
+    results = await asyncio.to_thread(analyze_test_files, test_files)
+
     conventions = {
         "success": True,
         "sample_size": len(test_files),
-        "naming": await _analyze_naming_conventions(test_files),
-        "assertions": await _analyze_assertion_styles(test_files),
-        "mocking": await _analyze_mock_patterns(test_files),
-        "setup": await _analyze_setup_patterns(test_files),
-        "organization": await _analyze_test_organization(test_files),
-        "annotations": await _analyze_annotation_usage(test_files),
-        "documentation": await _analyze_documentation_patterns(test_files),
+        **results,
     }
 
     return json.dumps(conventions, indent=2)
 
 
-async def _analyze_naming_conventions(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze test method naming conventions."""
-    naming_patterns = {
-        "should_when": 0,
-        "given_when_then": 0,
-        "test_description": 0,
-        "method_state_result": 0,
-        "camelCase": 0,
-        "snake_case": 0,
-    }
+def _round_robin(groups: list[list[str]]) -> list[str]:
+    """Interleave groups: first of each, then second of each, and so on."""
+    return [item for batch in zip_longest(*groups) for item in batch if item is not None]
 
-    method_names = []
 
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            # Find test method names
-            test_methods = re.findall(r"@Test\s+(?:public\s+)?void\s+(\w+)", content)
-            method_names.extend(test_methods)
-
-            for method in test_methods:
-                if "should" in method.lower() and "when" in method.lower():
-                    naming_patterns["should_when"] += 1
-                elif "given" in method.lower() and "then" in method.lower():
-                    naming_patterns["given_when_then"] += 1
-                elif method.startswith("test"):
-                    naming_patterns["test_description"] += 1
-
-                # Check case style
-                if "_" in method:
-                    naming_patterns["snake_case"] += 1
-                else:
-                    naming_patterns["camelCase"] += 1
-
-        except Exception:
-            pass
-
-    # Determine dominant pattern
-    total = sum(naming_patterns.values())
-    dominant_pattern = max(naming_patterns, key=lambda k: naming_patterns[k]) if total > 0 else "unknown"
-
-    return {
-        "dominant_pattern": dominant_pattern,
-        "patterns": naming_patterns,
-        "sample_methods": method_names[:10],
-        "uses_snake_case": naming_patterns["snake_case"] > naming_patterns["camelCase"],
-    }
+def stratified_sample(paths: list[str], size: int) -> list[str]:
+    """Pick up to ``size`` paths spread evenly over modules, then packages.
 
-
-async def _analyze_assertion_styles(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze assertion library and style preferences."""
-    assertion_styles = {"junit_assertions": 0, "assertj": 0, "hamcrest": 0, "truth": 0}
-
-    assertion_examples = []
-
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            if "assertThat(" in content and "org.assertj" in content:
-                assertion_styles["assertj"] += content.count("assertThat(")
-            if "assertThat(" in content and "org.hamcrest" in content:
-                assertion_styles["hamcrest"] += content.count("assertThat(")
-            if "assertEquals(" in content or "assertTrue(" in content:
-                assertion_styles["junit_assertions"] += (
-                    content.count("assertEquals(")
-                    + content.count("assertTrue(")
-                    + content.count("assertFalse(")
-                    + content.count("assertNotNull(")
-                )
-            if "com.google.common.truth" in content:
-                assertion_styles["truth"] += content.count("assertThat(")
-
-            # Extract sample assertions
-            assertions = re.findall(r"(assert\w+\([^;]+\);)", content)
-            assertion_examples.extend(assertions[:3])
-
-        except Exception:
-            pass
-
-    dominant_style = (
-        max(assertion_styles, key=lambda k: assertion_styles[k])
-        if sum(assertion_styles.values()) > 0
-        else "junit_assertions"
-    )
-
-    return {
-        "dominant_style": dominant_style,
-        "styles": assertion_styles,
-        "examples": assertion_examples[:5],
-    }
-
-
-async def _analyze_mock_patterns(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze mocking patterns and frameworks."""
-    mock_patterns = {
-        "mockito_annotations": 0,
-        "mockito_inline": 0,
-        "mock_bean": 0,
-        "spy": 0,
-        "argument_captor": 0,
-        "verify": 0,
-    }
-
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            if "@Mock" in content or "@InjectMocks" in content:
-                mock_patterns["mockito_annotations"] += 1
-            if "Mockito.mock(" in content or "mock(" in content:
-                mock_patterns["mockito_inline"] += 1
-            if "@MockBean" in content:
-                mock_patterns["mock_bean"] += 1
-            if "@Spy" in content or "Mockito.spy(" in content:
-                mock_patterns["spy"] += 1
-            if "ArgumentCaptor" in content:
-                mock_patterns["argument_captor"] += 1
-            if "verify(" in content:
-                mock_patterns["verify"] += 1
-
-        except Exception:
-            pass
-
-    uses_mockito = mock_patterns["mockito_annotations"] > 0 or mock_patterns["mockito_inline"] > 0
-    uses_spring_mock = mock_patterns["mock_bean"] > 0
-
-    return {
-        "uses_mockito": uses_mockito,
-        "uses_spring_mock_bean": uses_spring_mock,
-        "patterns": mock_patterns,
-        "prefers_annotations": mock_patterns["mockito_annotations"]
-        > mock_patterns["mockito_inline"],
-    }
-
-
-async def _analyze_setup_patterns(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze test setup and teardown patterns."""
-    setup_patterns = {
-        "before_each": 0,
-        "before_all": 0,
-        "after_each": 0,
-        "after_all": 0,
-        "nested_classes": 0,
-        "parameterized": 0,
-    }
-
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            if "@BeforeEach" in content or "@Before" in content:
-                setup_patterns["before_each"] += 1
-            if "@BeforeAll" in content or "@BeforeClass" in content:
-                setup_patterns["before_all"] += 1
-            if "@AfterEach" in content or "@After" in content:
-                setup_patterns["after_each"] += 1
-            if "@AfterAll" in content or "@AfterClass" in content:
-                setup_patterns["after_all"] += 1
-            if "@Nested" in content:
-                setup_patterns["nested_classes"] += 1
-            if "@ParameterizedTest" in content:
-                setup_patterns["parameterized"] += 1
-
-        except Exception:
-            pass
-
-    return {
-        "patterns": setup_patterns,
-        "uses_setup": setup_patterns["before_each"] > 0,
-        "uses_nested": setup_patterns["nested_classes"] > 0,
-        "uses_parameterized": setup_patterns["parameterized"] > 0,
-    }
-
-
-async def _analyze_test_organization(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze how tests are organized."""
-    organization: dict[str, int | float] = {
-        "avg_tests_per_file": 0.0,
-        "uses_display_name": 0,
-        "uses_tags": 0,
-        "groups_by_method": 0,
-        "groups_by_scenario": 0,
-    }
-
-    total_tests = 0
-
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            # Count tests per file
-            test_count = content.count("@Test")
-            total_tests += test_count
-
-            if "@DisplayName" in content:
-                organization["uses_display_name"] += 1
-            if "@Tag" in content:
-                organization["uses_tags"] += 1
-
-        except Exception:
-            pass
-
-    if test_files:
-        organization["avg_tests_per_file"] = round(total_tests / len(test_files), 1)
-
-    return organization
-
-
-async def _analyze_annotation_usage(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze common test annotations used."""
-    annotations: Counter[str] = Counter()
-
-    for test_file in test_files:
-        try:
-            content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            # Find all annotations
-            found_annotations = re.findall(r"@(\w+)", content)
-            annotations.update(found_annotations)
-
-        except Exception:
-            pass
-
-    # Get most common test-related annotations
-    test_annotations = [
-        "Test",
-        "BeforeEach",
-        "AfterEach",
-        "BeforeAll",
-        "AfterAll",
-        "Mock",
-        "InjectMocks",
-        "MockBean",
-        "Spy",
-        "Captor",
-        "ParameterizedTest",
-        "ValueSource",
-        "CsvSource",
-        "MethodSource",
-        "DisplayName",
-        "Nested",
-        "Tag",
-        "Disabled",
-        "SpringBootTest",
-        "WebMvcTest",
-        "DataJpaTest",
-        "ExtendWith",
+    A module is whatever precedes ``src/`` in the path; a package is the
+    file's directory. Files are taken round-robin across modules and,
+    within a module, round-robin across packages, so a large package or
+    module cannot crowd the others out of the sample.
+    """
+    modules: dict[str, dict[str, list[str]]] = {}
+    for rel in sorted(paths):
+        directory = rel.rsplit("/", 1)[0] if "/" in rel else ""
+        module = directory.split("src/", 1)[0] if "src/" in directory else ""
+        modules.setdefault(module, {}).setdefault(directory, []).append(rel)
+    per_module = [
+        _round_robin([packages[d] for d in sorted(packages)])
+        for _, packages in sorted(modules.items())
     ]
+    return _round_robin(per_module)[:size]
 
-    relevant = {k: annotations[k] for k in test_annotations if k in annotations}
-
-    return {"common_annotations": dict(annotations.most_common(15)), "test_specific": relevant}
 
+def analyze_test_files(test_files: list[Path]) -> dict[str, Any]:
+    """Read each test file once and feed it to every analyzer.
 
-async def _analyze_documentation_patterns(test_files: list[Path]) -> dict[str, Any]:
-    """Analyze test documentation patterns."""
-    documentation: dict[str, int | float] = {
-        "has_javadoc": 0,
-        "has_comments": 0,
-        "uses_display_name": 0,
-        "avg_display_name_length": 0.0,
+    Returns the per-category conventions (``naming``, ``assertions``, ...)
+    of ``test_files``; the per-module analysis calls it on each module's
+    own sample.
+    """
+    analyzers: dict[str, _ConventionAnalyzer] = {
+        "naming": _NamingAnalyzer(),
+        "assertions": _AssertionAnalyzer(),
+        "mocking": _MockAnalyzer(),
+        "setup": _SetupAnalyzer(),
+        "organization": _OrganizationAnalyzer(),
+        "annotations": _AnnotationAnalyzer(),
+        "documentation": _DocumentationAnalyzer(),
     }
-
-    display_name_lengths: list[int] = []
-
     for test_file in test_files:
         try:
             content = test_file.read_text(encoding="utf-8", errors="replace")
-
-            if "/**" in content:
-                documentation["has_javadoc"] += 1
-            if "//" in content:
-                documentation["has_comments"] += 1
-
-            # Extract display names
-            display_names = re.findall(r'@DisplayName\s*\(\s*"([^"]+)"\s*\)', content)
-            if display_names:
-                documentation["uses_display_name"] += 1
-                display_name_lengths.extend(len(dn) for dn in display_names)
-
-        except Exception:
-            pass
-
-    if display_name_lengths:
-        documentation["avg_display_name_length"] = round(
-            sum(display_name_lengths) / len(display_name_lengths), 1
+        except OSError:
+            continue
+        for analyzer in analyzers.values():
+            analyzer.visit(content)
+    return {key: analyzer.result() for key, analyzer in analyzers.items()}
+
+
+class _ConventionAnalyzer(ABC):
+    """Accumulates one convention category over the visited test files."""
+
+    @abstractmethod
+    def visit(self, content: str) -> None:
+        """Record the conventions found in one test file's content."""
+
+    @abstractmethod
+    def result(self) -> dict[str, Any]:
+        """Return the category's summary over every visited file."""
+
+
+_TEST_METHOD_PATTERN = re.compile(r"@Test\s+(?:public\s+)?void\s+(\w+)")
+_ASSERTION_PATTERN = re.compile(r"(assert\w+\([^;]+\);)")
+_ANNOTATION_PATTERN = re.compile(r"@(\w+)")
+_DISPLAY_NAME_PATTERN = re.compile(r'@DisplayName\s*\(\s*"([^"]+)"\s*\)')
+
+
+class _NamingAnalyzer(_ConventionAnalyzer):
+    """Test method naming conventions."""
+
+    def __init__(self) -> None:
+        self.patterns = {
+            "should_when": 0,
+            "given_when_then": 0,
+            "test_description": 0,
+            "method_state_result": 0,
+            "camelCase": 0,
+            "snake_case": 0,
+        }
+        self.method_names: list[str] = []
+
+    def visit(self, content: str) -> None:
+        test_methods = _TEST_METHOD_PATTERN.findall(content)
+        if len(self.method_names) < 10:
+            self.method_names.extend(test_methods)
+
+        for method in test_methods:
+            lower = method.lower()
+            if "should" in lower and "when" in lower:
+                self.patterns["should_when"] += 1
+            elif "given" in lower and "then" in lower:
+                self.patterns["given_when_then"] += 1
+            elif method.startswith("test"):
+                self.patterns["test_description"] += 1
+
+            # Check case style
+            if "_" in method:
+                self.patterns["snake_case"] += 1
+            else:
+                self.patterns["camelCase"] += 1
+
+    def result(self) -> dict[str, Any]:
+        patterns = self.patterns
+        total = sum(patterns.values())
+        dominant_pattern = max(patterns, key=lambda k: patterns[k]) if total > 0 else "unknown"
+        return {
+            "dominant_pattern": dominant_pattern,
+            "patterns": patterns,
+            "sample_methods": self.method_names[:10],
+            "uses_snake_case": patterns["snake_case"] > patterns["camelCase"],
+        }
+
+
+class _AssertionAnalyzer(_ConventionAnalyzer):
+    """Assertion library and style preferences."""
+
+    def __init__(self) -> None:
+        self.styles = {"junit_assertions": 0, "assertj": 0, "hamcrest": 0, "truth": 0}
+        self.examples: list[str] = []
+
+    def visit(self, content: str) -> None:
+        styles = self.styles
+        if "assertThat(" in content and "org.assertj" in content:
+            styles["assertj"] += content.count("assertThat(")
+        if "assertThat(" in content and "org.hamcrest" in content:
+            styles["hamcrest"] += content.count("assertThat(")
+        if "assertEquals(" in content or "assertTrue(" in content:
+            styles["junit_assertions"] += (
+                content.count("assertEquals(")
+                + content.count("assertTrue(")
+                + content.count("assertFalse(")
+                + content.count("assertNotNull(")
+            )
+        if "com.google.common.truth" in content:
+            styles["truth"] += content.count("assertThat(")
+
+        # Sample assertions: a few per file, enough for the result
+        if len(self.examples) < 5:
+            self.examples.extend(_ASSERTION_PATTERN.findall(content)[:3])
+
+    def result(self) -> dict[str, Any]:
+        styles = self.styles
+        dominant_style = (
+            max(styles, key=lambda k: styles[k])
+            if sum(styles.values()) > 0
+            else "junit_assertions"
         )
-
-    return documentation
+        return {
+            "dominant_style": dominant_style,
+            "styles": styles,
+            "examples": self.examples[:5],
+        }
+
+
+class _MockAnalyzer(_ConventionAnalyzer):
+    """Mocking patterns and frameworks."""
+
+    def __init__(self) -> None:
+        self.patterns = {
+            "mockito_annotations": 0,
+            "mockito_inline": 0,
+            "mock_bean": 0,
+            "spy": 0,
+            "argument_captor": 0,
+            "verify": 0,
+        }
+
+    def visit(self, content: str) -> None:
+        patterns = self.patterns
+        if "@Mock" in content or "@InjectMocks" in content:
+            patterns["mockito_annotations"] += 1
+        if "Mockito.mock(" in content or "mock(" in content:
+            patterns["mockito_inline"] += 1
+        if "@MockBean" in content:
+            patterns["mock_bean"] += 1
+        if "@Spy" in content or "Mockito.spy(" in content:
+            patterns["spy"] += 1
+        if "ArgumentCaptor" in content:
+            patterns["argument_captor"] += 1
+        if "verify(" in content:
+            patterns["verify"] += 1
+
+    def result(self) -> dict[str, Any]:
+        patterns = self.patterns
+        return {
+            "uses_mockito": patterns["mockito_annotations"] > 0 or patterns["mockito_inline"] > 0,
+            "uses_spring_mock_bean": patterns["mock_bean"] > 0,
+            "patterns": patterns,
+            "prefers_annotations": patterns["mockito_annotations"] > patterns["mockito_inline"],
+        }
+
+
+class _SetupAnalyzer(_ConventionAnalyzer):
+    """Test setup and teardown patterns."""
+
+    def __init__(self) -> None:
+        self.patterns = {
+            "before_each": 0,
+            "before_all": 0,
+            "after_each": 0,
+            "after_all": 0,
+            "nested_classes": 0,
+            "parameterized": 0,
+        }
+
+    def visit(self, content: str) -> None:
+        patterns = self.patterns
+        if "@BeforeEach" in content or "@Before" in content:
+            patterns["before_each"] += 1
+        if "@BeforeAll" in content or "@BeforeClass" in content:
+            patterns["before_all"] += 1
+        if "@AfterEach" in content or "@After" in content:
+            patterns["after_each"] += 1
+        if "@AfterAll" in content or "@AfterClass" in content:
+            patterns["after_all"] += 1
+        if "@Nested" in content:
+            patterns["nested_classes"] += 1
+        if "@ParameterizedTest" in content:
+            patterns["parameterized"] += 1
+
+    def result(self) -> dict[str, Any]:
+        patterns = self.patterns
+        return {
+            "patterns": patterns,
+            "uses_setup": patterns["before_each"] > 0,
+            "uses_nested": patterns["nested_classes"] > 0,
+            "uses_parameterized": patterns["parameterized"] > 0,
+        }
+
+
+class _OrganizationAnalyzer(_ConventionAnalyzer):
+    """How tests are organized."""
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.total_tests = 0
+        self.uses_display_name = 0
+        self.uses_tags = 0
+
+    def visit(self, content: str) -> None:
+        self.files += 1
+        self.total_tests += content.count("@Test")
+        if "@DisplayName" in content:
+            self.uses_display_name += 1
+        if "@Tag" in content:
+            self.uses_tags += 1
+
+    def result(self) -> dict[str, Any]:
+        return {
+            "avg_tests_per_file": round(self.total_tests / self.files, 1) if self.files else 0.0,
+            "uses_display_name": self.uses_display_name,
+            "uses_tags": self.uses_tags,
+            "groups_by_method": 0,
+            "groups_by_scenario": 0,
+        }
+
+
+# Test-related annotations reported individually
+_TEST_ANNOTATIONS = [
+    "Test",
+    "BeforeEach",
+    "AfterEach",
+    "BeforeAll",
+    "AfterAll",
+    "Mock",
+    "InjectMocks",
+    "MockBean",
+    "Spy",
+    "Captor",
+    "ParameterizedTest",
+    "ValueSource",
+    "CsvSource",
+    "MethodSource",
+    "DisplayName",
+    "Nested",
+    "Tag",
+    "Disabled",
+    "SpringBootTest",
+    "WebMvcTest",
+    "DataJpaTest",
+    "ExtendWith",
+]
+
+
+class _AnnotationAnalyzer(_ConventionAnalyzer):
+    """Common test annotations used."""
+
+    def __init__(self) -> None:
+        self.annotations: Counter[str] = Counter()
+
+    def visit(self, content: str) -> None:
+        self.annotations.update(_ANNOTATION_PATTERN.findall(content))
+
+    def result(self) -> dict[str, Any]:
+        annotations = self.annotations
+        relevant = {k: annotations[k] for k in _TEST_ANNOTATIONS if k in annotations}
+        return {"common_annotations": dict(annotations.most_common(15)), "test_specific": relevant}
+
+
+class _DocumentationAnalyzer(_ConventionAnalyzer):
+    """Test documentation patterns."""
+
+    def __init__(self) -> None:
+        self.has_javadoc = 0
+        self.has_comments = 0
+        self.uses_display_name = 0
+        self.display_name_lengths: list[int] = []
+
+    def visit(self, content: str) -> None:
+        if "/**" in content:
+            self.has_javadoc += 1
+        if "//" in content:
+            self.has_comments += 1
+
+        display_names = _DISPLAY_NAME_PATTERN.findall(content)
+        if display_names:
+            self.uses_display_name += 1
+            self.display_name_lengths.extend(len(dn) for dn in display_names)
+
+    def result(self) -> dict[str, Any]:
+        lengths = self.display_name_lengths
+        return {
+            "has_javadoc": self.has_javadoc,
+            "has_comments": self.has_comments,
+            "uses_display_name": self.uses_display_name,
+            "avg_display_name_length": round(sum(lengths) / len(lengths), 1) if lengths else 0.0,
+        }
@@ -6,18 +6,17 @@ using LLM to create intelligent test cases.
 """
 
 import json
-import re
 import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from src.java.parsing_utils import (
-    _analyze_jpa_fields,
-    _extract_balanced_parens,
     _extract_public_signatures,
     _is_primitive_type,
-    _parse_parameters,
+    parse_java_source,
 )
 from src.lib.llm import get_llm
 from src.lib.logging import get_logger
@@ -26,6 +25,41 @@ from src.lib.prompt_utils import load_prompt_template, render_template
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class GenerationResult:
+    """Outcome of :func:`generate_adaptive_tests` for one source file.
+
+    Attributes:
+        success: Whether test code was produced
+        source_file: Resolved path of the source file
+        test_file: Conventional test file path for the source
+        class_type: Class classification used for the prompt
+        class_name: Name of the class under test
+        package: Package of the class under test
+        test_code: Generated test source
+        methods_covered: Number of public methods of the class
+        estimated_coverage: Coverage estimate (percent)
+        test_count: Number of test methods in ``test_code``
+        error: Failure reason when ``success`` is False
+    """
+
+    success: bool
+    source_file: str = ""
+    test_file: str = ""
+    class_type: str = ""
+    class_name: str = ""
+    package: str = ""
+    test_code: str = ""
+    methods_covered: int = 0
+    estimated_coverage: float = 0
+    test_count: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict (for persistence boundaries)."""
+        return asdict(self)
+
+
 async def generate_adaptive_tests(
     project_path: str,
     source_file: str,
@@ -33,10 +67,10 @@ async def generate_adaptive_tests(
     conventions: dict[str, Any] | None = None,
     coverage_target: float = 80,
     test_requirements: list[dict[str, Any]] | None = None,
-    class_index: dict[str, dict[str, Any]] | None = None,
+    class_index: Mapping[str, dict[str, Any]] | None = None,
     test_examples: list[dict[str, str]] | None = None,
     prompt_template_dir: str | None = None,
-) -> str:
+) -> GenerationResult:
     """
     Generate unit tests adapted to project conventions.
 
@@ -47,9 +81,12 @@ async def generate_adaptive_tests(
         conventions: Test conventions to follow
         coverage_target: Target code coverage percentage
         test_requirements: Optional list of specific test requirements from impact analysis
+        class_index: Optional class index mapping (a plain dict or a lazy
+            ``ClassIndexView``); only the entries for this class, its parent
+            and its dependencies are looked up
 
     Returns:
-        JSON string with generated test code and metadata
+        GenerationResult with the generated test code and metadata
     """
     project_dir = Path(project_path)
     source_path = Path(source_file)
@@ -58,13 +95,13 @@ async def generate_adaptive_tests(
         # Try as relative path
         source_path = project_dir / source_file
         if not source_path.exists():
-            return json.dumps({"success": False, "error": f"Source file not found: {source_file}"})
+            return GenerationResult(success=False, error=f"Source file not found: {source_file}")
 
     # Read source code
     try:
         source_code = source_path.read_text(encoding="utf-8", errors="replace")
     except Exception as e:
-        return json.dumps({"success": False, "error": f"Failed to read source file: {e}"})
+        return GenerationResult(success=False, error=f"Failed to read source file: {e}")
 
     # Analyze source file
     class_info = _analyze_class(source_code)
@@ -99,19 +136,18 @@ async def generate_adaptive_tests(
     logger.info("generating_tests_with_llm", class_name=class_info["class_name"])
     test_code = await _generate_test_code_with_llm(context, source_code, prompt_template_dir=prompt_template_dir)
 
-    results = {
-        "success": True,
-        "source_file": str(source_path),
-        "test_file": str(test_file_path),
-        "class_type": class_type,
-        "test_code": test_code,
-        "methods_covered": len(class_info["methods"]),
-        "estimated_coverage": min(coverage_target, 85),
-        "test_count": test_code.count("@Test") or test_code.count("def test_"),
-        "context": context,
-    }
-
-    return json.dumps(results, indent=2)
+    return GenerationResult(
+        success=True,
+        source_file=str(source_path),
+        test_file=str(test_file_path),
+        class_type=class_type,
+        class_name=class_info["class_name"],
+        package=class_info["package"],
+        test_code=test_code,
+        methods_covered=len(class_info["methods"]),
+        estimated_coverage=min(coverage_target, 85),
+        test_count=test_code.count("@Test") or test_code.count("def test_"),
+    )
 
 
 @lru_cache(maxsize=16)
@@ -439,7 +475,7 @@ def _extract_dependency_signatures(project_path: str, dependencies: list[dict[st
 
 
 def _resolve_dependency_signatures_from_index(
-    dependencies: list[dict[str, Any]], class_index: dict[str, dict[str, Any]]
+    dependencies: list[dict[str, Any]], class_index: Mapping[str, dict[str, Any]]
 ) -> str:
     """Resolve dependency method signatures from the pre-built class index.
 
@@ -614,7 +650,7 @@ async def _generate_test_code_with_llm(context: dict[str, Any], source_code: str
     test_requirements = context.get("test_requirements", [])
     conventions = context.get("conventions", {})
     project_path = context.get("project_path", "")
-    class_index: dict[str, dict[str, Any]] | None = context.get("class_index")
+    class_index: Mapping[str, dict[str, Any]] | None = context.get("class_index")
     test_examples: list[dict[str, str]] | None = context.get("test_examples")
 
     # Extract project context from pom.xml
@@ -833,126 +869,28 @@ async def _generate_test_code_with_llm(context: dict[str, Any], source_code: str
 
 
 def _analyze_class(source_code: str) -> dict[str, Any]:
-    """Analyze Java class structure."""
-    methods: list[dict[str, Any]] = []
-    dependencies: list[dict[str, str]] = []
-    annotations: list[str] = []
-    fields: list[str] = []
-    imports: list[str] = []
+    """Analyze Java class structure.
 
+    Shares its parse with ``analyze_java_class`` (see ``parse_java_source``).
+    """
+    parsed = parse_java_source(source_code)
     info: dict[str, Any] = {
-        "class_name": "",
-        "package": "",
-        "methods": methods,
-        "dependencies": dependencies,
-        "annotations": annotations,
-        "fields": fields,
-        "imports": imports,
-        "is_record": False,
+        "class_name": parsed.class_name,
+        "package": parsed.package,
+        "methods": [],
+        "dependencies": parsed.dependency_dicts(),
+        "annotations": [],
+        "fields": [],
+        "imports": list(parsed.imports),
+        "is_record": parsed.is_record,
     }
-
-    # Extract package
-    package_match = re.search(r"package\s+([\w.]+);", source_code)
-    if package_match:
-        info["package"] = package_match.group(1)
-
-    # Extract imports
-    import_pattern = re.compile(r"import\s+([\w.]+(?:\.\*)?);", re.MULTILINE)
-    for match in import_pattern.finditer(source_code):
-        imports.append(match.group(1))
-
-    # Check if this is a Java record
-    record_match = re.search(r"(?:public\s+)?record\s+(\w+)\s*\(([^)]*)\)", source_code)
-    if record_match:
-        info["class_name"] = record_match.group(1)
-        info["is_record"] = True
-        record_params = record_match.group(2)
-        for param in _parse_parameters(record_params):
-            if not _is_primitive_type(param["type"]):
-                dependencies.append({"type": param["type"], "name": param["name"]})
+    if parsed.is_record:
         return info
 
-    # Extract class name
-    class_match = re.search(r"(?:public\s+)?(?:abstract\s+)?class\s+(\w+)", source_code)
-    if class_match:
-        info["class_name"] = class_match.group(1)
-
-    # Extract ALL class-level annotations (before the class declaration)
-    class_decl_match = re.search(r'(?:public\s+)?(?:abstract\s+)?class\s+\w+', source_code)
-    if class_decl_match:
-        before_class = source_code[:class_decl_match.start()]
-        class_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', before_class)
-        class_level_annots = [a for a in class_annotations if a in (
-            'Controller', 'RestController', 'Service', 'Repository', 'Component',
-            'RequestMapping', 'Timed', 'Transactional', 'Configuration', 'Bean',
-            'Slf4j', 'Log4j2', 'Data', 'Entity', 'Table', 'Document'
-        )]
-        annotations.extend(class_level_annots)
-
-    # Extract constructor parameters for dependency injection
-    class_name = info["class_name"]
-    if class_name:
-        constructor_pattern = re.compile(
-            rf"(?:public\s+)?{re.escape(class_name)}\s*\(([^)]*)\)",
-            re.MULTILINE | re.DOTALL
-        )
-        for match in constructor_pattern.finditer(source_code):
-            constructor_params = match.group(1)
-            if constructor_params.strip():
-                for param in _parse_parameters(constructor_params):
-                    if not _is_primitive_type(param["type"]):
-                        if not any(d["name"] == param["name"] for d in dependencies):
-                            dependencies.append({"type": param["type"], "name": param["name"]})
-
-    # Extract methods
-    method_sig_pattern = re.compile(
-        r"(public|private|protected)\s+"
-        r"(?:static\s+)?(?:final\s+)?(?:synchronized\s+)?"
-        r"(\w+(?:<[^>]+>)?)\s+"
-        r"(\w+)\s*\(",
-        re.MULTILINE,
-    )
-
-    for match in method_sig_pattern.finditer(source_code):
-        visibility = match.group(1)
-        return_type = match.group(2)
-        method_name = match.group(3)
-
-        if method_name == info["class_name"]:
-            continue
-
-        # Filter private methods - they shouldn't be tested directly
-        if visibility == "private":
-            continue
-
-        params = _extract_balanced_parens(source_code, match.end() - 1)
-        parsed_params = _parse_parameters(params)
-
-        methods.append(
-            {
-                "name": method_name,
-                "return_type": return_type,
-                "parameters": params,
-                "parsed_params": parsed_params,
-                "is_void": return_type == "void",
-                "visibility": visibility,
-            }
-        )
-
-    # Extract dependencies (fields with @Autowired, @Inject, etc.)
-    dep_pattern = re.compile(
-        r"@(?:Autowired|Inject|Resource)\s+(?:private\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)", re.MULTILINE
-    )
-    for match in dep_pattern.finditer(source_code):
-        dep_type = match.group(1)
-        dep_name = match.group(2)
-        if not any(d["name"] == dep_name for d in dependencies):
-            dependencies.append({"type": dep_type, "name": dep_name})
-
-    # Analyze JPA entity fields
-    jpa_info = _analyze_jpa_fields(source_code)
-    info["jpa_info"] = jpa_info
-    info["is_jpa_entity"] = "Entity" in annotations or "Table" in annotations
+    info["methods"] = parsed.method_dicts()
+    info["annotations"] = list(parsed.annotations)
+    info["jpa_info"] = parsed.jpa_dict()
+    info["is_jpa_entity"] = "Entity" in parsed.annotations or "Table" in parsed.annotations
 
     return info
 
@@ -231,3 +231,86 @@ class TestLLMConnectionRetry:
 
             # Should fail immediately without retries (call count = 1)
             assert call_count == 1
+
+
+class TestLLMConnectionCache:
+    """A successful check is reused per provider/model/base_url until the TTL expires."""
+
+    @staticmethod
+    def _ok_llm(mock_get_llm):
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke.return_value = AIMessage(content="pong")
+        mock_get_llm.return_value = mock_llm
+        return mock_llm
+
+    @pytest.mark.asyncio
+    async def test_second_check_is_served_from_cache(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            mock_llm = self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+            await check_llm_connection(project_path=str(tmp_path))
+
+        assert mock_llm.ainvoke.call_count == 1
+        assert (tmp_path / ".testboost" / "llm_check.json").exists()
+        assert "llm_check.json" in (tmp_path / ".testboost" / ".gitignore").read_text()
+
+    @pytest.mark.asyncio
+    async def test_model_change_misses_cache(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            mock_llm = self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+            await check_llm_connection(model="other-model", project_path=str(tmp_path))
+
+        assert mock_llm.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_pings_again(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            mock_llm = self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+            with patch("src.lib.llm_check_cache.time.time", return_value=10**12):
+                await check_llm_connection(project_path=str(tmp_path))
+
+        assert mock_llm.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_forces_ping(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            mock_llm = self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+            await check_llm_connection(project_path=str(tmp_path), use_cache=False)
+
+        assert mock_llm.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_check_invalidates_cache(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        cache_file = tmp_path / ".testboost" / "llm_check.json"
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+        assert cache_file.exists()
+
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            mock_get_llm.side_effect = LLMProviderError("key revoked")
+            with pytest.raises(LLMProviderError):
+                await check_llm_connection(project_path=str(tmp_path), use_cache=False)
+        assert not cache_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_real_call_invalidates_cache(self, tmp_path):
+        from src.lib.llm_callbacks import LLMMetricsCallback
+
+        (tmp_path / ".testboost").mkdir()
+        cache_file = tmp_path / ".testboost" / "llm_check.json"
+        with patch("src.lib.startup_checks.get_llm") as mock_get_llm:
+            self._ok_llm(mock_get_llm)
+            await check_llm_connection(project_path=str(tmp_path))
+        assert cache_file.exists()
+
+        LLMMetricsCallback(provider="openai", model="m").on_llm_error(RuntimeError("502 Bad Gateway"))
+        assert not cache_file.exists()
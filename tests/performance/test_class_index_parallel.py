@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark: serial vs process-pool class index on a 10k-file project.
+
+Opt-in (``slow`` marker, run with ``pytest -m slow``). The parallel index
+must equal the serial one everywhere; on machines with at least 4 CPUs it
+must also take under 75% of the serial time.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.java.class_analyzer import build_class_index
+
+N_FILES = 10_000
+
+_TEMPLATE = """package com.example.p{pkg};
+
+import java.util.List;
+import org.springframework.stereotype.Service;
+
+@Service
+public class Service{i} extends Base{base} implements Api{pkg} {{
+    private final Repo{i} repo;
+    private final Client{pkg} client;
+
+    public Service{i}(Repo{i} repo, Client{pkg} client) {{
+        this.repo = repo;
+        this.client = client;
+    }}
+
+    public List<String> find(String name, int limit) {{
+        // look things up
+        return repo.findByName(name, limit);
+    }}
+
+    public void save(Item{i} item) {{
+        if (item == null) throw new IllegalArgumentException("item");
+        repo.save(item);
+    }}
+}}
+"""
+
+
+def _make_project(root: Path, n: int) -> list[str]:
+    files = []
+    for i in range(n):
+        rel = f"src/main/java/com/example/p{i % 100}/Service{i}.java"
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_TEMPLATE.format(i=i, pkg=i % 100, base=i % 7))
+        files.append(rel)
+    return files
+
+
+@pytest.mark.slow
+def test_parallel_class_index_speedup(tmp_path):
+    files = _make_project(tmp_path, N_FILES)
+    cpus = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    serial = build_class_index(str(tmp_path), files, workers=1)
+    t_serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = build_class_index(str(tmp_path), files, workers=max(2, min(cpus, 8)))
+    t_parallel = time.perf_counter() - start
+
+    assert len(serial) == N_FILES
+    assert parallel == serial
+    if cpus >= 4:
+        assert t_parallel < t_serial * 0.75
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Scaling benchmark for existing-test lookup during ``analyze``.
+
+``analyze`` looks up the test of every source file. With one recursive
+glob per lookup the step was quadratic in project size; with the
+test-name index it must stay linear.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.java.discovery import ExistingTestIndex, find_existing_test
+from src.lib.project_index import forget_project_index
+
+
+def _make_project(root: Path, n_classes: int) -> list[str]:
+    sources = []
+    for i in range(n_classes):
+        pkg = f"com/example/p{i % 50}"
+        src = root / "src/main/java" / pkg / f"Service{i}.java"
+        src.parent.mkdir(parents=True, exist_ok=True)
+        src.write_text(f"class Service{i} {{}}")
+        sources.append(str(src.relative_to(root)))
+        if i % 2 == 0:
+            test = root / "src/test/java" / pkg / f"Service{i}Test.java"
+            test.parent.mkdir(parents=True, exist_ok=True)
+            test.write_text(f"class Service{i}Test {{}}")
+    return sources
+
+
+def _time_lookups(root: Path, sources: list[str]) -> tuple[float, int]:
+    forget_project_index(root)
+    start = time.perf_counter()
+    index = ExistingTestIndex.from_project(str(root))
+    found = sum(1 for s in sources if find_existing_test(str(root), s, index=index))
+    return time.perf_counter() - start, found
+
+
+@pytest.mark.slow
+def test_lookup_time_scales_linearly(tmp_path):
+    small, large = 500, 2000
+    small_sources = _make_project(tmp_path / "small", small)
+    large_sources = _make_project(tmp_path / "large", large)
+
+    t_small, found_small = _time_lookups(tmp_path / "small", small_sources)
+    t_large, found_large = _time_lookups(tmp_path / "large", large_sources)
+
+    assert found_small == small // 2
+    assert found_large == large // 2
+    per_file_small = t_small / small
+    per_file_large = t_large / large
+    # Linear: per-source cost must not grow with the project (generous
+    # margin for noisy CI machines; the old glob-per-lookup was ~4x here)
+    assert per_file_large < per_file_small * 3
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Microbenchmark: per-file cost of handing a generation result back.
+
+``generate_adaptive_tests`` used to return ``json.dumps(results, indent=2)``
+with the whole prompt context (source, class index, test examples) echoed
+in it, and ``generate`` parsed it straight back. It now returns a
+``GenerationResult`` object; the only per-file cost left is building it.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.test_generation.generate_unit import GenerationResult
+
+N_CLASSES = 5000
+ROUNDS = 20
+
+
+def _class_index() -> dict[str, dict]:
+    return {
+        f"Service{i}": {
+            "class_name": f"Service{i}",
+            "package": f"com.example.p{i % 50}",
+            "category": "service",
+            "fields": [{"name": "repo", "type": f"Repository{i}"}],
+            "methods": [f"public Order find{j}(Long id)" for j in range(8)],
+            "extends": None,
+        }
+        for i in range(N_CLASSES)
+    }
+
+
+def _legacy_round_trip(class_index, source_code, test_code) -> dict:
+    """What generate paid per file before: serialize the echo, parse it back."""
+    results = {
+        "success": True,
+        "source_file": "src/main/java/com/example/OrderService.java",
+        "test_file": "src/test/java/com/example/OrderServiceTest.java",
+        "class_type": "service",
+        "test_code": test_code,
+        "methods_covered": 8,
+        "estimated_coverage": 80,
+        "test_count": 1,
+        "context": {
+            "class_name": "OrderService",
+            "package": "com.example",
+            "source_code": source_code,
+            "class_index": class_index,
+            "test_examples": [{"path": "OrderServiceTest.java", "content": test_code}],
+        },
+    }
+    return json.loads(json.dumps(results, indent=2))
+
+
+@pytest.mark.slow
+def test_result_object_removes_per_file_serialization():
+    class_index = _class_index()
+    source_code = "public class OrderService {\n" + "    void m() {}\n" * 300 + "}\n"
+    test_code = "class OrderServiceTest {\n  @Test\n  void t() {}\n}\n"
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        legacy = _legacy_round_trip(class_index, source_code, test_code)
+    t_legacy = (time.perf_counter() - start) / ROUNDS
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = GenerationResult(
+            success=True,
+            source_file="src/main/java/com/example/OrderService.java",
+            test_file="src/test/java/com/example/OrderServiceTest.java",
+            class_type="service",
+            class_name="OrderService",
+            package="com.example",
+            test_code=test_code,
+            methods_covered=8,
+            estimated_coverage=80,
+            test_count=1,
+        )
+    t_object = (time.perf_counter() - start) / ROUNDS
+
+    assert legacy["context"]["class_name"] == result.class_name
+    assert t_object * 100 < t_legacy
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Throughput benchmark for the Java source parser.
+
+Every source file of a project goes through ``analyze_java_class`` when the
+class index is built, and ``generate`` parses each file it targets again.
+Both run on one masked copy of the source (comments and literals blanked
+in a single pass) through ``parse_java_source``.
+"""
+
+import time
+
+import pytest
+
+from src.java.class_analyzer import analyze_java_class
+from src.java.parsing_utils import parse_java_source
+from src.test_generation.generate_unit import _analyze_class
+
+SMALL, LARGE = 500, 2000
+
+
+def _source(i: int) -> str:
+    methods = "\n".join(
+        f"""
+    /**
+     * Looks up item {j}; see {{@link #find{j}(Long)}}.
+     * public void notAMethod() {{}}
+     */
+    @Transactional(readOnly = true)
+    public Order find{j}(@PathVariable("id") Long id, String filter) throws NotFoundException {{
+        log.debug("find{j}({{}})", id); // trailing ) comment
+        return repo{i % 7}.findById(id).orElseThrow(() -> new NotFoundException("missing"));
+    }}"""
+        for j in range(12)
+    )
+    return f"""package com.example.p{i % 40};
+
+import java.util.List;
+import org.springframework.stereotype.Service;
+import com.example.repository.Repository{i % 7};
+
+/* Service for {i}.
+ * class Fake extends Nothing {{ }}
+ */
+@Service
+public class Service{i} extends BaseService implements Api{i % 5} {{
+
+    @Autowired
+    private Repository{i % 7} repo{i % 7};
+
+    private final String name = "Service{i} \\"quoted\\" (paren";
+
+    public Service{i}(Repository{i % 7} repo, Clock clock) {{
+        this.repo{i % 7} = repo;
+    }}
+{methods}
+}}
+"""
+
+
+def _time_parse(corpus: list[str]) -> tuple[float, list[dict]]:
+    parse_java_source.cache_clear()
+    start = time.perf_counter()
+    entries = [analyze_java_class(src) for src in corpus]
+    return time.perf_counter() - start, entries
+
+
+@pytest.mark.slow
+def test_parse_time_scales_linearly():
+    t_small, _ = _time_parse([_source(i) for i in range(SMALL)])
+    t_large, entries = _time_parse([_source(i) for i in range(LARGE)])
+
+    assert all(len(e["methods"]) == 12 for e in entries)
+    assert all(e["extends"] == "BaseService" for e in entries)
+    # Per-file cost must not grow with the corpus (the parse cache is
+    # cleared, so every file is parsed); generous margin for noisy machines
+    assert t_large / LARGE < (t_small / SMALL) * 3
+
+
+@pytest.mark.slow
+def test_generator_reuses_the_index_parse():
+    corpus = [_source(i) for i in range(50)]
+    parse_java_source.cache_clear()
+    for src in corpus:
+        analyze_java_class(src)
+        _analyze_class(src)
+    info = parse_java_source.cache_info()
+    assert info.misses == len(corpus)
+    assert info.hits == len(corpus)
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Microbenchmark: cost of 10k session log entries.
+
+``MdLogger`` used to call ``write_log`` for every message: mkdir, exists()
+and an open/append/close of the daily log file per line. It now queues the
+entry (``queue_log``) for a writer thread that appends in batches.
+"""
+
+import time
+
+import pytest
+
+from src.lib.log_writer import flush_logs
+from src.lib.session_tracker import create_session, init_project, queue_log, write_log
+
+N_ENTRIES = 10_000
+
+
+@pytest.mark.slow
+def test_buffered_logging_is_cheaper_per_entry(tmp_path):
+    init_project(str(tmp_path))
+    unbuffered_dir = create_session(str(tmp_path), name="unbuffered")["session_dir"]
+    buffered_dir = create_session(str(tmp_path), name="buffered")["session_dir"]
+
+    start = time.perf_counter()
+    for i in range(N_ENTRIES):
+        write_log(unbuffered_dir, "generation", "INFO", f"Generated test {i}", file=f"F{i}.java")
+    t_unbuffered = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(N_ENTRIES):
+        queue_log(buffered_dir, "generation", "INFO", f"Generated test {i}", file=f"F{i}.java")
+    t_queued = time.perf_counter() - start
+    flush_logs()
+    t_buffered = time.perf_counter() - start
+
+    logs = [
+        next((tmp_path / ".testboost" / "sessions" / sid / "logs").glob("*.md")).read_text()
+        for sid in ("001-unbuffered", "002-buffered")
+    ]
+    assert logs[0].count("Generated test") == logs[1].count("Generated test") == N_ENTRIES
+
+    # What the caller pays per entry, and the total once everything is on disk
+    assert t_queued * 2 < t_unbuffered
+    assert t_buffered < t_unbuffered
@@ -124,6 +124,55 @@ class TestTestRunCommand:
         assert "-P" in cmd
         assert "corp" in cmd
 
+    def test_surefire_settings(self, plugin, tmp_path):
+        cmd = plugin.test_run_command(
+            tmp_path, {"maven_test_cmd": "mvn test", "surefire_fork_count": "1C", "surefire_parallel": "classes"},
+        )
+        assert cmd[1:] == [
+            "test", "-DforkCount=1C", "-DreuseForks=true", "-Dparallel=classes", "-DthreadCount=1",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# scoped_test_commands() — run only the generated test classes
+# ---------------------------------------------------------------------------
+
+class TestScopedTestCommands:
+    def test_maven_dtest_selection(self, plugin, tmp_path):
+        cmds = plugin.scoped_test_commands(tmp_path, {"maven_test_cmd": "mvn test -q"}, [
+            "src/test/java/com/shop/CartTest.java",
+            "src/test/java/com/shop/OrderServiceTest.java",
+        ])
+        assert cmds == [[
+            cmds[0][0], "test", "-q", "-Dtest=CartTest,OrderServiceTest",
+            "-Dsurefire.failIfNoSpecifiedTests=false", "-DfailIfNoTests=false",
+        ]]
+        assert plugin.scoped_test_commands(tmp_path, {}, []) is None
+
+    def test_long_selection_is_chunked(self, plugin, tmp_path):
+        from src.lib.plugins.java_spring import _TEST_SELECTION_MAX_CHARS
+        files = [f"src/test/java/com/shop/Generated{i:04d}ServiceTest.java" for i in range(400)]
+        cmds = plugin.scoped_test_commands(tmp_path, {"maven_test_cmd": "mvn test"}, files)
+        assert len(cmds) > 1
+        selections = [next(a for a in c if a.startswith("-Dtest=")) for c in cmds]
+        assert all(len(sel) - len("-Dtest=") <= _TEST_SELECTION_MAX_CHARS for sel in selections)
+        names = [n for sel in selections for n in sel[len("-Dtest="):].split(",")]
+        assert names == [f"Generated{i:04d}ServiceTest" for i in range(400)]
+
+    def test_gradle_grouped_by_owning_project(self, plugin, tmp_path):
+        _gradle_project(tmp_path)
+        cmds = plugin.scoped_test_commands(tmp_path, {}, [
+            "core/src/test/java/com/shop/CartTest.java",
+            "src/test/java/com/shop/AppTest.java",
+            "core/src/test/java/com/shop/PriceTest.java",
+        ])
+        assert len(cmds) == 2
+        core = next(c for c in cmds if ":core:test" in c)
+        assert core[-4:] == ["--tests", "com.shop.CartTest", "--tests", "com.shop.PriceTest"]
+        root = next(c for c in cmds if ":core:test" not in c)
+        assert root[1] == ":test" and root[-2:] == ["--tests", "com.shop.AppTest"]
+        assert not any(a.startswith("-DforkCount") for c in cmds for a in c)
+
 
 # ---------------------------------------------------------------------------
 # _detect_maven_build_config() — pom profiles + .mvn/maven.config
@@ -165,3 +214,69 @@ class TestParseMavenCmd:
         from src.lib.plugins.java_spring import _parse_maven_cmd
         with _pytest.raises(ValueError):
             _parse_maven_cmd("rm -rf /")
+
+    def test_accepts_gradle_wrapper(self):
+        from src.lib.plugins.java_spring import _parse_maven_cmd
+        assert _parse_maven_cmd("./gradlew test --tests a.FooTest") == [
+            "./gradlew", "test", "--tests", "a.FooTest",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Gradle builds — wrapper, daemon/caches, per-project scoping
+# ---------------------------------------------------------------------------
+
+def _gradle_project(tmp_path, gradle_version="8.5"):
+    (tmp_path / "settings.gradle").write_text("rootProject.name = 'shop'\ninclude 'core'\n")
+    (tmp_path / "build.gradle").write_text("plugins { id 'java' }\n")
+    (tmp_path / "gradlew").write_text("#!/bin/sh\n")
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core/build.gradle").write_text("plugins { id 'java' }\n")
+    if gradle_version:
+        wrapper = tmp_path / "gradle" / "wrapper"
+        wrapper.mkdir(parents=True)
+        (wrapper / "gradle-wrapper.properties").write_text(
+            "distributionUrl=https\\://services.gradle.org/distributions/"
+            f"gradle-{gradle_version}-bin.zip\n"
+        )
+    return tmp_path
+
+
+class TestGradleBuildConfig:
+    def test_wrapper_daemon_and_caches(self, plugin, tmp_path):
+        _gradle_project(tmp_path)
+        cmd = plugin.validation_command(tmp_path, {})
+        assert cmd[:2] == ["./gradlew", "compileTestJava"]
+        assert {"--daemon", "--build-cache", "--configuration-cache"} <= set(cmd)
+        assert plugin.test_run_command(tmp_path, {})[:2] == ["./gradlew", "test"]
+
+    def test_old_gradle_skips_configuration_cache(self, tmp_path):
+        from src.lib.plugins.java_spring import _detect_build_config
+        _gradle_project(tmp_path, gradle_version="6.5.1")
+        config = _detect_build_config(tmp_path)
+        assert "--build-cache" in config["compile_cmd"]
+        assert "--configuration-cache" not in config["compile_cmd"]
+
+    def test_pom_wins_over_gradle(self, tmp_path):
+        from src.lib.plugins.java_spring import _detect_build_config
+        _gradle_project(tmp_path)
+        (tmp_path / "pom.xml").write_text("<project></project>")
+        assert "test-compile" in _detect_build_config(tmp_path)["compile_cmd"]
+
+    def test_commands_scoped_to_owning_project(self, tmp_path):
+        from src.lib.plugins.java_spring import _single_test_command, _test_compile_command
+        _gradle_project(tmp_path)
+        test_file = tmp_path / "core/src/test/java/com/shop/CartTest.java"
+
+        compile_cmd = _test_compile_command(str(tmp_path), test_file)
+        assert compile_cmd[:2] == ["./gradlew", ":core:compileTestJava"]
+
+        run_cmd = _single_test_command(str(tmp_path), test_file, "CartTest")
+        assert run_cmd[:2] == ["./gradlew", ":core:test"]
+        assert run_cmd[-2:] == ["--tests", "com.shop.CartTest"]
+
+    def test_maven_single_test_uses_dtest(self, tmp_path):
+        from src.lib.plugins.java_spring import _single_test_command
+        test_file = tmp_path / "src/test/java/com/shop/CartTest.java"
+        cmd = _single_test_command(str(tmp_path), test_file, "CartTest", "mvn test -q")
+        assert cmd[1:] == ["test", "-q", "-Dtest=CartTest"]
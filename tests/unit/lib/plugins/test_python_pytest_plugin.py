@@ -37,6 +37,10 @@ def test_test_file_pattern(plugin):
     assert "**/*_test.py" in patterns
 
 
+def test_junit_report_args(plugin, tmp_path):
+    assert plugin.junit_report_args(tmp_path / "r.xml") == [f"--junitxml={tmp_path / 'r.xml'}"]
+
+
 # ---------------------------------------------------------------------------
 # find_source_files()
 # ---------------------------------------------------------------------------
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.analysis_store (lazy class index view)."""
+
+import pytest
+
+from src.lib.analysis_store import (
+    ClassIndexView,
+    open_class_index,
+    write_analysis_data,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / ".testboost").mkdir()
+    write_analysis_data(str(tmp_path), {
+        "class_index": {
+            "Foo": {"class_name": "Foo", "category": "service"},
+            "Bar": {"class_name": "Bar", "extends": "Foo"},
+            "Baz": {"class_name": "Baz"},
+        },
+        "conventions": {"naming": "should"},
+    })
+    return tmp_path
+
+
+class TestOpenClassIndex:
+    def test_mapping_api(self, store):
+        with open_class_index(str(store)) as index:
+            assert isinstance(index, ClassIndexView)
+            assert len(index) == 3
+            assert list(index) == ["Foo", "Bar", "Baz"]
+            assert index["Bar"]["extends"] == "Foo"
+            assert "Baz" in index
+            assert "String" not in index
+            assert index.get("String") is None
+            assert index.get("Foo", {}).get("category") == "service"
+            with pytest.raises(KeyError):
+                index["Missing"]
+
+    def test_lru_keeps_only_recent_entries(self, store):
+        with open_class_index(str(store), cache_size=2) as index:
+            index.get("Foo")
+            index.get("Bar")
+            index.get("Foo")
+            index.get("Baz")
+            assert list(index._cache) == ["Foo", "Baz"]
+
+    def test_cached_entries_are_returned_as_is(self, store):
+        with open_class_index(str(store)) as index:
+            assert index["Foo"] is index["Foo"]
+
+    def test_empty_index_is_falsy(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        write_analysis_data(str(tmp_path), {"class_index": {}})
+        with open_class_index(str(tmp_path)) as index:
+            assert index is not None
+            assert not index
+
+    def test_none_without_store_or_class_index(self, tmp_path):
+        assert open_class_index(str(tmp_path)) is None
+        (tmp_path / ".testboost").mkdir()
+        write_analysis_data(str(tmp_path), {"conventions": {}})
+        assert open_class_index(str(tmp_path)) is None
@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.cache_files (atomic, git-ignored cache writes)."""
+
+from src.lib.cache_files import ensure_gitignored, write_cache_file
+
+
+def test_write_cache_file_replaces_and_ignores(tmp_path):
+    tb_dir = tmp_path / ".testboost"
+    tb_dir.mkdir()
+    path = tb_dir / "cache.json"
+    write_cache_file(path, "{}", tb_dir=tb_dir, comment="Test cache")
+    write_cache_file(path, '{"v": 2}', tb_dir=tb_dir, comment="Test cache")
+
+    assert path.read_text() == '{"v": 2}'
+    assert sorted(p.name for p in tb_dir.iterdir()) == [".gitignore", "cache.json"]
+    assert (tb_dir / ".gitignore").read_text() == "# Test cache\ncache.json\n"
+
+
+def test_ensure_gitignored_appends_once(tmp_path):
+    (tmp_path / ".gitignore").write_text("# Secret\n.tb_secret\n")
+    for _ in range(2):
+        ensure_gitignored(tmp_path, "sessions/*/status_cache.json", "Status cache")
+    assert (tmp_path / ".gitignore").read_text() == (
+        "# Secret\n.tb_secret\n\n# Status cache\nsessions/*/status_cache.json\n"
+    )
+
+
+def test_sidecar_without_tb_dir_touches_no_gitignore(tmp_path):
+    write_cache_file(tmp_path / "analysis.json", "{}")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["analysis.json"]
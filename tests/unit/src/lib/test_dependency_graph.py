@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.dependency_graph."""
+
+import subprocess
+
+import pytest
+
+from src.lib.dependency_graph import DependencyGraph, changed_files_since
+
+REPO = "src/main/java/com/example/OrderRepository.java"
+SERVICE = "src/main/java/com/example/OrderService.java"
+CONTROLLER = "src/main/java/com/example/OrderController.java"
+BASE = "src/main/java/com/example/BaseEntity.java"
+ORDER = "src/main/java/com/example/Order.java"
+API = "src/main/java/com/example/OrderApi.java"
+REPORT = "src/main/java/com/example/ReportService.java"
+
+
+@pytest.fixture
+def graph():
+    return DependencyGraph({
+        "OrderRepository": {"relative_path": REPO},
+        "OrderService": {
+            "relative_path": SERVICE,
+            "dependencies": [{"type": "OrderRepository", "name": "repo"}],
+        },
+        "OrderController": {
+            "relative_path": CONTROLLER,
+            "implements": ["OrderApi"],
+            "dependencies": [{"type": "OrderService", "name": "service"}],
+        },
+        "BaseEntity": {"relative_path": BASE},
+        "Order": {"relative_path": ORDER, "extends": "BaseEntity"},
+        "OrderApi": {"relative_path": API},
+        "ReportService": {
+            "relative_path": REPORT,
+            "fields": [{"name": "cache", "type": "Map<String, List<Order>>"}],
+        },
+    })
+
+
+class TestDependencyGraph:
+    def test_direct_dependents(self, graph):
+        assert graph.dependents(REPO) == {SERVICE}
+        assert graph.dependents(CONTROLLER) == set()
+
+    def test_affected_is_transitive(self, graph):
+        assert graph.affected([REPO]) == sorted([REPO, SERVICE, CONTROLLER])
+
+    def test_extends_and_implements_edges(self, graph):
+        assert graph.affected([BASE]) == sorted([BASE, ORDER, REPORT])
+        assert graph.affected([API]) == sorted([API, CONTROLLER])
+
+    def test_generic_field_types(self, graph):
+        assert graph.dependents(ORDER) == {REPORT}
+
+    def test_unindexed_paths_ignored(self, graph):
+        assert graph.affected(["pom.xml", "README.md"]) == []
+
+    def test_windows_separators(self, graph):
+        assert graph.affected([REPO.replace("/", "\\")]) == sorted([REPO, SERVICE, CONTROLLER])
+
+    def test_cycles_terminate(self):
+        graph = DependencyGraph({
+            "A": {"relative_path": "A.java", "dependencies": [{"type": "B"}]},
+            "B": {"relative_path": "B.java", "dependencies": [{"type": "A"}]},
+        })
+        assert graph.affected(["A.java"]) == ["A.java", "B.java"]
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+class TestChangedFilesSince:
+    def test_lists_modified_files(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "config", "user.email", "dev@example.com")
+        _git(tmp_path, "config", "user.name", "dev")
+        (tmp_path / "A.java").write_text("class A {}")
+        (tmp_path / "B.java").write_text("class B {}")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+
+        (tmp_path / "B.java").write_text("class B { int x; }")
+        assert changed_files_since(str(tmp_path), "HEAD") == ["B.java"]
+
+    def test_unknown_ref(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        with pytest.raises(ValueError):
+            changed_files_since(str(tmp_path), "no-such-ref")
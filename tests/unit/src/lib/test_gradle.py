@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.java.gradle (build-script analysis)."""
+
+from src.java.gradle import (
+    gradle_project_path,
+    is_gradle_project,
+    parse_gradle_build,
+    parse_gradle_settings,
+    read_gradle_build,
+)
+
+GROOVY_BUILD = """
+plugins { id 'java' }
+group = 'com.example'
+version = '1.2.0'
+java { sourceCompatibility = JavaVersion.VERSION_1_8 }
+repositories { maven { url 'https://repo.example.com/maven' } }
+dependencies {
+    implementation 'org.springframework.boot:spring-boot-starter-web'
+    // implementation 'com.old:removed:1.0'
+    api platform('org.springframework.boot:spring-boot-dependencies:3.2.0')
+    compileOnly group: 'org.projectlombok', name: 'lombok', version: '1.18.30'
+    testImplementation "org.junit.jupiter:junit-jupiter:5.10.0"
+}
+"""
+
+KOTLIN_BUILD = """
+plugins { java }
+java { toolchain { languageVersion.set(JavaLanguageVersion.of(21)) } }
+dependencies {
+    implementation(libs.spring.web)
+    testRuntimeOnly("org.junit.platform:junit-platform-launcher")
+}
+"""
+
+CATALOG = """
+[versions]
+spring = "6.1.2"
+
+[libraries]
+spring-web = { module = "org.springframework:spring-web", version.ref = "spring" }
+"""
+
+
+def _coords(deps):
+    return [(d["groupId"], d["artifactId"], d["version"], d["scope"]) for d in deps]
+
+
+class TestParseGradleBuild:
+    def test_groovy_dsl(self):
+        parsed = parse_gradle_build(GROOVY_BUILD)
+        assert parsed["java_version"] == "1.8"
+        assert parsed["group"] == "com.example"
+        assert parsed["version"] == "1.2.0"
+        assert _coords(parsed["dependencies"]) == [
+            ("org.springframework.boot", "spring-boot-starter-web", "managed", "compile"),
+            ("org.springframework.boot", "spring-boot-dependencies", "3.2.0", "compile"),
+            ("org.projectlombok", "lombok", "1.18.30", "provided"),
+            ("org.junit.jupiter", "junit-jupiter", "5.10.0", "test"),
+        ]
+
+    def test_kotlin_dsl_with_catalog(self):
+        catalog = {"spring.web": {"groupId": "org.springframework", "artifactId": "spring-web",
+                                  "version": "6.1.2"}}
+        parsed = parse_gradle_build(KOTLIN_BUILD, catalog)
+        assert parsed["java_version"] == "21"
+        assert _coords(parsed["dependencies"]) == [
+            ("org.springframework", "spring-web", "6.1.2", "compile"),
+            ("org.junit.platform", "junit-platform-launcher", "managed", "test"),
+        ]
+
+
+class TestSettings:
+    def test_includes_and_project_dir(self):
+        settings = parse_gradle_settings(
+            "rootProject.name = 'shop'\n"
+            "include 'core', ':services:billing'\n"
+            "include(\":web\")\n"
+            "project(':web').projectDir = file('apps/web')\n"
+        )
+        assert settings["root_name"] == "shop"
+        assert settings["projects"] == {
+            ":core": "core", ":services:billing": "services/billing", ":web": "apps/web",
+        }
+
+
+def _multi_project(tmp_path):
+    (tmp_path / "settings.gradle.kts").write_text(
+        'rootProject.name = "shop"\ninclude("core", "web")\n'
+    )
+    (tmp_path / "gradle").mkdir()
+    (tmp_path / "gradle/libs.versions.toml").write_text(CATALOG)
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core/build.gradle.kts").write_text(KOTLIN_BUILD)
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web/build.gradle").write_text(GROOVY_BUILD)
+    return tmp_path
+
+
+class TestReadGradleBuild:
+    def test_multi_project_merges_subprojects(self, tmp_path):
+        build = read_gradle_build(_multi_project(tmp_path))
+        assert build["module_info"] == {
+            "groupId": "com.example", "artifactId": "shop", "version": "1.2.0",
+        }
+        assert build["java_version"] == "21"
+        assert build["subprojects"] == [":core", ":web"]
+        artifacts = [d["artifactId"] for d in build["dependencies"]]
+        assert artifacts[:2] == ["spring-web", "junit-platform-launcher"]
+        assert "spring-boot-starter-web" in artifacts
+
+    def test_is_gradle_project(self, tmp_path):
+        assert not is_gradle_project(tmp_path)
+        _multi_project(tmp_path)
+        assert is_gradle_project(tmp_path)
+        (tmp_path / "pom.xml").write_text("<project/>")
+        assert not is_gradle_project(tmp_path)
+
+
+class TestGradleProjectPath:
+    def test_owning_project(self, tmp_path):
+        _multi_project(tmp_path)
+        assert gradle_project_path(tmp_path, "core/src/test/java/a/FooTest.java") == ":core"
+        assert gradle_project_path(tmp_path, "web/src/main/java/a/Web.java") == ":web"
+        assert gradle_project_path(tmp_path, "src/test/java/a/RootTest.java") == ""
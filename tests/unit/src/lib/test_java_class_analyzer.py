@@ -1,6 +1,6 @@
 """Unit tests for src.java.class_analyzer."""
 
-
+import pytest
 
 from src.java.class_analyzer import (
     _extract_extends_implements,
@@ -8,7 +8,10 @@ from src.java.class_analyzer import (
     analyze_java_class,
     build_class_index,
     extract_test_examples,
+    update_class_index,
 )
+from src.java.parsing_utils import mask_java_source, parse_java_source
+from src.test_generation.generate_unit import _analyze_class
 
 # ---------------------------------------------------------------------------
 # _extract_extends_implements
@@ -171,6 +174,66 @@ class TestAnalyzeJavaClass:
 # build_class_index
 # ---------------------------------------------------------------------------
 
+NOISY_SOURCE = """\
+package com.example.web;
+
+// @Service
+/* public class Decoy extends Nothing {
+ *   public void ghost(String s) {}
+ * }
+ */
+@RestController
+public class OwnerController {
+    private static final String HELP = "public void fake(int x) { } // not code";
+    private final char paren = ')';
+
+    public Owner find(@PathVariable("ownerId") int ownerId, String q) {
+        return null; // public void trailing() {}
+    }
+}
+"""
+
+
+class TestMaskedParsing:
+    def test_mask_preserves_offsets_and_lines(self):
+        masked = mask_java_source(NOISY_SOURCE)
+        assert len(masked) == len(NOISY_SOURCE)
+        assert masked.count("\n") == NOISY_SOURCE.count("\n")
+        assert "Decoy" not in masked
+        assert "fake" not in masked
+        assert '"ownerId"' not in masked and '"       "' in masked
+
+    def test_comments_and_strings_are_ignored(self):
+        entry = analyze_java_class(NOISY_SOURCE)
+        assert entry["class_name"] == "OwnerController"
+        assert entry["extends"] is None
+        assert entry["annotations"] == ["RestController"]
+        assert [m["name"] for m in entry["methods"]] == ["find"]
+        assert "ghost" not in entry["public_signatures"]
+        assert "fake" not in entry["public_signatures"]
+
+    def test_parameters_keep_original_text(self):
+        entry = analyze_java_class(NOISY_SOURCE)
+        params = entry["methods"][0]["parameters"]
+        assert params == '@PathVariable("ownerId") int ownerId, String q'
+        assert '@PathVariable("ownerId") int ownerId' in entry["public_signatures"]
+
+    def test_generator_and_index_share_one_parse(self):
+        parse_java_source.cache_clear()
+        analyze_java_class(SERVICE_SOURCE)
+        info = _analyze_class(SERVICE_SOURCE)
+        assert parse_java_source.cache_info().hits == 1
+        assert info["methods"] == analyze_java_class(SERVICE_SOURCE)["methods"]
+
+    def test_callers_get_independent_copies(self):
+        first = analyze_java_class(SERVICE_SOURCE)
+        first["dependencies"].clear()
+        first["methods"][0]["parsed_params"].clear()
+        second = analyze_java_class(SERVICE_SOURCE)
+        assert second["dependencies"]
+        assert second["methods"][0]["parsed_params"]
+
+
 class TestBuildClassIndex:
     def test_builds_index_from_dir(self, tmp_path):
         java_dir = tmp_path / "src" / "main" / "java"
@@ -200,6 +263,108 @@ class TestBuildClassIndex:
         assert "MyService" in index
         assert index["MyService"]["category"] == "service"
 
+    def test_duplicate_simple_names_are_kept_under_fqn(self, tmp_path):
+        for pkg in ("a", "b"):
+            d = tmp_path / "src" / "main" / "java" / pkg
+            d.mkdir(parents=True)
+            (d / "Mapper.java").write_text(f"package {pkg};\npublic class Mapper {{}}", encoding="utf-8")
+
+        index = build_class_index(
+            str(tmp_path),
+            ["src/main/java/a/Mapper.java", "src/main/java/b/Mapper.java"],
+        )
+
+        # First in (sorted) input order keeps the simple name
+        assert index["Mapper"]["package"] == "a"
+        assert index["Mapper"]["duplicates"] == ["b.Mapper"]
+        assert index["b.Mapper"]["package"] == "b"
+        # One entry per class: counts and the analysis table stay exact
+        assert sorted(index) == ["Mapper", "b.Mapper"]
+
+    def test_parallel_build_matches_serial(self, tmp_path):
+        java_dir = tmp_path / "src" / "main" / "java"
+        java_dir.mkdir(parents=True)
+        files = []
+        for i in range(20):
+            (java_dir / f"C{i}.java").write_text(
+                f"public class C{i} {{ public int v{i}() {{ return {i}; }} }}", encoding="utf-8"
+            )
+            files.append(f"src/main/java/C{i}.java")
+
+        serial = build_class_index(str(tmp_path), files, workers=1)
+        parallel = build_class_index(str(tmp_path), files, workers=2)
+
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+
+
+class TestUpdateClassIndex:
+    FILES = ["src/main/java/Base.java", "src/main/java/Child.java", "src/main/java/Other.java"]
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        java_dir = tmp_path / "src" / "main" / "java"
+        java_dir.mkdir(parents=True)
+        (java_dir / "Base.java").write_text("public abstract class Base {}", encoding="utf-8")
+        (java_dir / "Child.java").write_text("public class Child extends Base {}", encoding="utf-8")
+        (java_dir / "Other.java").write_text("public class Other {}", encoding="utf-8")
+        return tmp_path
+
+    @staticmethod
+    def _age_cache(project):
+        """Move the cache write time into the past (outside the racy window)."""
+        import json
+        path = project / ".testboost" / "class_index_cache.json"
+        data = json.loads(path.read_text())
+        data["written_at_ns"] += 10 * 10**9
+        path.write_text(json.dumps(data))
+
+    def test_first_run_parses_everything(self, project):
+        index, stats = update_class_index(str(project), self.FILES)
+        assert set(index) == {"Base", "Child", "Other"}
+        assert stats == {"reused": 0, "reparsed": 3, "removed": 0}
+        assert "class_index_cache.json" in (project / ".testboost" / ".gitignore").read_text()
+
+    def test_unchanged_files_are_reused(self, project):
+        first, _ = update_class_index(str(project), self.FILES)
+        self._age_cache(project)
+        second, stats = update_class_index(str(project), self.FILES)
+        assert second == first
+        assert stats["reused"] == 3 and stats["reparsed"] == 0
+
+    def test_touched_but_identical_file_is_reused(self, project):
+        import os
+        update_class_index(str(project), self.FILES)
+        self._age_cache(project)
+        other = project / "src/main/java/Other.java"
+        os.utime(other, ns=(1, 1))
+        _, stats = update_class_index(str(project), self.FILES)
+        assert stats["reused"] == 3
+
+    def test_changed_parent_invalidates_children(self, project):
+        update_class_index(str(project), self.FILES)
+        self._age_cache(project)
+        (project / "src/main/java/Base.java").write_text(
+            "public abstract class Base { public void hook() {} }", encoding="utf-8"
+        )
+        index, stats = update_class_index(str(project), self.FILES)
+        assert stats == {"reused": 1, "reparsed": 2, "removed": 0}
+        assert index["Base"]["methods"][0]["name"] == "hook"
+
+    def test_deleted_file_is_dropped(self, project):
+        update_class_index(str(project), self.FILES)
+        self._age_cache(project)
+        index, stats = update_class_index(str(project), self.FILES[:1] + self.FILES[2:])
+        assert "Child" not in index
+        assert stats["removed"] == 1
+
+    def test_full_ignores_cache(self, project):
+        update_class_index(str(project), self.FILES)
+        self._age_cache(project)
+        _, stats = update_class_index(str(project), self.FILES, full=True)
+        assert stats["reparsed"] == 3
+
 
 # ---------------------------------------------------------------------------
 # extract_test_examples
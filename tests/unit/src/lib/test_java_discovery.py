@@ -60,3 +60,52 @@ class TestFindExistingTest:
             str(java_project), "src/main/java/com/example/service/OrderService.java"
         )
         assert result is None
+
+
+class TestExistingTestIndex:
+    def _write(self, root, rel):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("class X {}")
+
+    def test_same_package_wins_over_other_package(self, tmp_path):
+        from src.java.discovery import ExistingTestIndex
+
+        self._write(tmp_path, "src/test/java/com/a/FooTest.java")
+        self._write(tmp_path, "src/test/java/com/b/FooTest.java")
+        index = ExistingTestIndex.from_project(str(tmp_path))
+
+        result = index.find("src/main/java/com/b/Foo.java")
+
+        assert Path(result).as_posix() == "src/test/java/com/b/FooTest.java"
+
+    def test_falls_back_to_any_package_then_naming_order(self, tmp_path):
+        from src.java.discovery import ExistingTestIndex
+
+        self._write(tmp_path, "src/test/java/com/z/TestFoo.java")
+        self._write(tmp_path, "src/test/java/com/y/FooTests.java")
+        index = ExistingTestIndex.from_project(str(tmp_path))
+
+        result = index.find("src/main/java/com/x/Foo.java")
+
+        assert Path(result).as_posix() == "src/test/java/com/y/FooTests.java"
+
+    def test_module_test_root(self, tmp_path):
+        self._write(tmp_path, "core/src/test/java/com/x/FooTest.java")
+
+        result = find_existing_test(str(tmp_path), "core/src/main/java/com/x/Foo.java")
+
+        assert Path(result).as_posix() == "core/src/test/java/com/x/FooTest.java"
+
+    def test_prebuilt_index_is_reused(self, tmp_path):
+        from unittest.mock import patch
+
+        from src.java.discovery import ExistingTestIndex
+
+        self._write(tmp_path, "src/test/java/com/x/FooTest.java")
+        index = ExistingTestIndex.from_project(str(tmp_path))
+
+        with patch.object(ExistingTestIndex, "from_project") as rebuild:
+            find_existing_test(str(tmp_path), "src/main/java/com/x/Foo.java", index=index)
+
+        rebuild.assert_not_called()
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.java.modules (build module discovery)."""
+
+from src.java.modules import discover_modules, find_module, module_for_path
+from src.lib.project_index import scan_project
+
+PARENT_POM = """<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <artifactId>shop-parent</artifactId>
+  <modules><module>core</module><module>services</module></modules>
+  <profiles><profile><modules><module>tools/pom.xml</module></modules></profile></profiles>
+</project>"""
+
+
+def _pom(artifact_id, modules=""):
+    return (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        f"<artifactId>{artifact_id}</artifactId>{modules}</project>"
+    )
+
+
+def _write(path, content="class A {}"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _paths(modules):
+    return [(m["path"], m["name"]) for m in modules]
+
+
+class TestDiscoverModules:
+    def test_maven_reactor_nested_and_profiles(self, tmp_path):
+        _write(tmp_path / "pom.xml", PARENT_POM)
+        _write(tmp_path / "core/pom.xml", _pom("core"))
+        _write(tmp_path / "services/pom.xml", _pom("services", "<modules><module>billing</module></modules>"))
+        _write(tmp_path / "services/billing/pom.xml", _pom("billing"))
+        _write(tmp_path / "tools/pom.xml", _pom("tools"))
+        modules = discover_modules(tmp_path, scan_project(str(tmp_path)))
+        assert _paths(modules) == [
+            ("", "shop-parent"), ("core", "core"), ("services", "services"),
+            ("services/billing", "billing"), ("tools", "tools"),
+        ]
+        assert modules[3]["build_file"] == "services/billing/pom.xml"
+
+    def test_gradle_settings(self, tmp_path):
+        _write(tmp_path / "settings.gradle", "rootProject.name = 'shop'\ninclude 'core', 'web'\n")
+        _write(tmp_path / "core/build.gradle", "plugins { id 'java' }")
+        modules = discover_modules(tmp_path, scan_project(str(tmp_path)))
+        assert _paths(modules) == [("", "shop"), ("core", ":core"), ("web", ":web")]
+        assert modules[2]["build_file"] == ""
+
+    def test_undeclared_source_trees_are_modules(self, tmp_path):
+        _write(tmp_path / "pom.xml", _pom("app"))
+        _write(tmp_path / "src/main/java/a/A.java")
+        _write(tmp_path / "legacy/src/main/java/b/B.java")
+        modules = discover_modules(tmp_path, scan_project(str(tmp_path)))
+        assert _paths(modules) == [("", "app"), ("legacy", "legacy")]
+
+
+class TestModuleForPath:
+    def test_innermost_module_wins(self):
+        paths = ["", "services", "services/billing"]
+        assert module_for_path(paths, "services/billing/src/main/java/A.java") == "services/billing"
+        assert module_for_path(paths, "services/src/main/java/S.java") == "services"
+        assert module_for_path(paths, "src/main/java/R.java") == ""
+        assert module_for_path(paths, "servicesx/A.java") == ""
+
+    def test_find_module(self):
+        modules = [{"path": "", "name": "root"}, {"path": "core", "name": "core"}]
+        assert find_module(modules, "core/src/main/java/A.java")["name"] == "core"
+        assert find_module(modules, "README.md")["name"] == "root"
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.junit_reports (JUnit XML test results)."""
+
+import os
+import time
+
+from src.lib.junit_reports import (
+    CaseResult,
+    build_module_dir,
+    collect_results,
+    find_junit_reports,
+    format_failures,
+    format_summary,
+    parse_junit_xml,
+    summarize,
+    trim_trace,
+)
+
+SUREFIRE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="com.example.OrderServiceTest" time="0.31" tests="4" errors="1" skipped="1" failures="1">
+  <properties><property name="java.version" value="21"/></properties>
+  <testcase name="total" classname="com.example.OrderServiceTest" time="0.012">
+    <failure message="expected: &lt;100&gt; but was: &lt;99&gt;" type="org.opentest4j.AssertionFailedError">\
+org.opentest4j.AssertionFailedError: expected: &lt;100&gt; but was: &lt;99&gt;
+\tat org.junit.jupiter.api.AssertionFailureBuilder.build(AssertionFailureBuilder.java:151)
+\tat org.junit.jupiter.api.AssertEquals.assertEquals(AssertEquals.java:150)
+\tat com.example.OrderServiceTest.total(OrderServiceTest.java:42)
+\tat java.base/java.lang.reflect.Method.invoke(Method.java:580)
+\tat org.junit.platform.commons.util.ReflectionUtils.invokeMethod(ReflectionUtils.java:728)
+</failure>
+    <system-out>noise</system-out>
+  </testcase>
+  <testcase name="create" classname="com.example.OrderServiceTest" time="1,204.5">
+    <error message="boom" type="java.lang.IllegalStateException">java.lang.IllegalStateException: boom
+\tat com.example.OrderService.create(OrderService.java:17)
+\tat com.example.OrderServiceTest.create(OrderServiceTest.java:30)
+Caused by: java.io.IOException: disk
+\tat com.example.Store.write(Store.java:9)
+\t... 12 more
+</error>
+  </testcase>
+  <testcase name="cancel" classname="com.example.OrderServiceTest$WhenPaid" time="0.001">
+    <skipped/>
+  </testcase>
+  <testcase name="list" classname="com.example.OrderServiceTest" time="0.002"/>
+</testsuite>
+"""
+
+PYTEST_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="0" failures="1" skipped="0" tests="2">
+<testcase classname="tests.test_orders" name="test_total" time="0.004">\
+<failure message="assert 99 == 100">tests/test_orders.py:12: in test_total
+    assert total() == 100
+E   assert 99 == 100</failure></testcase>
+<testcase classname="tests.test_orders" name="test_list" time="0.001" />
+</testsuite></testsuites>
+"""
+
+
+def _report(directory, name, content, age=None):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(content, encoding="utf-8")
+    if age is not None:
+        past = time.time() - age
+        os.utime(path, (past, past))
+    return path
+
+
+class TestParse:
+    def test_surefire_report(self, tmp_path):
+        results = parse_junit_xml(_report(tmp_path, "TEST-com.example.OrderServiceTest.xml", SUREFIRE_XML))
+
+        assert [(r.name, r.status) for r in results] == [
+            ("total", "failed"), ("create", "error"), ("cancel", "skipped"), ("list", "passed"),
+        ]
+        total = results[0]
+        assert total.message == "expected: <100> but was: <99>"
+        assert total.failure_type == "org.opentest4j.AssertionFailedError"
+        assert total.time == 0.012
+        assert results[1].time == 1204.5
+        assert results[2].simple_class_name == "OrderServiceTest"
+        assert summarize(results) == {
+            "tests": 4, "passed": 1, "failed": 1, "error": 1, "skipped": 1, "time": 1204.515,
+        }
+
+    def test_pytest_report(self, tmp_path):
+        results = parse_junit_xml(_report(tmp_path, "report.xml", PYTEST_XML))
+        assert [(r.class_name, r.name, r.status) for r in results] == [
+            ("tests.test_orders", "test_total", "failed"),
+            ("tests.test_orders", "test_list", "passed"),
+        ]
+        assert "E   assert 99 == 100" in trim_trace(results[0])
+
+    def test_malformed_report_gives_no_results(self, tmp_path):
+        assert parse_junit_xml(_report(tmp_path, "TEST-x.xml", "<testsuite><testcase")) == []
+        assert parse_junit_xml(tmp_path / "missing.xml") == []
+
+
+class TestFormatting:
+    def test_trace_keeps_throwing_and_test_frames(self, tmp_path):
+        total, create = parse_junit_xml(_report(tmp_path, "TEST-a.xml", SUREFIRE_XML))[:2]
+
+        assert trim_trace(total).splitlines() == [
+            "org.opentest4j.AssertionFailedError: expected: <100> but was: <99>",
+            "\tat org.junit.jupiter.api.AssertionFailureBuilder.build(AssertionFailureBuilder.java:151)",
+            "\t... 1 more",
+            "\tat com.example.OrderServiceTest.total(OrderServiceTest.java:42)",
+            "\t... 2 more",
+        ]
+        assert trim_trace(create).splitlines() == [
+            "java.lang.IllegalStateException: boom",
+            "\tat com.example.OrderService.create(OrderService.java:17)",
+            "\tat com.example.OrderServiceTest.create(OrderServiceTest.java:30)",
+            "Caused by: java.io.IOException: disk",
+            "\tat com.example.Store.write(Store.java:9)",
+        ]
+
+    def test_failures_only_and_capped(self):
+        long_trace = "\n".join(f"line {i}" for i in range(100))
+        results = [
+            CaseResult("a.ATest", "ok", "passed"),
+            CaseResult("a.ATest", "bad", "failed", message="x" * 600, trace=long_trace),
+        ]
+        text = format_failures(results, max_lines=5)
+        assert text.startswith("a.ATest.bad (FAILED): " + "x" * 500 + "...\nline 0\n")
+        assert text.endswith("line 4\n... (95 more lines)")
+        assert "ok" not in text
+        assert format_summary(summarize(results)) == "2 tests: 1 passed, 1 failed (0.0s)"
+
+
+class TestFindReports:
+    def test_only_report_dirs_and_recent_files(self, tmp_path):
+        fresh = _report(tmp_path / "core" / "target" / "surefire-reports", "TEST-a.ATest.xml", SUREFIRE_XML)
+        gradle = _report(tmp_path / "api" / "build" / "test-results" / "test", "TEST-b.BTest.xml", PYTEST_XML)
+        _report(tmp_path / "core" / "target" / "surefire-reports", "TEST-a.OldTest.xml", SUREFIRE_XML, age=600)
+        _report(tmp_path / "core" / "target" / "surefire-reports", "a.ATest.txt", "")
+        _report(tmp_path / "src" / "test" / "resources" / "test-results", "TEST-fixture.xml", SUREFIRE_XML)
+
+        since = time.time_ns()
+        assert find_junit_reports(tmp_path, since_ns=since) == sorted([fresh, gradle])
+        assert len(find_junit_reports(tmp_path)) == 3
+        assert len(collect_results(find_junit_reports(tmp_path, since_ns=since))) == 6
+
+    def test_build_module_dir(self, tmp_path):
+        (tmp_path / "pom.xml").write_text("<project/>")
+        (tmp_path / "core").mkdir()
+        (tmp_path / "core" / "pom.xml").write_text("<project/>")
+        test_file = "core/src/test/java/a/ATest.java"
+        assert build_module_dir(tmp_path, test_file) == tmp_path.resolve() / "core"
+        assert build_module_dir(tmp_path, "src/test/java/a/BTest.java") == tmp_path.resolve()
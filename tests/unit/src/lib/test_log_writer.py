@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.log_writer (buffered session log writer)."""
+
+import io
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.lib.log_writer import SessionLogWriter, log_file_header, tail_log_entries
+
+DAY = "2026-10-18"
+
+
+@pytest.fixture
+def writer():
+    w = SessionLogWriter(max_batch=1000, interval=60)
+    yield w
+    w.close(timeout=5)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestSessionLogWriter:
+    def test_flush_writes_header_and_entries_in_order(self, writer, tmp_path):
+        logs = tmp_path / "logs"
+        for i in range(50):
+            writer.submit(logs, DAY, f"| line {i} |\n")
+        assert not (logs / f"{DAY}.md").exists()
+
+        assert writer.flush(timeout=5)
+        content = (logs / f"{DAY}.md").read_text()
+        assert content.startswith(log_file_header(DAY))
+        lines = content[len(log_file_header(DAY)):].splitlines()
+        assert lines == [f"| line {i} |" for i in range(50)]
+
+    def test_batch_opens_each_file_once(self, writer, tmp_path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        for i in range(10):
+            writer.submit(a, DAY, f"| a{i} |\n")
+        for i in range(10):
+            writer.submit(b, DAY, f"| b{i} |\n")
+        with patch("builtins.open", wraps=open) as opened:
+            writer.flush(timeout=5)
+        assert opened.call_count == 2
+        assert (a / f"{DAY}.md").read_text().count("| a") == 10
+        assert (b / f"{DAY}.md").read_text().count("| b") == 10
+
+    def test_urgent_entry_is_written_without_flush(self, writer, tmp_path):
+        logs = tmp_path / "logs"
+        writer.submit(logs, DAY, "| queued |\n")
+        writer.submit(logs, DAY, "| ERROR boom |\n", urgent=True)
+        log_file = logs / f"{DAY}.md"
+        assert _wait_for(lambda: log_file.exists() and "boom" in log_file.read_text())
+        assert log_file.read_text().index("queued") < log_file.read_text().index("boom")
+
+    def test_full_batch_and_interval_trigger_writes(self, tmp_path):
+        by_size = SessionLogWriter(max_batch=3, interval=60)
+        by_time = SessionLogWriter(max_batch=1000, interval=0.05)
+        try:
+            for i in range(3):
+                by_size.submit(tmp_path / "size", DAY, f"| {i} |\n")
+            by_time.submit(tmp_path / "time", DAY, "| late |\n")
+            assert _wait_for(lambda: (tmp_path / "size" / f"{DAY}.md").exists())
+            assert _wait_for(lambda: (tmp_path / "time" / f"{DAY}.md").exists())
+        finally:
+            by_size.close(timeout=5)
+            by_time.close(timeout=5)
+
+    def test_close_writes_pending_entries(self, tmp_path):
+        w = SessionLogWriter(max_batch=1000, interval=60)
+        w.submit(tmp_path / "logs", DAY, "| last words |\n")
+        w.close(timeout=5)
+        assert "last words" in (tmp_path / "logs" / f"{DAY}.md").read_text()
+
+    def test_unwritable_directory_does_not_stop_the_writer(self, writer, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        writer.submit(blocker / "logs", DAY, "| lost |\n")
+        writer.submit(tmp_path / "logs", DAY, "| kept |\n")
+        assert writer.flush(timeout=5)
+        assert "kept" in (tmp_path / "logs" / f"{DAY}.md").read_text()
+
+
+class TestTailLogEntries:
+    def _log(self, tmp_path, rows, newline="\n"):
+        f = tmp_path / f"{DAY}.md"
+        body = log_file_header(DAY) + "".join(
+            f"| 10:00:{i:02d} | INFO | generation | entry {i} é |\n" for i in range(rows)
+        )
+        f.write_bytes(body.replace("\n", newline).encode("utf-8"))
+        return f
+
+    def test_matches_a_full_read_across_block_boundaries(self, tmp_path):
+        f = self._log(tmp_path, 60)
+        expected = [
+            ln for ln in f.read_text(encoding="utf-8").split("\n")
+            if ln.startswith("|") and not ln.startswith("| Time") and not ln.startswith("|---")
+        ][-10:]
+        for block_size in (7, 64, 8192):
+            assert tail_log_entries(f, 10, block_size=block_size) == expected
+
+    def test_short_log_and_crlf(self, tmp_path):
+        f = self._log(tmp_path, 3, newline="\r\n")
+        rows = tail_log_entries(f, 10, block_size=16)
+        assert rows == [f"| 10:00:0{i} | INFO | generation | entry {i} é |" for i in range(3)]
+        empty = tmp_path / "empty.md"
+        empty.write_text("")
+        assert tail_log_entries(empty) == []
+
+    def test_reads_only_the_end_of_a_large_log(self, tmp_path, monkeypatch):
+        from src.lib import log_writer
+
+        f = self._log(tmp_path, 50_000)
+        bytes_read = []
+
+        class _Tracked(io.FileIO):
+            def read(self, size=-1):
+                data = super().read(size)
+                bytes_read.append(len(data))
+                return data
+
+        monkeypatch.setattr(log_writer, "open", lambda path, mode: _Tracked(path, "r"), raising=False)
+        rows = tail_log_entries(f, 10)
+        assert "entry 49990 " in rows[0] and "entry 49999 " in rows[-1]
+        assert f.stat().st_size > 2_000_000
+        assert sum(bytes_read) <= 8192
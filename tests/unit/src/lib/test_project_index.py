@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.project_index (pruned filesystem index)."""
+
+import json
+import os
+import time
+
+from src.lib.project_index import (
+    get_project_index,
+    load_project_index,
+    scan_project,
+    settle_project_index,
+    update_project_index,
+)
+
+
+def _touch(path, content="class X {}"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _age(index, seconds=10):
+    """Pretend the index was built long ago so the racy window does not apply."""
+    index.dirs = {d: m - seconds * 10**9 for d, m in index.dirs.items()}
+    for d, m in index.dirs.items():
+        os.utime(os.path.join(index.root, d), ns=(m, m))
+    return index
+
+
+class TestScanProject:
+    def test_indexes_sources_tests_and_build_files(self, tmp_path):
+        (tmp_path / "pom.xml").write_text("<project/>")
+        _touch(tmp_path / "src/main/java/com/x/Foo.java")
+        _touch(tmp_path / "src/test/java/com/x/FooTest.java")
+        (tmp_path / "README.md").write_text("ignored")
+
+        index = scan_project(str(tmp_path))
+
+        assert index.java_sources() == ["src/main/java/com/x/Foo.java"]
+        assert index.java_tests() == ["src/test/java/com/x/FooTest.java"]
+        assert index.build_files("pom.xml") == ["pom.xml"]
+        assert "README.md" not in index.files
+        size, mtime_ns = index.files["src/main/java/com/x/Foo.java"]
+        assert size == len("class X {}") and mtime_ns > 0
+
+    def test_prunes_vcs_and_build_output(self, tmp_path):
+        (tmp_path / "pom.xml").write_text("<project/>")
+        _touch(tmp_path / "src/main/java/Foo.java")
+        _touch(tmp_path / "target/generated-sources/src/main/java/Gen.java")
+        _touch(tmp_path / ".git/objects/Blob.java")
+        _touch(tmp_path / "web/node_modules/pkg/Dep.java")
+
+        index = scan_project(str(tmp_path))
+
+        assert index.java_sources() == ["src/main/java/Foo.java"]
+        assert not any(d.startswith(("target", ".git")) for d in index.dirs)
+
+    def test_keeps_packages_named_like_build_dirs(self, tmp_path):
+        """`build`/`target` are only pruned next to a build file."""
+        (tmp_path / "pom.xml").write_text("<project/>")
+        _touch(tmp_path / "src/main/java/com/x/build/Builder.java")
+
+        index = scan_project(str(tmp_path))
+
+        assert "src/main/java/com/x/build/Builder.java" in index.files
+
+    def test_multi_module_roots(self, tmp_path):
+        (tmp_path / "pom.xml").write_text("<project/>")
+        for module in ("core", "web"):
+            (tmp_path / module).mkdir()
+            (tmp_path / module / "pom.xml").write_text("<project/>")
+            _touch(tmp_path / module / "src/main/java/A.java")
+
+        index = scan_project(str(tmp_path))
+
+        assert index.source_roots() == ["core/src/main/java", "web/src/main/java"]
+
+
+class TestPersistence:
+    def test_written_to_testboost_and_gitignored(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        _touch(tmp_path / "src/main/java/Foo.java")
+
+        get_project_index(tmp_path, refresh=True)
+
+        data = json.loads((tmp_path / ".testboost" / "fs_index.json").read_text())
+        assert "src/main/java/Foo.java" in data["files"]
+        assert "fs_index.json" in (tmp_path / ".testboost" / ".gitignore").read_text()
+        assert load_project_index(str(tmp_path)) is not None
+
+    def test_unchanged_tree_is_current(self, tmp_path):
+        _touch(tmp_path / "src/main/java/Foo.java")
+        index = _age(scan_project(str(tmp_path)))
+        assert index.is_current()
+
+    def test_new_file_makes_index_stale(self, tmp_path):
+        _touch(tmp_path / "src/main/java/Foo.java")
+        index = _age(scan_project(str(tmp_path)))
+
+        _touch(tmp_path / "src/main/java/Bar.java")
+
+        assert not index.is_current()
+        assert "src/main/java/Bar.java" in get_project_index(tmp_path).files
+
+    def test_racy_directory_is_never_trusted(self, tmp_path):
+        _touch(tmp_path / "src/main/java/Foo.java")
+        index = scan_project(str(tmp_path))
+        # Directories were modified within the mtime-granularity window
+        assert not index.is_current()
+
+
+class TestIncrementalUpdate:
+    """Changes reported by ``testboost watch`` are applied without a rescan."""
+
+    def _project(self, tmp_path):
+        (tmp_path / ".testboost").mkdir()
+        (tmp_path / "pom.xml").write_text("<project/>")
+        _touch(tmp_path / "src/main/java/com/x/Foo.java")
+        return _age(get_project_index(tmp_path))
+
+    def test_files_added_and_removed(self, tmp_path):
+        self._project(tmp_path)
+        _touch(tmp_path / "src/main/java/com/x/Bar.java")
+        (tmp_path / "src/main/java/com/x/Foo.java").unlink()
+
+        index = update_project_index(
+            tmp_path, ["src/main/java/com/x/Bar.java", "src/main/java/com/x/Foo.java"],
+        )
+
+        assert index.java_sources() == ["src/main/java/com/x/Bar.java"]
+        assert load_project_index(str(tmp_path)).files == index.files
+
+    def test_new_directory_is_walked_and_removed_directory_dropped(self, tmp_path):
+        self._project(tmp_path)
+        _touch(tmp_path / "src/main/java/com/x/sub/A.java")
+        _touch(tmp_path / "src/main/java/com/x/sub/deep/B.java")
+
+        index = update_project_index(tmp_path, ["src/main/java/com/x/sub"])
+        assert "src/main/java/com/x/sub/deep/B.java" in index.files
+        assert "src/main/java/com/x/sub/deep" in index.dirs
+
+        for f in ("sub/deep/B.java", "sub/A.java"):
+            (tmp_path / "src/main/java/com/x" / f).unlink()
+        (tmp_path / "src/main/java/com/x/sub/deep").rmdir()
+        (tmp_path / "src/main/java/com/x/sub").rmdir()
+        index = update_project_index(tmp_path, ["src/main/java/com/x/sub"])
+        assert index.java_sources() == ["src/main/java/com/x/Foo.java"]
+        assert not any(d.startswith("src/main/java/com/x/sub") for d in index.dirs)
+
+    def test_live_index_is_trusted_in_process(self, tmp_path):
+        index = self._project(tmp_path)
+        index.live = True
+        _touch(tmp_path / "src/main/java/com/x/Unreported.java")
+        assert get_project_index(tmp_path) is index
+
+    def test_settle_waits_for_racy_window(self, tmp_path):
+        self._project(tmp_path)
+        _touch(tmp_path / "src/main/java/com/x/Bar.java")
+        update_project_index(tmp_path, ["src/main/java/com/x/Bar.java"])
+
+        assert not settle_project_index(tmp_path, ["src/main/java"])
+        assert not load_project_index(str(tmp_path)).is_current()
+
+        old = time.time_ns() - 10 * 10**9
+        os.utime(tmp_path / "src/main/java/com/x", ns=(old, old))
+        assert settle_project_index(tmp_path, ["src/main/java"])
+        assert load_project_index(str(tmp_path)).is_current()
+
+    def test_settle_rescans_on_unwatched_change(self, tmp_path):
+        self._project(tmp_path)
+        _touch(tmp_path / "module/pom.xml", "<project/>")
+
+        assert not settle_project_index(tmp_path, ["src/main/java"])
+        assert "module/pom.xml" in get_project_index(tmp_path).files
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.report_writer."""
+
+from src.lib.report_writer import ReportWriter, reset_sidecar_dir, table_or_pages, write_table_pages
+
+
+class TestReportWriter:
+    def test_renders_markdown(self):
+        report = ReportWriter()
+        report.heading("Structure")
+        report.bullet("Classes", 3)
+        report.table(["A", "B"], [(1, "x"), (2, "y")])
+        assert report.getvalue() == (
+            "## Structure\n\n- **Classes**: 3\n"
+            "| A | B |\n|---|---|\n| 1 | x |\n| 2 | y |\n\n"
+        )
+        # getvalue is repeatable and the writer keeps accepting parts
+        report.line("end")
+        assert report.getvalue().endswith("\n\nend\n")
+
+
+class TestTablePages:
+    def test_pages_are_linked(self, tmp_path):
+        pages = write_table_pages(tmp_path, "rows", "Rows", ["N"], ((i,) for i in range(5)), page_size=2)
+        assert [p.name for p in pages] == ["rows-001.md", "rows-002.md", "rows-003.md"]
+        first, middle, last = (p.read_text() for p in pages)
+        assert first.startswith("# Rows (page 1)") and "| 1 |" in first
+        assert "[Next page](rows-002.md)" in first
+        assert "[Previous page](rows-001.md)" in middle and "[Next page](rows-003.md)" in middle
+        assert "| 4 |" in last and "Next page" not in last
+
+    def test_no_rows_no_pages(self, tmp_path):
+        assert write_table_pages(tmp_path, "rows", "Rows", ["N"], []) == []
+
+    def test_small_table_inlined(self, tmp_path):
+        report = ReportWriter()
+        assert table_or_pages(report, tmp_path / "side", "rows", "Rows", ["N"], [(1,)], tmp_path) == []
+        assert "| 1 |" in report.getvalue()
+        assert not (tmp_path / "side").exists()
+
+    def test_large_table_moved_to_pages(self, tmp_path):
+        report = ReportWriter()
+        rows = [(i,) for i in range(5)]
+        pages = table_or_pages(
+            report, tmp_path / "side", "rows", "Rows", ["N"], rows, tmp_path, page_size=2,
+        )
+        content = report.getvalue()
+        assert len(pages) == 3
+        assert "| 1 |" not in content
+        assert "- [Page 3](side/rows-003.md)" in content
+
+        reset_sidecar_dir(tmp_path / "side")
+        assert not (tmp_path / "side").exists()
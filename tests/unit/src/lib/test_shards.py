@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.shards (partitioning of generation runs)."""
+
+import pytest
+
+from src.lib.shards import get_shard_dir, list_shard_dirs, parse_shard, select_shard, shard_of
+
+FILES = [f"src/main/java/com/example/Service{i}.java" for i in range(200)]
+
+
+class TestParseShard:
+    def test_valid(self):
+        assert parse_shard("2/4") == (2, 4)
+        assert parse_shard(" 1 / 1 ") == (1, 1)
+
+    @pytest.mark.parametrize("spec", ["", "2", "0/4", "5/4", "a/b", "1/0", "-1/2"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_shard(spec)
+
+
+class TestPartition:
+    def test_shards_are_disjoint_and_cover_every_file(self):
+        shards = [select_shard(FILES, i, 4) for i in range(1, 5)]
+        assert sorted(f for shard in shards for f in shard) == sorted(FILES)
+        assert all(shards)
+        # Each shard keeps the order of the input
+        assert all(shard == [f for f in FILES if f in shard] for shard in shards)
+
+    def test_stable_and_separator_independent(self):
+        path = "src/main/java/com/example/OrderService.java"
+        assert shard_of(path, 7) == shard_of(path.replace("/", "\\"), 7)
+        # Fixed values: every runner, platform and hash seed agrees
+        assert [shard_of(f, 4) for f in FILES[:8]] == [3, 3, 3, 2, 1, 4, 1, 4]
+        # Adding files does not move the existing ones
+        assert select_shard(FILES + ["new/File.java"], 2, 4)[:10] == select_shard(FILES, 2, 4)[:10]
+
+
+def test_list_shard_dirs(tmp_path):
+    for index in (1, 2):
+        get_shard_dir(tmp_path, index, 3).mkdir(parents=True)
+    (tmp_path / "shards" / "notes.txt").write_text("")
+    assert list_shard_dirs(tmp_path) == {3: {1: get_shard_dir(tmp_path, 1, 3), 2: get_shard_dir(tmp_path, 2, 3)}}
+    assert list_shard_dirs(tmp_path / "missing") == {}
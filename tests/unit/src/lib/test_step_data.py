@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.step_data (parsed step-file cache and sidecars)."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.lib import step_data
+from src.lib.session_tracker import create_session, init_project, update_step_file
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    init_project(str(tmp_path))
+    return create_session(str(tmp_path))["session_dir"]
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    step_data._cache.clear()
+    yield
+    step_data._cache.clear()
+
+
+def _age(path, seconds=60):
+    """Move a file's mtime out of the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestReadStep:
+    def test_fields_and_status(self, tmp_path):
+        f = tmp_path / "coverage-gaps.md"
+        f.write_text(
+            "---\nstatus: completed\nstep: coverage-gaps\n---\n\n# Gaps\n\n"
+            "```json\n{broken\n```\n\n```json\n{\"gaps\": [\"A.java\"], \"count\": 1}\n```\n"
+        )
+        data = step_data.read_step(f)
+        assert data.status == "completed"
+        assert data.field("gaps") == ["A.java"]
+        assert data.field("missing", 0) == 0
+        assert step_data.step_status(tmp_path / "absent.md") == "unknown"
+
+    def test_parsed_once_until_the_file_changes(self, tmp_path):
+        f = tmp_path / "analysis.md"
+        f.write_text("---\nstatus: completed\n---\n\n```json\n{\"maven_test_cmd\": \"mvn test\"}\n```\n")
+        _age(f)
+        with patch.object(step_data, "parse_step_markdown", wraps=step_data.parse_step_markdown) as parse:
+            for _ in range(3):
+                assert step_data.step_field(f, "maven_test_cmd") == "mvn test"
+            assert parse.call_count == 1
+
+            f.write_text("---\nstatus: completed\n---\n\n```json\n{\"maven_test_cmd\": \"mvn -Pci test\"}\n```\n")
+            assert step_data.step_field(f, "maven_test_cmd") == "mvn -Pci test"
+            assert parse.call_count == 2
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        f = tmp_path / "generation.md"
+        f.write_text("---\nstatus: in_progress\n---\n")
+        step_data.read_step(f)
+        assert str(f) not in step_data._cache
+
+
+class TestSidecar:
+    def test_update_step_file_writes_sidecar_used_by_a_fresh_process(self, session_dir):
+        update_step_file(session_dir, "coverage-gaps", "completed", "# Gaps\n", data={"gaps": ["A.java"]})
+        md = step_data.Path(session_dir) / "coverage-gaps.md"
+        assert step_data.sidecar_path(md).exists()
+
+        with patch.object(step_data, "parse_step_markdown", side_effect=AssertionError("parsed")):
+            assert step_data.coverage_gaps(session_dir) == ["A.java"]
+            assert step_data.step_status(md) == "completed"
+
+    def test_hand_edited_markdown_wins_over_sidecar(self, session_dir):
+        update_step_file(
+            session_dir, "analysis", "completed", "# Analysis\n",
+            data={"maven_compile_cmd": "mvn test-compile", "maven_test_cmd": "mvn test"},
+        )
+        md = step_data.Path(session_dir) / "analysis.md"
+        md.write_text(md.read_text().replace("mvn test-compile", "mvn test-compile -P corp"))
+
+        assert step_data.session_build_commands(session_dir) == ("mvn test-compile -P corp", "mvn test")
+
+
+class TestAccessors:
+    def test_missing_files_give_empty_values(self, session_dir):
+        assert step_data.coverage_gaps(session_dir) == []
+        assert step_data.generated_tests(session_dir) == []
+        assert step_data.session_build_commands(session_dir) == (None, None)
+        assert step_data.session_conventions(session_dir) is None
+        assert step_data.surviving_mutants(session_dir) is None
+
+    def test_surviving_mutants_distinguishes_none_from_empty(self, session_dir):
+        update_step_file(session_dir, "mutation", "completed", "# Mutation\n", data={"surviving_mutants": []})
+        assert step_data.surviving_mutants(session_dir) == []
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.watcher (inotify and polling backends)."""
+
+import os
+import shutil
+import time
+
+import pytest
+
+from src.lib import watcher as watcher_mod
+from src.lib.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    collect_changes,
+    open_watcher,
+)
+
+ROOT = "src/main/java"
+
+needs_inotify = pytest.mark.skipif(
+    watcher_mod._load_libc() is None, reason="inotify is not available",
+)
+
+
+def _touch(path, content="class X {}"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def project(tmp_path):
+    _touch(tmp_path / ROOT / "com/x/Foo.java")
+    return tmp_path
+
+
+def _drain(w, until, timeout=5.0):
+    """Read until ``until`` is a subset of what was reported."""
+    seen: set[str] = set()
+    deadline = time.monotonic() + timeout
+    while not until <= seen and time.monotonic() < deadline:
+        seen |= w.read(0.2) or set()
+    return seen
+
+
+class TestPollingWatcher:
+    def test_create_modify_delete(self, project):
+        w = PollingWatcher(str(project), [ROOT], interval=0.05)
+        assert w.read(0.1) == set()
+
+        _touch(project / ROOT / "com/x/Bar.java")
+        assert _drain(w, {f"{ROOT}/com/x/Bar.java"}) == {f"{ROOT}/com/x/Bar.java"}
+
+        (project / ROOT / "com/x/Foo.java").write_text("class Foo { int longer; }")
+        assert f"{ROOT}/com/x/Foo.java" in _drain(w, {f"{ROOT}/com/x/Foo.java"})
+
+        (project / ROOT / "com/x/Bar.java").unlink()
+        assert f"{ROOT}/com/x/Bar.java" in _drain(w, {f"{ROOT}/com/x/Bar.java"})
+
+    def test_ignores_other_files(self, project):
+        w = PollingWatcher(str(project), [ROOT], interval=0.05)
+        (project / ROOT / "com/x/notes.txt").write_text("x")
+        assert w.read(0.2) == set()
+
+    def test_new_directory_reported(self, project):
+        w = PollingWatcher(str(project), [ROOT], interval=0.05)
+        _touch(project / ROOT / "com/y/Baz.java")
+        seen = _drain(w, {f"{ROOT}/com/y", f"{ROOT}/com/y/Baz.java"})
+        assert {f"{ROOT}/com/y", f"{ROOT}/com/y/Baz.java"} <= seen
+
+
+@needs_inotify
+class TestInotifyWatcher:
+    def test_create_and_delete(self, project):
+        w = InotifyWatcher(str(project), [ROOT])
+        try:
+            assert w.read(0.05) == set()
+            _touch(project / ROOT / "com/x/Bar.java")
+            assert _drain(w, {f"{ROOT}/com/x/Bar.java"}) == {f"{ROOT}/com/x/Bar.java"}
+            (project / ROOT / "com/x/Bar.java").unlink()
+            assert _drain(w, {f"{ROOT}/com/x/Bar.java"}) == {f"{ROOT}/com/x/Bar.java"}
+        finally:
+            w.close()
+
+    def test_new_directories_are_watched(self, project):
+        w = InotifyWatcher(str(project), [ROOT])
+        try:
+            (project / ROOT / "com/y").mkdir()
+            assert f"{ROOT}/com/y" in _drain(w, {f"{ROOT}/com/y"})
+            _touch(project / ROOT / "com/y/Baz.java")
+            assert f"{ROOT}/com/y/Baz.java" in _drain(w, {f"{ROOT}/com/y/Baz.java"})
+        finally:
+            w.close()
+
+    def test_directory_moved_out_is_unwatched(self, project, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside")
+        w = InotifyWatcher(str(project), [ROOT])
+        try:
+            shutil.move(str(project / ROOT / "com/x"), str(outside / "x"))
+            assert f"{ROOT}/com/x" in _drain(w, {f"{ROOT}/com/x"})
+            _touch(outside / "x/Ghost.java")
+            assert w.read(0.2) == set()
+        finally:
+            w.close()
+
+
+class _Scripted:
+    backend = "scripted"
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def read(self, timeout):
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self):
+        pass
+
+
+class TestCollectChanges:
+    def test_idle(self):
+        assert collect_changes(_Scripted([]), timeout=0) == set()
+
+    def test_burst_is_merged_until_quiet(self):
+        w = _Scripted([{"a"}, {"b"}, {"c"}, set(), {"d"}])
+        assert collect_changes(w, timeout=0, debounce=0) == {"a", "b", "c"}
+        assert collect_changes(w, timeout=0, debounce=0) == {"d"}
+
+    def test_lost_events_request_a_rescan(self):
+        assert collect_changes(_Scripted([{"a"}, None, set()]), timeout=0) is None
+
+
+class TestOpenWatcher:
+    def test_polling_requested(self, project):
+        assert open_watcher(str(project), [ROOT], polling=True).backend == "polling"
+
+    def test_falls_back_to_polling(self, project, monkeypatch):
+        def unavailable(*args, **kwargs):
+            raise OSError(os.strerror(28))
+        monkeypatch.setattr(watcher_mod, "InotifyWatcher", unavailable)
+        assert open_watcher(str(project), [ROOT]).backend == "polling"
@@ -47,6 +47,25 @@ class TestAnalyzeProjectContext:
         result = json.loads(await analyze_project_context(str(tmp_path)))
         assert result["success"] is True
         assert result["build_system"] == "gradle"
+        assert result["dependencies"] == [{
+            "groupId": "org.junit.jupiter", "artifactId": "junit-jupiter", "version": "5.9.0",
+            "scope": "test", "configuration": "testImplementation",
+        }]
+
+    @pytest.mark.asyncio
+    async def test_gradle_multi_project_settings_only_root(self, tmp_path):
+        (tmp_path / "settings.gradle.kts").write_text('rootProject.name = "shop"\ninclude("core")\n')
+        (tmp_path / "core").mkdir()
+        (tmp_path / "core/build.gradle.kts").write_text(
+            "java { toolchain { languageVersion.set(JavaLanguageVersion.of(17)) } }\n"
+            'dependencies { implementation("com.google.guava:guava:33.0.0-jre") }\n'
+        )
+        result = json.loads(await analyze_project_context(str(tmp_path)))
+        assert result["build_system"] == "gradle"
+        assert result["java_version"] == "17"
+        assert result["module_info"]["artifactId"] == "shop"
+        assert result["subprojects"] == [":core"]
+        assert [d["artifactId"] for d in result["dependencies"]] == ["guava"]
 
     @pytest.mark.asyncio
     async def test_project_without_build_file(self, tmp_path):
@@ -54,3 +73,76 @@ class TestAnalyzeProjectContext:
         result = json.loads(await analyze_project_context(str(tmp_path)))
         assert result["success"] is True
         assert result["build_system"] == "unknown"
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _reactor(tmp_path):
+    _write(tmp_path / "pom.xml", (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0"><artifactId>shop</artifactId>'
+        "<modules><module>core</module><module>web</module></modules></project>"
+    ))
+    _write(tmp_path / "core/pom.xml", (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0"><artifactId>core</artifactId>'
+        "<dependencies><dependency><groupId>com.google.guava</groupId>"
+        "<artifactId>guava</artifactId><version>33.0.0-jre</version></dependency>"
+        "</dependencies></project>"
+    ))
+    _write(tmp_path / "web/pom.xml", (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0"><artifactId>web</artifactId></project>'
+    ))
+    for i in range(40):
+        _write(tmp_path / f"core/src/main/java/com/shop/core/p{i}/C{i}.java",
+               f"package com.shop.core.p{i};\npublic class C{i} {{}}\n")
+    _write(tmp_path / "core/src/test/java/com/shop/core/C0Test.java",
+           "package com.shop.core;\nimport org.junit.Test;\nimport static org.assertj.core.api.Assertions.*;\n"
+           "public class C0Test { @Test public void works() {} }\n")
+    _write(tmp_path / "web/src/main/java/com/shop/web/App.java",
+           "package com.shop.web;\nimport org.springframework.boot.autoconfigure.SpringBootApplication;\n"
+           "@SpringBootApplication public class App {}\n")
+    (tmp_path / ".testboost").mkdir()
+    return tmp_path
+
+
+class TestMultiModule:
+    @pytest.mark.asyncio
+    async def test_modules_merged_without_sampling(self, tmp_path):
+        result = json.loads(await analyze_project_context(str(_reactor(tmp_path))))
+
+        assert [(m["path"], m["name"]) for m in result["modules"]] == [
+            ("", "shop"), ("core", "core"), ("web", "web"),
+        ]
+        core = result["modules"][1]
+        assert core["class_count"] == 40 and core["test_count"] == 1
+        assert core["test_frameworks"] == ["assertj", "junit4"]
+        assert core["conventions"]["success"] is True
+        assert result["modules"][2]["conventions"] is None
+        # Every package, every module
+        assert len(result["source_structure"]["packages"]) == 41
+        assert result["source_structure"]["class_count"] == 41
+        assert result["project_type"] == "spring-boot"
+        assert "guava" in [d["artifactId"] for d in result["dependencies"]]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_modules_come_from_cache(self, tmp_path, monkeypatch):
+        from src.test_generation import analyze as analyze_mod
+
+        project = _reactor(tmp_path)
+        first = json.loads(await analyze_project_context(str(project)))
+        assert not any(m["cached"] for m in first["modules"])
+
+        # Everything written above is older than the racy window now
+        monkeypatch.setattr(analyze_mod, "RACY_WINDOW_NS", 0)
+        (project / "web/src/main/java/com/shop/web/App.java").write_text(
+            "package com.shop.web;\npublic class App { int changed; }\n"
+        )
+        second = json.loads(await analyze_project_context(str(project)))
+
+        cached = {m["path"]: m["cached"] for m in second["modules"]}
+        assert cached == {"": True, "core": True, "web": False}
+        assert second["modules"][1]["class_count"] == 40
+        assert second["project_type"] == "java"
+
@@ -3,10 +3,11 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.test_generation.conventions import detect_test_conventions
+from src.test_generation.conventions import detect_test_conventions, stratified_sample
 
 
 def _make_java_project(tmp_path: Path) -> Path:
@@ -87,3 +88,45 @@ class TestDetectTestConventions:
         # @BeforeEach setup detected
         assert result["setup"]["uses_setup"] is True
         assert result["setup"]["patterns"]["before_each"] == 1
+
+    @pytest.mark.asyncio
+    async def test_each_file_is_read_once(self, tmp_path):
+        project = _make_java_project(tmp_path)
+        real_read = Path.read_text
+        reads: list[str] = []
+
+        def counting_read(self, *args, **kwargs):
+            if self.suffix == ".java":
+                reads.append(self.name)
+            return real_read(self, *args, **kwargs)
+
+        with patch.object(Path, "read_text", counting_read):
+            result = json.loads(await detect_test_conventions(str(project)))
+
+        assert result["success"] is True
+        assert sorted(reads) == ["OrderServiceTest.java", "UserServiceTest.java"]
+
+
+class TestStratifiedSample:
+    def test_spreads_over_packages(self):
+        paths = [f"src/test/java/big/T{i}Test.java" for i in range(50)]
+        paths += ["src/test/java/small/ATest.java", "src/test/java/tiny/BTest.java"]
+
+        sample = stratified_sample(paths, 6)
+
+        assert len(sample) == 6
+        assert "src/test/java/small/ATest.java" in sample
+        assert "src/test/java/tiny/BTest.java" in sample
+
+    def test_spreads_over_modules_first(self):
+        paths = [f"core/src/test/java/p{i}/T{i}Test.java" for i in range(30)]
+        paths += ["web/src/test/java/w/WTest.java"]
+
+        sample = stratified_sample(paths, 2)
+
+        assert sample[1] == "web/src/test/java/w/WTest.java"
+
+    def test_is_deterministic_and_complete(self):
+        paths = [f"src/test/java/p{i % 3}/T{i}Test.java" for i in range(9)]
+        assert stratified_sample(paths, 100) == stratified_sample(list(reversed(paths)), 100)
+        assert sorted(stratified_sample(paths, 100)) == sorted(paths)
@@ -40,29 +40,32 @@ def _llm_returning(text):
 class TestGenerateAdaptiveTests:
     @pytest.mark.asyncio
     async def test_source_not_found(self, java_project):
-        result = json.loads(await generate_adaptive_tests(
+        result = await generate_adaptive_tests(
             str(java_project), "src/main/java/com/example/Nope.java",
-        ))
-        assert result["success"] is False
-        assert "not found" in result["error"]
+        )
+        assert result.success is False
+        assert "not found" in result.error
 
     @pytest.mark.asyncio
     async def test_full_generation_flow(self, java_project):
         """Relative source path resolved, class analyzed, context assembled,
-        LLM output wrapped in the result JSON."""
+        LLM output wrapped in the result object."""
         with patch("src.test_generation.generate_unit._generate_test_code_with_llm",
                    new=AsyncMock(return_value=JAVA_TEST)) as mock_gen:
-            result = json.loads(await generate_adaptive_tests(
+            result = await generate_adaptive_tests(
                 str(java_project),
                 "src/main/java/com/example/service/OrderService.java",
                 conventions={"naming": {"dominant_pattern": "camelCase"}},
-            ))
-
-        assert result["success"] is True
-        assert result["test_code"] == JAVA_TEST
-        assert result["test_count"] == 2
-        assert result["class_type"] == "service"
-        assert result["test_file"].endswith("src/test/java/com/example/service/OrderServiceTest.java")
+            )
+
+        assert result.success is True
+        assert result.test_code == JAVA_TEST
+        assert result.test_count == 2
+        assert result.class_type == "service"
+        assert result.class_name == "OrderService"
+        assert result.package == "com.example.service"
+        assert result.test_file.endswith("src/test/java/com/example/service/OrderServiceTest.java")
+        assert json.loads(json.dumps(result.to_dict()))["test_count"] == 2
         # The context handed to the LLM holds the analyzed class
         context = mock_gen.call_args.args[0]
         assert context["class_name"] == "OrderService"
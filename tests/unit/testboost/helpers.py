@@ -12,6 +12,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.lib.session_tracker import get_current_session, update_step_file
+from src.test_generation.generate_unit import GenerationResult
 
 ORDER_SERVICE = "src/main/java/com/example/service/OrderService.java"
 USER_SERVICE = "src/main/java/com/example/service/UserService.java"
@@ -20,13 +21,19 @@ PAYMENT_SERVICE = "src/main/java/com/example/service/PaymentService.java"
 
 THREE_FILES = [ORDER_SERVICE, USER_CONTROLLER, PAYMENT_SERVICE]
 
+# update_class_index() result for a mocked analyze: empty index, no cache
+EMPTY_CLASS_INDEX = ({}, {"reused": 0, "reparsed": 0, "removed": 0})
 
-async def setup_gaps(project_path, files=None, run_gaps=True):
+
+async def setup_gaps(project_path, files=None, run_gaps=True, class_index=None, modules=None,
+                     conventions=None):
     """Run analyze (and optionally gaps) with a fully mocked bridge.
 
     Creates the listed source files on disk if missing — edge-case
     analysis is silently skipped for files that don't exist, which would
-    turn "generate" cases into "deferred" cases.
+    turn "generate" cases into "deferred" cases. ``class_index`` is what
+    the mocked class indexer returns (empty by default); ``modules`` and
+    ``conventions`` are what the mocked analysis reports.
     """
     from src.lib.cli import _cmd_analyze_async, _cmd_gaps_async
 
@@ -42,12 +49,14 @@ async def setup_gaps(project_path, files=None, run_gaps=True):
         "java_version": "17", "frameworks": [], "test_frameworks": [],
         "source_structure": {"class_count": len(files), "packages": []},
         "test_structure": {"test_count": 0}, "dependencies": [],
+        **({"modules": modules} if modules else {}),
     })
     args = argparse.Namespace(project_path=str(project_path), verbose=False)
     with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=mock_context), \
-         patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=json.dumps({"success": False})), \
+         patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=json.dumps(conventions or {"success": False})), \
          patch("src.lib.bridge.find_source_files", return_value=files), \
-         patch("src.lib.bridge.build_class_index", return_value={}), \
+         patch("src.lib.bridge.update_class_index",
+               return_value=(class_index, EMPTY_CLASS_INDEX[1]) if class_index else EMPTY_CLASS_INDEX), \
          patch("src.lib.bridge.extract_test_examples", return_value=[]):
         await _cmd_analyze_async(args)
     if run_gaps:
@@ -55,18 +64,19 @@ async def setup_gaps(project_path, files=None, run_gaps=True):
 
 
 def gen_result(class_name="OrderService", package="com.example"):
-    """A successful generate_adaptive_tests JSON result for one class."""
-    return json.dumps({
-        "success": True,
-        "test_code": (
+    """A successful generate_adaptive_tests result for one class."""
+    return GenerationResult(
+        success=True,
+        test_code=(
             f"package {package};\n"
             "import org.junit.jupiter.api.Test;\n"
             f"class {class_name}Test {{\n  @Test\n  void t() {{}}\n}}"
         ),
-        "test_file": f"src/test/java/com/example/{class_name}Test.java",
-        "test_count": 1,
-        "context": {"class_name": class_name, "package": package},
-    })
+        test_file=f"src/test/java/com/example/{class_name}Test.java",
+        test_count=1,
+        class_name=class_name,
+        package=package,
+    )
 
 
 def failing_compile(file_name="OrderServiceTest.java"):
@@ -81,13 +81,7 @@ class TestCmdGenerateInterruption:
         from src.lib.cli import _cmd_generate_async
         await setup_gaps(initialized_project)
 
-        mock_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n  @Test\n  void t() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_result = gen_result()
         gen_args = argparse.Namespace(
             project_path=str(initialized_project),
             verbose=False, files=None,
@@ -134,13 +128,7 @@ class TestCmdGenerateInterruption:
         answer = tmp_path / "answer.json"
         answer.write_text(json.dumps(answer_payload))
 
-        mock_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n  @Test\n  void t() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_result = gen_result()
         gen_args = argparse.Namespace(
             project_path=str(initialized_project),
             verbose=False, files=None,
@@ -572,6 +560,48 @@ class TestValidatePause:
         fm = _parse_frontmatter((session_dir / "validation.md").read_text())
         assert fm["status"] == STATUS_AWAITING_INPUT
 
+    @pytest.mark.asyncio
+    async def test_question_uses_surefire_reports(self, initialized_project):
+        from src.lib.cli import _cmd_validate_async
+        from src.lib.session_tracker import EXIT_AWAITING_INPUT
+        session = self._prepare_generation(initialized_project)
+        reports = initialized_project / "target" / "surefire-reports"
+
+        def run(cmd, **kwargs):
+            if "test" in cmd:
+                reports.mkdir(parents=True, exist_ok=True)
+                (reports / "TEST-com.example.service.OrderServiceTest.xml").write_text(
+                    '<testsuite name="com.example.service.OrderServiceTest" tests="2">'
+                    '<testcase classname="com.example.service.OrderServiceTest" name="total" time="0.1">'
+                    '<failure message="expected: &lt;100&gt; but was: &lt;99&gt;">'
+                    "org.opentest4j.AssertionFailedError: expected: &lt;100&gt; but was: &lt;99&gt;\n"
+                    "\tat org.junit.jupiter.api.AssertEquals.assertEquals(AssertEquals.java:150)\n"
+                    "\tat org.junit.jupiter.api.Assertions.assertEquals(Assertions.java:531)\n"
+                    "\tat com.example.service.OrderServiceTest.total(OrderServiceTest.java:42)\n"
+                    "\tat java.base/java.lang.reflect.Method.invoke(Method.java:580)\n"
+                    "</failure></testcase>"
+                    '<testcase classname="com.example.service.OrderServiceTest" name="list" time="0.1"/>'
+                    "</testsuite>"
+                )
+                return MagicMock(returncode=1, stdout="[ERROR] Tests run: 2, Failures: 1", stderr="")
+            return MagicMock(returncode=0, stdout="BUILD SUCCESS", stderr="")
+
+        args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False,
+            fail_on_uncertainty=True, answer_file=None,
+        )
+        with patch("subprocess.run", side_effect=run):
+            rc = await _cmd_validate_async(args)
+
+        assert rc == EXIT_AWAITING_INPUT
+        payload = json.loads((Path(session["session_dir"]) / "question.json").read_text())
+        assert payload["subject"]["failing_classes"] == ["OrderServiceTest"]
+        assert payload["subject"]["failing_tests"] == ["com.example.service.OrderServiceTest.total"]
+        trace = payload["stack_trace"]
+        assert "OrderServiceTest.total (FAILED): expected: <100> but was: <99>" in trace
+        assert "OrderServiceTest.java:42" in trace
+        assert "Assertions.java" not in trace and "Method.invoke" not in trace
+
     @pytest.mark.asyncio
     async def test_no_pause_when_flag_off(self, initialized_project):
         """Regression guard: existing behaviour preserved when flag is off."""
@@ -664,6 +694,38 @@ class TestGuessFailingClass:
         assert _guess_failing_class("nothing relevant here") is None
 
 
+class TestRuntimeFixPrompt:
+    @pytest.mark.asyncio
+    async def test_prompt_carries_failing_methods_from_reports(self, tmp_path):
+        from src.lib.commands.generate_cmd import _attempt_test_runtime_fix
+
+        (tmp_path / "pom.xml").write_text("<project/>")
+        test_file = tmp_path / "src" / "test" / "java" / "a" / "ATest.java"
+        test_file.parent.mkdir(parents=True)
+        test_file.write_text("class ATest {}")
+        reports = tmp_path / "target" / "surefire-reports"
+
+        def run(cmd, **kwargs):
+            reports.mkdir(parents=True, exist_ok=True)
+            (reports / "TEST-a.ATest.xml").write_text(
+                '<testsuite name="a.ATest" tests="2">'
+                '<testcase classname="a.ATest" name="ok" time="0.1"/>'
+                '<testcase classname="a.ATest" name="broken" time="0.1">'
+                '<error message="NPE" type="java.lang.NullPointerException">'
+                "java.lang.NullPointerException: NPE\n\tat a.ATest.broken(ATest.java:7)</error>"
+                "</testcase></testsuite>"
+            )
+            return MagicMock(returncode=1, stdout="[INFO] lots of maven noise\n" * 200, stderr="")
+
+        fix = AsyncMock(return_value="class ATest { /* fixed */ }")
+        with patch("subprocess.run", side_effect=run), \
+                patch("src.lib.bridge.fix_test_runtime_errors", fix):
+            await _attempt_test_runtime_fix(str(tmp_path), test_file, "class ATest {}", "ATest", MagicMock())
+
+        errors = fix.await_args.args[1]
+        assert errors == "a.ATest.broken (ERROR): NPE\njava.lang.NullPointerException: NPE\n\tat a.ATest.broken(ATest.java:7)"
+
+
 # ============================================================================
 # Phase 2 — Killer pause (2.3, minimal wiring)
 # ============================================================================
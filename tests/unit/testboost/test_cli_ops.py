@@ -78,6 +78,75 @@ class TestCmdCleanup:
         assert rc == 0
         fm = _parse_frontmatter(spec.read_text())
         assert fm["status"] == "abandoned"
+class TestCmdCompact:
+    def _project_with_finished_session(self, tmp_path):
+        from src.lib.session_tracker import create_session, mark_abandoned
+        cmd_init(argparse.Namespace(
+            project_path=str(tmp_path), name=None, description="", tech="java-spring",
+        ))
+        mark_abandoned(get_current_session(str(tmp_path))["session_dir"])
+        create_session(str(tmp_path), name="current")
+
+    def test_dry_run_does_not_archive(self, tmp_path, capsys):
+        from src.lib.cli import cmd_compact
+        self._project_with_finished_session(tmp_path)
+        capsys.readouterr()
+        rc = cmd_compact(argparse.Namespace(
+            project_path=str(tmp_path), keep_last=1, older_than_days=None, status=None, dry_run=True,
+        ))
+        assert rc == 0
+        assert "Would archive 1 session(s)" in capsys.readouterr().out
+        assert (tmp_path / ".testboost" / "sessions" / "001-test-generation").is_dir()
+        assert not (tmp_path / ".testboost" / "archive").exists()
+
+    def test_real_run_archives_and_status_lists_it(self, tmp_path, capsys):
+        from src.lib.cli import cmd_compact, cmd_status
+        self._project_with_finished_session(tmp_path)
+        capsys.readouterr()
+        rc = cmd_compact(argparse.Namespace(
+            project_path=str(tmp_path), keep_last=1, older_than_days=None, status=None, dry_run=False,
+        ))
+        assert rc == 0
+        assert "Archived 1 session(s)" in capsys.readouterr().out
+        assert (tmp_path / ".testboost" / "archive" / "001-test-generation.tar.gz").is_file()
+        assert not (tmp_path / ".testboost" / "sessions" / "001-test-generation").exists()
+
+        assert cmd_status(argparse.Namespace(project_path=str(tmp_path))) == 0
+        out = capsys.readouterr().out
+        assert "Archived Sessions (1)" in out and "001-test-generation" in out
+
+    def test_nothing_to_compact(self, tmp_path, capsys):
+        from src.lib.cli import cmd_compact
+        self._project_with_finished_session(tmp_path)
+        capsys.readouterr()
+        rc = cmd_compact(argparse.Namespace(
+            project_path=str(tmp_path), keep_last=10, older_than_days=None, status=None, dry_run=False,
+        ))
+        assert rc == 0
+        assert "No sessions to compact." in capsys.readouterr().out
+
+
+class TestCmdSessions:
+    def test_requires_init(self, tmp_path, capsys):
+        from src.lib.cli import cmd_sessions
+        rc = cmd_sessions(argparse.Namespace(project_path=str(tmp_path), rebuild=False))
+        assert rc == 1
+        assert "Run `init` first" in capsys.readouterr().err
+
+    def test_rebuild_lists_legacy_sessions(self, tmp_path, capsys):
+        from src.lib.cli import cmd_sessions
+        from src.lib.session_registry import get_registry_path
+        cmd_init(argparse.Namespace(
+            project_path=str(tmp_path), name=None, description="", tech="java-spring",
+        ))
+        get_registry_path(str(tmp_path)).unlink()
+        capsys.readouterr()
+
+        rc = cmd_sessions(argparse.Namespace(project_path=str(tmp_path), rebuild=True))
+        out = capsys.readouterr().out
+        assert rc == 0
+        assert "1 session(s) indexed" in out
+        assert "001-test-generation" in out and "status=in_progress" in out
 class TestCmdDoctor:
     def test_reports_missing_tb_secret(self, tmp_path, capsys):
         from src.lib.cli import cmd_doctor
@@ -21,6 +21,7 @@ from src.lib.cli import (
     _cmd_generate_async,
     cmd_init,
 )
+from tests.unit.testboost.helpers import EMPTY_CLASS_INDEX
 
 PY_TEST_CODE = "import app\n\n\ndef test_app():\n    assert app.PRODUCTION_CODE == 42\n"
 
@@ -63,7 +64,7 @@ async def _run_pipeline(project):
     with patch("src.lib.bridge.analyze_project_context", new=AsyncMock(return_value=ctx)), \
          patch("src.lib.bridge.detect_test_conventions",
                new=AsyncMock(return_value='{"success": false}')), \
-         patch("src.lib.bridge.build_class_index", return_value={}), \
+         patch("src.lib.bridge.update_class_index", return_value=EMPTY_CLASS_INDEX), \
          patch("src.lib.bridge.extract_test_examples", return_value=[]):
         await _cmd_analyze_async(args)
     await _cmd_gaps_async(args)
@@ -119,3 +120,130 @@ class TestSafeTestTarget:
 
         target = _safe_test_target(str(tmp_path), "tests/test_app.py", "app.py")
         assert target == tmp_path / "tests/test_app.py"
+
+
+class TestParallelPerFileValidation:
+    """validate runs py_compile / pytest once per generated file, several at
+    a time, and reports them in the order of the generation step."""
+
+    FILES = [f"tests/test_mod{i}.py" for i in range(6)]
+
+    def _fake_run(self, peak, failing_compile=(), failing_tests=()):
+        import subprocess
+        import threading
+        import time
+        from unittest.mock import MagicMock
+
+        lock = threading.Lock()
+        running = [0]
+
+        def run(cmd, **kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            tf = next(part for part in cmd if part in self.FILES)
+            # Later files finish first: order must come from the input
+            time.sleep(0.02 * (len(self.FILES) - self.FILES.index(tf)))
+            with lock:
+                running[0] -= 1
+            if "py_compile" in cmd:
+                code = 1 if tf in failing_compile else 0
+                return MagicMock(returncode=code, stdout="", stderr=f"SyntaxError in {tf}" if code else "")
+            if tf in failing_tests:
+                return subprocess.CompletedProcess(cmd, 1, stdout=f"{tf} FAILED\n", stderr="")
+            return subprocess.CompletedProcess(cmd, 0, stdout=f"{tf} PASSED\n", stderr="")
+
+        return run
+
+    def _session_with_generated(self, project):
+        from src.lib.session_tracker import STATUS_COMPLETED, get_current_session, update_step_file
+
+        session_dir = get_current_session(str(project))["session_dir"]
+        update_step_file(session_dir, "generation", STATUS_COMPLETED, "# Generation\n", data={
+            "generated": [{"path": tf, "source_file": tf.replace("tests/test_", "")} for tf in self.FILES],
+        })
+        return Path(session_dir)
+
+    @pytest.mark.asyncio
+    async def test_compile_failures_reported_in_order(self, python_project):
+        from src.lib.cli import _cmd_validate_async
+
+        session_dir = self._session_with_generated(python_project)
+        peak = [0]
+        failing = {self.FILES[1], self.FILES[4]}
+        with patch("subprocess.run", side_effect=self._fake_run(peak, failing_compile=failing)):
+            rc = await _cmd_validate_async(argparse.Namespace(
+                project_path=str(python_project), verbose=False, workers=3,
+            ))
+
+        assert rc == 1
+        content = (session_dir / "validation.md").read_text()
+        first, second = content.index(f"FAILED (`{self.FILES[1]}`)"), content.index(f"FAILED (`{self.FILES[4]}`)")
+        assert first < second
+        assert 1 < peak[0] <= 3
+
+    @pytest.mark.asyncio
+    async def test_test_output_collected_in_order(self, python_project):
+        from src.lib.cli import _cmd_validate_async
+
+        session_dir = self._session_with_generated(python_project)
+        peak = [0]
+        with patch("subprocess.run", side_effect=self._fake_run(peak, failing_tests={self.FILES[2]})):
+            rc = await _cmd_validate_async(argparse.Namespace(
+                project_path=str(python_project), verbose=False,
+            ))
+
+        assert rc == 1
+        content = (session_dir / "validation.md").read_text()
+        assert "## Tests: FAILED" in content
+        output = content[content.index("### Full Output"):]
+        assert [output.index(tf) for tf in self.FILES] == sorted(output.index(tf) for tf in self.FILES)
+
+    @pytest.mark.asyncio
+    async def test_junit_reports_replace_the_output_dump(self, python_project):
+        import subprocess
+
+        from src.lib.cli import _cmd_validate_async
+
+        session_dir = self._session_with_generated(python_project)
+        failing = self.FILES[3]
+
+        def run(cmd, **kwargs):
+            report = next((p for p in cmd if p.startswith("--junitxml=")), None)
+            if report and failing in cmd:
+                Path(report.split("=", 1)[1]).write_text(
+                    '<testsuites><testsuite name="pytest" tests="1">'
+                    '<testcase classname="tests.test_mod3" name="test_total" time="0.01">'
+                    '<failure message="assert 99 == 100">E   assert 99 == 100</failure>'
+                    "</testcase></testsuite></testsuites>"
+                )
+                return subprocess.CompletedProcess(cmd, 1, stdout="1 failed\n", stderr="")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch("subprocess.run", side_effect=run):
+            rc = await _cmd_validate_async(argparse.Namespace(
+                project_path=str(python_project), verbose=False,
+            ))
+
+        assert rc == 1
+        content = (session_dir / "validation.md").read_text()
+        assert "tests.test_mod3.test_total (FAILED): assert 99 == 100" in content
+        assert "### Full Output" not in content
+        from src.lib.step_data import step_field
+        assert step_field(session_dir / "validation.md", "failing_tests") == [{
+            "class_name": "tests.test_mod3", "name": "test_total", "status": "failed",
+            "message": "assert 99 == 100",
+        }]
+
+    @pytest.mark.asyncio
+    async def test_workers_1_runs_serially(self, python_project):
+        from src.lib.cli import _cmd_validate_async
+
+        self._session_with_generated(python_project)
+        peak = [0]
+        with patch("subprocess.run", side_effect=self._fake_run(peak)):
+            rc = await _cmd_validate_async(argparse.Namespace(
+                project_path=str(python_project), verbose=False, workers=1,
+            ))
+        assert rc == 0
+        assert peak[0] == 1
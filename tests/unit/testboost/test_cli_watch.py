@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for `testboost watch`."""
+
+import argparse
+import json
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.lib.analysis_store import open_class_index
+from src.lib.commands.analyze_cmd import _find_gaps
+from src.lib.commands.watch_cmd import _refresh_analysis, _watch_loop, cmd_watch
+from src.lib.session_tracker import (
+    GENERATION_CURSOR_FILENAME,
+    STATUS_COMPLETED,
+    get_current_session,
+    read_project_analysis_data,
+    save_generation_cursor,
+    update_step_file,
+)
+from src.lib.watcher import PollingWatcher
+
+ROOTS = ["src/main/java", "src/test/java"]
+
+
+async def _analyze_and_gaps(project_path):
+    """Real analyze (class index included) with the LLM-facing parts mocked."""
+    from src.lib.cli import _cmd_analyze_async, _cmd_gaps_async
+
+    context = json.dumps({"success": True, "project_type": "spring-boot"})
+    args = argparse.Namespace(project_path=str(project_path), verbose=False)
+    with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=context), \
+         patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock,
+               return_value=json.dumps({"success": False})):
+        assert await _cmd_analyze_async(args) == 0
+    assert await _cmd_gaps_async(args) == 0
+
+
+def _run_until(project_path, edit, predicate, timeout=20.0):
+    """Run the watch loop in a thread, apply ``edit``, stop once ``predicate`` holds."""
+    stop = threading.Event()
+    summaries = []
+
+    def on_refresh(summary):
+        summaries.append(summary)
+        if predicate():
+            stop.set()
+
+    watcher = PollingWatcher(str(project_path), ROOTS, interval=0.05)
+    thread = threading.Thread(
+        target=_watch_loop, args=(str(project_path), watcher, ROOTS),
+        kwargs={"debounce": 0.05, "stop": stop, "on_refresh": on_refresh},
+    )
+    thread.start()
+    try:
+        edit()
+        stop.wait(timeout)
+    finally:
+        stop.set()
+        thread.join(timeout)
+    return summaries
+
+
+def _gaps(project_path):
+    """Gaps per the refreshed analysis store (watch never rewrites the session's list)."""
+    data = read_project_analysis_data(str(project_path), include_class_index=False)
+    return _find_gaps(str(project_path), data["source_files"])[0]
+
+
+class TestCmdWatch:
+    def test_requires_analysis(self, initialized_project, capsys):
+        args = argparse.Namespace(project_path=str(initialized_project))
+        assert cmd_watch(args) == 1
+        assert "Run `analyze` first" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_new_source_is_indexed_and_listed_as_gap(self, initialized_project):
+        await _analyze_and_gaps(initialized_project)
+        new_rel = "src/main/java/com/example/service/InvoiceService.java"
+
+        def edit():
+            (initialized_project / new_rel).write_text(
+                "package com.example.service;\n\npublic class InvoiceService {\n"
+                "    public int total() { return 0; }\n}\n"
+            )
+
+        def done():
+            with open_class_index(str(initialized_project)) as index:
+                return "InvoiceService" in index
+
+        summaries = _run_until(initialized_project, edit, done)
+
+        assert summaries and summaries[-1]["reparsed"] >= 1
+        with open_class_index(str(initialized_project)) as index:
+            assert index["InvoiceService"]["package"] == "com.example.service"
+        data = read_project_analysis_data(str(initialized_project), include_class_index=False)
+        assert new_rel in data["source_files"]
+        assert new_rel in _gaps(initialized_project)
+
+    @pytest.mark.asyncio
+    async def test_new_test_closes_gap(self, initialized_project):
+        await _analyze_and_gaps(initialized_project)
+        order_service = "src/main/java/com/example/service/OrderService.java"
+        assert order_service in _gaps(initialized_project)
+
+        def edit():
+            test = initialized_project / "src/test/java/com/example/OrderServiceTest.java"
+            test.write_text("package com.example;\n\nclass OrderServiceTest {}\n")
+
+        summaries = _run_until(
+            initialized_project, edit, lambda: order_service not in _gaps(initialized_project),
+        )
+
+        assert summaries
+        assert order_service not in _gaps(initialized_project)
+        details = read_project_analysis_data(str(initialized_project))["source_file_details"]
+        assert next(d for d in details if d["path"] == order_service)["has_test"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_leaves_session_files_alone(self, initialized_project):
+        await _analyze_and_gaps(initialized_project)
+        order_service = "src/main/java/com/example/service/OrderService.java"
+        session_dir = Path(get_current_session(str(initialized_project))["session_dir"])
+        update_step_file(str(session_dir), "generation", STATUS_COMPLETED, "# Generation\n")
+        update_step_file(str(session_dir), "validation", STATUS_COMPLETED, "# Validation\n")
+        save_generation_cursor(
+            str(session_dir), target_files=[order_service], current_index=1,
+            completed_files=[order_service],
+        )
+        snapshot = {
+            name: (session_dir / name).read_bytes()
+            for name in ("spec.md", "coverage-gaps.md", GENERATION_CURSOR_FILENAME)
+        }
+        gaps_before = len(_gaps(initialized_project))
+
+        test = initialized_project / "src/test/java/com/example/OrderServiceTest.java"
+        test.write_text("package com.example;\n\nclass OrderServiceTest {}\n")
+        summary = _refresh_analysis(str(initialized_project), None)
+
+        assert summary["gaps"] == gaps_before - 1
+        assert get_current_session(str(initialized_project))["step"] == "validation"
+        for name, content in snapshot.items():
+            assert (session_dir / name).read_bytes() == content, name
@@ -24,6 +24,7 @@ from src.lib.session_tracker import (
     update_step_file,
 )
 from tests.unit.testboost.helpers import (  # noqa: F401
+    EMPTY_CLASS_INDEX,
     ORDER_SERVICE,
     PAYMENT_SERVICE,
     THREE_FILES,
@@ -107,7 +108,7 @@ class TestCmdAnalyze:
         with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=mock_context), \
              patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=mock_conventions), \
              patch("src.lib.bridge.find_source_files", return_value=mock_files), \
-             patch("src.lib.bridge.build_class_index", return_value={}), \
+             patch("src.lib.bridge.update_class_index", return_value=EMPTY_CLASS_INDEX), \
              patch("src.lib.bridge.extract_test_examples", return_value=[]):
             result = await _cmd_analyze_async(args)
 
@@ -143,7 +144,7 @@ class TestCmdAnalyze:
         with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=mock_context), \
              patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=json.dumps({"success": False})), \
              patch("src.lib.bridge.find_source_files", return_value=mock_files), \
-             patch("src.lib.bridge.build_class_index", return_value={}), \
+             patch("src.lib.bridge.update_class_index", return_value=EMPTY_CLASS_INDEX), \
              patch("src.lib.bridge.extract_test_examples", return_value=[]):
             await _cmd_analyze_async(args)
 
@@ -153,6 +154,38 @@ class TestCmdAnalyze:
         assert "UserService" in content
         assert "UserController" in content
 
+    @pytest.mark.asyncio
+    async def test_analyze_large_project_pages_detail_tables(self, initialized_project, capsys):
+        """Detail tables of a large project go to sidecar pages; stdout stays a summary."""
+        from src.lib.report_writer import DEFAULT_PAGE_SIZE
+
+        class_count = DEFAULT_PAGE_SIZE * 2 + 1
+        class_index = {
+            f"Class{i}": {"class_name": f"Class{i}", "package": "com.example", "category": "service"}
+            for i in range(class_count)
+        }
+        # A stale page from an earlier, larger run must not survive
+        stale = initialized_project / ".testboost" / "analysis" / "class-index-009.md"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old")
+
+        await setup_gaps(initialized_project, files=[USER_SERVICE], run_gaps=False,
+                         class_index=class_index)
+
+        out = capsys.readouterr().out
+        assert "Class1000" not in out
+        assert f"**Classes indexed**: {class_count}" in out
+        assert len(out) < 5000
+
+        sidecars = sorted((initialized_project / ".testboost" / "analysis").iterdir())
+        assert [p.name for p in sidecars] == ["class-index-001.md", "class-index-002.md",
+                                             "class-index-003.md"]
+        assert "`Class999`" in "".join(p.read_text() for p in sidecars)
+        content = (initialized_project / ".testboost" / "analysis.md").read_text()
+        assert "- [Page 3](analysis/class-index-003.md)" in content
+        # Small tables stay inline
+        assert "`UserService.java`" in content
+
     @pytest.mark.asyncio
     async def test_analyze_no_session(self, tmp_path):
         from src.lib.cli import _cmd_analyze_async
@@ -179,7 +212,7 @@ class TestCmdAnalyze:
         with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=mock_context), \
              patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=json.dumps({"success": False})), \
              patch("src.lib.bridge.find_source_files", return_value=[]), \
-             patch("src.lib.bridge.build_class_index", return_value={}), \
+             patch("src.lib.bridge.update_class_index", return_value=EMPTY_CLASS_INDEX), \
              patch("src.lib.bridge.extract_test_examples", return_value=[]):
             await _cmd_analyze_async(args)
 
@@ -209,7 +242,7 @@ class TestCmdAnalyze:
         with patch("src.lib.bridge.analyze_project_context", new_callable=AsyncMock, return_value=mock_context), \
              patch("src.lib.bridge.detect_test_conventions", new_callable=AsyncMock, return_value=mock_conventions), \
              patch("src.lib.bridge.find_source_files", return_value=[]), \
-             patch("src.lib.bridge.build_class_index", return_value={}), \
+             patch("src.lib.bridge.update_class_index", return_value=EMPTY_CLASS_INDEX), \
              patch("src.lib.bridge.extract_test_examples", return_value=[]):
             await _cmd_analyze_async(args)
 
@@ -282,13 +315,7 @@ class TestCmdGenerate:
         from src.lib.cli import _cmd_generate_async
         await setup_gaps(initialized_project, files=[ORDER_SERVICE, USER_CONTROLLER])
 
-        mock_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n    @Test\n    void test() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_result = gen_result()
 
         gen_args = argparse.Namespace(
             project_path=str(initialized_project), verbose=False, files=None,
@@ -309,13 +336,7 @@ class TestCmdGenerate:
         from src.lib.cli import _cmd_generate_async
         await setup_gaps(initialized_project, files=[ORDER_SERVICE, USER_CONTROLLER])
 
-        mock_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n    @Test\n    void test() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_result = gen_result()
 
         gen_args = argparse.Namespace(
             project_path=str(initialized_project), verbose=False, files=None,
@@ -330,6 +351,99 @@ class TestCmdGenerate:
         assert test_file.exists()
         assert "@Test" in test_file.read_text()
 
+    @pytest.mark.asyncio
+    async def test_generate_changed_targets_dependents_only(self, initialized_project):
+        """--changed regenerates the changed class and its users, never
+        a hand-written test and never unrelated classes."""
+        from src.lib.cli import _cmd_generate_async
+        user_service = initialized_project / "src/test/java/com/example/service/UserServiceTest.java"
+        user_service.parent.mkdir(parents=True, exist_ok=True)
+        user_service.write_text("class UserServiceTest {}")
+        class_index = {
+            "OrderService": {"relative_path": ORDER_SERVICE},
+            "UserController": {
+                "relative_path": USER_CONTROLLER,
+                "dependencies": [{"type": "OrderService", "name": "orders"}],
+            },
+            "UserService": {
+                "relative_path": USER_SERVICE,
+                "fields": [{"name": "orders", "type": "List<OrderService>"}],
+            },
+            "PaymentService": {"relative_path": PAYMENT_SERVICE},
+        }
+        await setup_gaps(
+            initialized_project,
+            files=[ORDER_SERVICE, USER_CONTROLLER, USER_SERVICE, PAYMENT_SERVICE],
+            class_index=class_index,
+        )
+
+        gen_args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False, files=None,
+            changed=[ORDER_SERVICE], changed_since=None,
+        )
+        with patch("src.lib.startup_checks.check_llm_connection", new_callable=AsyncMock), \
+             patch("src.lib.bridge.generate_adaptive_tests", new_callable=AsyncMock,
+                   return_value=gen_result()) as mock_gen, \
+             patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="", stderr="")):
+            result = await _cmd_generate_async(gen_args)
+
+        assert result == 0
+        targeted = sorted(
+            Path(c.kwargs["source_file"]).as_posix() for c in mock_gen.call_args_list
+        )
+        # UserService uses OrderService but its test is hand-written
+        assert targeted == sorted([ORDER_SERVICE, USER_CONTROLLER])
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_module_conventions(self, initialized_project):
+        """A file in a module with tests follows that module's conventions."""
+        from src.lib.cli import _cmd_generate_async
+        billing = "billing/src/main/java/com/example/billing/InvoiceService.java"
+        module_conventions = {"success": True, "naming": {"dominant_pattern": "should_when"}}
+        project_conventions = {"success": True, "naming": {"dominant_pattern": "test_prefix"}}
+        await setup_gaps(
+            initialized_project, files=[ORDER_SERVICE, billing],
+            modules=[
+                {"path": "", "name": "app", "conventions": None},
+                {"path": "billing", "name": "billing", "conventions": module_conventions},
+            ],
+            conventions=project_conventions,
+        )
+
+        gen_args = argparse.Namespace(project_path=str(initialized_project), verbose=False, files=None)
+        with patch("src.lib.startup_checks.check_llm_connection", new_callable=AsyncMock), \
+             patch("src.lib.bridge.generate_adaptive_tests", new_callable=AsyncMock,
+                   return_value=gen_result()) as mock_gen, \
+             patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="", stderr="")):
+            assert await _cmd_generate_async(gen_args) == 0
+
+        used = {
+            Path(c.kwargs["source_file"]).as_posix(): c.kwargs["conventions"]
+            for c in mock_gen.call_args_list
+        }
+        assert used == {billing: module_conventions, ORDER_SERVICE: project_conventions}
+
+    @pytest.mark.asyncio
+    async def test_generate_changed_without_affected_tests(self, initialized_project):
+        from src.lib.cli import _cmd_generate_async
+        await setup_gaps(
+            initialized_project, files=[ORDER_SERVICE],
+            class_index={"OrderService": {"relative_path": ORDER_SERVICE}},
+        )
+        gen_args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False, files=None,
+            changed=["README.md"], changed_since=None,
+        )
+        with patch("src.lib.startup_checks.check_llm_connection", new_callable=AsyncMock), \
+             patch("src.lib.bridge.generate_adaptive_tests", new_callable=AsyncMock) as mock_gen:
+            result = await _cmd_generate_async(gen_args)
+
+        assert result == 0
+        mock_gen.assert_not_called()
+        session = get_current_session(str(initialized_project))
+        content = (Path(session["session_dir"]) / "generation.md").read_text()
+        assert "No tests affected" in content
+
     @pytest.mark.asyncio
     async def test_generate_without_gaps(self, initialized_project):
         from src.lib.cli import _cmd_generate_async
@@ -340,6 +454,72 @@ class TestCmdGenerate:
         assert result == 1
 
 
+class TestShardedGenerate:
+    @pytest.mark.asyncio
+    async def test_shards_then_merge(self, initialized_project, capsys):
+        from src.lib.cli import _cmd_generate_async, cmd_merge_shards
+        from src.lib.shards import get_shard_dir
+        await setup_gaps(initialized_project, files=THREE_FILES)
+        session_dir = Path(get_current_session(str(initialized_project))["session_dir"])
+
+        targeted = []
+        for shard in ("1/2", "2/2"):
+            gen_args = argparse.Namespace(
+                project_path=str(initialized_project), verbose=False, files=None, shard=shard,
+            )
+            with patch("src.lib.startup_checks.check_llm_connection", new_callable=AsyncMock), \
+                 patch("src.lib.bridge.analyze_edge_cases", new_callable=AsyncMock, return_value=[]), \
+                 patch("src.lib.bridge.generate_adaptive_tests", new_callable=AsyncMock,
+                       return_value=gen_result()) as mock_gen, \
+                 patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="", stderr="")):
+                assert await _cmd_generate_async(gen_args) == 0
+            targeted.append([Path(c.kwargs["source_file"]).as_posix() for c in mock_gen.call_args_list])
+
+        # Each file generated exactly once, session-level generation.md untouched
+        assert sorted(targeted[0] + targeted[1]) == sorted(THREE_FILES)
+        assert not (session_dir / "generation.md").exists()
+        assert (get_shard_dir(session_dir, 1, 2) / "generation.md").read_text().count("status: completed") == 1
+        assert "TESTBOOST_TOKEN" not in capsys.readouterr().out
+
+        assert cmd_merge_shards(argparse.Namespace(project_path=str(initialized_project))) == 0
+        content = (session_dir / "generation.md").read_text()
+        assert "status: completed" in content
+        assert "**Target files**: 3" in content and "**Shards**: 2" in content
+        from src.lib.step_data import generated_tests
+        assert sorted(t["source_file"] for t in generated_tests(session_dir)) == sorted(THREE_FILES)
+
+    @pytest.mark.asyncio
+    async def test_merge_refuses_missing_shard(self, initialized_project, capsys):
+        from src.lib.cli import _cmd_generate_async, cmd_merge_shards
+        await setup_gaps(initialized_project, files=THREE_FILES)
+        gen_args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False, files=None, shard="1/3",
+        )
+        with patch("src.lib.startup_checks.check_llm_connection", new_callable=AsyncMock), \
+             patch("src.lib.bridge.analyze_edge_cases", new_callable=AsyncMock, return_value=[]), \
+             patch("src.lib.bridge.generate_adaptive_tests", new_callable=AsyncMock,
+                   return_value=gen_result()), \
+             patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="", stderr="")):
+            assert await _cmd_generate_async(gen_args) == 0
+        capsys.readouterr()
+
+        assert cmd_merge_shards(argparse.Namespace(project_path=str(initialized_project))) == 1
+        assert "shard(s) 2/3, 3/3 missing" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_shard_cannot_pause(self, initialized_project, capsys):
+        from src.lib.cli import _cmd_generate_async
+        await setup_gaps(initialized_project, files=THREE_FILES)
+        gen_args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False, files=None, shard="1/2",
+            fail_on_uncertainty=True,
+        )
+        assert await _cmd_generate_async(gen_args) == 1
+        assert "--shard cannot pause" in capsys.readouterr().err
+        bad = argparse.Namespace(project_path=str(initialized_project), files=None, shard="3/2")
+        assert await _cmd_generate_async(bad) == 1
+
+
 # ============================================================================
 # cmd_validate (with mocked subprocess)
 # ============================================================================
@@ -362,6 +542,43 @@ class TestCmdValidate:
         content = (Path(session["session_dir"]) / "validation.md").read_text()
         assert "PASSED" in content
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("full_suite", [False, True])
+    async def test_validate_runs_only_generated_tests(self, initialized_project, full_suite):
+        from src.lib.cli import _cmd_validate_async
+
+        session = get_current_session(str(initialized_project))
+        update_step_file(session["session_dir"], "generation", STATUS_COMPLETED, "# Generation\n\nDone.", data={
+            "generated": [
+                {"path": "src/test/java/com/example/service/OrderServiceTest.java", "source_file": ORDER_SERVICE},
+                {"path": "src/test/java/com/example/web/UserControllerTest.java", "source_file": USER_CONTROLLER},
+            ],
+        })
+        args = argparse.Namespace(
+            project_path=str(initialized_project), verbose=False,
+            full_suite=full_suite, fork_count="2", surefire_parallel=None,
+        )
+        ok = MagicMock(returncode=0, stdout="Tests run: 4, Failures: 0\nBUILD SUCCESS", stderr="")
+        with patch("subprocess.run", return_value=ok) as run:
+            assert await _cmd_validate_async(args) == 0
+
+        test_cmd = run.call_args_list[-1].args[0]
+        assert "-DforkCount=2" in test_cmd
+        content = (Path(session["session_dir"]) / "validation.md").read_text()
+        if full_suite:
+            assert not any(a.startswith("-Dtest=") for a in test_cmd)
+            assert "**Scope**" not in content
+        else:
+            assert "-Dtest=OrderServiceTest,UserControllerTest" in test_cmd
+            assert "**Scope**: 2 generated test file(s), 1 run(s)" in content
+
+    @pytest.mark.asyncio
+    async def test_validate_rejects_bad_fork_count(self, initialized_project, capsys):
+        from src.lib.cli import _cmd_validate_async
+        args = argparse.Namespace(project_path=str(initialized_project), verbose=False, fork_count="lots")
+        assert await _cmd_validate_async(args) == 1
+        assert "invalid --fork-count" in capsys.readouterr().err
+
     @pytest.mark.asyncio
     async def test_validate_compilation_failure_uses_maven_parser(self, initialized_project):
         from src.lib.cli import _cmd_validate_async
@@ -593,13 +810,7 @@ class TestEdgeCaseIntegration:
              "input_hint": "null", "expected_behavior": "throws NullPointerException", "category": "null_input"},
         ]
 
-        mock_gen_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n    @Test\n    void test() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_gen_result = gen_result()
 
         gen_args = argparse.Namespace(
             project_path=str(initialized_project), verbose=False, files=None,
@@ -626,13 +837,7 @@ class TestEdgeCaseIntegration:
         from src.lib.cli import _cmd_generate_async
         await setup_gaps(initialized_project)
 
-        mock_gen_result = json.dumps({
-            "success": True,
-            "test_code": "package com.example;\nimport org.junit.jupiter.api.Test;\nclass OrderServiceTest {\n    @Test\n    void test() {}\n}",
-            "test_file": "src/test/java/com/example/OrderServiceTest.java",
-            "test_count": 1,
-            "context": {"class_name": "OrderService", "package": "com.example"},
-        })
+        mock_gen_result = gen_result()
 
         gen_args = argparse.Namespace(
             project_path=str(initialized_project), verbose=False, files=None,
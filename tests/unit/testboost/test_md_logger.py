@@ -24,6 +24,7 @@ class TestMdLogger:
     def test_info_writes_to_log(self, session_dir):
         logger = MdLogger(session_dir, "analysis")
         logger.info("Test info message")
+        logger.flush()
 
         from pathlib import Path
         log_files = list((Path(session_dir) / "logs").glob("*.md"))
@@ -35,6 +36,7 @@ class TestMdLogger:
     def test_error_writes_to_log(self, session_dir):
         logger = MdLogger(session_dir, "analysis")
         logger.error("Something broke")
+        logger.flush()
 
         from pathlib import Path
         log_files = list((Path(session_dir) / "logs").glob("*.md"))
@@ -45,6 +47,7 @@ class TestMdLogger:
     def test_warn_writes_to_log(self, session_dir):
         logger = MdLogger(session_dir, "analysis")
         logger.warn("Watch out")
+        logger.flush()
 
         from pathlib import Path
         log_files = list((Path(session_dir) / "logs").glob("*.md"))
@@ -55,6 +58,7 @@ class TestMdLogger:
     def test_debug_writes_to_log_only(self, session_dir, capsys):
         logger = MdLogger(session_dir, "analysis")
         logger.debug("Debug detail")
+        logger.flush()
 
         # Debug should be in log file
         from pathlib import Path
@@ -128,6 +132,7 @@ class TestMdLogger:
 
         logger1.info("Analysis started")
         logger2.info("Generation started")
+        logger2.flush()
 
         from pathlib import Path
         log_files = list((Path(session_dir) / "logs").glob("*.md"))
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.session_archive (session compaction)."""
+
+import tarfile
+
+from src.lib.session_archive import (
+    archive_session,
+    get_archive_dir,
+    read_manifest,
+    select_sessions,
+)
+from src.lib.session_tracker import (
+    create_session,
+    get_current_session,
+    init_project,
+    list_generated_tests,
+    list_sessions,
+    update_step_file,
+)
+
+
+def _session(sid, status, age_hours=1.0):
+    return {"session_id": sid, "session_dir": f"/x/{sid}", "status": status, "age_hours": age_hours}
+
+
+class TestSelectSessions:
+    def test_keeps_the_most_recent_and_unfinished(self):
+        sessions = [
+            _session("001-a", "completed"),
+            _session("002-b", "in_progress"),
+            _session("003-c", "awaiting_input"),
+            _session("004-d", "failed"),
+            _session("005-e", "completed"),
+        ]
+        ids = [s["session_id"] for s in select_sessions(sessions, keep_last=1)]
+        assert ids == ["001-a", "004-d"]
+        # keep_last 0 still keeps the newest session
+        assert "005-e" not in [s["session_id"] for s in select_sessions(sessions, keep_last=0)]
+        assert select_sessions(sessions, keep_last=10) == []
+
+    def test_age_and_status_filters(self):
+        sessions = [
+            _session("001-a", "completed", age_hours=24 * 40),
+            _session("002-b", "abandoned", age_hours=24 * 2),
+            _session("003-c", "in_progress", age_hours=24 * 90),
+            _session("004-d", "completed", age_hours=None),
+            _session("005-e", "completed"),
+        ]
+        ids = [s["session_id"] for s in select_sessions(sessions, keep_last=1, older_than_days=30)]
+        assert ids == ["001-a"]
+        ids = [s["session_id"] for s in select_sessions(
+            sessions, keep_last=1, statuses=("in_progress",),
+        )]
+        assert ids == ["003-c"]
+
+
+class TestArchiveSession:
+    def test_archive_round_trip(self, tmp_path):
+        init_project(str(tmp_path))
+        old = create_session(str(tmp_path), name="old")
+        update_step_file(
+            old["session_dir"], "generation", "completed", "# Generation\n",
+            data={"generated": [{"source_file": "src/main/java/A.java", "path": "src/test/java/ATest.java"}]},
+        )
+        create_session(str(tmp_path), name="new")
+        session = next(s for s in list_sessions(str(tmp_path)) if s["session_id"] == "001-old")
+
+        entry = archive_session(str(tmp_path), session)
+
+        archive = get_archive_dir(str(tmp_path)) / entry["archive"]
+        with tarfile.open(archive) as tar:
+            names = tar.getnames()
+        assert "001-old/spec.md" in names and "001-old/generation.md" in names
+        assert not (tmp_path / ".testboost" / "sessions" / "001-old").exists()
+
+        manifest = read_manifest(str(tmp_path))
+        assert [m["session_id"] for m in manifest] == ["001-old"]
+        assert manifest[0]["technology"] == "java-spring"
+        assert manifest[0]["generated"] == {"src/main/java/A.java": "src/test/java/ATest.java"}
+
+        # Live state no longer lists it, but its generated tests stay known
+        assert [s["session_id"] for s in list_sessions(str(tmp_path))] == ["002-new"]
+        assert get_current_session(str(tmp_path))["session_id"] == "002-new"
+        assert list_generated_tests(str(tmp_path)) == {"src/main/java/A.java": "src/test/java/ATest.java"}
+
+    def test_numbering_continues_after_archived_sessions(self, tmp_path):
+        init_project(str(tmp_path))
+        first = create_session(str(tmp_path), name="first")
+        session = list_sessions(str(tmp_path))[0]
+        archive_session(str(tmp_path), session)
+        assert not (tmp_path / ".testboost" / "sessions" / first["session_id"]).exists()
+
+        assert create_session(str(tmp_path))["session_id"].startswith("002-")
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for src.lib.session_registry (the .testboost/sessions.db index)."""
+
+import os
+import shutil
+import sqlite3
+import time
+from unittest.mock import patch
+
+from src.lib.session_registry import (
+    REGISTRY_FILENAME,
+    all_sessions,
+    get_registry_path,
+    rebuild_registry,
+)
+from src.lib.session_tracker import (
+    STATUS_ABANDONED,
+    create_session,
+    get_current_session,
+    get_sessions_dir,
+    init_project,
+    list_sessions,
+    mark_abandoned,
+    set_session_technology,
+    update_step_file,
+)
+
+
+def _age(path, seconds=60):
+    """Move a file's mtime into the past, out of the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _settle(project_path):
+    """Age every session file so the registry trusts its recorded stats."""
+    sessions_dir = get_sessions_dir(project_path)
+    for spec in sessions_dir.glob("*/spec.md"):
+        _age(spec)
+    _age(sessions_dir)
+    # One lookup records the aged stats
+    all_sessions(project_path, sessions_dir)
+
+
+class TestRegistryUpdates:
+    def test_create_session_is_indexed(self, tmp_path):
+        init_project(str(tmp_path))
+        create_session(str(tmp_path), name="first")
+
+        assert get_registry_path(str(tmp_path)).exists()
+        rows = all_sessions(str(tmp_path), get_sessions_dir(str(tmp_path)))
+        assert [r["session_id"] for r in rows] == ["001-first"]
+        assert rows[0]["status"] == "in_progress"
+        assert rows[0]["step"] == "init"
+
+    def test_step_updates_and_technology_are_recorded(self, tmp_path):
+        init_project(str(tmp_path))
+        session = create_session(str(tmp_path))
+        update_step_file(session["session_dir"], "validation", "completed", "# ok\n")
+        set_session_technology(session["session_dir"], "python-pytest")
+
+        row = all_sessions(str(tmp_path), get_sessions_dir(str(tmp_path)))[0]
+        assert row["step"] == "validation"
+        assert row["status"] == "completed"
+        assert row["technology"] == "python-pytest"
+
+        mark_abandoned(session["session_dir"])
+        assert get_current_session(str(tmp_path))["status"] == STATUS_ABANDONED
+
+    def test_registry_is_gitignored(self, tmp_path):
+        init_project(str(tmp_path))
+        create_session(str(tmp_path))
+        gitignore = (tmp_path / ".testboost" / ".gitignore").read_text()
+        assert f"{REGISTRY_FILENAME}*" in gitignore
+
+
+class TestRegistryLookups:
+    def test_settled_lookup_reads_no_spec(self, tmp_path):
+        init_project(str(tmp_path))
+        for name in ("a", "b", "c"):
+            create_session(str(tmp_path), name=name)
+        _settle(str(tmp_path))
+
+        with patch("src.lib.session_registry._read_row") as read_row:
+            current = get_current_session(str(tmp_path))
+            sessions = list_sessions(str(tmp_path))
+        read_row.assert_not_called()
+        assert current["session_id"] == "003-c"
+        assert [s["session_id"] for s in sessions] == ["001-a", "002-b", "003-c"]
+
+    def test_create_session_checks_no_existing_spec(self, tmp_path):
+        init_project(str(tmp_path))
+        for name in ("a", "b", "c"):
+            create_session(str(tmp_path), name=name)
+        _settle(str(tmp_path))
+
+        with patch("src.lib.session_registry._fresh") as fresh:
+            assert create_session(str(tmp_path), name="d")["session_id"] == "004-d"
+        fresh.assert_not_called()
+
+    def test_hand_edited_spec_is_reread(self, tmp_path):
+        init_project(str(tmp_path))
+        session = create_session(str(tmp_path))
+        _settle(str(tmp_path))
+
+        spec = tmp_path / ".testboost" / "sessions" / session["session_id"] / "spec.md"
+        spec.write_text(spec.read_text().replace("status: in_progress", "status: awaiting_input"))
+
+        assert get_current_session(str(tmp_path))["status"] == "awaiting_input"
+
+    def test_sessions_added_or_removed_outside_the_tracker(self, tmp_path):
+        init_project(str(tmp_path))
+        first = create_session(str(tmp_path), name="first")
+        _settle(str(tmp_path))
+
+        # A session checked out from an earlier CI run
+        copied = get_sessions_dir(str(tmp_path)) / "007-from-ci"
+        shutil.copytree(first["session_dir"], copied)
+        assert get_current_session(str(tmp_path))["session_id"] == "007-from-ci"
+        assert create_session(str(tmp_path))["session_id"].startswith("008-")
+
+        shutil.rmtree(first["session_dir"])
+        ids = [s["session_id"] for s in list_sessions(str(tmp_path))]
+        assert "001-first" not in ids
+
+    def test_newest_directory_without_spec_means_no_session(self, tmp_path):
+        init_project(str(tmp_path))
+        create_session(str(tmp_path))
+        (get_sessions_dir(str(tmp_path)) / "999-broken").mkdir()
+        assert get_current_session(str(tmp_path)) is None
+
+    def test_unusable_registry_falls_back_to_scan(self, tmp_path):
+        init_project(str(tmp_path))
+        create_session(str(tmp_path), name="first")
+        with patch(
+            "src.lib.session_registry.newest_session",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            assert get_current_session(str(tmp_path))["session_id"] == "001-first"
+
+
+class TestRebuild:
+    def test_rebuild_indexes_legacy_sessions(self, tmp_path):
+        init_project(str(tmp_path))
+        create_session(str(tmp_path), name="one")
+        create_session(str(tmp_path), name="two")
+        get_registry_path(str(tmp_path)).unlink()
+
+        assert rebuild_registry(str(tmp_path)) == 2
+        ids = [r["session_id"] for r in all_sessions(str(tmp_path), get_sessions_dir(str(tmp_path)))]
+        assert ids == ["001-one", "002-two"]
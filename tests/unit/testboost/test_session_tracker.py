@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
 """Unit tests for src.lib.session_tracker."""
 
+import os
 import re
+import time
+from pathlib import Path
+from unittest.mock import patch
 
 from src.lib.session_tracker import (
     STATUS_COMPLETED,
@@ -16,6 +20,7 @@ from src.lib.session_tracker import (
     get_sessions_dir,
     get_testboost_dir,
     init_project,
+    list_generated_tests,
     update_step_file,
     write_log,
 )
@@ -297,6 +302,69 @@ class TestGetSessionStatus:
         status = get_session_status(str(tmp_path))
         assert "completed" in status
 
+    def test_shows_last_log_entries(self, tmp_path):
+        init_project(str(tmp_path))
+        session_dir = create_session(str(tmp_path))["session_dir"]
+        for i in range(15):
+            write_log(session_dir, "generation", "INFO", f"entry {i}")
+        status = get_session_status(str(tmp_path))
+        assert "entry 14" in status and "entry 5" in status
+        assert "entry 4" not in status
+
+    def test_cached_until_a_session_file_changes(self, tmp_path):
+        init_project(str(tmp_path))
+        session_dir = Path(create_session(str(tmp_path))["session_dir"])
+        write_log(str(session_dir), "generation", "INFO", "first")
+        past = time.time() - 60
+        for f in [session_dir / "spec.md", *(session_dir / "logs").glob("*.md")]:
+            os.utime(f, (past, past))
+
+        first = get_session_status(str(tmp_path))
+        assert (session_dir / "status_cache.json").is_file()
+        assert "status_cache.json" in (tmp_path / ".testboost" / ".gitignore").read_text()
+        with patch("src.lib.log_writer.tail_log_entries", side_effect=AssertionError("log read")):
+            assert get_session_status(str(tmp_path)) == first
+
+        write_log(str(session_dir), "generation", "INFO", "second")
+        assert "second" in get_session_status(str(tmp_path))
+
+
+# ============================================================================
+# list_generated_tests
+# ============================================================================
+
+
+class TestListGeneratedTests:
+    def test_no_sessions(self, tmp_path):
+        assert list_generated_tests(str(tmp_path)) == {}
+
+    def test_later_session_wins(self, tmp_path):
+        init_project(str(tmp_path))
+        first = create_session(str(tmp_path))["session_dir"]
+        update_step_file(first, "generation", STATUS_COMPLETED, "# Generation", data={
+            "generated": [
+                {"source_file": "src/main/java/A.java", "path": "src/test/java/ATest.java"},
+                {"source_file": "src/main/java/B.java", "path": "src/test/java/BTest.java"},
+            ],
+        })
+        second = create_session(str(tmp_path))["session_dir"]
+        update_step_file(second, "generation", STATUS_COMPLETED, "# Generation", data={
+            "generated": [
+                {"source_file": "src/main/java/A.java", "path": "src/test/java/AIT.java"},
+            ],
+        })
+
+        assert list_generated_tests(str(tmp_path)) == {
+            "src/main/java/A.java": "src/test/java/AIT.java",
+            "src/main/java/B.java": "src/test/java/BTest.java",
+        }
+
+    def test_ignores_steps_without_generated_data(self, tmp_path):
+        init_project(str(tmp_path))
+        session_dir = create_session(str(tmp_path))["session_dir"]
+        update_step_file(session_dir, "generation", STATUS_IN_PROGRESS, "# Generation")
+        assert list_generated_tests(str(tmp_path)) == {}
+
 
 # ============================================================================
 # Frontmatter helpers
@@ -404,6 +472,40 @@ class TestProjectAnalysis:
         result = read_project_analysis_data(str(tmp_path))
         assert result is None
 
+    def test_data_goes_to_store_not_markdown(self, tmp_path):
+        from src.lib.analysis_store import get_store_path, read_class_entry
+        from src.lib.session_tracker import (
+            get_project_analysis_path,
+            read_project_analysis_data,
+            write_project_analysis,
+        )
+        init_project(str(tmp_path))
+        data = {
+            "class_index": {"Foo": {"class_name": "Foo"}, "Bar": {"class_name": "Bar"}},
+            "maven_test_cmd": "mvn test",
+        }
+        write_project_analysis(str(tmp_path), "# Project Analysis\n", data)
+
+        assert get_store_path(str(tmp_path)).exists()
+        assert "```json" not in get_project_analysis_path(str(tmp_path)).read_text()
+        assert read_class_entry(str(tmp_path), "Bar") == {"class_name": "Bar"}
+        assert read_class_entry(str(tmp_path), "Missing") is None
+        light = read_project_analysis_data(str(tmp_path), include_class_index=False)
+        assert light == {"maven_test_cmd": "mvn test"}
+        assert list(read_project_analysis_data(str(tmp_path))["class_index"]) == ["Foo", "Bar"]
+
+    def test_reads_legacy_json_block_without_store(self, tmp_path):
+        from src.lib.session_tracker import (
+            get_project_analysis_path,
+            read_project_analysis_data,
+        )
+        init_project(str(tmp_path))
+        get_project_analysis_path(str(tmp_path)).write_text(
+            '---\nstatus: completed\n---\n\n## Raw Data\n\n```json\n{"source_files": ["A.java"]}\n```\n',
+            encoding="utf-8",
+        )
+        assert read_project_analysis_data(str(tmp_path)) == {"source_files": ["A.java"]}
+
 
 # ============================================================================
 # Human-in-the-loop: emit_question / consume_answer (spike)
@@ -601,6 +703,88 @@ class TestFileCursor:
         # idempotent: clearing again is fine
         clear_generation_cursor(session["session_dir"])
 
+    def test_journal_replays_completed_and_deferred(self, tmp_path):
+        from src.lib.session_tracker import (
+            GENERATION_CURSOR_FILENAME,
+            append_generation_cursor,
+            load_generation_cursor,
+            save_generation_cursor,
+        )
+        session = self._new_session(tmp_path)
+        sdir = session["session_dir"]
+        save_generation_cursor(
+            sdir, target_files=["a", "b", "c"], current_index=0, completed_files=[],
+            files_filter=["svc/"],
+        )
+        snapshot = (tmp_path / ".testboost" / "sessions" / session["session_id"]
+                    / GENERATION_CURSOR_FILENAME).read_text()
+
+        append_generation_cursor(sdir, completed_file="a", deferred=[])
+        append_generation_cursor(
+            sdir, completed_file="c", deferred=[{"source_file": "b", "reason": "x"}],
+        )
+
+        cursor = load_generation_cursor(sdir)
+        assert cursor["completed_files"] == ["a", "c"]
+        assert cursor["current_index"] == 2
+        assert cursor["deferred"] == [{"source_file": "b", "reason": "x"}]
+        assert cursor["files_filter"] == ["svc/"]
+        # Per-file progress never rewrote the snapshot
+        assert (tmp_path / ".testboost" / "sessions" / session["session_id"]
+                / GENERATION_CURSOR_FILENAME).read_text() == snapshot
+
+    def test_torn_tail_and_stale_epoch_are_ignored(self, tmp_path):
+        from src.lib.session_tracker import (
+            GENERATION_CURSOR_JOURNAL_FILENAME,
+            append_generation_cursor,
+            load_generation_cursor,
+            save_generation_cursor,
+        )
+        session = self._new_session(tmp_path)
+        sdir = session["session_dir"]
+        save_generation_cursor(sdir, target_files=["a", "b"], current_index=0, completed_files=[])
+        append_generation_cursor(sdir, completed_file="a")
+        journal = tmp_path / ".testboost" / "sessions" / session["session_id"] / GENERATION_CURSOR_JOURNAL_FILENAME
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"epoch": "0000", "completed": "b"}\n{"epoch": "')
+        assert load_generation_cursor(sdir)["completed_files"] == ["a"]
+
+    def test_large_journal_is_compacted(self, tmp_path, monkeypatch):
+        from src.lib import session_tracker
+        session = self._new_session(tmp_path)
+        sdir = session["session_dir"]
+        monkeypatch.setattr(session_tracker, "_CURSOR_JOURNAL_MAX_BYTES", 200)
+        files = [f"src/main/java/F{i}.java" for i in range(20)]
+        session_tracker.save_generation_cursor(
+            sdir, target_files=files, current_index=0, completed_files=[],
+        )
+        for f in files[:10]:
+            session_tracker.append_generation_cursor(sdir, completed_file=f)
+
+        journal = tmp_path / ".testboost" / "sessions" / session["session_id"] / session_tracker.GENERATION_CURSOR_JOURNAL_FILENAME
+        assert not journal.exists() or journal.stat().st_size <= 200
+        cursor = session_tracker.load_generation_cursor(sdir)
+        assert cursor["completed_files"] == files[:10]
+        assert cursor["current_index"] == 10
+
+    def test_legacy_snapshot_without_epoch(self, tmp_path):
+        import json
+
+        from src.lib.session_tracker import (
+            GENERATION_CURSOR_FILENAME,
+            append_generation_cursor,
+            load_generation_cursor,
+        )
+        session = self._new_session(tmp_path)
+        path = tmp_path / ".testboost" / "sessions" / session["session_id"] / GENERATION_CURSOR_FILENAME
+        path.write_text(json.dumps({
+            "target_files": ["a", "b"], "current_index": 1, "completed_files": ["a"],
+            "deferred": [], "updated_at": "2026-06-02T10:00:00Z",
+        }))
+        assert load_generation_cursor(session["session_dir"])["completed_files"] == ["a"]
+        append_generation_cursor(session["session_dir"], completed_file="b")
+        assert load_generation_cursor(session["session_dir"])["completed_files"] == ["a", "b"]
+
 
 # ============================================================================
 # Cleanup helpers (P3.1)